@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+AI Service Head-to-Head Benchmark for RecruiterAI
+Sends the same question generation and answer analysis workload through each of the
+parallel AI service families against one offline mock LLM (mock_llm.py):
+
+  groq       GroqAIService        (/api/groq-*)
+  optimized  OptimizedAIService   (/api/optimized-*)
+  smart      SmartAIService       (/api/smart-*)
+  free-llm   FreeLLMService       (/api/free-llm-*)
+  reliable   ReliableAIService    (no route; wraps SmartAIService)
+  hybrid     HybridAIService      (no route; wraps SmartAIService)
+
+Requests go through the development-only /api/ai-service-benchmark route, which calls
+each service the way its own routes do, fallbacks included, and nothing else. Per
+family and task it reports end-to-end latency, time in LLM calls (X-LLM-Usage), app
+overhead (latency minus LLM time), server heap/RSS delta per request
+(X-Memory-Delta-KB; run with --concurrency 1 for clean numbers) and, for every
+--failure-rates value injected by the mock, how requests ended: answered by the model,
+served a canned fallback (HTTP 200 without a successful LLM call) or failed.
+
+With --routes the families' public routes are measured too: the analysis routes with
+the same answers and, given --interview-id, the question regeneration routes.
+
+Start the app against the mock first (GEMINI_BASE_URL covers the Gemini paths of the
+optimized, smart and free-LLM services):
+
+    GROQ_BASE_URL=http://localhost:2360 GEMINI_BASE_URL=http://localhost:2360 \\
+        GROQ_API_KEY=local GEMINI_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+from typing import Dict, List
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import (DEFAULT_BASE_URL, LLM_USAGE_HEADER, Stopwatch, parse_llm_usage, parse_memory,
+                          print_table, run_concurrent, summarize)
+
+BENCHMARK_ROUTE = "/api/ai-service-benchmark"
+FAMILIES = ["groq", "optimized", "smart", "free-llm", "reliable", "hybrid"]
+TASKS = ["questions", "analysis"]
+
+ANALYSIS_ROUTES = {"groq": "/api/groq-analyze-response", "optimized": "/api/optimized-analyze-response"}
+GENERATION_ROUTES = {"groq": "/api/groq-generate-questions", "optimized": "/api/optimized-generate-questions",
+                     "smart": "/api/smart-generate-questions", "free-llm": "/api/free-llm-questions"}
+
+ANSWER = {
+    "question": "How would you design a rate limiter for a public API?",
+    "expectedAnswer": "Token bucket or sliding window, per-key state in shared storage, limit headers.",
+    "userAnswer": "I would use a token bucket per API key stored in Redis, refilled at the allowed rate, "
+                  "and return 429 with Retry-After once the bucket is empty.",
+    "category": "technical",
+    "companyContext": "Acme Corp",
+}
+
+ROLES = [("Backend Engineer", ["Python", "PostgreSQL", "Redis"]),
+         ("Frontend Engineer", ["React", "TypeScript", "CSS"]),
+         ("Data Engineer", ["Spark", "SQL", "Airflow"]),
+         ("Site Reliability Engineer", ["Kubernetes", "Go", "Prometheus"])]
+
+
+def workload(task: str, count: int, questions: int) -> List[Dict[str, object]]:
+    """The same list of payloads for every family; variants keep any answer cache cold"""
+    if task == "analysis":
+        return [{**ANSWER, "userAnswer": f"{ANSWER['userAnswer']} (variant {i})"} for i in range(count)]
+    return [{"jobTitle": ROLES[i % len(ROLES)][0], "companyName": "Acme Corp", "skills": ROLES[i % len(ROLES)][1],
+             "interviewType": "technical", "experienceLevel": "mid", "numberOfQuestions": questions}
+            for i in range(count)]
+
+
+def measure(url: str, body: Dict[str, object], timeout: float) -> Dict[str, object]:
+    try:
+        with Stopwatch() as sw:
+            response = requests.post(url, json=body, timeout=timeout)
+    except requests.RequestException as e:
+        return {"ms": 0.0, "status": None, "outcome": "error", "error": str(e)}
+
+    usage = parse_llm_usage(response.headers.get(LLM_USAGE_HEADER))
+    calls = sum(entry.get("calls", 0) for entry in usage)
+    failed = sum(entry.get("failed", 0) for entry in usage)
+    try:
+        data = response.json()
+    except ValueError:
+        data = {}
+    if response.status_code != 200 or data.get("success") is False:
+        outcome = "error"
+    elif calls - failed <= 0:
+        outcome = "fallback"
+    else:
+        outcome = "model"
+    return {
+        "ms": sw.elapsed_ms,
+        "status": response.status_code,
+        "outcome": outcome,
+        "calls": calls,
+        "failed": failed,
+        "tokens": sum(entry.get("prompt", 0) + entry.get("completion", 0) for entry in usage),
+        "llm_ms": sum(entry.get("queue", 0) + entry.get("network", 0) + entry.get("parse", 0) for entry in usage),
+        "memory": parse_memory(response.headers.get("x-memory-delta-kb", "")),
+    }
+
+
+def arm_row(family: str, task: str, path: str, failure_rate: float, results: List[Dict[str, object]],
+            wall_ms: float, mock_requests: int) -> Dict[str, object]:
+    answered = [r for r in results if r["outcome"] != "error"]
+    latency = summarize([r["ms"] for r in answered])
+    overhead = summarize([max(0.0, r["ms"] - r["llm_ms"]) for r in answered])
+    with_memory = [r["memory"] for r in answered if r["memory"]]
+    n = len(results)
+
+    def per_answered(key: str) -> float:
+        return sum(r[key] for r in answered) / len(answered) if answered else 0.0
+
+    return {
+        "family": family, "task": task, "path": path, "fail rate": f"{failure_rate:.0%}",
+        "model": sum(1 for r in results if r["outcome"] == "model"),
+        "fallback": sum(1 for r in results if r["outcome"] == "fallback"),
+        "error": n - len(answered),
+        "p50": latency["p50"], "p90": latency["p90"], "max": latency["max"],
+        "llm ms": per_answered("llm_ms"), "overhead p50": overhead["p50"], "overhead p90": overhead["p90"],
+        "heap KB": sum(m.get("heap", 0) for m in with_memory) / len(with_memory) if with_memory else "-",
+        "rss KB": sum(m.get("rss", 0) for m in with_memory) / len(with_memory) if with_memory else "-",
+        "calls/req": per_answered("calls"), "tokens/req": per_answered("tokens"),
+        "mock reqs": mock_requests, "req/s": n / (wall_ms / 1000) if wall_ms else 0.0,
+    }
+
+
+def route_arms(args, task: str) -> Dict[str, tuple]:
+    """Public routes of each family for one task: family -> (url, payloads)"""
+    if task == "analysis":
+        payloads = [{**body, "cache": False} for body in workload("analysis", args.requests, args.questions)]
+        return {family: (f"{args.base_url}{route}", payloads) for family, route in ANALYSIS_ROUTES.items()
+                if family in args.families}
+    if not args.interview_id:
+        return {}
+    payloads = [{"interviewId": args.interview_id, "regenerate": True}] * args.requests
+    return {family: (f"{args.base_url}{route}", payloads) for family, route in GENERATION_ROUTES.items()
+            if family in args.families}
+
+
+def print_ranking(rows: List[Dict[str, object]]):
+    print("\n🏁 Fastest healthy path per task (no injected failures, p50 among arms without errors):")
+    for task in TASKS:
+        healthy = [r for r in rows if r["task"] == task and r["fail rate"] == "0%" and r["error"] == 0 and r["model"]]
+        if not healthy:
+            print(f"  {task}: no arm answered from the model without errors")
+            continue
+        ordered = sorted(healthy, key=lambda r: r["p50"])
+        best = ordered[0]
+        others = ", ".join(f"{r['family']}/{r['path']} {r['p50'] / best['p50']:.2f}x" for r in ordered[1:]
+                           if best["p50"])
+        print(f"  {task}: {best['family']}/{best['path']} p50 {best['p50']:.1f}ms, "
+              f"overhead p50 {best['overhead p50']:.1f}ms" + (f" (then {others})" if others else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head-to-head benchmark of the AI service families")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--families", nargs="+", default=FAMILIES, choices=FAMILIES)
+    parser.add_argument("--tasks", nargs="+", default=TASKS, choices=TASKS)
+    parser.add_argument("--requests", type=int, default=12, help="requests per family, task and failure rate")
+    parser.add_argument("--questions", type=int, default=5, help="questions per generation request")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="parallel requests; memory deltas are process-wide, so only exact at 1")
+    parser.add_argument("--failure-rates", type=float, nargs="+", default=[0.0, 0.3],
+                        help="mock LLM 500 rates to run the whole matrix under")
+    parser.add_argument("--routes", action="store_true", help="also measure the families' public routes")
+    parser.add_argument("--interview-id", default="", help="interview whose questions the generation routes redo")
+    parser.add_argument("--timeout", type=float, default=300)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    print("🥊 RecruiterAI AI Service Head-to-Head Benchmark")
+    print("=" * 60)
+
+    try:
+        available = requests.get(f"{args.base_url}{BENCHMARK_ROUTE}", timeout=10).json().get("families", [])
+    except (requests.RequestException, ValueError) as e:
+        print(f"❌ {BENCHMARK_ROUTE} unavailable ({e}); it only runs outside production")
+        return 1
+    families = [family for family in args.families if family in available]
+    print(f"Families: {', '.join(families)}  tasks: {', '.join(args.tasks)}  "
+          f"{args.requests} requests each at concurrency {args.concurrency}")
+    if args.routes and not args.interview_id and "questions" in args.tasks:
+        print("ℹ️  No --interview-id: question generation routes skipped")
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+
+    rows = []
+    try:
+        for failure_rate in args.failure_rates:
+            for task in args.tasks:
+                payloads = workload(task, args.requests, args.questions)
+                arms = [(family, "service", f"{args.base_url}{BENCHMARK_ROUTE}",
+                         [{"family": family, "task": task, "params": p} for p in payloads]) for family in families]
+                if args.routes:
+                    arms += [(family, "route", url, bodies) for family, (url, bodies) in route_arms(args, task).items()]
+
+                for family, path, url, bodies in arms:
+                    # One unmeasured request first so route compilation and service start-up do not count
+                    mock.llm.failure_rate = 0.0
+                    measure(url, bodies[0], args.timeout)
+                    mock.llm.failure_rate = failure_rate
+                    mock.llm.reset_stats()
+                    with Stopwatch() as wall:
+                        results = run_concurrent(lambda body: measure(url, body, args.timeout), bodies,
+                                                 args.concurrency)
+                    rows.append(arm_row(family, task, path, failure_rate, results, wall.elapsed_ms,
+                                        mock.llm.snapshot().get("requests", 0)))
+                    print(f"  {family}/{path} {task} at {failure_rate:.0%} failures: "
+                          f"{rows[-1]['model']} model, {rows[-1]['fallback']} fallback, {rows[-1]['error']} error")
+    finally:
+        mock.stop()
+
+    print_table(rows, ["family", "task", "path", "fail rate", "model", "fallback", "error", "p50", "p90", "max",
+                       "llm ms", "overhead p50", "overhead p90", "calls/req", "tokens/req", "mock reqs", "req/s"],
+                title="Latency, LLM time and app overhead per family (ms)")
+    print_table([r for r in rows if r["path"] == "service"],
+                ["family", "task", "fail rate", "heap KB", "rss KB"],
+                title="Server memory delta per request (X-Memory-Delta-KB)")
+    print_ranking(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Answer Cache Benchmark for RecruiterAI
+Replays a synthetic answer corpus through /api/groq-analyze-response twice: once with
+the near-duplicate answer cache bypassed ("cache": false) and once with it on. The
+corpus has a few questions, each with several distinct "canonical" answers, and every
+request sends one of them either verbatim, lightly edited (case, punctuation, filler
+words, a swapped word) or heavily rewritten, the way many candidates give nearly the
+same short answer to standard questions.
+
+Reports the hit rate, the latency saved, and an accuracy check of every reuse: the
+true word-shingle Jaccard similarity between the answer sent and the stored answer
+whose analysis came back (reuses below the threshold are false reuses caused by the
+MinHash estimate), how often both came from the same canonical answer, and the
+recall over answers that did have a stored near-duplicate.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import random
+import re
+import sys
+import unicodedata
+import uuid
+from typing import Dict, List, Optional, Set
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, run_concurrent, summarize
+
+ROUTE = "/api/groq-analyze-response"
+
+QUESTIONS = [
+    ("What is React and why would you use it?", "technical", [
+        "React is a JavaScript library for building user interfaces out of reusable components",
+        "it uses a virtual DOM to batch and minimise real DOM updates",
+        "data flows one way from parent to child through props",
+        "hooks such as useState and useEffect manage state and side effects in function components",
+        "the large ecosystem and community make hiring and tooling easy",
+        "JSX lets you describe the UI declaratively next to the logic",
+    ]),
+    ("Explain the difference between a process and a thread.", "technical", [
+        "a process is an independent program with its own address space",
+        "threads live inside a process and share its memory",
+        "switching between threads is cheaper than switching between processes",
+        "shared memory makes threads fast to communicate but needs locks to stay safe",
+        "a crash in one process does not take down other processes",
+        "the operating system schedules threads onto CPU cores",
+    ]),
+    ("Tell me about a time you handled a conflict in your team.", "behavioral", [
+        "two engineers disagreed about the database choice for a new service",
+        "I set up a meeting where each of them presented the trade-offs with data",
+        "we agreed on evaluation criteria before looking at the options",
+        "we ran a small benchmark and picked the option that met the latency goal",
+        "afterwards we wrote the decision down so it would not be reopened",
+        "the project shipped on time and both of them felt heard",
+    ]),
+]
+FILLERS = ["basically", "so", "um", "like", "actually", "you know"]
+SWAPS = {"library": "framework", "reusable": "composable", "cheaper": "faster", "independent": "separate",
+         "meeting": "call", "small": "quick", "large": "big"}
+
+
+def normalize(text: str) -> str:
+    """Mirror of normalizeAnswer in src/lib/answerSimilarityCache.ts"""
+    text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+    return re.sub(r"[^a-z0-9+#]+", " ", text.lower()).strip()
+
+
+def shingles(text: str, size: int) -> Set[str]:
+    words = normalize(text).split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a: str, b: str, size: int) -> float:
+    sa, sb = shingles(a, size), shingles(b, size)
+    return len(sa & sb) / len(sa | sb) if sa | sb else 1.0
+
+
+def canonical_answers(rng: random.Random, phrases: List[str], count: int) -> List[str]:
+    """Distinct answers to one question, each a different selection and order of its points"""
+    answers = []
+    for _ in range(count):
+        picked = rng.sample(phrases, k=rng.randint(3, len(phrases)))
+        answers.append(". ".join(p[0].upper() + p[1:] for p in picked) + ".")
+    return answers
+
+
+def light_edit(rng: random.Random, text: str) -> str:
+    words = text.split()
+    for _ in range(rng.randint(1, 2)):
+        edit = rng.random()
+        if edit < 0.4:
+            words.insert(rng.randrange(len(words)), rng.choice(FILLERS))
+        elif edit < 0.7:
+            i = rng.randrange(len(words))
+            words[i] = SWAPS.get(words[i].lower(), words[i])
+        else:
+            words[rng.randrange(len(words))] += rng.choice([",", "!", "..."])
+    edited = " ".join(words)
+    return edited.lower() if rng.random() < 0.3 else edited
+
+
+def heavy_edit(rng: random.Random, text: str, phrases: List[str]) -> str:
+    """Keeps about half of the answer and adds other points: related but not a duplicate"""
+    sentences = [s for s in text.split(". ") if s]
+    kept = rng.sample(sentences, k=max(1, len(sentences) // 2))
+    extra = rng.sample(phrases, k=2)
+    return ". ".join(kept + extra) + "."
+
+
+def build_corpus(requests_count: int, clusters: int, mix: Dict[str, float], seed: int) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    canon = {qi: canonical_answers(rng, phrases, clusters) for qi, (_, _, phrases) in enumerate(QUESTIONS)}
+    kinds, weights = zip(*mix.items())
+    corpus = []
+    for n in range(requests_count):
+        qi = rng.randrange(len(QUESTIONS))
+        question, category, phrases = QUESTIONS[qi]
+        cluster = rng.randrange(clusters)
+        kind = rng.choices(kinds, weights)[0]
+        text = canon[qi][cluster]
+        if kind == "light":
+            text = light_edit(rng, text)
+        elif kind == "heavy":
+            text = heavy_edit(rng, text, phrases)
+            cluster = -1 - n  # Rewritten answers start their own cluster
+        corpus.append({"question": question, "category": category, "userAnswer": text, "expectedAnswer":
+                       "A correct, structured answer with an example.", "qi": qi, "cluster": cluster, "kind": kind})
+    return corpus
+
+
+class AnalyseArm:
+    def __init__(self, base_url: str, company: str, cache: bool, timeout: float):
+        self.base_url = base_url
+        self.company = company
+        self.cache = cache
+        self.timeout = timeout
+
+    def run(self, item: Dict[str, object]) -> Dict[str, object]:
+        body = {k: item[k] for k in ("question", "category", "userAnswer", "expectedAnswer")}
+        with Stopwatch() as sw:
+            response = requests.post(f"{self.base_url}{ROUTE}", timeout=self.timeout,
+                                     json={**body, "companyContext": self.company, "cache": self.cache})
+        cache = response.json().get("metadata", {}).get("cache", {}) if response.status_code == 200 else {}
+        return {**item, "http": response.status_code, "ms": sw.elapsed_ms, "hit": bool(cache.get("hit")),
+                "similarity": cache.get("similarity"), "entry": cache.get("entryId")}
+
+
+def cache_stats(base_url: str) -> Optional[Dict[str, object]]:
+    try:
+        response = requests.get(f"{base_url}{ROUTE}", params={"type": "cache-stats"}, timeout=10)
+        caches = response.json().get("answerCache", {}).get("caches", []) if response.status_code == 200 else []
+        return next((c for c in caches if c.get("name") == "groq-answer-analysis"), None)
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def accuracy(results: List[Dict[str, object]], threshold: float, size: int) -> Dict[str, object]:
+    """Check every reuse against the stored answer it came from, in request order"""
+    stored: Dict[str, Dict[str, object]] = {}
+    hits, false_reuse, same, reusable, recalled, true_sims, errors = 0, 0, 0, 0, 0, [], []
+    for r in results:
+        prior = [s for s in stored.values() if s["qi"] == r["qi"]]
+        could_reuse = any(jaccard(r["userAnswer"], s["userAnswer"], size) >= threshold for s in prior)
+        reusable += int(could_reuse)
+        if r["hit"] and r["entry"] in stored:
+            source = stored[r["entry"]]
+            hits += 1
+            recalled += int(could_reuse)
+            true_sim = jaccard(r["userAnswer"], source["userAnswer"], size)
+            true_sims.append(true_sim)
+            errors.append(abs((r["similarity"] or 0) - true_sim))
+            false_reuse += int(true_sim < threshold)
+            same += int(source["cluster"] == r["cluster"])
+        elif not r["hit"] and r["entry"]:
+            stored[r["entry"]] = r
+    return {"checked hits": hits, "false reuse": false_reuse,
+            "precision": (hits - false_reuse) / hits if hits else 1.0, "same canonical": same / hits if hits else 1.0,
+            "recall": recalled / reusable if reusable else 1.0, "true sim min": min(true_sims, default=0.0),
+            "true sim avg": summarize(true_sims)["avg"], "estimate err avg": summarize(errors)["avg"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate answer cache benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--clusters", type=int, default=4, help="distinct canonical answers per question")
+    parser.add_argument("--mix", nargs="*", default=["exact=0.3", "light=0.5", "heavy=0.2"], metavar="KIND=SHARE")
+    parser.add_argument("--concurrency", type=int, default=1, help="> 1 lets near-duplicates race past the cache")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--shingle-size", type=int, default=2, help="must match the server's shingle size")
+    parser.add_argument("--timeout", type=float, default=120)
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["analysis=800"])
+    args = parser.parse_args()
+
+    print("🧬 RecruiterAI Near-Duplicate Answer Cache Benchmark")
+    print("=" * 60)
+
+    mix = {k: float(v) for k, _, v in (spec.partition("=") for spec in args.mix)}
+    corpus = build_corpus(args.requests, args.clusters, mix, args.seed)
+    print(f"{len(corpus)} answers over {len(QUESTIONS)} questions × {args.clusters} canonical answers, mix {mix}")
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+
+    company = f"bench-{uuid.uuid4().hex[:8]}"  # Fresh cache scope for this run
+    rows, runs = [], {}
+    try:
+        before = cache_stats(args.base_url) or {}
+        for label, cache in (("uncached", False), ("cached", True)):
+            mock.llm.reset_stats()
+            with Stopwatch() as wall:
+                results = run_concurrent(AnalyseArm(args.base_url, company, cache, args.timeout).run, corpus,
+                                         args.concurrency)
+            runs[label] = results
+            ok = [r for r in results if r["http"] == 200]
+            latency = summarize([r["ms"] for r in ok])
+            rows.append({"arm": label, "ok": len(ok), "hits": sum(1 for r in ok if r["hit"]),
+                         "p50": latency["p50"], "p90": latency["p90"], "avg": latency["avg"],
+                         "llm calls": mock.llm.snapshot().get("requests", 0), "wall s": wall.elapsed_ms / 1000})
+        after = cache_stats(args.base_url) or {}
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        mock.stop()
+
+    print_table(rows, ["arm", "ok", "hits", "p50", "p90", "avg", "llm calls", "wall s"],
+                title="Answer analysis latency (ms)")
+
+    cached = runs["cached"]
+    by_kind = []
+    for kind in mix:
+        subset = [r for r in cached if r["kind"] == kind]
+        if subset:
+            hits = [r for r in subset if r["hit"]]
+            by_kind.append({"answer kind": kind, "requests": len(subset), "hit rate": len(hits) / len(subset),
+                            "hit p50": summarize([r["ms"] for r in hits])["p50"],
+                            "miss p50": summarize([r["ms"] for r in subset if not r["hit"]])["p50"]})
+    print_table(by_kind, ["answer kind", "requests", "hit rate", "hit p50", "miss p50"], title="Cache hits by answer kind")
+
+    threshold = after.get("threshold", 0.8)
+    check = accuracy(cached, threshold, args.shingle_size)
+    print_table([check], ["checked hits", "false reuse", "precision", "same canonical", "recall", "true sim min",
+                          "true sim avg", "estimate err avg"], title=f"Reuse accuracy (threshold {threshold})")
+
+    uncached_total = sum(r["ms"] for r in runs["uncached"])
+    cached_total = sum(r["ms"] for r in cached)
+    saved_server = after.get("savedMs", 0) - before.get("savedMs", 0)
+    print(f"\n  Hit rate {rows[1]['hits'] / max(1, rows[1]['ok']):.1%}; client time "
+          f"{uncached_total / 1000:.1f}s → {cached_total / 1000:.1f}s "
+          f"({(1 - cached_total / uncached_total) * 100 if uncached_total else 0:.0f}% saved); "
+          f"server credits {saved_server / 1000:.1f}s of analysis to reuse")
+    # A reuse well below the threshold is more than MinHash estimation noise
+    sound = check["true sim min"] >= threshold - 0.1 or not check["checked hits"]
+    return 0 if all(row["ok"] == len(corpus) for row in rows) and sound else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Batch Answer Analysis Benchmark for RecruiterAI
+Analyses whole interview rounds two ways against the offline mock LLM from
+mock_llm.py: one POST /api/groq-analyze-response per answer (sent --concurrency at a
+time, like the interview page does) and one POST /api/groq-analyze-responses per
+round, both with the near-duplicate answer cache bypassed. Reports latency per
+round, answers analysed per second, LLM calls per round and how many answers the
+batch endpoint had to re-analyse alone or fall back on (raise --mock-drop-rate to
+make the mock leave answers out of batch replies).
+
+Rounds come from recorded answers in MongoDB (--from-db N) or are synthesised.
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, get_database, print_table, summarize
+
+SINGLE_ROUTE = "/api/groq-analyze-response"
+BATCH_ROUTE = "/api/groq-analyze-responses"
+COMPANY = "Acme Corp"
+
+
+def synthetic_rounds(count: int, answers: int, answer_words: int) -> List[List[Dict[str, str]]]:
+    categories = ["technical", "behavioral", "dsa", "aptitude"]
+    return [[{
+        "question": f"Question {i + 1} of round {r + 1}: how would you design a rate limiter for a public API?",
+        "expectedAnswer": "Token bucket or sliding window, per-key state, shared storage, headers and trade-offs.",
+        "userAnswer": " ".join(f"word{(r * 31 + i * 7 + w) % 97}" for w in range(answer_words)),
+        "category": categories[i % len(categories)],
+    } for i in range(answers)] for r in range(count)]
+
+
+def rounds_from_db(count: int) -> List[List[Dict[str, str]]]:
+    """Recorded rounds: each answered question paired with its answer"""
+    db = get_database()
+    rounds = []
+    for doc in db.questions.find({"answers.0": {"$exists": True}}, {"questions": 1, "answers": 1}).limit(count):
+        questions = doc.get("questions") or []
+        round_ = []
+        for answer in doc.get("answers", []):
+            index = answer.get("questionIndex", -1)
+            text = answer.get("answer") or ""
+            if 0 <= index < len(questions) and text and text != "No answer provided":
+                q = questions[index]
+                round_.append({"question": q.get("question", ""), "userAnswer": text,
+                               "expectedAnswer": q.get("expectedAnswer") or "A complete, well-structured answer.",
+                               "category": q.get("category") or "technical"})
+        if round_:
+            rounds.append(round_)
+    return rounds
+
+
+def run_per_answer(base_url: str, round_: List[Dict[str, str]], concurrency: int, timeout: float) -> Dict[str, object]:
+    def analyse(answer: Dict[str, str]) -> int:
+        response = requests.post(f"{base_url}{SINGLE_ROUTE}", timeout=timeout,
+                                 json={**answer, "companyContext": COMPANY, "cache": False})
+        return response.status_code
+
+    with Stopwatch() as sw:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            statuses = list(pool.map(analyse, round_))
+    return {"ms": sw.elapsed_ms, "ok": sum(1 for s in statuses if s == 200), "answers": len(round_),
+            "sources": {}}
+
+
+def run_batched(base_url: str, round_: List[Dict[str, str]], timeout: float) -> Dict[str, object]:
+    with Stopwatch() as sw:
+        response = requests.post(f"{base_url}{BATCH_ROUTE}", timeout=timeout,
+                                 json={"answers": round_, "companyContext": COMPANY, "cache": False})
+    body = response.json() if response.status_code == 200 else {}
+    return {"ms": sw.elapsed_ms, "ok": len(body.get("analyses", [])), "answers": len(round_),
+            "sources": body.get("metadata", {}).get("sources", {}),
+            "batches": body.get("metadata", {}).get("batches", 0)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-answer vs batched answer analysis benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--from-db", type=int, default=0, help="use up to N recorded rounds from MongoDB")
+    parser.add_argument("--rounds", type=int, default=10, help="synthetic rounds when not using --from-db")
+    parser.add_argument("--answers", type=int, default=10, help="answers per synthetic round")
+    parser.add_argument("--answer-words", type=int, default=80, help="words per synthetic answer")
+    parser.add_argument("--concurrency", type=int, default=3, help="parallel per-answer requests within a round")
+    parser.add_argument("--timeout", type=float, default=300)
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["analysis=600", "analysis_batch=700:150"])
+    args = parser.parse_args()
+
+    print("📦 RecruiterAI Batch Answer Analysis Benchmark")
+    print("=" * 60)
+
+    rounds = rounds_from_db(args.from_db) if args.from_db else synthetic_rounds(args.rounds, args.answers,
+                                                                                 args.answer_words)
+    if not rounds:
+        print("❌ No answered rounds found")
+        return 1
+    total_answers = sum(len(r) for r in rounds)
+    print(f"{len(rounds)} rounds, {total_answers} answers")
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url} (batch drop rate {args.mock_drop_rate:.0%}); "
+          f"the app must run with GROQ_BASE_URL={mock.url}")
+
+    rows, batch_results = [], []
+    try:
+        arms = [("per-answer", lambda r: run_per_answer(args.base_url, r, args.concurrency, args.timeout)),
+                ("batched", lambda r: run_batched(args.base_url, r, args.timeout))]
+        for label, run in arms:
+            mock.llm.reset_stats()
+            with Stopwatch() as wall:
+                results = [run(r) for r in rounds]
+            stats = mock.llm.snapshot()
+            if label == "batched":
+                batch_results = results
+            latency = summarize([r["ms"] for r in results])
+            analysed = sum(r["ok"] for r in results)
+            rows.append({"mode": label, "analysed": f"{analysed}/{total_answers}", "round p50": latency["p50"],
+                         "round p90": latency["p90"], "round max": latency["max"],
+                         "answers/s": analysed / (wall.elapsed_ms / 1000) if wall.elapsed_ms else 0.0,
+                         "llm calls/round": stats.get("requests", 0) / len(rounds),
+                         "ok": analysed == total_answers})
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        mock.stop()
+
+    print_table(rows, ["mode", "analysed", "round p50", "round p90", "round max", "answers/s", "llm calls/round"],
+                title="Analysis latency per round (ms) and throughput")
+
+    sources = {"batch": 0, "single": 0, "mock": 0}
+    for result in batch_results:
+        for key, value in result["sources"].items():
+            sources[key] = sources.get(key, 0) + value
+    print(f"\n  Batched answers: {sources['batch']} in batch, {sources['single']} re-analysed alone, "
+          f"{sources['mock']} offline fallback; "
+          f"{summarize([r['batches'] for r in batch_results])['avg']:.1f} LLM batches per round")
+
+    single, batched = rows
+    if batched["round p50"]:
+        print(f"  Round latency p50 {single['round p50']:.0f}ms → {batched['round p50']:.0f}ms "
+              f"({single['round p50'] / batched['round p50']:.1f}x), throughput "
+              f"{single['answers/s']:.1f} → {batched['answers/s']:.1f} answers/s")
+    return 0 if all(row["ok"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Company DSA Catalogue Builder for RecruiterAI
+Precomputes what /api/generate-company-dsa and /api/company-dsa-stats otherwise work
+out per request: gathers stored company DSA problems (company_dsa_problems, the
+problems of generated dsa_sessions and optional JSON files), normalises them to the
+shape the routes serve, de-duplicates them per company and writes
+
+    dsa_catalogue_problems   one compact document per problem, indexed by
+                             (company, difficulty), (company, tags) and tags
+    dsa_catalogue_companies  one document per company: difficulty histogram, topic
+                             distribution, problems grouped by topic and the tag list
+
+Both collections are built under a staging name and renamed over the live ones, so
+readers never see a half-built catalogue. Re-run whenever new problems are stored.
+
+Usage:
+    MONGODB_URI=... python build_dsa_catalogue.py
+    MONGODB_URI=... python build_dsa_catalogue.py --from-json extra_problems.json --dry-run
+    MONGODB_URI=... python build_dsa_catalogue.py --synthetic-companies 120   # benchmark data
+    MONGODB_URI=... python build_dsa_catalogue.py --purge-synthetic
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from collections import Counter, defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
+
+from perf_harness import Stopwatch, get_database, print_table
+
+PROBLEMS = "dsa_catalogue_problems"
+COMPANIES = "dsa_catalogue_companies"
+STAGING_SUFFIX = "_build"
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# (collection, keys, options) - created on the staging collections before the swap
+CATALOGUE_INDEXES = [
+    (PROBLEMS, [("company", 1), ("difficulty", 1)], {"name": "company_difficulty"}),
+    (PROBLEMS, [("company", 1), ("tags", 1)], {"name": "company_tags"}),
+    (PROBLEMS, [("tags", 1)], {"name": "tags"}),
+    (COMPANIES, [("company", 1)], {"name": "company", "unique": True}),
+]
+
+SYNTHETIC_TOPICS = ["Array", "Hash Table", "String", "Tree", "Graph", "Dynamic Programming", "Heap",
+                    "Sliding Window", "Binary Search", "Greedy", "Trie", "Union Find"]
+
+
+def company_key(name: str) -> str:
+    """Must match catalogueCompanyKey in src/lib/dsaCatalogue.ts"""
+    return re.sub(r"\s+", " ", (name or "").lower()).strip()
+
+
+def tag_key(topic: str) -> str:
+    return re.sub(r"[^a-z0-9+#]+", "-", topic.lower()).strip("-")
+
+
+def normalize_problem(raw: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
+    """The DSAProblem shape the routes serve, or None when the problem is unusable"""
+    title, description = (raw.get("title") or "").strip(), (raw.get("description") or "").strip()
+    test_cases = [tc for tc in raw.get("testCases") or [] if isinstance(tc, dict) and "input" in tc
+                  and "expectedOutput" in tc]
+    problem_id = str(raw.get("id") or "")
+    if not title or not description or not test_cases or "fallback" in problem_id:
+        return None
+
+    difficulty = str(raw.get("difficulty") or "medium").lower()
+    complexity = raw.get("expectedComplexity") or {}
+    return {
+        "id": problem_id or f"catalogue-{index}",
+        "title": title,
+        "difficulty": difficulty if difficulty in DIFFICULTIES else "medium",
+        "description": description,
+        "examples": raw.get("examples") or [],
+        "testCases": [{"id": str(tc.get("id") or f"test-{i + 1}"), "input": str(tc["input"]),
+                       "expectedOutput": str(tc["expectedOutput"]), "hidden": bool(tc.get("hidden", False))}
+                      for i, tc in enumerate(test_cases)],
+        "constraints": raw.get("constraints") or [],
+        "topics": [str(t) for t in raw.get("topics") or [] if t],
+        "hints": raw.get("hints") or [],
+        "timeComplexity": raw.get("timeComplexity") or complexity.get("time"),
+        "spaceComplexity": raw.get("spaceComplexity") or complexity.get("space"),
+        "companyContext": raw.get("companyContext"),
+        "realWorldApplication": raw.get("realWorldApplication"),
+    }
+
+
+def collect_sources(db, json_files: List[str], skip_synthetic: bool = False,
+                    synthetic: Optional[List[Dict[str, Any]]] = None) -> Iterable[Dict[str, Any]]:
+    """(companyName, raw problem, source, uniquenessScore) from every store of company problems;
+    synthetic problems about to be seeded are read from memory, not the database"""
+    stored = {"synthetic": {"$ne": True}} if skip_synthetic else {}
+    for doc in chain(db.company_dsa_problems.find(stored, {"_id": 0}), synthetic or []):
+        yield {"companyName": doc.get("companyName"), "raw": doc, "source": "company_dsa_problems",
+               "uniquenessScore": doc.get("uniquenessScore")}
+    # Sessions served from the catalogue itself are not a new source
+    sessions = db.dsa_sessions.find({"aiProvider": {"$nin": ["fallback", "dsa-catalogue"]}},
+                                    {"companyName": 1, "problems": 1})
+    for session in sessions:
+        for problem in session.get("problems") or []:
+            yield {"companyName": session.get("companyName"), "raw": problem, "source": "dsa_sessions",
+                   "uniquenessScore": problem.get("uniquenessScore")}
+    for path in json_files:
+        with open(path) as f:
+            for problem in json.load(f):
+                yield {"companyName": problem.get("companyName"), "raw": problem, "source": path,
+                       "uniquenessScore": problem.get("uniquenessScore")}
+
+
+def build_catalogue(sources: Iterable[Dict[str, Any]]):
+    """Group by company, de-duplicate by title and derive the per-company statistics"""
+    problems_by_company: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    spellings: Dict[str, Counter] = defaultdict(Counter)
+    skipped = 0
+    for i, item in enumerate(sources):
+        key = company_key(item["companyName"] or "")
+        problem = normalize_problem(item["raw"], i) if key else None
+        if problem is None:
+            skipped += 1
+            continue
+        spellings[key][item["companyName"].strip()] += 1
+        title_key = re.sub(r"\W+", " ", problem["title"].lower()).strip()
+        # First source wins: company_dsa_problems carries the uniqueness scores
+        problems_by_company[key].setdefault(title_key, {
+            "company": key, "problemId": problem["id"], "difficulty": problem["difficulty"],
+            "tags": sorted({tag_key(t) for t in problem["topics"]} - {""}),
+            "uniquenessScore": item["uniquenessScore"], "source": item["source"], "problem": problem,
+        })
+
+    built_at = datetime.utcnow()
+    problem_docs, company_docs = [], []
+    for key, by_title in problems_by_company.items():
+        docs = list(by_title.values())
+        seen_ids = Counter()
+        for doc in docs:  # Generated ids repeat across sessions; keep them unique per company
+            seen_ids[doc["problemId"]] += 1
+            if seen_ids[doc["problemId"]] > 1:
+                doc["problemId"] = doc["problem"]["id"] = f"{doc['problemId']}-{seen_ids[doc['problemId']]}"
+        problem_docs.extend(docs)
+
+        topics: Dict[str, Dict[str, Any]] = {}
+        for doc in docs:
+            for topic in doc["problem"]["topics"]:
+                group = topics.setdefault(topic, {"topic": topic, "count": 0,
+                                                  "difficultyBreakdown": dict.fromkeys(DIFFICULTIES, 0),
+                                                  "problemIds": []})
+                group["count"] += 1
+                group["difficultyBreakdown"][doc["difficulty"]] += 1
+                group["problemIds"].append(doc["problemId"])
+        scores = [doc["uniquenessScore"] or 0 for doc in docs]
+        company_docs.append({
+            "company": key,
+            "companyName": spellings[key].most_common(1)[0][0],
+            "totalProblems": len(docs),
+            "difficultyBreakdown": {d: sum(1 for doc in docs if doc["difficulty"] == d) for d in DIFFICULTIES},
+            "topicDistribution": {t: g["count"] for t, g in topics.items()},
+            "averageUniquenessScore": sum(scores) / len(scores),
+            "topics": sorted(topics.values(), key=lambda g: -g["count"]),
+            "tags": sorted({tag for doc in docs for tag in doc["tags"]}),
+            "builtAt": built_at,
+        })
+    return problem_docs, company_docs, skipped
+
+
+def write_catalogue(db, problem_docs: List[Dict[str, Any]], company_docs: List[Dict[str, Any]]):
+    for name, docs in ((PROBLEMS, problem_docs), (COMPANIES, company_docs)):
+        staging = db[name + STAGING_SUFFIX]
+        staging.drop()
+        for start in range(0, len(docs), 1000):
+            staging.insert_many(docs[start:start + 1000], ordered=False)
+        for collection, keys, options in CATALOGUE_INDEXES:
+            if collection == name:
+                staging.create_index(keys, **options)
+    for name in (PROBLEMS, COMPANIES):
+        db[name + STAGING_SUFFIX].rename(name, dropTarget=True)
+
+
+def verify_indexes(db, company: str) -> List[Dict[str, Any]]:
+    """explain() the route queries: each must be answered by an index scan"""
+    queries = [
+        (COMPANIES, {"company": company}),
+        (PROBLEMS, {"company": company, "difficulty": "medium"}),
+        (PROBLEMS, {"company": company, "tags": "array"}),
+    ]
+    rows = []
+    for collection, query in queries:
+        plan = db[collection].find(query).explain()["queryPlanner"]["winningPlan"]
+        stages = json.dumps(plan)
+        rows.append({"collection": collection, "query": ",".join(query), "indexed": "IXSCAN" in stages})
+    return rows
+
+
+def synthetic_problems(companies: int, per_company: int, seed: int) -> List[Dict[str, Any]]:
+    """Synthetic company problems (flagged synthetic) so benchmarks can span 100+ companies"""
+    rng = random.Random(seed)
+    docs = []
+    for c in range(companies):
+        company = f"Benchmark Company {c + 1:03d}"
+        for p in range(per_company):
+            topics = rng.sample(SYNTHETIC_TOPICS, 2)
+            docs.append({
+                "id": f"synthetic-{c + 1}-{p + 1}", "companyName": company, "synthetic": True,
+                "title": f"{company} {topics[0]} Challenge {p + 1}",
+                "description": f"Solve a {topics[0].lower()} problem drawn from {company}'s systems.",
+                "difficulty": rng.choices(DIFFICULTIES, (3, 5, 2))[0], "topics": topics,
+                "uniquenessScore": rng.randint(4, 10),
+                "companyContext": f"{company} production workloads",
+                "realWorldApplication": f"Used in {company}'s services",
+                "expectedComplexity": {"time": "O(n log n)", "space": "O(n)"},
+                "variations": [], "hints": ["Think about the constraints first"], "followUpQuestions": [],
+                "testCases": [{"id": "test-1", "input": "3\n1 2 3", "expectedOutput": "6", "hidden": False}],
+                "companySpecificContext": {"businessUseCase": "", "industryRelevance": "", "scaleRequirements": ""},
+                "generatedAt": datetime.utcnow(),
+            })
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed company DSA catalogue")
+    parser.add_argument("--db", default=None, help="database name (default RECRUITERAI_DB_NAME or Cluster0)")
+    parser.add_argument("--from-json", nargs="*", default=[], help="extra problem files: [{companyName, ...}]")
+    parser.add_argument("--dry-run", action="store_true", help="build and report without writing")
+    parser.add_argument("--synthetic-companies", type=int, default=0,
+                        help="first seed company_dsa_problems with N synthetic companies")
+    parser.add_argument("--synthetic-problems", type=int, default=30, help="problems per synthetic company")
+    parser.add_argument("--purge-synthetic", action="store_true", help="remove synthetic problems, then rebuild")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("📚 RecruiterAI Company DSA Catalogue Builder")
+    print("=" * 60)
+
+    db = get_database(db_name=args.db)
+    # Built in memory and only written past the dry-run guard
+    synthetic = synthetic_problems(args.synthetic_companies, args.synthetic_problems, args.seed)
+
+    with Stopwatch() as build:
+        problem_docs, company_docs, skipped = build_catalogue(
+            collect_sources(db, args.from_json, skip_synthetic=args.purge_synthetic, synthetic=synthetic))
+    print(f"Built {len(problem_docs)} problems for {len(company_docs)} companies in {build.elapsed_ms:.0f}ms "
+          f"({skipped} unusable or fallback problems skipped)")
+
+    largest = sorted(company_docs, key=lambda d: -d["totalProblems"])[:10]
+    print_table([{"company": d["companyName"], "problems": d["totalProblems"], **d["difficultyBreakdown"],
+                  "topics": len(d["topics"]), "tags": len(d["tags"])} for d in largest],
+                ["company", "problems", "easy", "medium", "hard", "topics", "tags"], title="Largest companies")
+
+    if args.dry_run:
+        print("\n(dry run: nothing written)")
+        return 0
+    if not company_docs:
+        print("❌ No usable problems found; the live catalogue was left untouched")
+        return 1
+
+    if args.purge_synthetic:
+        removed = db.company_dsa_problems.delete_many({"synthetic": True}).deleted_count
+        print(f"🧹 Removed {removed} synthetic problems")
+    if synthetic:
+        db.company_dsa_problems.insert_many(synthetic, ordered=False)
+        print(f"🧪 Seeded {len(synthetic)} synthetic problems for {args.synthetic_companies} companies")
+
+    with Stopwatch() as write:
+        write_catalogue(db, problem_docs, company_docs)
+    print(f"\n💾 Wrote {PROBLEMS} and {COMPANIES} in {write.elapsed_ms:.0f}ms")
+
+    rows = verify_indexes(db, largest[0]["company"])
+    print_table(rows, ["collection", "query", "indexed"], title="Route query plans")
+    return 0 if all(row["indexed"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
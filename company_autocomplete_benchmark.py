@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Company Autocomplete Keystroke Replay Benchmark for RecruiterAI
+Replays typing of company names one keystroke at a time against /api/company-search
+and reports per-keystroke latency and how often the local prefix index answered.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+import requests
+
+from perf_harness import DEFAULT_BASE_URL, print_table, summarize
+
+
+class AutocompleteBenchmark:
+    def __init__(self, base_url: str = DEFAULT_BASE_URL):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.sources: Counter = Counter()
+        self.empty_results = 0
+
+    def keystroke(self, prefix: str) -> float:
+        start = time.perf_counter()
+        response = self.session.post(f"{self.base_url}/api/company-search", json={"query": prefix}, timeout=15)
+        elapsed = (time.perf_counter() - start) * 1000
+        data = response.json() if response.status_code == 200 else {}
+        self.sources[data.get("source", "error" if response.status_code != 200 else "none")] += 1
+        if not data.get("companies"):
+            self.empty_results += 1
+        return elapsed
+
+    def replay(self, words: List[str], rounds: int):
+        # The route rejects queries shorter than 2 characters, so typing starts at the 2nd key
+        for _ in range(rounds):
+            for word in words:
+                for end in range(2, len(word) + 1):
+                    self.latencies[word].append(self.keystroke(word[:end]))
+
+    def report(self) -> float:
+        rows = []
+        all_samples: List[float] = []
+        for word, samples in self.latencies.items():
+            stats = summarize(samples)
+            all_samples.extend(samples)
+            rows.append({"word": word, "keystrokes": stats["count"], "p50_ms": stats["p50"],
+                         "p99_ms": stats["p99"], "max_ms": stats["max"]})
+        overall = summarize(all_samples)
+        rows.append({"word": "ALL", "keystrokes": overall["count"], "p50_ms": overall["p50"],
+                     "p99_ms": overall["p99"], "max_ms": overall["max"]})
+        print_table(rows, ["word", "keystrokes", "p50_ms", "p99_ms", "max_ms"], title="Per-keystroke latency")
+        print_table([{"source": s, "responses": n} for s, n in self.sources.most_common()],
+                    ["source", "responses"], title="Answer source")
+        print(f"  Keystrokes with no suggestions: {self.empty_results}")
+        return overall["p99"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay company autocomplete keystrokes")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--words", nargs="+", default=["goog", "micro", "amaz"])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--p99-budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    print("⌨️ RecruiterAI Company Autocomplete Benchmark")
+    print("=" * 60)
+
+    bench = AutocompleteBenchmark(args.base_url)
+    try:
+        bench.replay(args.words, args.rounds)
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    p99 = bench.report()
+    if p99 > args.p99_budget_ms:
+        print(f"⚠️ Keystroke p99 {p99:.1f}ms exceeds budget {args.p99_budget_ms:.0f}ms")
+        return 1
+    print(f"✅ Keystroke p99 {p99:.1f}ms within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Company Intelligence Cache Benchmark for RecruiterAI
+Measures cold vs warm latency of /api/company-intelligence and request coalescing
+under a burst of concurrent misses for the same company.
+
+Requires a non-production server (the cache reset endpoint is disabled in production).
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import requests
+
+from perf_harness import DEFAULT_BASE_URL, print_table, run_concurrent, summarize
+
+
+class CompanyCacheBenchmark:
+    def __init__(self, base_url: str = DEFAULT_BASE_URL):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+
+    def reset_cache(self, scope: str = "all"):
+        response = self.session.delete(f"{self.base_url}/api/company-intelligence?scope={scope}", timeout=30)
+        if response.status_code != 200:
+            raise RuntimeError(f"Cache reset failed ({response.status_code}): {response.text[:200]}")
+
+    def cache_metrics(self) -> Dict:
+        response = self.session.get(f"{self.base_url}/api/company-intelligence?type=cache-stats", timeout=30)
+        response.raise_for_status()
+        return response.json()["data"]["intelligence"]
+
+    def lookup(self, company: str) -> Tuple[float, str, int]:
+        start = time.perf_counter()
+        response = requests.post(
+            f"{self.base_url}/api/company-intelligence",
+            json={"companyName": company, "jobTitle": "Senior Software Engineer"},
+            timeout=60,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, response.headers.get("X-Cache", "?"), response.status_code
+
+    def measure_cold_warm(self, companies: List[str], warm_rounds: int) -> List[Dict]:
+        print("\n🧊 Cold vs warm lookups")
+        print("=" * 50)
+        self.reset_cache("all")
+        cold = {c: self.lookup(c) for c in companies}
+        warm: Dict[str, List[float]] = {c: [] for c in companies}
+        warm_hits = 0
+        for _ in range(warm_rounds):
+            for company in companies:
+                elapsed, cache, _ = self.lookup(company)
+                warm[company].append(elapsed)
+                warm_hits += cache.startswith("HIT")
+
+        # Persistence across restarts: memory tier cleared, Mongo tier kept
+        self.reset_cache("memory")
+        persistent = {c: self.lookup(c) for c in companies}
+
+        print(f"Warm hit ratio: {warm_hits}/{warm_rounds * len(companies)}")
+        return [
+            {
+                "company": c,
+                "cold_ms": cold[c][0],
+                "cold_cache": cold[c][1],
+                "warm_p50_ms": summarize(warm[c])["p50"],
+                "warm_p99_ms": summarize(warm[c])["p99"],
+                "persistent_ms": persistent[c][0],
+                "persistent_cache": persistent[c][1],
+            }
+            for c in companies
+        ]
+
+    def measure_burst(self, company: str, burst: int) -> Dict:
+        print(f"\n💥 Burst of {burst} concurrent misses for '{company}'")
+        print("=" * 50)
+        self.reset_cache("all")
+        before = self.cache_metrics()
+        results = run_concurrent(lambda _: self.lookup(company), range(burst), burst)
+        after = self.cache_metrics()
+        latencies = [r[0] for r in results]
+        stats = summarize(latencies)
+        return {
+            "company": company,
+            "requests": burst,
+            "upstream_calls": after["misses"] - before["misses"],
+            "coalesced": after["coalesced"] - before["coalesced"],
+            "memory_hits": after["hits"] - before["hits"],
+            "errors": sum(1 for r in results if r[2] != 200),
+            "p50_ms": stats["p50"],
+            "p99_ms": stats["p99"],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the company intelligence cache")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--companies", nargs="+", default=["Google", "Microsoft", "Amazon", "Apple", "Netflix"])
+    parser.add_argument("--warm-rounds", type=int, default=5)
+    parser.add_argument("--burst", type=int, default=20)
+    args = parser.parse_args()
+
+    print("🏢 RecruiterAI Company Intelligence Cache Benchmark")
+    print("=" * 60)
+
+    bench = CompanyCacheBenchmark(args.base_url)
+    try:
+        rows = bench.measure_cold_warm(args.companies, args.warm_rounds)
+        burst = bench.measure_burst(args.companies[0], args.burst)
+    except (requests.RequestException, RuntimeError) as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    print_table(rows, ["company", "cold_ms", "cold_cache", "warm_p50_ms", "warm_p99_ms",
+                       "persistent_ms", "persistent_cache"], title="Cold vs warm latency")
+    print_table([burst], ["company", "requests", "upstream_calls", "coalesced", "memory_hits",
+                          "errors", "p50_ms", "p99_ms"], title="Burst coalescing")
+    print_table([bench.cache_metrics()], ["size", "maxEntries", "hits", "persistentHits", "misses",
+                                          "coalesced", "evictions", "hitRate"], title="Cache metrics")
+
+    if burst["upstream_calls"] > 1:
+        print(f"⚠️ Burst triggered {burst['upstream_calls']} upstream calls - coalescing not effective")
+        return 1
+    print("✅ Burst coalesced into a single upstream call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
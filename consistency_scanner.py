@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Bulk Consistency Scanner & Repair Tool for RecruiterAI
+Offline replacement for the /api/fix-completed-interviews round-trips: scans the
+interviews, questions, performances and interview_sessions collections in
+parallel _id ranges, detects userId/interviewId type mismatches and
+status/completedAt drift, and repairs them with ordered bulk_write batches.
+
+Usage:
+    MONGODB_URI=... python consistency_scanner.py                  # report only
+    MONGODB_URI=... python consistency_scanner.py --repair --workers 8
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from perf_harness import DEFAULT_DB_NAME, get_database, print_table
+
+# Only the fields the rules look at are fetched
+PROJECTIONS = {
+    "interviews": {"userId": 1, "status": 1, "completedAt": 1, "updatedAt": 1, "createdAt": 1, "performanceId": 1},
+    "performances": {"userId": 1, "interviewId": 1, "completedAt": 1},
+    "questions": {"interviewId": 1},
+    "interview_sessions": {"interviewId": 1, "status": 1, "completedAt": 1, "updatedAt": 1},
+}
+
+
+def _as_object_id(value: Any):
+    """ObjectId for a 24-hex string, None when the value is not convertible"""
+    from bson import ObjectId
+
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    return None
+
+
+def check_interview(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    fixes: Dict[str, Any] = {}
+    issues: List[str] = []
+    # interviews.userId stays a string: create-interview writes it that way and the
+    # interview routes query it with the session's string id
+    if doc.get("status") == "completed" and not doc.get("completedAt"):
+        fixes["completedAt"] = doc.get("updatedAt") or doc.get("createdAt") or datetime.utcnow()
+        issues.append("interviews.completed_without_completedAt")
+    if doc.get("status") != "completed" and doc.get("performanceId"):
+        fixes["status"] = "completed"
+        if not doc.get("completedAt"):
+            fixes["completedAt"] = doc.get("updatedAt") or datetime.utcnow()
+        issues.append("interviews.performance_but_not_completed")
+    return fixes, issues
+
+
+def check_performance(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    fixes: Dict[str, Any] = {}
+    issues: List[str] = []
+    for field in ("userId", "interviewId"):
+        oid = _as_object_id(doc.get(field))
+        if oid is not None:
+            fixes[field] = oid
+            issues.append(f"performances.{field}_string")
+    return fixes, issues
+
+
+def check_questions(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    from bson import ObjectId
+
+    # The routes look questions up by the string form of the interview id
+    if isinstance(doc.get("interviewId"), ObjectId):
+        return {"interviewId": str(doc["interviewId"])}, ["questions.interviewId_objectid"]
+    return {}, []
+
+
+def check_session(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    from bson import ObjectId
+
+    fixes: Dict[str, Any] = {}
+    issues: List[str] = []
+    if isinstance(doc.get("interviewId"), ObjectId):
+        fixes["interviewId"] = str(doc["interviewId"])
+        issues.append("interview_sessions.interviewId_objectid")
+    if doc.get("status") == "completed" and not doc.get("completedAt"):
+        fixes["completedAt"] = doc.get("updatedAt") or datetime.utcnow()
+        issues.append("interview_sessions.completed_without_completedAt")
+    return fixes, issues
+
+
+RULES = {
+    "interviews": check_interview,
+    "performances": check_performance,
+    "questions": check_questions,
+    "interview_sessions": check_session,
+}
+
+
+class ConsistencyScanner:
+    def __init__(self, db, workers: int = 4, batch_size: int = 1000, repair: bool = False):
+        self.db = db
+        self.workers = workers
+        self.batch_size = batch_size
+        self.repair = repair
+        self.lock = threading.Lock()
+        self.issues: Counter = Counter()
+        self.scanned: Counter = Counter()
+        self.repaired: Counter = Counter()
+        self.elapsed: Dict[str, float] = {}
+
+    def log(self, message: str):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {message}")
+
+    def partitions(self, collection: str, count: int) -> List[Tuple[Any, Any]]:
+        """Split the _id space into contiguous ranges by ObjectId timestamp"""
+        from bson import ObjectId
+
+        coll = self.db[collection]
+        first = coll.find_one({}, {"_id": 1}, sort=[("_id", 1)])
+        last = coll.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        if not first or not isinstance(first["_id"], ObjectId) or not isinstance(last["_id"], ObjectId):
+            return [(None, None)]
+
+        start = first["_id"].generation_time.timestamp()
+        end = last["_id"].generation_time.timestamp() + 1
+        step = max(1.0, (end - start) / count)
+        bounds = [first["_id"]]
+        t = start + step
+        while t < end:
+            bounds.append(ObjectId.from_datetime(datetime.utcfromtimestamp(t)))
+            t += step
+        ranges: List[Tuple[Any, Any]] = [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+        ranges.append((bounds[-1], None))
+        return ranges
+
+    def _flush(self, collection: str, ops: List[Any], key: str):
+        if not ops:
+            return
+        if self.repair:
+            result = self.db[collection].bulk_write(ops, ordered=True)
+            with self.lock:
+                self.repaired[key] += result.modified_count
+        ops.clear()
+
+    def scan_range(self, collection: str, bounds: Tuple[Any, Any]):
+        from pymongo import UpdateOne
+
+        lo, hi = bounds
+        id_filter: Dict[str, Any] = {}
+        if lo is not None:
+            id_filter["$gte"] = lo
+        if hi is not None:
+            id_filter["$lt"] = hi
+        query = {"_id": id_filter} if id_filter else {}
+        rule = RULES[collection]
+
+        ops: List[Any] = []
+        completed_by_perf: List[Dict[str, Any]] = []
+        scanned = 0
+        local_issues: Counter = Counter()
+        cursor = self.db[collection].find(query, PROJECTIONS[collection], batch_size=self.batch_size)
+        for doc in cursor:
+            scanned += 1
+            fixes, issues = rule(doc)
+            local_issues.update(issues)
+            if fixes:
+                ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": fixes}))
+            if collection == "performances":
+                completed_by_perf.append(doc)
+                if len(completed_by_perf) >= self.batch_size:
+                    self._reconcile_interviews(completed_by_perf)
+            if len(ops) >= self.batch_size:
+                self._flush(collection, ops, collection)
+        self._flush(collection, ops, collection)
+        if completed_by_perf:
+            self._reconcile_interviews(completed_by_perf)
+
+        with self.lock:
+            self.scanned[collection] += scanned
+            self.issues.update(local_issues)
+
+    def _reconcile_interviews(self, performances: List[Dict[str, Any]]):
+        """Interviews that have a performance document must be marked completed"""
+        from bson import ObjectId
+        from pymongo import UpdateOne
+
+        by_interview: Dict[Any, Dict[str, Any]] = {}
+        for perf in performances:
+            interview_id = perf.get("interviewId")
+            if isinstance(interview_id, str) and ObjectId.is_valid(interview_id):
+                interview_id = ObjectId(interview_id)
+            if isinstance(interview_id, ObjectId):
+                by_interview[interview_id] = perf
+        performances.clear()
+        if not by_interview:
+            return
+
+        drifted = self.db.interviews.find(
+            {"_id": {"$in": list(by_interview)}, "status": {"$ne": "completed"}}, {"_id": 1})
+        ops = []
+        for interview in drifted:
+            perf = by_interview[interview["_id"]]
+            ops.append(UpdateOne({"_id": interview["_id"]}, {"$set": {
+                "status": "completed",
+                "completedAt": perf.get("completedAt") or datetime.utcnow(),
+                "performanceId": perf["_id"],
+            }}))
+        with self.lock:
+            self.issues["performances.interview_not_completed"] += len(ops)
+        self._flush("interviews", ops, "interviews (from performances)")
+
+    def scan_collection(self, collection: str):
+        from concurrent.futures import ThreadPoolExecutor
+
+        ranges = self.partitions(collection, self.workers * 4)
+        self.log(f"🔍 Scanning {collection} in {len(ranges)} ranges with {self.workers} workers")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for future in [pool.submit(self.scan_range, collection, r) for r in ranges]:
+                future.result()
+        self.elapsed[collection] = time.perf_counter() - start
+
+    def run(self, collections: Optional[List[str]] = None):
+        # Interviews first so the performance reconciliation sees converted userIds
+        for collection in collections or list(RULES):
+            self.scan_collection(collection)
+
+    def report(self):
+        print_table(
+            [
+                {
+                    "collection": name,
+                    "scanned": self.scanned[name],
+                    "seconds": self.elapsed.get(name, 0.0),
+                    "docs/sec": self.scanned[name] / self.elapsed[name] if self.elapsed.get(name) else 0.0,
+                    "repaired": self.repaired[name],
+                }
+                for name in self.elapsed
+            ],
+            ["collection", "scanned", "seconds", "docs/sec", "repaired"],
+            title="Scan throughput",
+        )
+        print_table(
+            [{"issue": issue, "count": count} for issue, count in self.issues.most_common()],
+            ["issue", "count"],
+            title="Detected inconsistencies",
+        )
+        if self.repaired.get("interviews (from performances)"):
+            print(f"  Interviews completed from performances: {self.repaired['interviews (from performances)']}")
+        if not self.repair and self.issues:
+            print("\nℹ️ Report only - rerun with --repair to apply the fixes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan and repair RecruiterAI collection consistency")
+    parser.add_argument("--db", default=DEFAULT_DB_NAME)
+    parser.add_argument("--workers", type=int, default=4, help="parallel range scanners")
+    parser.add_argument("--batch-size", type=int, default=1000, help="cursor and bulk_write batch size")
+    parser.add_argument("--collection", action="append", choices=list(RULES),
+                        help="limit the scan to these collections")
+    parser.add_argument("--repair", action="store_true", help="apply fixes (default: report only)")
+    args = parser.parse_args()
+
+    print("🧰 RecruiterAI Consistency Scanner")
+    print("=" * 60)
+
+    scanner = ConsistencyScanner(get_database(db_name=args.db), args.workers, args.batch_size, args.repair)
+    scanner.run(args.collection)
+    scanner.report()
+    return 0 if args.repair or not scanner.issues else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
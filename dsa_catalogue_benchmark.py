@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Company DSA Catalogue Benchmark for RecruiterAI
+Compares on-demand company DSA work with precomputed catalogue lookups across every
+company in the catalogue built by build_dsa_catalogue.py (seed 100+ companies with
+--synthetic-companies there first):
+
+  stats     GET /api/company-dsa-stats?company=X with catalogue=false (regex scan of
+            company_dsa_problems aggregated per request) vs the catalogue document
+  problems  POST /api/generate-company-dsa with "useCatalogue": false (LLM generation
+            against the offline mock from mock_llm.py) vs catalogue sampling.
+            Needs a signed-in session cookie (--cookie); skipped without one.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, get_database, print_table, run_concurrent, summarize
+
+STATS_ROUTE = "/api/company-dsa-stats"
+GENERATE_ROUTE = "/api/generate-company-dsa"
+
+
+def catalogue_companies(limit: int) -> List[Dict[str, object]]:
+    db = get_database()
+    return list(db.dsa_catalogue_companies.find({}, {"_id": 0, "companyName": 1, "totalProblems": 1,
+                                                     "difficultyBreakdown": 1}).limit(limit))
+
+
+def fetch_stats(base_url: str, company: str, use_catalogue: bool, timeout: float) -> Dict[str, object]:
+    params = {"company": company} if use_catalogue else {"company": company, "catalogue": "false"}
+    with Stopwatch() as sw:
+        response = requests.get(f"{base_url}{STATS_ROUTE}", params=params, timeout=timeout)
+    body = response.json() if response.status_code == 200 else {}
+    return {"ms": sw.elapsed_ms, "ok": response.status_code == 200, "source": body.get("source"),
+            "total": body.get("statistics", {}).get("totalProblems")}
+
+
+def fetch_problems(base_url: str, cookie: str, company: str, difficulty: str, count: int, use_catalogue: bool,
+                   timeout: float) -> Dict[str, object]:
+    body = {"companyName": company, "difficulty": difficulty, "count": count, "includeCompiler": False,
+            "useCatalogue": use_catalogue}
+    with Stopwatch() as sw:
+        response = requests.post(f"{base_url}{GENERATE_ROUTE}", json=body, headers={"Cookie": cookie},
+                                 timeout=timeout)
+    data = response.json() if response.status_code == 200 else {}
+    return {"ms": sw.elapsed_ms, "ok": len(data.get("problems", [])) == count,
+            "source": data.get("metadata", {}).get("aiProvider")}
+
+
+def arm_row(label: str, results: List[Dict[str, object]], wall_ms: float,
+            llm_calls: Optional[int] = None) -> Dict[str, object]:
+    latency = summarize([r["ms"] for r in results if r["ok"]])
+    sources: Dict[str, int] = {}
+    for r in results:
+        sources[str(r["source"])] = sources.get(str(r["source"]), 0) + 1
+    return {"arm": label, "ok": f"{sum(1 for r in results if r['ok'])}/{len(results)}", "p50": latency["p50"],
+            "p90": latency["p90"], "p99": latency["p99"], "max": latency["max"],
+            "req/s": len(results) / (wall_ms / 1000) if wall_ms else 0.0,
+            "sources": ", ".join(f"{k}={v}" for k, v in sorted(sources.items())),
+            "llm calls": "-" if llm_calls is None else llm_calls}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="On-demand vs catalogue company DSA benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--companies", type=int, default=150, help="at most this many catalogue companies")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--cookie", help="session cookie for /api/generate-company-dsa")
+    parser.add_argument("--generate-companies", type=int, default=20, help="companies for the problems arms")
+    parser.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard"])
+    parser.add_argument("--count", type=int, default=3, help="problems per request")
+    parser.add_argument("--timeout", type=float, default=120)
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["dsa=3000:1500"])
+    args = parser.parse_args()
+
+    print("🗂️  RecruiterAI Company DSA Catalogue Benchmark")
+    print("=" * 60)
+
+    companies = catalogue_companies(args.companies)
+    if not companies:
+        print("❌ The catalogue is empty; run build_dsa_catalogue.py first")
+        return 1
+    if len(companies) < 100:
+        print(f"⚠️  Only {len(companies)} catalogue companies; seed more with "
+              f"build_dsa_catalogue.py --synthetic-companies 120")
+    names = [c["companyName"] for c in companies]
+    print(f"{len(names)} companies, {sum(c['totalProblems'] for c in companies)} catalogued problems")
+
+    rows, mismatches = [], 0
+    try:
+        stats_results = {}
+        for label, use_catalogue in (("stats on-demand", False), ("stats catalogue", True)):
+            with Stopwatch() as wall:
+                results = run_concurrent(lambda name: fetch_stats(args.base_url, name, use_catalogue, args.timeout),
+                                         names, args.concurrency)
+            stats_results[label] = results
+            rows.append(arm_row(label, results, wall.elapsed_ms))
+        # On-demand matches company names by substring, so it can count a few extra problems
+        mismatches = sum(1 for a, b in zip(*stats_results.values()) if a["total"] != b["total"])
+
+        if args.cookie:
+            # Only companies the catalogue can actually serve at this difficulty
+            eligible = [c["companyName"] for c in companies
+                        if c["difficultyBreakdown"].get(args.difficulty, 0) >= args.count][:args.generate_companies]
+            mock = mock_from_args(args).start()
+            print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+            try:
+                for label, use_catalogue in (("problems generated", False), ("problems catalogue", True)):
+                    mock.llm.reset_stats()
+                    with Stopwatch() as wall:
+                        results = run_concurrent(
+                            lambda name: fetch_problems(args.base_url, args.cookie, name, args.difficulty, args.count,
+                                                        use_catalogue, args.timeout),
+                            eligible, args.concurrency)
+                    rows.append(arm_row(label, results, wall.elapsed_ms, mock.llm.snapshot().get("requests", 0)))
+            finally:
+                mock.stop()
+        else:
+            print("ℹ️  No --cookie: skipping the /api/generate-company-dsa arms")
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    print_table(rows, ["arm", "ok", "p50", "p90", "p99", "max", "req/s", "llm calls", "sources"],
+                title="On-demand vs catalogue (ms)")
+    print(f"\n  Stats differing between on-demand and catalogue: {mismatches}/{len(names)}")
+    for on_demand, catalogue in zip(rows[::2], rows[1::2]):
+        if catalogue["p50"]:
+            print(f"  {catalogue['arm'].split()[0]}: p50 {on_demand['p50']:.1f}ms → {catalogue['p50']:.1f}ms "
+                  f"({on_demand['p50'] / catalogue['p50']:.1f}x)")
+    return 0 if all(row["ok"].split("/")[0] == row["ok"].split("/")[1] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
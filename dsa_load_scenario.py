@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Concurrent DSA Submission Load Scenario for RecruiterAI
+Simulates an interview peak: many candidates press "Run" at the same moment with
+different languages and test-case counts, against the local Judge0 stand-in.
+
+For every submission the total latency is split into
+  queue_ms     longest time one of its test cases waited for a Judge0 worker
+  exec_ms      longest execution of one of its test cases (they run in parallel)
+  overhead_ms  everything outside Judge0: HTTP, polling slack, auth, Mongo writes
+and per-user latency is checked for fairness (Jain's index, worst/best ratio).
+
+  --mode direct  the harness plays the app's Judge0 client (batch + adaptive polling)
+  --mode app     posts to /api/execute-dsa-code on a dev server started with
+                 JUDGE0_BASE_URL=http://localhost:<judge0-port> JUDGE0_API_KEY=local
+"""
+
+import argparse
+import base64
+import random
+import sys
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from judge0_batch_benchmark import ClientStrategies
+from local_judge0 import LocalJudge0Server
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, run_concurrent, summarize
+
+# Every solution sums the integers on stdin, so any test case is valid for any language
+SOLUTIONS = {
+    "python": (71, "#", "import sys\nprint(sum(int(x) for x in sys.stdin.read().split()))\n"),
+    "javascript": (63, "//", "const data = require('fs').readFileSync(0, 'utf8').trim();\n"
+                             "console.log(data ? data.split(/\\s+/).map(Number).reduce((a, b) => a + b, 0) : 0);\n"),
+    "cpp": (54, "//", "#include <iostream>\nint main() { long long x, s = 0; while (std::cin >> x) s += x; "
+                      "std::cout << s << std::endl; return 0; }\n"),
+}
+
+
+class SubmissionPlan:
+    def __init__(self, user: int, seq: int, language: str, test_cases: int, rng: random.Random):
+        self.user = f"candidate-{user:03d}"
+        self.seq = seq
+        self.language = language
+        self.marker = f"load-{uuid.uuid4().hex[:12]}"
+        _, comment, body = SOLUTIONS[language]
+        self.source = f"{comment} {self.marker}\n{body}"
+        self.cases = []
+        for i in range(test_cases):
+            numbers = [rng.randint(-1000, 1000) for _ in range(rng.randint(1, 50))]
+            self.cases.append({"id": f"tc-{i + 1}", "input": " ".join(map(str, numbers)),
+                               "expectedOutput": str(sum(numbers))})
+
+
+class DirectClient(ClientStrategies):
+    """The batch strategy from judge0_batch_benchmark with prebuilt submissions"""
+
+    def _submission(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        return case
+
+
+class DSALoadScenario:
+    def __init__(self, server: LocalJudge0Server, mode: str, base_url: str, cookie: Optional[str]):
+        self.server = server
+        self.mode = mode
+        self.base_url = base_url.rstrip("/")
+        self.cookie = cookie
+        self.local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+            if self.cookie:
+                self.local.session.headers["Cookie"] = self.cookie
+        return self.local.session
+
+    def _run_direct(self, plan: SubmissionPlan) -> int:
+        language_id = SOLUTIONS[plan.language][0]
+        client = DirectClient(self.server.url)
+        client.session = self._session()
+        payloads = [{
+            "source_code": base64.b64encode(plan.source.encode()).decode(),
+            "language_id": language_id,
+            "stdin": base64.b64encode(case["input"].encode()).decode(),
+            "expected_output": base64.b64encode(case["expectedOutput"].encode()).decode(),
+        } for case in plan.cases]
+        return sum(1 for r in client.batch(payloads) if r["status"]["id"] == 3)
+
+    def _run_app(self, plan: SubmissionPlan) -> int:
+        response = self._session().post(f"{self.base_url}/api/execute-dsa-code", timeout=120, json={
+            "sourceCode": plan.source,
+            "language": plan.language,
+            "companyName": "Load Test",
+            "problem": {"id": "load-sum", "title": "Sum of integers", "difficulty": "easy",
+                        "testCases": plan.cases},
+        })
+        response.raise_for_status()
+        results = response.json().get("execution", {}).get("testResults") or []
+        return sum(1 for r in results if r.get("passed"))
+
+    def execute(self, plan: SubmissionPlan) -> Dict[str, Any]:
+        record = {"user": plan.user, "language": plan.language, "test_cases": len(plan.cases),
+                  "passed": 0, "error": None, "total_ms": 0.0}
+        with Stopwatch() as sw:
+            try:
+                record["passed"] = self._run_direct(plan) if self.mode == "direct" else self._run_app(plan)
+            except Exception as e:
+                record["error"] = str(e)[:120]
+        record["total_ms"] = sw.elapsed_ms
+        record.update(self._judge_breakdown(plan, sw.elapsed_ms))
+        return record
+
+    def _judge_breakdown(self, plan: SubmissionPlan, total_ms: float) -> Dict[str, float]:
+        timings = [s.timings() for s in self.server.judge.find(plan.marker)]
+        timings = [t for t in timings if t["finished"]]
+        if not timings:
+            return {"queue_ms": 0.0, "exec_ms": 0.0, "overhead_ms": total_ms}
+        span_ms = (max(t["finished"] for t in timings) - min(t["enqueued"] for t in timings)) * 1000
+        return {
+            "queue_ms": max(t["queue_ms"] for t in timings),
+            "exec_ms": max(t["exec_ms"] for t in timings),
+            "overhead_ms": max(0.0, total_ms - span_ms),
+        }
+
+    def run_user(self, plans: List[SubmissionPlan], barrier: threading.Barrier) -> List[Dict[str, Any]]:
+        barrier.wait()
+        # A candidate presses "Run" again only after seeing the previous result
+        return [self.execute(plan) for plan in plans]
+
+
+def build_plans(users: int, per_user: int, languages: List[str], counts: List[int], seed: int) -> List[List[SubmissionPlan]]:
+    rng = random.Random(seed)
+    return [[SubmissionPlan(u, j, languages[(u + j) % len(languages)], rng.choice(counts), rng)
+             for j in range(per_user)] for u in range(users)]
+
+
+def jain_index(values: List[float]) -> float:
+    if not values:
+        return 0.0
+    return sum(values) ** 2 / (len(values) * sum(v * v for v in values))
+
+
+def report(records: List[Dict[str, Any]], baseline: Dict[str, float], wall_ms: float):
+    ok = [r for r in records if not r["error"]]
+    errors = len(records) - len(ok)
+
+    groups: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for r in ok:
+        groups[(r["language"], r["test_cases"])].append(r)
+    rows = []
+    for (language, count), items in sorted(groups.items()):
+        total = summarize([r["total_ms"] for r in items])
+        rows.append({"language": language, "test_cases": count, "runs": len(items),
+                     "total_p50": total["p50"], "total_p99": total["p99"],
+                     "queue_p50": summarize([r["queue_ms"] for r in items])["p50"],
+                     "exec_p50": summarize([r["exec_ms"] for r in items])["p50"],
+                     "overhead_p50": summarize([r["overhead_ms"] for r in items])["p50"]})
+    print_table(rows, ["language", "test_cases", "runs", "total_p50", "total_p99", "queue_p50",
+                       "exec_p50", "overhead_p50"], title="Latency breakdown (ms)")
+
+    overall = {k: summarize([r[k] for r in ok]) for k in ("total_ms", "queue_ms", "exec_ms", "overhead_ms")}
+    print_table([{"component": k, **{m: v for m, v in s.items() if m != "count"}} for k, s in overall.items()],
+                ["component", "avg", "p50", "p90", "p99", "max"], title="Overall components (ms)")
+
+    per_user: Dict[str, List[float]] = defaultdict(list)
+    for r in ok:
+        per_user[r["user"]].append(r["total_ms"])
+    means = {user: sum(v) / len(v) for user, v in per_user.items()}
+    ranked = sorted(means.items(), key=lambda item: item[1])
+    print_table([{"user": u, "mean_ms": m, "submissions": len(per_user[u])} for u, m in ranked[-5:][::-1]],
+                ["user", "mean_ms", "submissions"], title="Slowest candidates")
+
+    print("\n⚖️ Fairness")
+    print(f"  Jain's index over per-user mean latency: {jain_index(list(means.values())):.3f} (1.0 = perfectly fair)")
+    if ranked:
+        print(f"  Worst / best candidate mean: {ranked[-1][1] / max(ranked[0][1], 1e-6):.2f}x")
+
+    # Head-of-line blocking: small runs stuck behind big ones wait far longer than they execute
+    smallest = min((r["test_cases"] for r in ok), default=0)
+    small = [r for r in ok if r["test_cases"] == smallest]
+    blocked = [r for r in ok if r["queue_ms"] > r["exec_ms"]]
+    print("\n🚦 Head-of-line blocking")
+    print(f"  Submissions that queued longer than they executed: {len(blocked)}/{len(ok)}")
+    if small and baseline:
+        solo = sum(baseline.values()) / len(baseline)
+        small_p99 = summarize([r["total_ms"] for r in small])["p99"]
+        print(f"  Smallest runs ({small[0]['test_cases']} test case(s)) p99 {small_p99:.0f}ms vs solo {solo:.0f}ms "
+              f"({small_p99 / max(solo, 1e-6):.1f}x)")
+
+    throughput = len(ok) / (wall_ms / 1000) if wall_ms else 0
+    print(f"\n  Completed {len(ok)} submissions in {wall_ms / 1000:.1f}s ({throughput:.1f}/s), errors: {errors}")
+    for r in [r for r in records if r["error"]][:5]:
+        print(f"  ❌ {r['user']} {r['language']}: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent DSA submission load scenario")
+    parser.add_argument("--mode", choices=["direct", "app"], default="direct")
+    parser.add_argument("--users", type=int, default=30, help="candidates pressing Run at the same time (K)")
+    parser.add_argument("--submissions-per-user", type=int, default=2)
+    parser.add_argument("--languages", nargs="+", choices=sorted(SOLUTIONS), default=["python", "javascript", "cpp"])
+    parser.add_argument("--test-case-counts", type=int, nargs="+", default=[1, 3, 5, 10])
+    parser.add_argument("--workers", type=int, default=4, help="Judge0 stand-in worker count")
+    parser.add_argument("--queue-depth", type=int, default=500)
+    parser.add_argument("--judge0-port", type=int, default=2358)
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--cookie", help="session cookie for /api/execute-dsa-code in app mode")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("🏁 RecruiterAI Concurrent DSA Submission Scenario")
+    print("=" * 60)
+
+    port = args.judge0_port if args.mode == "app" else 0
+    with LocalJudge0Server(port=port, workers=args.workers, queue_depth=args.queue_depth) as server:
+        languages = [l for l in args.languages if SOLUTIONS[l][0] in server.judge.languages]
+        if not languages:
+            print("❌ None of the requested languages is installed locally")
+            return 1
+        print(f"Judge0 stand-in {server.url}: {args.workers} workers, queue depth {args.queue_depth}")
+        print(f"{args.users} candidates x {args.submissions_per_user} runs, languages: {', '.join(languages)}")
+
+        scenario = DSALoadScenario(server, args.mode, args.base_url, args.cookie)
+
+        # Solo baseline: one single-test-case run per language on an idle backend
+        baseline = {}
+        for language in languages:
+            record = scenario.execute(SubmissionPlan(0, 0, language, 1, random.Random(args.seed)))
+            if record["error"]:
+                print(f"❌ Baseline {language} run failed: {record['error']}")
+                return 1
+            baseline[language] = record["total_ms"]
+        print("Solo baseline: " + ", ".join(f"{l} {ms:.0f}ms" for l, ms in baseline.items()))
+
+        plans = build_plans(args.users, args.submissions_per_user, languages, args.test_case_counts, args.seed)
+        barrier = threading.Barrier(len(plans))
+        with Stopwatch() as wall:
+            per_user = run_concurrent(lambda p: scenario.run_user(p, barrier), plans, len(plans))
+        records = [r for user_records in per_user for r in user_records]
+        print(f"Peak Judge0 queue: {server.judge.snapshot()['max_queue_seen']}")
+
+    report(records, baseline, wall.elapsed_ms)
+    return 0 if all(not r["error"] for r in records) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
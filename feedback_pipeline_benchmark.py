@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Feedback Pipeline Comparison Benchmark for RecruiterAI
+Seeds identical completed interviews of several sizes, with and without DSA problems
+and their dsa_executions, and runs each end-of-interview feedback pipeline on its own
+copy against the offline mock LLM (mock_llm.py):
+
+  fast-feedback                  /api/fast-feedback                  (GroqAIService)
+  optimized-feedback             /api/optimized-feedback             (OptimizedFeedbackService)
+  groq-overall-performance       /api/groq-overall-performance       (OptimizedFeedbackService)
+  optimized-overall-performance  /api/optimized-overall-performance  (OptimizedAIService; takes
+                                 the questions and answers in the body)
+
+Per pipeline and interview shape it reports latency, LLM calls and tokens
+(X-LLM-Usage), server heap/RSS delta (X-Memory-Delta-KB) and, with --profile, the
+MongoDB operations each request issued (attributed through the x-correlation-id query
+comment; needs a local mongod, the profiler is unavailable on Atlas shared tiers).
+It then diffs the structural shape of the responses: where each pipeline puts the
+common feedback fields, which paths only some pipelines return, and whether a
+pipeline's shape changes with interview size or DSA content.
+
+Requests run one at a time so memory deltas belong to a single request. Seeded
+documents are tagged with the run id and removed afterwards unless --keep is given.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GEMINI_BASE_URL=http://localhost:2360 \\
+        GROQ_API_KEY=local GEMINI_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Set
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from mongo_profiler import ProfilerCapture, entry_comment
+from perf_harness import (CORRELATION_HEADER, DEFAULT_BASE_URL, LLM_USAGE_HEADER, Stopwatch, get_database,
+                          new_correlation_id, parse_llm_usage, parse_memory, print_table, summarize)
+
+PIPELINES = ["fast-feedback", "optimized-feedback", "groq-overall-performance", "optimized-overall-performance"]
+
+# Fields every feedback report is expected to carry, looked up by key name anywhere in a response
+FEEDBACK_FIELDS = ["overallScore", "parameterScores", "strengths", "improvements", "recommendations",
+                   "overallVerdict", "adviceForImprovement", "summary"]
+
+TOPICS = ["caching", "database indexing", "API design", "message queues", "testing strategy", "observability"]
+SKILLS = ["Python", "PostgreSQL", "Redis", "Kubernetes"]
+
+TWO_SUM = """def twoSum(nums, target):
+    seen = {}
+    for i, n in enumerate(nums):
+        if target - n in seen:
+            return [seen[target - n], i]
+        seen[n] = i
+    return []
+"""
+
+
+def interview_content(size: int, with_dsa: bool) -> Dict[str, Any]:
+    """Questions, answers and DSA executions of one interview; identical for every pipeline.
+    As in the app, a DSA question has no written answer (None): its submission only lives
+    in dsa_executions."""
+    dsa_count = max(1, size // 5) if with_dsa else 0
+    questions, answers, executions = [], [], []
+    for i in range(size):
+        if i >= size - dsa_count:
+            problem_id = f"dsa-{i}"
+            questions.append({"id": problem_id, "question": f"Two Sum variant {i}", "category": "dsa",
+                              "difficulty": "medium", "points": 20,
+                              "dsaProblem": {"id": problem_id, "title": f"Two Sum variant {i}",
+                                             "difficulty": "medium"}})
+            answers.append(None)
+            executions.append({"problemId": problem_id, "language": "python", "sourceCode": TWO_SUM,
+                               "success": i % 2 == 0, "testsPassed": 5 if i % 2 == 0 else 3, "totalTests": 5,
+                               "executionTime": 42.0})
+            continue
+        topic = TOPICS[i % len(TOPICS)]
+        category = "behavioral" if i % 4 == 3 else "technical"
+        questions.append({"id": f"q-{i}", "question": f"How would you approach {topic} in a service like ours?",
+                          "expectedAnswer": f"A structured answer covering trade-offs of {topic}.",
+                          "category": category, "difficulty": "medium", "points": 10})
+        answers.append(f"For {topic} I would start from the access patterns, measure the current latency, "
+                       f"pick the simplest design that meets the goal and add monitoring before rolling it out. "
+                       f"In my last project this took our p99 from 900ms to 200ms (answer {i}).")
+    return {"questions": questions, "answers": answers, "executions": executions}
+
+
+def seed_interview(db, run_id: str, content: Dict[str, Any], label: str) -> str:
+    from bson import ObjectId
+    interview_id = ObjectId()
+    now = datetime.utcnow()
+    suffix = str(interview_id)[-6:]
+    # Problem ids are made unique per copy so pipelines never see each other's executions
+    questions = []
+    for question in content["questions"]:
+        question = {**question, "id": f"{question['id']}-{suffix}"}
+        if "dsaProblem" in question:
+            question["dsaProblem"] = {**question["dsaProblem"], "id": question["id"]}
+        questions.append(question)
+    db.interviews.insert_one({"_id": interview_id, "userId": "feedback-benchmark", "jobTitle": "Backend Engineer",
+                              "companyName": "Acme Corp", "skills": SKILLS, "interviewType": "technical",
+                              "experienceLevel": "mid", "status": "completed", "createdAt": now - timedelta(hours=1),
+                              "completedAt": now, "benchmarkRun": run_id, "benchmarkLabel": label})
+    # Shaped like /api/setanswers leaves it at the end of an interview
+    answers = [{"questionIndex": i, "answer": a, "timestamp": now}
+               for i, a in enumerate(content["answers"]) if a is not None]
+    db.questions.insert_one({"interviewId": str(interview_id), "questions": questions, "answers": answers,
+                             "answersCount": len(answers), "completedAt": now,
+                             "createdAt": now - timedelta(hours=1), "benchmarkRun": run_id})
+    if content["executions"]:
+        db.dsa_executions.insert_many([{**e, "problemId": f"{e['problemId']}-{suffix}",
+                                        "interviewId": str(interview_id), "createdAt": now, "benchmarkRun": run_id}
+                                       for e in content["executions"]])
+    return str(interview_id)
+
+
+def cleanup(db, run_id: str, interview_ids: List[str]):
+    db.interviews.delete_many({"benchmarkRun": run_id})
+    db.questions.delete_many({"benchmarkRun": run_id})
+    db.dsa_executions.delete_many({"benchmarkRun": run_id})
+    # Reports the pipelines wrote about the seeded interviews
+    db.performance_reports.delete_many({"interviewId": {"$in": interview_ids}})
+    db.performance_analysis.delete_many({"interviewId": {"$in": interview_ids}})
+    print(f"🧹 Removed {len(interview_ids)} seeded interviews and the reports written about them")
+
+
+def request_body(pipeline: str, interview_id: str, content: Dict[str, Any]) -> Dict[str, Any]:
+    if pipeline == "optimized-overall-performance":
+        return {"interviewId": interview_id, "questions": content["questions"],
+                "answers": [a or "" for a in content["answers"]],
+                "jobTitle": "Backend Engineer", "companyName": "Acme Corp", "skills": SKILLS}
+    return {"interviewId": interview_id}
+
+
+def shape_paths(node: Any, prefix: str = "") -> Set[str]:
+    """Key paths with value types; list items collapse to [] and merge their shapes"""
+    if isinstance(node, dict):
+        paths = {f"{prefix}:object"} if prefix else set()
+        for key, value in node.items():
+            paths |= shape_paths(value, f"{prefix}.{key}" if prefix else key)
+        return paths
+    if isinstance(node, list):
+        paths = {f"{prefix}:array"}
+        for item in node:
+            paths |= shape_paths(item, f"{prefix}[]")
+        return paths
+    kind = "null" if node is None else "bool" if isinstance(node, bool) else \
+        "number" if isinstance(node, (int, float)) else "string"
+    return {f"{prefix}:{kind}"}
+
+
+def field_locations(paths: Set[str], field: str) -> List[str]:
+    """Where a feedback field appears, shallowest first"""
+    found = {p.rsplit(":", 1)[0] for p in paths if p.rsplit(":", 1)[0].split(".")[-1].rstrip("[]") == field}
+    return sorted(found, key=lambda p: (p.count("."), p))
+
+
+def run_pipeline(base_url: str, pipeline: str, body: Dict[str, Any], run_id: str, timeout: float) -> Dict[str, Any]:
+    correlation_id = f"{run_id}-{new_correlation_id(pipeline)}"
+    with Stopwatch() as sw:
+        response = requests.post(f"{base_url}/api/{pipeline}", json=body, timeout=timeout,
+                                 headers={CORRELATION_HEADER: correlation_id})
+    try:
+        data = response.json()
+    except ValueError:
+        data = {}
+    usage = parse_llm_usage(response.headers.get(LLM_USAGE_HEADER))
+    return {"ms": sw.elapsed_ms, "status": response.status_code, "correlation_id": correlation_id,
+            "ok": response.status_code == 200 and data.get("success") is not False,
+            "llm_calls": sum(e.get("calls", 0) for e in usage),
+            "llm_failed": sum(e.get("failed", 0) for e in usage),
+            "tokens": sum(e.get("prompt", 0) + e.get("completion", 0) for e in usage),
+            "memory": parse_memory(response.headers.get("x-memory-delta-kb", "")),
+            "paths": shape_paths(data)}
+
+
+def used_executions(db, interview_id: str) -> bool:
+    """Whether fast-feedback graded this interview from its dsa_executions: answers it
+    builds from an execution start with "Code Solution:" in the stored analysis"""
+    analysis = db.performance_analysis.find_one({"interviewId": interview_id}, {"questions.userAnswer": 1})
+    return any(str(q.get("userAnswer", "")).startswith("Code Solution:")
+               for q in (analysis or {}).get("questions", []))
+
+
+def mongo_ops(entries: List[Dict[str, Any]], results: List[Dict[str, Any]]):
+    """Attach profiler entries to the request whose correlation id they carry"""
+    by_id = {r["correlation_id"]: r for r in results}
+    for r in results:
+        r["db_ops"], r["db_docs"], r["db_ms"] = 0, 0, 0
+    for entry in entries:
+        result = by_id.get((entry_comment(entry) or "|").split("|", 1)[1])
+        if result:
+            result["db_ops"] += 1
+            result["db_docs"] += entry.get("docsExamined", 0)
+            result["db_ms"] += entry.get("millis", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-of-interview feedback pipeline comparison")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--pipelines", nargs="+", default=PIPELINES, choices=PIPELINES)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 15, 30, 60], help="questions per interview")
+    parser.add_argument("--dsa", choices=["without", "with", "both"], default="both",
+                        help="seed interviews without DSA problems, with them (plus dsa_executions) or both")
+    parser.add_argument("--repeat", type=int, default=3, help="seeded copies per pipeline and interview shape")
+    parser.add_argument("--profile", action="store_true", help="count MongoDB operations with the profiler")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded interviews and reports in place")
+    parser.add_argument("--db", default=None, help="database name (default RECRUITERAI_DB_NAME or Cluster0)")
+    parser.add_argument("--timeout", type=float, default=300)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    print("🧮 RecruiterAI Feedback Pipeline Benchmark")
+    print("=" * 60)
+
+    shapes = [(size, with_dsa) for size in args.sizes
+              for with_dsa in ({"without": [False], "with": [True], "both": [False, True]}[args.dsa])]
+    db = get_database(db_name=args.db)
+    run_id = new_correlation_id("feedback")
+    print(f"Run {run_id}: {len(shapes)} interview shapes x {len(args.pipelines)} pipelines x {args.repeat} copies")
+
+    jobs = []
+    for size, with_dsa in shapes:
+        content = interview_content(size, with_dsa)
+        label = f"{size}q{' +dsa' if with_dsa else ''}"
+        for pipeline in args.pipelines:
+            for _ in range(args.repeat):
+                jobs.append({"pipeline": pipeline, "label": label, "content": content,
+                             "interview_id": seed_interview(db, run_id, content, label)})
+    seeded = [job["interview_id"] for job in jobs]
+    print(f"🌱 Seeded {len(seeded)} completed interviews")
+
+    results: List[Dict[str, Any]] = []
+    entries: List[Dict[str, Any]] = []
+    mock = None
+    try:
+        mock = mock_from_args(args).start()
+        print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+        with ProfilerCapture(db) if args.profile else nullcontext() as profiler:
+            for job in jobs:
+                result = run_pipeline(args.base_url, job["pipeline"],
+                                      request_body(job["pipeline"], job["interview_id"], job["content"]),
+                                      run_id, args.timeout)
+                if job["pipeline"] == "fast-feedback" and job["content"]["executions"]:
+                    result["dsa_exec"] = used_executions(db, job["interview_id"])
+                results.append({**result, "pipeline": job["pipeline"], "label": job["label"]})
+            if profiler:
+                # Give the profiler a moment to flush trailing writes
+                time.sleep(0.5)
+                entries = profiler.entries(run_id)
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        if mock:
+            mock.stop()
+        if not args.keep:
+            cleanup(db, run_id, seeded)
+
+    if args.profile:
+        mongo_ops(entries, results)
+
+    rows = []
+    for pipeline in args.pipelines:
+        for size, with_dsa in shapes:
+            label = f"{size}q{' +dsa' if with_dsa else ''}"
+            runs = [r for r in results if r["pipeline"] == pipeline and r["label"] == label]
+            latency = summarize([r["ms"] for r in runs])
+            memory = [r["memory"] for r in runs if r["memory"]]
+            rows.append({"pipeline": pipeline, "interview": label,
+                         "ok": f"{sum(r['ok'] for r in runs)}/{len(runs)}",
+                         "fallback": sum(1 for r in runs if r["ok"] and r["llm_calls"] == r["llm_failed"]),
+                         "statuses": ",".join(sorted({str(r["status"]) for r in runs})),
+                         "p50": latency["p50"], "max": latency["max"],
+                         "llm calls": sum(r["llm_calls"] for r in runs) / len(runs),
+                         "tokens": sum(r["tokens"] for r in runs) / len(runs),
+                         "heap KB": sum(m.get("heap", 0) for m in memory) / len(memory) if memory else "-",
+                         "rss KB": sum(m.get("rss", 0) for m in memory) / len(memory) if memory else "-",
+                         "db ops": sum(r["db_ops"] for r in runs) / len(runs) if args.profile else "-",
+                         "db docs": sum(r["db_docs"] for r in runs) / len(runs) if args.profile else "-",
+                         "db ms": sum(r["db_ms"] for r in runs) / len(runs) if args.profile else "-",
+                         "dsa exec": (f"{sum(r['dsa_exec'] for r in runs)}/{len(runs)}"
+                                      if any("dsa_exec" in r for r in runs) else "-")})
+    print_table(rows, ["pipeline", "interview", "ok", "fallback", "statuses", "p50", "max", "llm calls", "tokens",
+                       "heap KB", "rss KB", "db ops", "db docs", "db ms", "dsa exec"],
+                title="Feedback pipelines per interview shape (ms; per-request averages)")
+
+    # Structural diff of every answered request; fallback reports (e.g. 206) are part of the contract too
+    union: Dict[str, Set[str]] = {}
+    variants: Dict[str, int] = {}
+    for pipeline in args.pipelines:
+        shapes_seen = [frozenset(r["paths"]) for r in results
+                       if r["pipeline"] == pipeline and r["status"] < 400 and r["paths"]]
+        union[pipeline] = set().union(*shapes_seen) if shapes_seen else set()
+        # Value types can legitimately differ (a null score); count shapes by key paths only
+        variants[pipeline] = len({frozenset(p.rsplit(":", 1)[0] for p in shape) for shape in shapes_seen})
+
+    print_table([{"field": field, **{pipeline: (field_locations(union[pipeline], field) or ["-"])[0]
+                                     for pipeline in args.pipelines}} for field in FEEDBACK_FIELDS],
+                ["field"] + args.pipelines, title="Where each pipeline returns the feedback fields")
+
+    common = set.intersection(*union.values()) if union else set()
+    print_table([{"pipeline": pipeline, "paths": len(union[pipeline]), "shared by all": len(common),
+                  "only here": len(union[pipeline] - set().union(*(union[p] for p in args.pipelines if p != pipeline))),
+                  "shapes across runs": variants[pipeline]} for pipeline in args.pipelines],
+                ["pipeline", "paths", "shared by all", "only here", "shapes across runs"],
+                title="Response shape comparison (key paths with value types)")
+
+    graded = [r for r in results if "dsa_exec" in r]
+    if graded and not any(r["dsa_exec"] for r in graded):
+        print("\n⚠️  fast-feedback never graded from dsa_executions: it only reads them when an interview has "
+              "no written answers at all, so DSA submissions in mixed interviews go unscored")
+
+    failing = [r for r in rows if r["ok"].split("/")[0] != r["ok"].split("/")[1]]
+    if failing:
+        print(f"\n⚠️  {len(failing)} pipeline/interview combinations had failed responses")
+    return 0 if not failing else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
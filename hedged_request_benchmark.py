@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Hedged LLM Request Benchmark for RecruiterAI
+Generates question sets through /api/smart-generate-questions with request hedging
+off and on ("hedge": false/true in the body) against the offline mock LLM from
+mock_llm.py, configured with a slow tail (a few percent of calls take several times
+longer). Reports client latency percentiles for both arms and what hedging cost in
+extra LLM calls, plus how many losing calls the app abandoned.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+import threading
+from typing import Dict
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, interviews_from_db, print_table, run_concurrent, summarize
+
+ROUTE = "/api/smart-generate-questions"
+
+
+class HedgeArm:
+    def __init__(self, base_url: str, hedge: bool, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.hedge = hedge
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def run(self, interview_id: str) -> Dict[str, object]:
+        with Stopwatch() as sw:
+            response = self._session().post(f"{self.base_url}{ROUTE}", timeout=self.timeout,
+                                            json={"interviewId": interview_id, "regenerate": True, "hedge": self.hedge})
+        body = response.json() if response.status_code == 200 else {}
+        return {"http": response.status_code, "ms": sw.elapsed_ms, "hedged": body.get("hedged", False),
+                "model": body.get("model")}
+
+
+def hedging_metrics(base_url: str) -> Dict[str, object]:
+    try:
+        response = requests.get(f"{base_url}/api/smart-ai-health", timeout=30)
+        return response.json().get("hedging", {}) if response.status_code == 200 else {}
+    except (requests.RequestException, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hedged LLM request benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--interview-ids", nargs="+", default=[])
+    parser.add_argument("--from-db", type=int, default=0, help="use the N newest interviews from MongoDB")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per arm")
+    parser.add_argument("--warmup", type=int, default=30, help="unmeasured requests to fill the latency window")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=120)
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["questions=300:40"], mock_slow_fraction=0.05, mock_slow_factor=8.0)
+    args = parser.parse_args()
+
+    print("🏇 RecruiterAI Hedged LLM Request Benchmark")
+    print("=" * 60)
+
+    interview_ids = list(args.interview_ids)
+    if args.from_db:
+        interview_ids += interviews_from_db(args.from_db)
+    if not interview_ids:
+        print("❌ No interviews: pass --interview-ids or --from-db N")
+        return 1
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url} (slow tail {args.mock_slow_fraction:.0%} × {args.mock_slow_factor:g}); "
+          f"the app must run with GROQ_BASE_URL={mock.url}")
+
+    work = [interview_ids[i % len(interview_ids)] for i in range(args.requests)]
+    rows, costs = [], {}
+    try:
+        run_concurrent(HedgeArm(args.base_url, False, args.timeout).run,
+                       [interview_ids[i % len(interview_ids)] for i in range(args.warmup)], args.concurrency)
+        for hedge in (False, True):
+            label = "hedged" if hedge else "baseline"
+            mock.llm.reset_stats()
+            with Stopwatch() as wall:
+                results = run_concurrent(HedgeArm(args.base_url, hedge, args.timeout).run, work, args.concurrency)
+            stats = mock.llm.snapshot()
+            ok = [r for r in results if r["http"] == 200]
+            latency = summarize([r["ms"] for r in ok])
+            calls = stats.get("requests", 0)
+            costs[label] = calls / max(1, len(results))
+            rows.append({"arm": label, "ok": len(ok), "failed": len(results) - len(ok), "p50": latency["p50"],
+                         "p90": latency["p90"], "p99": latency["p99"], "max": latency["max"],
+                         "llm calls/req": costs[label], "hedged": sum(1 for r in ok if r["hedged"]),
+                         "abandoned": stats.get("abandoned", 0), "wall s": wall.elapsed_ms / 1000})
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        mock.stop()
+
+    print_table(rows, ["arm", "ok", "failed", "p50", "p90", "p99", "max", "llm calls/req", "hedged", "abandoned",
+                       "wall s"], title="Question generation latency (ms)")
+
+    baseline, hedged = rows
+    if baseline["p99"]:
+        print(f"\n  p99 {baseline['p99']:.0f}ms → {hedged['p99']:.0f}ms "
+              f"({(1 - hedged['p99'] / baseline['p99']) * 100:.0f}% lower), "
+              f"extra LLM calls {(costs['hedged'] / max(costs['baseline'], 1e-9) - 1) * 100:+.1f}%")
+
+    metrics = hedging_metrics(args.base_url).get("tasks", {}).get("question_generation")
+    if metrics:
+        print(f"  Server: hedge rate {metrics['hedgeRate']:.1%} (budget {metrics['budget']:.0%}), "
+              f"hedge wins {metrics['hedgeWins']}, budget denied {metrics['budgetDenied']}, "
+              f"current delay {metrics['currentDelayMs']:.0f}ms (p90 {metrics['p90Ms'] or 0:.0f}ms)")
+    return 0 if all(row["failed"] == 0 for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,6 +67,39 @@ class InterviewFixesTester:
             self.log(f"❌ {name} - Error: {str(e)}", "FAIL")
             return False, {"error": str(e)}
     
+    def generate_questions(self, name: str, interview_id: str, timeout: int = 90) -> tuple[bool, Dict]:
+        """Generate questions via the async job API: POST returns 202 with a job id, then
+        long-poll the status URL so no single request is held open for the whole generation"""
+        self.tests_run += 1
+        self.log(f"🔍 Testing {name} (async job)...")
+        deadline = time.time() + timeout
+
+        try:
+            response = self.session.post(f"{self.base_url}/api/groq-generate-questions", timeout=30,
+                                         json={"interviewId": interview_id, "regenerate": False, "async": True})
+            status = response.json()
+            status_url = f"{self.base_url}{status.get('statusUrl', '')}"
+            # Questions that already exist come back directly with 200
+            while response.status_code == 202 and time.time() < deadline:
+                wait_ms = int(min(25, max(1, deadline - time.time())) * 1000)
+                response = self.session.get(status_url,
+                                            params={"waitMs": wait_ms}, timeout=wait_ms / 1000 + 10)
+                status = response.json()
+        except requests.exceptions.RequestException as e:
+            self.log(f"❌ {name} - Error: {str(e)}", "FAIL")
+            return False, {"error": str(e)}
+
+        if response.status_code == 202:
+            self.log(f"❌ {name} - job still {status.get('status')} after {timeout}s", "FAIL")
+            return False, {"error": "timeout"}
+        if response.status_code != 200:
+            self.log(f"❌ {name} - Status: {response.status_code}: {status.get('error')}", "FAIL")
+            return False, status
+
+        self.tests_passed += 1
+        self.log(f"✅ {name} - queued {status.get('queuedMs', 0)}ms, generated in {status.get('runMs', 0)}ms", "PASS")
+        return True, status
+
     def test_health_check(self) -> bool:
         """Test if the application is running"""
         try:
@@ -203,14 +236,7 @@ class InterviewFixesTester:
             "regenerate": False
         }
         
-        success, response = self.run_test(
-            "Groq Generate Questions API",
-            "POST",
-            "api/groq-generate-questions",
-            200,
-            test_data,
-            timeout=90
-        )
+        success, response = self.generate_questions("Groq Generate Questions API", test_data["interviewId"], timeout=90)
         
         if success:
             questions_count = response.get('questionsCount', 0)
@@ -256,14 +282,7 @@ class InterviewFixesTester:
             "regenerate": False
         }
         
-        success, response = self.run_test(
-            "Mixed Interview Time Allocation",
-            "POST",
-            "api/groq-generate-questions",
-            200,
-            test_data,
-            timeout=90
-        )
+        success, response = self.generate_questions("Mixed Interview Time Allocation", test_data["interviewId"], timeout=90)
         
         if success:
             questions = response.get('questions', [])
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Judge0 Run-to-Verdict Benchmark for RecruiterAI
+Measures how long a DSA run takes to reach a verdict as the number of test cases
+grows, using the local Judge0 stand-in (local_judge0.py).
+
+  --mode client  replays both polling strategies directly against the stand-in:
+                 sequential (submit, then poll every 1000ms, one test case at a time)
+                 and batch (one /submissions/batch call, adaptive polling)
+  --mode app     posts to /api/test-dsa-execution on a dev server started with
+                 JUDGE0_BASE_URL=http://localhost:<judge0-port> JUDGE0_API_KEY=local
+"""
+
+import argparse
+import base64
+import sys
+import time
+from typing import Any, Dict, List
+
+import requests
+
+from local_judge0 import LocalJudge0Server
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, summarize
+
+TWO_SUM = """def twoSum(nums, target):
+    seen = {}
+    for i, n in enumerate(nums):
+        if target - n in seen:
+            return [seen[target - n], i]
+        seen[n] = i
+    return []
+"""
+
+RESULT_FIELDS = "token,stdout,stderr,compile_output,message,status,time,memory"
+BATCH_SIZE = 20
+
+
+def make_test_cases(count: int) -> List[Dict[str, str]]:
+    cases = []
+    for i in range(count):
+        nums = list(range(i + 2))
+        target = nums[-1] + nums[-2]
+        cases.append({
+            "id": f"bench-{i + 1}",
+            "input": f"nums = [{','.join(map(str, nums))}], target = {target}",
+            "expectedOutput": f"[{len(nums) - 2},{len(nums) - 1}]",
+        })
+    return cases
+
+
+def executable_code(case: Dict[str, str]) -> str:
+    # Function plus an appended call, the shape the services' createExecutableCode produces
+    assignments = case["input"].replace("], target", "]\ntarget")
+    return f"{TWO_SUM}\n{assignments}\nprint(str(twoSum(nums, target)).replace(' ', ''))\n"
+
+
+def b64(text: str) -> str:
+    return base64.b64encode(text.encode()).decode()
+
+
+class ClientStrategies:
+    """Python replicas of the old and new polling strategies in the Judge0 services"""
+
+    def __init__(self, judge0_url: str):
+        self.url = judge0_url
+        self.session = requests.Session()
+        self.requests_made = 0
+
+    def _submission(self, case: Dict[str, str]) -> Dict[str, Any]:
+        return {"source_code": b64(executable_code(case)), "language_id": 71, "cpu_time_limit": 2, "memory_limit": 128000}
+
+    def sequential(self, cases: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        results = []
+        for case in cases:
+            token = self.session.post(f"{self.url}/submissions?base64_encoded=true",
+                                      json=self._submission(case), timeout=30).json()["token"]
+            self.requests_made += 1
+            for _ in range(30):
+                result = self.session.get(f"{self.url}/submissions/{token}?base64_encoded=true", timeout=30).json()
+                self.requests_made += 1
+                if result["status"]["id"] > 2:
+                    results.append(result)
+                    break
+                time.sleep(1.0)
+        return results
+
+    def batch(self, cases: List[Dict[str, str]], initial_ms: float = 25, max_ms: float = 1000,
+              factor: float = 1.6, timeout_s: float = 30) -> List[Dict[str, Any]]:
+        tokens: List[str] = []
+        for start in range(0, len(cases), BATCH_SIZE):
+            chunk = [self._submission(c) for c in cases[start:start + BATCH_SIZE]]
+            entries = self.session.post(f"{self.url}/submissions/batch?base64_encoded=true",
+                                        json={"submissions": chunk}, timeout=30).json()
+            self.requests_made += 1
+            tokens.extend(entry["token"] for entry in entries)
+
+        done: Dict[str, Dict[str, Any]] = {}
+        delay = initial_ms / 1000
+        deadline = time.monotonic() + timeout_s
+        while len(done) < len(tokens):
+            pending = [t for t in tokens if t not in done]
+            for start in range(0, len(pending), BATCH_SIZE):
+                part = ",".join(pending[start:start + BATCH_SIZE])
+                response = self.session.get(f"{self.url}/submissions/batch", timeout=30, params={
+                    "tokens": part, "base64_encoded": "true", "fields": RESULT_FIELDS})
+                self.requests_made += 1
+                for submission in response.json()["submissions"]:
+                    if submission and submission["status"]["id"] > 2:
+                        done[submission["token"]] = submission
+            if len(done) == len(tokens):
+                break
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError("Code execution timeout - submission took too long")
+            time.sleep(delay)
+            delay = min(max_ms / 1000, delay * factor)
+        return [done[t] for t in tokens]
+
+
+def count_passed(results: List[Dict[str, Any]], cases: List[Dict[str, str]]) -> int:
+    passed = 0
+    for result, case in zip(results, cases):
+        stdout = base64.b64decode(result.get("stdout") or "").decode().strip()
+        if result["status"]["id"] == 3 and stdout == case["expectedOutput"]:
+            passed += 1
+    return passed
+
+
+def run_client_mode(args) -> List[Dict[str, Any]]:
+    rows = []
+    with LocalJudge0Server(workers=args.workers, queue_depth=args.queue_depth) as server:
+        clients = ClientStrategies(server.url)
+        for count in args.test_cases:
+            cases = make_test_cases(count)
+            for strategy in args.strategies:
+                samples, passed = [], 0
+                clients.requests_made = 0
+                for _ in range(args.repeat):
+                    with Stopwatch() as sw:
+                        results = getattr(clients, strategy)(cases)
+                    samples.append(sw.elapsed_ms)
+                    passed = count_passed(results, cases)
+                stats = summarize(samples)
+                rows.append({"strategy": strategy, "test_cases": count, "p50_ms": stats["p50"],
+                             "max_ms": stats["max"], "http_calls": clients.requests_made // args.repeat,
+                             "passed": f"{passed}/{count}"})
+    return rows
+
+
+def run_app_mode(args) -> List[Dict[str, Any]]:
+    rows = []
+    session = requests.Session()
+    with LocalJudge0Server(port=args.judge0_port, workers=args.workers, queue_depth=args.queue_depth) as server:
+        for count in args.test_cases:
+            cases = make_test_cases(count)
+            samples, passed = [], "-"
+            session.post(f"{server.url}/stats/reset", json={}, timeout=5)
+            for _ in range(args.repeat):
+                with Stopwatch() as sw:
+                    response = session.post(f"{args.base_url}/api/test-dsa-execution", timeout=120, json={
+                        "code": TWO_SUM, "language": "python", "testCases": cases})
+                samples.append(sw.elapsed_ms)
+                summary = response.json().get("summary", {}) if response.status_code == 200 else {}
+                passed = f"{summary.get('passed', 0)}/{summary.get('total', count)}"
+            judge_stats = session.get(f"{server.url}/stats", timeout=5).json()
+            stats = summarize(samples)
+            rows.append({"strategy": "app", "test_cases": count, "p50_ms": stats["p50"], "max_ms": stats["max"],
+                         "http_calls": judge_stats.get("http_requests", 0) // args.repeat,
+                         "passed": passed})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Judge0 run-to-verdict latency vs test-case count")
+    parser.add_argument("--mode", choices=["client", "app"], default="client")
+    parser.add_argument("--strategies", nargs="+", choices=["sequential", "batch"], default=["sequential", "batch"])
+    parser.add_argument("--test-cases", type=int, nargs="+", default=[1, 3, 5, 10, 20])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-depth", type=int, default=200)
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--judge0-port", type=int, default=2358)
+    args = parser.parse_args()
+
+    print("⚡ RecruiterAI Judge0 Run-to-Verdict Benchmark")
+    print("=" * 60)
+
+    try:
+        rows = run_client_mode(args) if args.mode == "client" else run_app_mode(args)
+    except (requests.RequestException, TimeoutError) as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    print_table(rows, ["strategy", "test_cases", "p50_ms", "max_ms", "http_calls", "passed"],
+                title="Run-to-verdict latency")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
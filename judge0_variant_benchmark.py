@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Judge0 Client Variant Benchmark for RecruiterAI
+Runs a fixed suite of submissions through every Judge0 client in the app against the
+local Judge0 stand-in (local_judge0.py), via the development-only
+/api/judge0-benchmark route:
+
+  judge0    Judge0Service          (AdvancedDSACompiler)
+  improved  ImprovedJudge0Service  (DSACompiler)
+  fixed     FixedJudge0Service     (EnhancedDSACompiler component)
+  enhanced  EnhancedJudge0Service  (FixedDSACompiler component, /api/test-dsa-execution)
+  compiler  EnhancedDSACompiler    (/api/execute-dsa-code)
+
+The suite covers Python, JavaScript and C++, 1 to 20 test cases, a wrong answer, a
+time limit and a compile error. Every case carries the same algorithm both as a bare
+function (for variants that append the call themselves) and as a stdin program (for
+variants that pass the test input on stdin). Per variant it reports verdict latency,
+upstream Judge0 HTTP calls per run, and correctness: whether the verdict and pass
+count match what the submission deserves. Submissions run one at a time so the
+stand-in's call counters belong to a single run.
+
+Start the app against the stand-in first:
+
+    JUDGE0_BASE_URL=http://localhost:2358 JUDGE0_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List
+
+import requests
+
+from judge0_batch_benchmark import TWO_SUM, make_test_cases
+from local_judge0 import LocalJudge0Server, available_languages
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, summarize
+
+BENCHMARK_ROUTE = "/api/judge0-benchmark"
+VARIANTS = ["judge0", "improved", "fixed", "enhanced", "compiler"]
+LANGUAGE_IDS = {"python": 71, "javascript": 63, "cpp": 54}
+
+TWO_SUM_PROGRAM = """import re
+
+line = input()
+nums = [int(n) for n in re.search(r"\\[(.*?)\\]", line).group(1).split(",")]
+target = int(line.rsplit("=", 1)[1])
+""" + TWO_SUM + """
+print(str(twoSum(nums, target)).replace(" ", ""))
+"""
+
+TWO_SUM_JS = """function twoSum(nums, target) {
+    const seen = new Map();
+    for (let i = 0; i < nums.length; i++) {
+        if (seen.has(target - nums[i])) return [seen.get(target - nums[i]), i];
+        seen.set(nums[i], i);
+    }
+    return [];
+}"""
+
+TWO_SUM_JS_PROGRAM = TWO_SUM_JS + """
+const line = require("fs").readFileSync(0, "utf8");
+const nums = JSON.parse(line.match(/\\[.*?\\]/)[0]);
+const target = parseInt(line.split("=").pop());
+console.log(JSON.stringify(twoSum(nums, target)));
+"""
+
+SQUARE = "def square(n):\n    return n * n\n"
+SQUARE_PROGRAM = SQUARE + "\nprint(square(int(input().split('=')[1])))\n"
+SQUARE_OFF_BY_ONE = "def square(n):\n    return n * n + 1\n"
+SQUARE_OFF_BY_ONE_PROGRAM = SQUARE_OFF_BY_ONE + "\nprint(square(int(input().split('=')[1])))\n"
+SPIN = "def square(n):\n    while True:\n        n += 1\n"
+SPIN_PROGRAM = SPIN + "\nprint(square(int(input().split('=')[1])))\n"
+
+SQUARE_CPP = "int solution(int n) {\n    return n * n;\n}\n"
+SQUARE_CPP_PROGRAM = """#include <iostream>
+#include <string>
+using namespace std;
+
+""" + SQUARE_CPP + """
+int main() {
+    string line;
+    getline(cin, line);
+    cout << solution(stoi(line.substr(line.find('=') + 1))) << endl;
+    return 0;
+}
+"""
+BROKEN_CPP = "int solution(int n) {\n    return n * n\n}\n"
+BROKEN_CPP_PROGRAM = SQUARE_CPP_PROGRAM.replace("return n * n;", "return n * n")
+
+
+def square_cases(count: int) -> List[Dict[str, str]]:
+    return [{"id": f"square-{i + 1}", "input": f"n = {i + 2}", "expectedOutput": str((i + 2) ** 2)}
+            for i in range(count)]
+
+
+def suite() -> List[Dict[str, Any]]:
+    """Submissions with the verdict each deserves; every variant gets the same list"""
+    cases = []
+    for count in (1, 5, 20):
+        cases.append({"name": f"python two-sum x{count}", "language": "python", "function": TWO_SUM,
+                      "program": TWO_SUM_PROGRAM, "testCases": make_test_cases(count), "expected": "accepted"})
+    cases.append({"name": "javascript two-sum x5", "language": "javascript", "function": TWO_SUM_JS,
+                  "program": TWO_SUM_JS_PROGRAM, "testCases": make_test_cases(5), "expected": "accepted"})
+    for count in (1, 10):
+        cases.append({"name": f"python square x{count}", "language": "python", "function": SQUARE,
+                      "program": SQUARE_PROGRAM, "testCases": square_cases(count), "expected": "accepted"})
+    cases.append({"name": "cpp square x5", "language": "cpp", "function": SQUARE_CPP, "program": SQUARE_CPP_PROGRAM,
+                  "testCases": square_cases(5), "expected": "accepted"})
+    cases.append({"name": "python wrong answer x5", "language": "python", "function": SQUARE_OFF_BY_ONE,
+                  "program": SQUARE_OFF_BY_ONE_PROGRAM, "testCases": square_cases(5), "expected": "wrong_answer"})
+    cases.append({"name": "python time limit x2", "language": "python", "function": SPIN, "program": SPIN_PROGRAM,
+                  "testCases": square_cases(2), "expected": "time_limit"})
+    cases.append({"name": "cpp compile error x3", "language": "cpp", "function": BROKEN_CPP,
+                  "program": BROKEN_CPP_PROGRAM, "testCases": square_cases(3), "expected": "compile_error"})
+    return cases
+
+
+def judge(case: Dict[str, Any], outcome: Dict[str, Any]) -> Dict[str, bool]:
+    """exact: the verdict the submission deserves; pass_fail: at least right about passing"""
+    verdict = outcome.get("verdict")
+    expected = case["expected"]
+    expected_passed = len(case["testCases"]) if expected == "accepted" else 0
+    counts_right = outcome.get("passed") == expected_passed
+    # Variants without Judge0 statuses can only say "failed"
+    pass_fail = (counts_right and (verdict == "accepted") == (expected == "accepted")
+                 and verdict not in ("error", "mock"))
+    return {"exact": pass_fail and verdict == expected, "pass_fail": pass_fail}
+
+
+def run_case(base_url: str, judge0_url: str, variant: str, case: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    requests.post(f"{judge0_url}/stats/reset", json={}, timeout=5)
+    body = {"variant": variant, "language": case["language"], "functionSource": case["function"],
+            "programSource": case["program"], "testCases": case["testCases"]}
+    with Stopwatch() as sw:
+        response = requests.post(f"{base_url}{BENCHMARK_ROUTE}", json=body, timeout=timeout)
+    outcome = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+    stats = requests.get(f"{judge0_url}/stats", timeout=5).json()
+    calls = stats.get("http_requests", 0)
+    if response.status_code == 200 and calls == 0:
+        # Nothing reached Judge0: the variant answered with its mock results
+        outcome["verdict"] = "mock"
+    return {"ms": sw.elapsed_ms, "status": response.status_code, "calls": calls,
+            "submits": stats.get("http_submit", 0) + stats.get("http_batch_submit", 0),
+            "polls": stats.get("http_get", 0) + stats.get("http_batch_get", 0), **outcome, **judge(case, outcome)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head-to-head benchmark of the Judge0 client variants")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--variants", nargs="+", default=VARIANTS, choices=VARIANTS)
+    parser.add_argument("--repeat", type=int, default=3, help="runs of the whole suite per variant")
+    parser.add_argument("--judge0-port", type=int, default=2358)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=180)
+    parser.add_argument("--details", action="store_true", help="print every case's verdict per variant")
+    args = parser.parse_args()
+
+    print("⚖️  RecruiterAI Judge0 Client Variant Benchmark")
+    print("=" * 60)
+
+    installed = set(LANGUAGE_IDS.values()) & set(available_languages())
+    cases = [c for c in suite() if LANGUAGE_IDS[c["language"]] in installed]
+    skipped = len(suite()) - len(cases)
+    print(f"{len(cases)} submissions x {args.repeat} runs per variant"
+          + (f" ({skipped} skipped: toolchain not installed)" if skipped else ""))
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        with LocalJudge0Server(port=args.judge0_port, workers=args.workers, queue_depth=500) as server:
+            print(f"🧪 Judge0 stand-in on {server.url}; the app must run with JUDGE0_BASE_URL={server.url}")
+            # One unmeasured run so route compilation does not count against the first variant
+            run_case(args.base_url, server.url, args.variants[0], cases[0], args.timeout)
+            for variant in args.variants:
+                results[variant] = [dict(run_case(args.base_url, server.url, variant, case, args.timeout),
+                                         case=case["name"], expected=case["expected"])
+                                    for _ in range(args.repeat) for case in cases]
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    rows = []
+    for variant, runs in results.items():
+        latency = summarize([r["ms"] for r in runs])
+        verdict = summarize([r.get("verdictMs", 0.0) for r in runs])
+        rows.append({"variant": variant, "runs": len(runs), "exact": sum(r["exact"] for r in runs),
+                     "pass/fail ok": sum(r["pass_fail"] for r in runs),
+                     "mock": sum(1 for r in runs if r.get("verdict") == "mock"),
+                     "errors": sum(1 for r in runs if r.get("verdict") == "error" or r["status"] != 200),
+                     "verdict p50": verdict["p50"], "verdict p90": verdict["p90"], "e2e p50": latency["p50"],
+                     "e2e max": latency["max"], "calls/run": sum(r["calls"] for r in runs) / len(runs),
+                     "submits/run": sum(r["submits"] for r in runs) / len(runs),
+                     "polls/run": sum(r["polls"] for r in runs) / len(runs)})
+    print_table(rows, ["variant", "runs", "exact", "pass/fail ok", "mock", "errors", "verdict p50", "verdict p90",
+                       "e2e p50", "e2e max", "calls/run", "submits/run", "polls/run"],
+                title="Judge0 client variants (ms, upstream HTTP calls per run)")
+
+    if args.details:
+        for variant, runs in results.items():
+            print_table([{"case": r["case"], "expected": r["expected"], "verdict": r.get("verdict"),
+                          "passed": f"{r.get('passed', 0)}/{r.get('total', 0)}", "ms": r["ms"], "calls": r["calls"]}
+                         for r in runs[:len(cases)]],
+                        ["case", "expected", "verdict", "passed", "ms", "calls"], title=f"{variant}: first run")
+
+    correct = [r for r in rows if r["exact"] == r["runs"]]
+    candidates = correct or [r for r in rows if r["pass/fail ok"] == r["runs"]]
+    if candidates:
+        best = min(candidates, key=lambda r: r["verdict p50"])
+        print(f"\n🏁 Fastest {'fully correct' if correct else 'pass/fail-correct'} variant: {best['variant']} "
+              f"(verdict p50 {best['verdict p50']:.1f}ms, {best['calls/run']:.1f} Judge0 calls per run)")
+    else:
+        print("\n⚠️  No variant judged every submission correctly; see --details")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
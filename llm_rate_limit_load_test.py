@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+LLM Provider Rate-Limit Load Test for RecruiterAI
+Starts three rate-limited mock providers (Groq, Gemini and Hugging Face formats from
+mock_llm.py, each answering 429 past its requests-per-minute limit) and drives a
+burst of mixed traffic at one or more app workers: background question generation
+(POST /api/free-llm-questions) next to interactive answer analysis
+(POST /api/free-llm-analysis). Reports latency and success per traffic class, the
+load and 429s each provider saw, and each worker's scheduler view
+(GET /api/free-llm-questions?type=provider-stats).
+
+Run it against several workers (--base-urls) started with the printed environment,
+once with the default in-process buckets and once with LLM_RATE_LIMIT_STORE=mongo,
+to compare per-process and shared quotas.
+"""
+
+import argparse
+import sys
+import threading
+from itertools import cycle
+from typing import Dict, List
+
+import requests
+
+from mock_llm import MockLLMServer, parse_latency
+from perf_harness import (DEFAULT_BASE_URL, Stopwatch, get_database, interviews_from_db, print_table, run_concurrent,
+                          summarize)
+
+PROVIDERS = [
+    # name, env prefix, default port offset, default requests per minute
+    ("groq", "GROQ", 0, 30),
+    ("gemini", "GEMINI", 1, 60),
+    ("huggingface", "HUGGINGFACE", 2, 10),
+]
+
+
+class TrafficClass:
+    def __init__(self, name: str, route: str, base_urls: List[str], body: Dict[str, object], timeout: float):
+        self.name = name
+        self.route = route
+        self.base_urls = cycle(base_urls)
+        self.lock = threading.Lock()
+        self.body = body
+        self.timeout = timeout
+
+    def run(self, interview_id: str) -> Dict[str, object]:
+        with self.lock:
+            base_url = next(self.base_urls)
+        try:
+            with Stopwatch() as sw:
+                response = requests.post(f"{base_url}{self.route}", json={"interviewId": interview_id, **self.body},
+                                         timeout=self.timeout)
+            return {"http": response.status_code, "ms": sw.elapsed_ms}
+        except requests.RequestException:
+            return {"http": "error", "ms": self.timeout * 1000}
+
+
+def interviews_by_kind(count: int) -> Dict[str, List[str]]:
+    """Newest interviews for generation, and newest ones with recorded answers for analysis"""
+    db = get_database()
+    return {"generate": interviews_from_db(count, db=db), "analyze": interviews_from_db(count, answered=True, db=db)}
+
+
+def provider_stats(base_url: str) -> Dict[str, object]:
+    try:
+        response = requests.get(f"{base_url}/api/free-llm-questions", params={"type": "provider-stats"}, timeout=10)
+        return response.json().get("providers", {}).get("scheduler", {}) if response.status_code == 200 else {}
+    except (requests.RequestException, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM provider rate-limit load test")
+    parser.add_argument("--base-urls", nargs="+", default=[DEFAULT_BASE_URL], help="one URL per app worker")
+    parser.add_argument("--generate-ids", nargs="+", default=[], help="interviews to regenerate questions for")
+    parser.add_argument("--analyze-ids", nargs="+", default=[], help="answered interviews to analyse")
+    parser.add_argument("--from-db", type=int, default=0, help="pick up to N interviews of each kind from MongoDB")
+    parser.add_argument("--background", type=int, default=20, help="question generation requests")
+    parser.add_argument("--interactive", type=int, default=40, help="answer analysis requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients per traffic class")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--mock-port", type=int, default=2360, help="first of three consecutive ports")
+    parser.add_argument("--rpm", nargs="*", default=[], metavar="PROVIDER=N", help="override a mock's limit")
+    parser.add_argument("--mock-latency", nargs="*", default=["questions=300:40", "dsa=600:150", "analysis=300"])
+    args = parser.parse_args()
+
+    print("🚦 RecruiterAI LLM Provider Rate-Limit Load Test")
+    print("=" * 60)
+
+    ids = {"generate": list(args.generate_ids), "analyze": list(args.analyze_ids)}
+    if args.from_db:
+        for kind, found in interviews_by_kind(args.from_db).items():
+            ids[kind] += found
+    if not ids["generate"] and not ids["analyze"]:
+        print("❌ No interviews: pass --generate-ids / --analyze-ids or --from-db N")
+        return 1
+
+    rpm = {name: limit for name, _, _, limit in PROVIDERS}
+    rpm.update({k: int(v) for k, _, v in (spec.partition("=") for spec in args.rpm)})
+    mocks = {name: MockLLMServer(port=args.mock_port + offset, latency=parse_latency(args.mock_latency),
+                                 rpm=rpm[name]).start()
+             for name, _, offset, _ in PROVIDERS}
+
+    print("Start every worker with:")
+    for name, prefix, _, _ in PROVIDERS:
+        print(f"  {prefix}_BASE_URL={mocks[name].url} {prefix}_API_KEY=local {prefix}_REQUESTS_PER_MINUTE={rpm[name]}")
+    print("  (add LLM_RATE_LIMIT_STORE=mongo to share the buckets between workers)\n")
+
+    classes = []
+    if ids["generate"]:
+        classes.append((TrafficClass("background", "/api/free-llm-questions", args.base_urls, {"regenerate": True},
+                                     args.timeout), [ids["generate"][i % len(ids["generate"])]
+                                                     for i in range(args.background)]))
+    if ids["analyze"]:
+        classes.append((TrafficClass("interactive", "/api/free-llm-analysis", args.base_urls, {}, args.timeout),
+                        [ids["analyze"][i % len(ids["analyze"])] for i in range(args.interactive)]))
+
+    results: Dict[str, List[Dict[str, object]]] = {}
+
+    def drive(traffic: TrafficClass, work: List[str]):
+        results[traffic.name] = run_concurrent(traffic.run, work, args.concurrency)
+
+    try:
+        with Stopwatch() as wall:
+            threads = [threading.Thread(target=drive, args=pair) for pair in classes]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        provider_rows = []
+        for name, _, _, _ in PROVIDERS:
+            stats = mocks[name].llm.snapshot()
+            calls = stats.get("requests", 0)
+            limited = stats.get("rate_limited", 0)
+            provider_rows.append({"provider": name, "rpm": rpm[name], "calls": calls, "served": calls - limited,
+                                  "429s": limited, "429 rate": limited / calls if calls else 0.0,
+                                  "max active": stats.get("max_active", 0)})
+    finally:
+        for mock in mocks.values():
+            mock.stop()
+
+    rows = []
+    for name, outcome in results.items():
+        ok = [r for r in outcome if r["http"] == 200]
+        latency = summarize([r["ms"] for r in ok])
+        rows.append({"class": name, "requests": len(outcome), "ok": len(ok), "p50": latency["p50"],
+                     "p90": latency["p90"], "p99": latency["p99"], "max": latency["max"]})
+    print_table(rows, ["class", "requests", "ok", "p50", "p90", "p99", "max"], title="Latency by traffic class (ms)")
+    print_table(provider_rows, ["provider", "rpm", "calls", "served", "429s", "429 rate", "max active"],
+                title="Provider load")
+
+    for base_url in args.base_urls:
+        scheduler = provider_stats(base_url)
+        if not scheduler:
+            continue
+        granted = {name: info.get("granted", 0) for name, info in scheduler.get("providers", {}).items()}
+        waits = scheduler.get("avgWaitMs", {})
+        print(f"\n  {base_url} [{scheduler.get('mode')}]: granted {granted}, "
+              f"avg wait interactive {waits.get('interactive', 0):.0f}ms / background {waits.get('background', 0):.0f}ms, "
+              f"timeouts {scheduler.get('timeouts', 0)}")
+
+    total_429 = sum(row["429s"] for row in provider_rows)
+    print(f"\n  {wall.elapsed_ms / 1000:.1f}s wall across {len(args.base_urls)} worker(s), {total_429} provider 429s")
+    return 0 if all(row["ok"] == row["requests"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
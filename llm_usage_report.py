@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+LLM Usage Report for RecruiterAI
+Drives the LLM-backed routes with a small representative workload against the
+offline mock LLM from mock_llm.py and reports, per route and provider/model, what
+each request cost: LLM calls, prompt/completion tokens and the time spent waiting
+for a rate-limit token, on the network and parsing replies. Figures come from the
+X-LLM-Usage header of every response; the server-side totals of /api/llm-usage
+(reset at the start of the run, so background work is included) follow.
+
+Answer analysis routes need nothing else. Question generation routes regenerate the
+questions of an existing interview, so pass --interview-id to include them.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GEMINI_BASE_URL=http://localhost:2360 \\
+        GROQ_API_KEY=local GEMINI_API_KEY=local npm run dev
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Tuple
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, LLMUsageTally, Stopwatch, print_table, summarize
+
+USAGE_ROUTE = "/api/llm-usage"
+
+ANSWER = {
+    "question": "How would you design a rate limiter for a public API?",
+    "expectedAnswer": "Token bucket or sliding window, per-key state in shared storage, limit headers.",
+    "userAnswer": "I would use a token bucket per API key stored in Redis, refilled at the allowed rate, "
+                  "and return 429 with Retry-After once the bucket is empty.",
+    "category": "technical",
+    "companyContext": "Acme Corp",
+    "cache": False,
+}
+
+GENERATION_ROUTES = ["/api/groq-generate-questions", "/api/free-llm-questions", "/api/smart-generate-questions",
+                     "/api/optimized-generate-questions"]
+
+
+def workload(interview_id: str, answers: int) -> List[Tuple[str, Dict[str, object]]]:
+    work: List[Tuple[str, Dict[str, object]]] = []
+    for i in range(answers):
+        answer = {**ANSWER, "userAnswer": f"{ANSWER['userAnswer']} (variant {i})"}
+        work.append(("/api/groq-analyze-response", answer))
+        work.append(("/api/optimized-analyze-response", answer))
+    work.append(("/api/groq-analyze-responses", {"answers": [ANSWER] * answers, "companyContext": "Acme Corp",
+                                                 "cache": False}))
+    if interview_id:
+        work.extend((route, {"interviewId": interview_id, "regenerate": True}) for route in GENERATION_ROUTES)
+    return work
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-route LLM cost and latency report")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--interview-id", default="", help="interview whose questions the generation routes redo")
+    parser.add_argument("--answers", type=int, default=5, help="answers analysed per analysis route")
+    parser.add_argument("--rounds", type=int, default=2, help="times the whole workload is repeated")
+    parser.add_argument("--timeout", type=float, default=300)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    print("🧾 RecruiterAI LLM Usage Report")
+    print("=" * 60)
+
+    work = workload(args.interview_id, args.answers) * args.rounds
+    print(f"{len(work)} requests over {len({route for route, _ in work})} routes")
+    if not args.interview_id:
+        print("ℹ️  No --interview-id: question generation routes skipped")
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+
+    tally = LLMUsageTally()
+    latencies: Dict[str, List[float]] = {}
+    failures = 0
+    try:
+        requests.delete(f"{args.base_url}{USAGE_ROUTE}", timeout=10)
+        for route, body in work:
+            with Stopwatch() as sw:
+                response = requests.post(f"{args.base_url}{route}", json=body, timeout=args.timeout)
+            if response.status_code != 200:
+                failures += 1
+                print(f"⚠️  {route} answered {response.status_code}")
+            latencies.setdefault(route, []).append(sw.elapsed_ms)
+            tally.add(route, response.headers)
+        server = requests.get(f"{args.base_url}{USAGE_ROUTE}", timeout=10).json()
+    except requests.RequestException as e:
+        print(f"❌ Report failed: {e}")
+        return 1
+    finally:
+        mock.stop()
+
+    tally.print()
+
+    rows = []
+    for route, values in latencies.items():
+        llm_ms = sum(r["llm ms/req"] for r in tally.rows() if r["route"] == route)
+        s = summarize(values)
+        rows.append({"route": route, "requests": s["count"], "p50": s["p50"], "p90": s["p90"],
+                     "llm ms/req": llm_ms, "llm share": llm_ms / s["avg"] if s["avg"] else 0.0})
+    print_table(rows, ["route", "requests", "p50", "p90", "llm ms/req", "llm share"],
+                title="Request latency vs time in LLM calls (ms)")
+
+    print_table([{"provider": f"{p['provider']}/{p['model']}", "calls": p["calls"], "failures": p["failures"],
+                  "tokens": p["totalTokens"], "estimated": p["estimatedCalls"], "queue avg": p["avgQueueMs"],
+                  "network avg": p["avgNetworkMs"], "network p90": p["networkP90Ms"] or 0.0,
+                  "parse avg": p["avgParseMs"]} for p in server.get("providers", [])],
+                ["provider", "calls", "failures", "tokens", "estimated", "queue avg", "network avg", "network p90",
+                 "parse avg"], title="Server totals per provider (/api/llm-usage)")
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Local Judge0-Compatible Execution Server for RecruiterAI
+Offline stand-in for the RapidAPI Judge0 CE endpoint used by the DSA services.
+Implements the subset of the Judge0 API the app calls:
+
+    POST /submissions[?wait=true&base64_encoded=true]
+    GET  /submissions/{token}
+    POST /submissions/batch            GET /submissions/batch?tokens=a,b,c
+    GET  /languages                    GET /stats  (local extension)
+
+Code runs in subprocesses inside a temporary directory with CPU, memory and wall
+clock limits. Queue depth and worker count are configurable so the app's
+execution pipeline can be benchmarked under many concurrent submissions.
+
+Point the app at it with:
+    JUDGE0_BASE_URL=http://localhost:2358 JUDGE0_API_KEY=local npm run dev
+"""
+
+import argparse
+import base64
+import json
+import os
+import queue
+import resource
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Judge0 status ids
+STATUS = {
+    1: "In Queue",
+    2: "Processing",
+    3: "Accepted",
+    4: "Wrong Answer",
+    5: "Time Limit Exceeded",
+    6: "Compilation Error",
+    11: "Runtime Error (NZEC)",
+    13: "Internal Error",
+}
+
+# language_id -> (name, source file, compile command or None, run command)
+LANGUAGES: Dict[int, Tuple[str, str, Optional[List[str]], List[str]]] = {
+    71: ("Python (3.8.1)", "main.py", None, [sys.executable, "main.py"]),
+    63: ("JavaScript (Node.js 12.14.0)", "main.js", None, ["node", "--max-old-space-size={mem_mb}", "main.js"]),
+    54: ("C++ (GCC 9.2.0)", "main.cpp", ["g++", "-O2", "-std=c++17", "-o", "main", "main.cpp"], ["./main"]),
+    50: ("C (GCC 9.2.0)", "main.c", ["gcc", "-O2", "-o", "main", "main.c"], ["./main"]),
+    62: ("Java (OpenJDK 13.0.1)", "Main.java", ["javac", "Main.java"], ["java", "-Xmx{mem_mb}m", "Main"]),
+}
+
+# Runtimes that reserve large virtual address space and cannot run under RLIMIT_AS
+NO_ADDRESS_SPACE_LIMIT = {63, 62}
+
+
+def available_languages() -> Dict[int, Tuple[str, str, Optional[List[str]], List[str]]]:
+    """Languages whose toolchain is installed on this machine"""
+    return {
+        lang_id: spec for lang_id, spec in LANGUAGES.items()
+        if shutil.which((spec[2] or spec[3])[0]) or spec[3][0] == sys.executable
+    }
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def run_limited(cmd: List[str], stdin: bytes, cwd: str, cpu_seconds: float, memory_mb: int,
+                wall_seconds: float, limit_address_space: bool = True) -> Dict[str, Any]:
+    """Run a command under rlimits and collect output plus per-process resource usage"""
+
+    def apply_limits():
+        os.setsid()
+        cpu = max(1, int(cpu_seconds + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+        if limit_address_space:
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        resource.setrlimit(resource.RLIMIT_FSIZE, (16 * 1024 * 1024, 16 * 1024 * 1024))
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, preexec_fn=apply_limits,
+                            env={"PATH": os.environ.get("PATH", ""), "HOME": cwd, "LANG": "C.UTF-8"})
+
+    outputs: Dict[str, bytes] = {}
+
+    def pump(name: str, stream):
+        outputs[name] = stream.read(4 * 1024 * 1024)
+        stream.close()
+
+    readers = [threading.Thread(target=pump, args=("stdout", proc.stdout), daemon=True),
+               threading.Thread(target=pump, args=("stderr", proc.stderr), daemon=True)]
+    for reader in readers:
+        reader.start()
+    try:
+        proc.stdin.write(stdin)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+
+    # os.wait4 instead of Popen.wait so the child's own rusage is available
+    timed_out = False
+    status, usage = 0, None
+    deadline = start + wall_seconds
+    while True:
+        pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.perf_counter() > deadline:
+            timed_out = True
+            os.killpg(proc.pid, signal.SIGKILL)
+            _, status, usage = os.wait4(proc.pid, 0)
+            break
+        time.sleep(0.002)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - start
+    for reader in readers:
+        reader.join(timeout=1)
+
+    term_signal = os.WTERMSIG(status) if os.WIFSIGNALED(status) else None
+    cpu_time = (usage.ru_utime + usage.ru_stime) if usage else 0.0
+    return {
+        "stdout": outputs.get("stdout", b""),
+        "stderr": outputs.get("stderr", b""),
+        "exit_code": proc.returncode if term_signal is None else None,
+        "exit_signal": term_signal,
+        "time": cpu_time,
+        "wall_time": wall,
+        "memory": usage.ru_maxrss if usage else 0,  # KB on Linux
+        "timed_out": timed_out or term_signal == signal.SIGXCPU or cpu_time > cpu_seconds,
+    }
+
+
+class Submission:
+    def __init__(self, payload: Dict[str, Any], base64_encoded: bool):
+        if not isinstance(payload, dict):
+            raise TypeError("submission must be a JSON object")
+        self.token = str(uuid.uuid4())
+        self.base64_encoded = base64_encoded
+        self.language_id = int(payload.get("language_id", 71))
+        self.source_code = self._decode(payload.get("source_code"))
+        self.stdin = self._decode(payload.get("stdin"))
+        self.expected_output = payload.get("expected_output")
+        if self.expected_output is not None:
+            self.expected_output = self._decode(self.expected_output)
+        self.cpu_time_limit = float(payload.get("cpu_time_limit") or 2.0)
+        self.wall_time_limit = float(payload.get("wall_time_limit") or max(5.0, self.cpu_time_limit * 2.5))
+        self.memory_limit_kb = int(payload.get("memory_limit") or 128000)
+        self.status_id = 1
+        self.created_at = _now_iso()
+        self.finished_at: Optional[str] = None
+        self.enqueued = time.perf_counter()
+        self.started = 0.0
+        self.finished = 0.0
+        self.result: Dict[str, Any] = {}
+        self.done = threading.Event()
+
+    def _decode(self, value: Optional[str]) -> str:
+        if value is None:
+            return ""
+        if self.base64_encoded:
+            return base64.b64decode(value).decode("utf-8", errors="replace")
+        return value
+
+    def _encode(self, value: Optional[str], base64_encoded: bool) -> Optional[str]:
+        if value is None or value == "":
+            return None
+        if base64_encoded:
+            return base64.b64encode(value.encode("utf-8")).decode("ascii")
+        return value
+
+    def timings(self) -> Dict[str, float]:
+        """Queue wait and execution time in ms (perf_counter based, local extension)"""
+        return {
+            "queue_ms": round((self.started - self.enqueued) * 1000, 2) if self.started else None,
+            "exec_ms": round((self.finished - self.started) * 1000, 2) if self.finished else None,
+            "enqueued": self.enqueued,
+            "finished": self.finished,
+        }
+
+    def to_json(self, base64_encoded: bool, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        data = {
+            "token": self.token,
+            "language_id": self.language_id,
+            "status": {"id": self.status_id, "description": STATUS[self.status_id]},
+            "stdout": self._encode(self.result.get("stdout"), base64_encoded),
+            "stderr": self._encode(self.result.get("stderr"), base64_encoded),
+            "compile_output": self._encode(self.result.get("compile_output"), base64_encoded),
+            "message": self._encode(self.result.get("message"), base64_encoded),
+            "exit_code": self.result.get("exit_code"),
+            "exit_signal": self.result.get("exit_signal"),
+            "time": f"{self.result['time']:.3f}" if "time" in self.result else None,
+            "wall_time": f"{self.result['wall_time']:.3f}" if "wall_time" in self.result else None,
+            "memory": self.result.get("memory"),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+        if fields and "*" not in fields:
+            data = {k: v for k, v in data.items() if k in fields}
+        return data
+
+
+class LocalJudge0:
+    """Submission store, bounded queue and worker pool; only the last `retain` finished
+    submissions are kept, so long benchmarks do not hold every source and output"""
+
+    def __init__(self, workers: int = 4, queue_depth: int = 100, retain: int = 5000):
+        self.languages = available_languages()
+        self.queue: "queue.Queue[Submission]" = queue.Queue(maxsize=queue_depth)
+        self.queue_depth = queue_depth
+        self.retain = retain
+        self.submissions: Dict[str, Submission] = {}
+        self.finished: Deque[str] = deque()
+        self.lock = threading.Lock()
+        self.stats: Counter = Counter()
+        self.max_queue_seen = 0
+        self.workers = [threading.Thread(target=self._worker, daemon=True, name=f"judge0-worker-{i}")
+                        for i in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, payload: Dict[str, Any], base64_encoded: bool) -> Submission:
+        submission = Submission(payload, base64_encoded)
+        self.queue.put_nowait(submission)  # raises queue.Full when saturated
+        with self.lock:
+            self.submissions[submission.token] = submission
+            self.stats["submissions"] += 1
+            self.stats[f"language_{submission.language_id}"] += 1
+            self.max_queue_seen = max(self.max_queue_seen, self.queue.qsize())
+        return submission
+
+    def get(self, token: str) -> Optional[Submission]:
+        with self.lock:
+            return self.submissions.get(token)
+
+    def find(self, marker: str) -> List[Submission]:
+        """Submissions whose source contains marker; harnesses tag code to correlate app requests"""
+        with self.lock:
+            return [s for s in self.submissions.values() if marker in s.source_code]
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+            self.max_queue_seen = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                **self.stats,
+                "queue_size": self.queue.qsize(),
+                "queue_depth": self.queue_depth,
+                "max_queue_seen": self.max_queue_seen,
+                "workers": len(self.workers),
+            }
+
+    def _worker(self):
+        while True:
+            submission = self.queue.get()
+            submission.status_id = 2
+            submission.started = time.perf_counter()
+            try:
+                self._execute(submission)
+            except Exception as e:
+                submission.status_id = 13
+                submission.result["message"] = str(e)
+            submission.finished = time.perf_counter()
+            submission.finished_at = _now_iso()
+            with self.lock:
+                self.stats["executed"] += 1
+                self.stats[f"status_{submission.status_id}"] += 1
+                self.finished.append(submission.token)
+                while len(self.finished) > self.retain:
+                    self.submissions.pop(self.finished.popleft(), None)
+                    self.stats["evicted"] += 1
+            submission.done.set()
+
+    def _execute(self, submission: Submission):
+        spec = self.languages.get(submission.language_id)
+        if not spec:
+            submission.status_id = 13
+            submission.result["message"] = f"Language {submission.language_id} not available in local Judge0"
+            return
+
+        _, filename, compile_cmd, run_cmd = spec
+        memory_mb = max(16, submission.memory_limit_kb // 1024)
+        workdir = tempfile.mkdtemp(prefix="judge0-")
+        try:
+            with open(os.path.join(workdir, filename), "w") as f:
+                f.write(submission.source_code)
+
+            if compile_cmd:
+                compiled = run_limited(compile_cmd, b"", workdir, cpu_seconds=15, memory_mb=1024,
+                                       wall_seconds=30, limit_address_space=False)
+                if compiled["exit_code"] != 0:
+                    submission.status_id = 6
+                    submission.result["compile_output"] = (compiled["stdout"] + compiled["stderr"]).decode(
+                        "utf-8", errors="replace")
+                    return
+
+            cmd = [part.format(mem_mb=memory_mb) for part in run_cmd]
+            result = run_limited(cmd, submission.stdin.encode("utf-8"), workdir, submission.cpu_time_limit,
+                                 memory_mb, submission.wall_time_limit,
+                                 limit_address_space=submission.language_id not in NO_ADDRESS_SPACE_LIMIT)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        stdout = result["stdout"].decode("utf-8", errors="replace")
+        submission.result.update({
+            "stdout": stdout,
+            "stderr": result["stderr"].decode("utf-8", errors="replace"),
+            "exit_code": result["exit_code"],
+            "exit_signal": result["exit_signal"],
+            "time": result["time"],
+            "wall_time": result["wall_time"],
+            "memory": result["memory"],
+        })
+
+        if result["timed_out"]:
+            submission.status_id = 5
+        elif result["exit_code"] != 0:
+            submission.status_id = 11
+            submission.result["message"] = (
+                f"Exited with error status {result['exit_code']}" if result["exit_code"] is not None
+                else f"Killed by signal {result['exit_signal']}")
+        elif submission.expected_output is not None and \
+                stdout.rstrip() != submission.expected_output.rstrip():
+            submission.status_id = 4
+        else:
+            submission.status_id = 3
+
+
+class Judge0RequestHandler(BaseHTTPRequestHandler):
+    judge: LocalJudge0 = None  # set by LocalJudge0Server
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _count(self, key: str):
+        with self.judge.lock:
+            self.judge.stats[f"http_{key}"] += 1
+            self.judge.stats["http_requests"] += 1
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        b64 = params.get("base64_encoded", ["false"])[0] == "true"
+        wait = params.get("wait", ["false"])[0] == "true"
+        try:
+            payload = self._read_json()
+        except ValueError:
+            return self._send(400, {"error": "invalid JSON"})
+
+        if url.path.rstrip("/") == "/stats/reset":
+            self.judge.reset_stats()
+            return self._send(200, {"reset": True})
+
+        if url.path.rstrip("/") == "/submissions/batch":
+            self._count("batch_submit")
+            items = payload.get("submissions") if isinstance(payload, dict) else None
+            if not isinstance(items, list):
+                return self._send(400, {"error": "submissions must be a list"})
+            results = []
+            for item in items:
+                try:
+                    results.append({"token": self.judge.submit(item, b64).token})
+                except queue.Full:
+                    results.append({"error": "queue is full"})
+                except (ValueError, TypeError) as e:
+                    results.append({"error": str(e)})
+            return self._send(201, results)
+
+        if url.path.rstrip("/") != "/submissions":
+            return self._send(404, {"error": "not found"})
+
+        self._count("submit")
+        try:
+            submission = self.judge.submit(payload, b64)
+        except queue.Full:
+            return self._send(503, {"error": "queue is full"})
+        except (ValueError, TypeError) as e:
+            return self._send(422, {"error": str(e)})
+
+        if wait:
+            submission.done.wait(timeout=submission.wall_time_limit + 60)
+            return self._send(201, submission.to_json(b64))
+        return self._send(201, {"token": submission.token})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        b64 = params.get("base64_encoded", ["false"])[0] == "true"
+        fields = params.get("fields", [""])[0].split(",") if params.get("fields") else None
+        path = url.path.rstrip("/")
+
+        if path == "/languages":
+            self._count("languages")
+            return self._send(200, [{"id": i, "name": spec[0]} for i, spec in sorted(self.judge.languages.items())])
+        if path == "/stats":
+            return self._send(200, self.judge.snapshot())
+        if path in ("/about", "/system_info"):
+            return self._send(200, {"version": "local-stand-in", "workers": len(self.judge.workers)})
+        if path == "/submissions/batch":
+            self._count("batch_get")
+            tokens = params.get("tokens", [""])[0].split(",")
+            found = [self.judge.get(t) for t in tokens if t]
+            return self._send(200, {"submissions": [s.to_json(b64, fields) if s else None for s in found]})
+        if path.startswith("/submissions/"):
+            self._count("get")
+            submission = self.judge.get(path.rsplit("/", 1)[-1])
+            if not submission:
+                return self._send(404, {"error": "submission not found"})
+            return self._send(200, submission.to_json(b64, fields))
+        return self._send(404, {"error": "not found"})
+
+
+class LocalJudge0Server:
+    """Run the stand-in on a background thread; usable as a context manager from harnesses"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, workers: int = 4, queue_depth: int = 100,
+                 retain: int = 5000):
+        self.judge = LocalJudge0(workers, queue_depth, retain)
+        handler = type("BoundJudge0Handler", (Judge0RequestHandler,), {"judge": self.judge})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalJudge0Server":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Judge0-compatible execution server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2358)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-depth", type=int, default=100)
+    parser.add_argument("--retain", type=int, default=5000, help="finished submissions kept for polling")
+    args = parser.parse_args()
+
+    server = LocalJudge0Server(args.host, args.port, args.workers, args.queue_depth, args.retain)
+    names = ", ".join(spec[0] for spec in server.judge.languages.values())
+    print("⚖️ Local Judge0 stand-in")
+    print("=" * 60)
+    print(f"URL: {server.url}  workers: {args.workers}  queue depth: {args.queue_depth}")
+    print(f"Languages: {names}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
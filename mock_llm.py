@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Mock LLM Server for RecruiterAI
+Offline stand-in for the LLM providers, for load tests and benchmarks. It
+recognises the app's prompts (interview questions, DSA problems, answer analysis)
+and answers with well-formed JSON of the requested size after a configurable,
+size-dependent latency, in the provider's own response format:
+
+    POST /openai/v1/chat/completions          OpenAI/Groq (also /v1/chat/completions)
+    POST /v1/models/<model>:generateContent   Gemini
+    POST /models/<model>                      Hugging Face Inference
+    GET  /stats                               POST /stats/reset
+
+Latency is base + per-item time per generated item, with lognormal jitter and an
+optional slow tail. An optional requests-per-minute limit answers 429 with
+Retry-After like the free tiers do, a failure rate injects 500s and a drop rate
+leaves entries out of batched analysis replies.
+
+Point the app at it with:
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+(GEMINI_BASE_URL / HUGGINGFACE_BASE_URL do the same for the other providers.)
+"""
+
+import argparse
+import json
+import random
+import re
+import select
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# kind -> (base latency ms, ms per generated item)
+DEFAULT_LATENCY: Dict[str, Tuple[float, float]] = {
+    "questions": (400.0, 150.0),
+    "dsa": (800.0, 600.0),
+    "analysis": (600.0, 0.0),
+    "analysis_batch": (700.0, 150.0),
+    "other": (300.0, 0.0),
+}
+
+
+def classify(prompt: str) -> Tuple[str, str, int]:
+    """(kind, category, item count) for an app prompt"""
+    count_match = re.search(r"(?:Generate|Create) exactly (\d+)", prompt)
+    count = int(count_match.group(1)) if count_match else 1
+    if re.search(r"DSA problems", prompt):
+        return "dsa", "dsa", count
+    category_match = re.search(r"(?:Generate|Create) exactly \d+ (?:EXTREMELY CHALLENGING )?(\w+) interview questions",
+                               prompt)
+    if category_match:
+        return "questions", category_match.group(1).lower(), count
+    batch_match = re.search(r"Analyze each of the (\d+) interview responses", prompt)
+    if batch_match:
+        return "analysis_batch", "analysis", int(batch_match.group(1))
+    if re.search(r"analy[sz]", prompt, re.IGNORECASE):
+        return "analysis", "analysis", 1
+    return "other", "other", 1
+
+
+def make_questions(category: str, count: int, seed: str) -> List[Dict[str, Any]]:
+    return [{
+        "id": f"mock-{category}-{seed}-{i}",
+        "question": f"[{category}] Mock question {i + 1}: describe how you would approach scenario {seed}-{i}.",
+        "expectedAnswer": "A structured answer covering trade-offs, an example and the outcome.",
+        "category": category,
+        "difficulty": "medium",
+        "points": 10,
+        "timeLimit": 5,
+        "evaluationCriteria": ["Accuracy", "Clarity", "Depth"],
+        "tags": ["mock", category],
+        "hints": ["Start from the requirements"],
+    } for i in range(count)]
+
+
+def make_dsa(count: int, seed: str) -> List[Dict[str, Any]]:
+    return [{
+        "id": f"mock-dsa-{seed}-{i}",
+        "title": f"Mock Pair Sum {seed}-{i}",
+        "difficulty": "medium",
+        "description": "Given an array nums and an integer target, return indices of the two numbers adding to target.",
+        "examples": [{"input": "nums = [2,7,11,15], target = 9", "output": "[0,1]", "explanation": "2 + 7 = 9"}],
+        "testCases": [
+            {"id": "test-1", "input": "nums = [2,7,11,15], target = 9", "expectedOutput": "[0,1]", "hidden": False},
+            {"id": "test-2", "input": "nums = [3,2,4], target = 6", "expectedOutput": "[1,2]", "hidden": False},
+        ],
+        "constraints": ["2 <= nums.length <= 10^4"],
+        "topics": ["Array", "Hash Table"],
+        "hints": ["Use a hash map"],
+        "timeComplexity": "O(n)",
+        "spaceComplexity": "O(n)",
+    } for i in range(count)]
+
+
+def make_analysis(seed: str) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    score = rng.randint(55, 95)
+    return {
+        "score": score,
+        "overallScore": score,
+        "feedback": "Clear structure with a concrete example; quantify the impact more.",
+        "strengths": ["Structured answer", "Relevant example"],
+        "improvements": ["Quantify results", "Discuss trade-offs"],
+        "technicalAccuracy": score,
+        "communication": max(0, score - 5),
+        "problemSolving": min(100, score + 3),
+    }
+
+
+class MockLLM:
+    def __init__(self, latency: Dict[str, Tuple[float, float]], jitter: float = 0.2, slow_fraction: float = 0.0,
+                 slow_factor: float = 5.0, rpm: int = 0, failure_rate: float = 0.0, drop_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_fraction = slow_fraction
+        self.slow_factor = slow_factor
+        self.rpm = rpm
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats: Counter = Counter()
+        self.latencies: List[float] = []
+        self.active = 0
+        self.window: List[float] = []  # request start times inside the last minute
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+            self.latencies.clear()
+            self.window.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {**self.stats, "active": self.active, "latencies_ms": list(self.latencies)}
+
+    def admit(self) -> Optional[float]:
+        """None when admitted, otherwise seconds until the rate limit frees a slot"""
+        now = time.time()
+        with self.lock:
+            self.stats["requests"] += 1
+            if self.rpm:
+                self.window = [t for t in self.window if now - t < 60]
+                if len(self.window) >= self.rpm:
+                    self.stats["rate_limited"] += 1
+                    return max(0.0, 60 - (now - self.window[0]))
+                self.window.append(now)
+            self.active += 1
+            self.stats["max_active"] = max(self.stats["max_active"], self.active)
+        return None
+
+    def delay_ms(self, kind: str, items: int) -> Tuple[float, bool, bool]:
+        base, per_item = self.latency.get(kind, self.latency["other"])
+        with self.lock:
+            jitter = self.rng.lognormvariate(0, self.jitter) if self.jitter else 1.0
+            slow = self.rng.random() < self.slow_fraction
+            fail = self.rng.random() < self.failure_rate
+        return (base + per_item * items) * jitter * (self.slow_factor if slow else 1.0), slow, fail
+
+    def complete(self, prompt: str) -> Optional[str]:
+        """Generated content for an app prompt after the simulated latency; None for an injected failure"""
+        kind, category, count = classify(prompt)
+        delay, slow, fail = self.delay_ms(kind, count)
+        time.sleep(delay / 1000)
+
+        with self.lock:
+            self.active -= 1
+            self.stats[f"kind_{kind}"] += 1
+            self.stats["slow"] += int(slow)
+            self.latencies.append(delay)
+            if fail:
+                self.stats["failed"] += 1
+        if fail:
+            return None
+
+        seed = f"{int(time.time() * 1000) % 100000}{self.rng.randint(0, 999)}"
+        if kind == "questions":
+            return json.dumps(make_questions(category, count, seed))
+        if kind == "dsa":
+            return json.dumps(make_dsa(count, seed))
+        if kind == "analysis_batch":
+            ids = re.findall(r"### Response id: (\S+)", prompt)
+            with self.lock:
+                kept = [i for i in ids if self.rng.random() >= self.drop_rate]
+                self.stats["dropped"] += len(ids) - len(kept)
+            return json.dumps({"analyses": [{"id": i, **make_analysis(seed + i)} for i in kept]})
+        return json.dumps(make_analysis(seed))
+
+
+def openai_prompt(payload: Dict[str, Any]) -> str:
+    return "\n".join(str(m.get("content", "")) for m in payload.get("messages", []))
+
+
+def openai_reply(payload: Dict[str, Any], prompt: str, content: str) -> Any:
+    prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+    return {
+        "id": f"chatcmpl-mock-{int(time.time() * 1000)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "mock"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens},
+    }
+
+
+def gemini_prompt(payload: Dict[str, Any]) -> str:
+    return "\n".join(part.get("text", "") for item in payload.get("contents", []) for part in item.get("parts", []))
+
+
+def gemini_reply(payload: Dict[str, Any], prompt: str, content: str) -> Any:
+    return {
+        "candidates": [{"content": {"role": "model", "parts": [{"text": content}]}, "finishReason": "STOP"}],
+        "usageMetadata": {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(content) // 4,
+                          "totalTokenCount": (len(prompt) + len(content)) // 4},
+    }
+
+
+def huggingface_prompt(payload: Dict[str, Any]) -> str:
+    return str(payload.get("inputs", ""))
+
+
+def huggingface_reply(payload: Dict[str, Any], prompt: str, content: str) -> Any:
+    return [{"generated_text": content}]
+
+
+def api_for(path: str):
+    """(prompt extractor, reply builder) for an OpenAI, Gemini or Hugging Face style path"""
+    if path.endswith("/chat/completions"):
+        return openai_prompt, openai_reply
+    if path.endswith(":generateContent"):
+        return gemini_prompt, gemini_reply
+    if path.startswith("/models/"):
+        return huggingface_prompt, huggingface_reply
+    return None
+
+
+class MockLLMRequestHandler(BaseHTTPRequestHandler):
+    llm: MockLLM = None  # set by MockLLMServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _client_gone(self) -> bool:
+        readable, _, _ = select.select([self.connection], [], [], 0)
+        try:
+            return bool(readable) and not self.connection.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send(400, {"error": {"message": "invalid JSON"}})
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path == "/stats/reset":
+            self.llm.reset_stats()
+            return self._send(200, {"reset": True})
+        api = api_for(path)
+        if api is None:
+            return self._send(404, {"error": {"message": "not found"}})
+        extract_prompt, build_reply = api
+
+        retry_after = self.llm.admit()
+        if retry_after is not None:
+            return self._send(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                              {"Retry-After": str(max(1, round(retry_after)))})
+        prompt = extract_prompt(payload)
+        content = self.llm.complete(prompt)
+        if self._client_gone():
+            # The caller gave up, e.g. a hedged request whose other attempt won
+            with self.llm.lock:
+                self.llm.stats["abandoned"] += 1
+            self.close_connection = True
+            return
+        if content is None:
+            return self._send(500, {"error": {"message": "mock upstream failure", "type": "server_error"}})
+        self._send(200, build_reply(payload, prompt, content))
+
+    def do_GET(self):
+        if self.path.split("?")[0].rstrip("/") == "/stats":
+            return self._send(200, self.llm.snapshot())
+        return self._send(404, {"error": {"message": "not found"}})
+
+
+class MockLLMServer:
+    """Run the mock on a background thread; usable as a context manager from harnesses"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **options):
+        self.llm = MockLLM(options.pop("latency", dict(DEFAULT_LATENCY)), **options)
+        handler = type("BoundMockLLMHandler", (MockLLMRequestHandler,), {"llm": self.llm})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockLLMServer":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def parse_latency(specs: List[str]) -> Dict[str, Tuple[float, float]]:
+    """kind=base_ms[:per_item_ms] overrides on top of the defaults"""
+    latency = dict(DEFAULT_LATENCY)
+    for spec in specs:
+        kind, _, value = spec.partition("=")
+        base, _, per_item = value.partition(":")
+        latency[kind] = (float(base), float(per_item or latency.get(kind, (0, 0))[1]))
+    return latency
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser, default_port: int = 2360):
+    """Flags shared by the harnesses that start a mock LLM"""
+    parser.add_argument("--mock-port", type=int, default=default_port)
+    parser.add_argument("--mock-latency", nargs="*", default=[], metavar="KIND=BASE[:PER_ITEM]",
+                        help=f"kinds: {', '.join(DEFAULT_LATENCY)}")
+    parser.add_argument("--mock-jitter", type=float, default=0.2, help="lognormal sigma of the latency")
+    parser.add_argument("--mock-slow-fraction", type=float, default=0.0, help="share of requests in the slow tail")
+    parser.add_argument("--mock-slow-factor", type=float, default=5.0)
+    parser.add_argument("--mock-rpm", type=int, default=0, help="requests per minute before 429 (0 = unlimited)")
+    parser.add_argument("--mock-failure-rate", type=float, default=0.0)
+    parser.add_argument("--mock-drop-rate", type=float, default=0.0, help="share of batched analyses left out")
+
+
+def mock_from_args(args: argparse.Namespace, host: str = "127.0.0.1") -> MockLLMServer:
+    return MockLLMServer(host, args.mock_port, latency=parse_latency(args.mock_latency), jitter=args.mock_jitter,
+                         slow_fraction=args.mock_slow_fraction, slow_factor=args.mock_slow_factor,
+                         rpm=args.mock_rpm, failure_rate=args.mock_failure_rate, drop_rate=args.mock_drop_rate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock OpenAI/Groq-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    server = mock_from_args(args, args.host)
+    print("🤖 Mock LLM server")
+    print("=" * 60)
+    print(f"URL: {server.url}  rpm limit: {args.mock_rpm or 'none'}  failure rate: {args.mock_failure_rate}")
+    for kind, (base, per_item) in server.llm.latency.items():
+        print(f"  {kind:<14} {base:.0f}ms + {per_item:.0f}ms/item")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+MongoDB Index Bootstrap & Query-Plan Verification for RecruiterAI
+Declares the indexes the hot API routes rely on, creates them idempotently and
+verifies with explain() that every route query shape is served by an index.
+
+Usage:
+    MONGODB_URI=... python mongo_index_tool.py                      # ensure + verify
+    MONGODB_URI=... python mongo_index_tool.py --db bench --seed-users 200
+    MONGODB_URI=... python mongo_index_tool.py --verify-only
+"""
+
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from perf_harness import DEFAULT_DB_NAME, Stopwatch, get_database, print_table, summarize
+
+# (collection, keys, name) - names are fixed so re-runs are no-ops
+REQUIRED_INDEXES = [
+    ("interviews", [("userId", 1), ("status", 1)], "userId_status"),
+    ("interviews", [("userId", 1), ("createdAt", -1)], "userId_createdAt"),
+    ("questions", [("interviewId", 1)], "interviewId"),
+    ("dsa_executions", [("problemId", 1)], "problemId"),
+    ("performances", [("userId", 1), ("completedAt", -1)], "userId_completedAt"),
+    ("performances", [("interviewId", 1), ("userId", 1)], "interviewId_userId"),
+    ("performance_analysis", [("userId", 1), ("createdAt", -1)], "userId_createdAt"),
+    ("interview_sessions", [("interviewId", 1), ("status", 1)], "interviewId_status"),
+    ("resumeAnalyses", [("userId", 1), ("createdAt", -1)], "userId_createdAt"),
+    ("resumeAnalyses", [("id", 1), ("userId", 1)], "id_userId"),
+    ("resumeAnalyses", [("userId", 1), ("fingerprint", 1), ("createdAt", -1)], "userId_fingerprint_createdAt"),
+]
+
+
+def _route_queries() -> List[Dict[str, Any]]:
+    """Query shapes exactly as issued by the API routes (see src/app/api/*/route.ts)"""
+    return [
+        {
+            "route": "/api/user-interviews",
+            "collection": "interviews",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_oid"], "status": {"$ne": "completed"}},
+            "sort": [("createdAt", -1)],
+            "limit": 10,
+        },
+        {
+            "route": "/api/user-interviews",
+            "collection": "interviews",
+            "op": "aggregate",
+            "pipeline": lambda c: [
+                {"$match": {"userId": c["user_oid"]}},
+                {"$group": {"_id": None, "total": {"$sum": 1}}},
+            ],
+        },
+        {
+            "route": "/api/user-interviews",
+            "collection": "interviews",
+            "op": "count",
+            "filter": lambda c: {"userId": c["user_str"], "status": "completed"},
+        },
+        {
+            "route": "/api/interviews",
+            "collection": "interviews",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_str"]},
+            "sort": [("createdAt", -1)],
+        },
+        {
+            "route": "/api/fast-feedback",
+            "collection": "questions",
+            "op": "find",
+            "filter": lambda c: {"interviewId": c["interview_str"]},
+            "limit": 1,
+        },
+        {
+            "route": "/api/fast-feedback",
+            "collection": "dsa_executions",
+            "op": "find",
+            "filter": lambda c: {"problemId": {"$in": c["problem_ids"]}},
+        },
+        {
+            "route": "/api/performance-stats",
+            "collection": "performances",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_oid"]},
+            "sort": [("completedAt", -1)],
+        },
+        {
+            "route": "/api/save-performance",
+            "collection": "performances",
+            "op": "find",
+            "filter": lambda c: {"interviewId": c["interview_oid"]},
+            "limit": 1,
+        },
+        {
+            "route": "/api/check-interview-status",
+            "collection": "performances",
+            "op": "find",
+            "filter": lambda c: {"interviewId": c["interview_oid"], "userId": c["user_oid"]},
+            "limit": 1,
+        },
+        {
+            "route": "/api/user-performance",
+            "collection": "performance_analysis",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_str"]},
+            "sort": [("createdAt", -1)],
+        },
+        {
+            "route": "/api/interview-session",
+            "collection": "interview_sessions",
+            "op": "find",
+            "filter": lambda c: {"interviewId": c["interview_str"], "status": "active"},
+            "limit": 1,
+        },
+        {
+            "route": "/api/resume-analysis-history",
+            "collection": "resumeAnalyses",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_str"]},
+            "sort": [("createdAt", -1)],
+        },
+        {
+            "route": "/api/resume-analysis-history/[id]",
+            "collection": "resumeAnalyses",
+            "op": "find",
+            "filter": lambda c: {"id": c["analysis_id"], "userId": c["user_str"]},
+            "limit": 1,
+        },
+        {
+            "route": "/api/analyze-resume (repeat upload)",
+            "collection": "resumeAnalyses",
+            "op": "find",
+            "filter": lambda c: {"userId": c["user_str"], "fingerprint": c["analysis_fingerprint"]},
+            "sort": [("createdAt", -1)],
+            "limit": 1,
+        },
+    ]
+
+
+class MongoIndexTool:
+    def __init__(self, db):
+        self.db = db
+        self.context: Dict[str, Any] = {}
+
+    def log(self, message: str):
+        print(message)
+
+    # ------------------------------------------------------------------ seeding
+
+    def seed(self, users: int, interviews_per_user: int = 20, batch_size: int = 1000):
+        """Insert synthetic documents shaped like the ones the routes write"""
+        from bson import ObjectId
+
+        self.log(f"\n🌱 Seeding {users} users x {interviews_per_user} interviews into '{self.db.name}'")
+        now = datetime.utcnow()
+        buffers: Dict[str, List[Dict]] = {name: [] for name in (
+            "interviews", "questions", "dsa_executions", "performances",
+            "performance_analysis", "interview_sessions", "resumeAnalyses")}
+
+        def flush(force: bool = False):
+            for name, docs in buffers.items():
+                if docs and (force or len(docs) >= batch_size):
+                    self.db[name].insert_many(docs, ordered=False)
+                    docs.clear()
+
+        for _ in range(users):
+            user_oid = ObjectId()
+            user_str = str(user_oid)
+            for i in range(interviews_per_user):
+                interview_oid = ObjectId()
+                interview_str = str(interview_oid)
+                created = now - timedelta(hours=random.randint(0, 24 * 90))
+                status = random.choice(["ready", "in-progress", "completed", "completed"])
+                problem_id = f"problem-{random.randint(1, 500)}"
+                buffers["interviews"].append({
+                    "_id": interview_oid,
+                    # Both userId formats exist in production data
+                    "userId": user_oid if i % 4 else user_str,
+                    "jobTitle": "Software Engineer",
+                    "companyName": random.choice(["Google", "Microsoft", "Amazon", "Meta"]),
+                    "status": status,
+                    "createdAt": created,
+                    "benchSeed": True,
+                })
+                buffers["questions"].append({
+                    "interviewId": interview_str,
+                    "questions": [{"id": problem_id, "category": "dsa"}],
+                    "answers": ["seeded answer"],
+                    "benchSeed": True,
+                })
+                buffers["dsa_executions"].append({
+                    "interviewId": interview_str,
+                    "problemId": problem_id,
+                    "userId": user_str,
+                    "createdAt": created,
+                    "benchSeed": True,
+                })
+                buffers["interview_sessions"].append({
+                    "interviewId": interview_str,
+                    "userId": user_str,
+                    "status": "active" if status != "completed" else "completed",
+                    "createdAt": created,
+                    "benchSeed": True,
+                })
+                if status == "completed":
+                    buffers["performances"].append({
+                        "userId": user_oid,
+                        "interviewId": interview_oid,
+                        "score": random.randint(30, 100),
+                        "completedAt": created + timedelta(minutes=45),
+                        "benchSeed": True,
+                    })
+                    buffers["performance_analysis"].append({
+                        "userId": user_str,
+                        "interviewId": interview_str,
+                        "createdAt": created + timedelta(minutes=45),
+                        "benchSeed": True,
+                    })
+            buffers["resumeAnalyses"].append({
+                "id": f"analysis-{user_str}",
+                "userId": user_str,
+                "fingerprint": f"fp-{user_str}",
+                "createdAt": now,
+                "benchSeed": True,
+            })
+            flush()
+        flush(force=True)
+
+        self.context = {
+            "user_oid": user_oid,
+            "user_str": user_str,
+            "interview_oid": interview_oid,
+            "interview_str": interview_str,
+            "problem_ids": [problem_id],
+            "analysis_id": f"analysis-{user_str}",
+            "analysis_fingerprint": f"fp-{user_str}",
+        }
+        self.log("✅ Seeding complete")
+
+    def cleanup_seed(self):
+        for name in {c for c, _, _ in REQUIRED_INDEXES}:
+            result = self.db[name].delete_many({"benchSeed": True})
+            self.log(f"🧹 {name}: removed {result.deleted_count} seeded documents")
+
+    def load_context(self):
+        """Pick real parameter values for the query shapes from existing data"""
+        from bson import ObjectId
+
+        if self.context:
+            return
+        interview = self.db.interviews.find_one({}, {"_id": 1, "userId": 1}) or {}
+        user_id = interview.get("userId") or ObjectId()
+        user_oid = user_id if isinstance(user_id, ObjectId) else (
+            ObjectId(user_id) if ObjectId.is_valid(str(user_id)) else ObjectId())
+        interview_oid = interview.get("_id") or ObjectId()
+        execution = self.db.dsa_executions.find_one({}, {"problemId": 1}) or {}
+        analysis = self.db.resumeAnalyses.find_one({}, {"id": 1, "fingerprint": 1}) or {}
+        self.context = {
+            "user_oid": user_oid,
+            "user_str": str(user_oid),
+            "interview_oid": interview_oid,
+            "interview_str": str(interview_oid),
+            "problem_ids": [execution.get("problemId", "problem-1")],
+            "analysis_id": analysis.get("id", "missing"),
+            "analysis_fingerprint": analysis.get("fingerprint", "missing"),
+        }
+
+    # ------------------------------------------------------------------ indexes
+
+    def ensure_indexes(self) -> int:
+        """Create every declared index; an index on the same keys under any name is left alone"""
+        from pymongo.errors import OperationFailure
+
+        self.log("\n🔧 Ensuring required indexes")
+        self.log("=" * 50)
+        failures = 0
+        for collection, keys, name in REQUIRED_INDEXES:
+            existing = self.db[collection].index_information()
+            present = next((index for index, info in existing.items() if list(info["key"]) == keys), None)
+            if present:
+                alias = "" if present == name else f" (as {present})"
+                self.log(f"  ✓ {collection}.{name} already present{alias}")
+                continue
+            try:
+                self.db[collection].create_index(keys, name=name)
+                self.log(f"  ➕ {collection}.{name} created")
+            except OperationFailure as e:
+                failures += 1
+                self.log(f"  ❌ {collection}.{name} failed: {e}")
+        return failures
+
+    def drop_declared_indexes(self):
+        from pymongo.errors import OperationFailure
+
+        # By key pattern, so indexes found under another name are dropped too
+        for collection, keys, _ in REQUIRED_INDEXES:
+            try:
+                self.db[collection].drop_index(keys)
+            except OperationFailure:
+                pass
+
+    # ------------------------------------------------------------------ queries
+
+    def _run(self, shape: Dict[str, Any]):
+        coll = self.db[shape["collection"]]
+        if shape["op"] == "count":
+            return coll.count_documents(shape["filter"](self.context))
+        if shape["op"] == "aggregate":
+            return list(coll.aggregate(shape["pipeline"](self.context)))
+        cursor = coll.find(shape["filter"](self.context))
+        if shape.get("sort"):
+            cursor = cursor.sort(shape["sort"])
+        if shape.get("limit"):
+            cursor = cursor.limit(shape["limit"])
+        return list(cursor)
+
+    def _explain(self, shape: Dict[str, Any]) -> Dict[str, Any]:
+        name = shape["collection"]
+        if shape["op"] == "count":
+            command = {"count": name, "query": shape["filter"](self.context)}
+        elif shape["op"] == "aggregate":
+            command = {"aggregate": name, "pipeline": shape["pipeline"](self.context), "cursor": {}}
+        else:
+            command = {"find": name, "filter": shape["filter"](self.context)}
+            if shape.get("sort"):
+                command["sort"] = dict(shape["sort"])
+            if shape.get("limit"):
+                command["limit"] = shape["limit"]
+        return self.db.command({"explain": command, "verbosity": "queryPlanner"})
+
+    @staticmethod
+    def winning_stages(node: Any, inside: bool = False) -> List[str]:
+        """Collect plan stage names from every winningPlan in an explain document"""
+        stages: List[str] = []
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "rejectedPlans":
+                    continue
+                if key == "stage" and inside:
+                    stages.append(value)
+                stages.extend(MongoIndexTool.winning_stages(value, inside or key == "winningPlan"))
+        elif isinstance(node, list):
+            for item in node:
+                stages.extend(MongoIndexTool.winning_stages(item, inside))
+        return stages
+
+    def time_queries(self, repeat: int) -> Dict[str, float]:
+        timings = {}
+        for shape in _route_queries():
+            samples = []
+            for _ in range(repeat):
+                with Stopwatch() as sw:
+                    self._run(shape)
+                samples.append(sw.elapsed_ms)
+            timings[self._label(shape)] = summarize(samples)["p50"]
+        return timings
+
+    def verify_plans(self) -> int:
+        """explain() each route query shape; returns the number of COLLSCANs"""
+        self.log("\n🔍 Verifying query plans")
+        self.log("=" * 50)
+        collscans = 0
+        for shape in _route_queries():
+            stages = self.winning_stages(self._explain(shape))
+            label = self._label(shape)
+            if "COLLSCAN" in stages:
+                collscans += 1
+                self.log(f"  ❌ {label}: COLLSCAN ({' > '.join(stages)})")
+            else:
+                self.log(f"  ✅ {label}: {' > '.join(stages) or 'EOF'}")
+        return collscans
+
+    @staticmethod
+    def _label(shape: Dict[str, Any]) -> str:
+        return f"{shape['route']} [{shape['collection']}.{shape['op']}]"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bootstrap and verify RecruiterAI MongoDB indexes")
+    parser.add_argument("--db", default=DEFAULT_DB_NAME, help="database name (default: %(default)s)")
+    parser.add_argument("--seed-users", type=int, default=0, help="seed synthetic data for N users first")
+    parser.add_argument("--interviews-per-user", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per query shape")
+    parser.add_argument("--verify-only", action="store_true", help="do not create indexes")
+    parser.add_argument("--drop-first", action="store_true",
+                        help="drop the declared indexes first to measure 'before' timings")
+    parser.add_argument("--cleanup", action="store_true", help="remove seeded documents at the end")
+    args = parser.parse_args()
+
+    print("🗄️ RecruiterAI MongoDB Index Tool")
+    print("=" * 60)
+
+    tool = MongoIndexTool(get_database(db_name=args.db))
+
+    if args.drop_first and not args.verify_only:
+        tool.drop_declared_indexes()
+    if args.seed_users:
+        tool.seed(args.seed_users, args.interviews_per_user)
+    tool.load_context()
+
+    before = tool.time_queries(args.repeat) if not args.verify_only else {}
+    failures = 0 if args.verify_only else tool.ensure_indexes()
+    after = tool.time_queries(args.repeat)
+
+    print_table(
+        [
+            {
+                "query": label,
+                "before_ms": before.get(label, 0.0),
+                "after_ms": after[label],
+                "speedup": (before[label] / after[label]) if before.get(label) and after[label] else 0.0,
+            }
+            for label in after
+        ],
+        ["query", "before_ms", "after_ms", "speedup"],
+        title="Query timings (p50)",
+    )
+
+    collscans = tool.verify_plans()
+
+    if args.cleanup and args.seed_users:
+        tool.cleanup_seed()
+
+    print(f"\n📋 Index failures: {failures}  COLLSCAN query shapes: {collscans}")
+    if failures or collscans:
+        print("❌ Index verification FAILED")
+        return 1
+    print("✅ All route query shapes are index-backed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
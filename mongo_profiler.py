@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+MongoDB Profiler Capture for RecruiterAI Load Runs
+Enables the database profiler for the duration of a load run, tags every request
+with an x-correlation-id that the routes forward as the query comment, and
+attributes the captured profile entries back to the API route that issued them.
+
+Usage:
+    MONGODB_URI=... python mongo_profiler.py \\
+        --route 'POST /api/fast-feedback {"interviewId": "..."}' \\
+        --route 'GET /api/performance-stats' --cookie 'authjs.session-token=...' \\
+        --requests 50 --concurrency 5
+
+The profiler is unavailable on Atlas shared tiers; run against a local mongod or a
+dedicated cluster.
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from perf_harness import (
+    CORRELATION_HEADER,
+    DEFAULT_BASE_URL,
+    DEFAULT_DB_NAME,
+    get_database,
+    new_correlation_id,
+    print_table,
+    run_concurrent,
+    summarize,
+)
+
+
+def query_shape(node: Any) -> Any:
+    """Replace literal values with their type name so equal shapes group together"""
+    if isinstance(node, dict):
+        return {k: query_shape(v) for k, v in sorted(node.items())}
+    if isinstance(node, list):
+        return [query_shape(v) for v in node[:1]]
+    return type(node).__name__
+
+
+def entry_comment(entry: Dict[str, Any]) -> Optional[str]:
+    """The forwarded comment lives in different places depending on the op type"""
+    for source in (entry.get("command") or {}, entry.get("originatingCommand") or {}, entry):
+        comment = source.get("comment")
+        if isinstance(comment, str):
+            return comment
+    return None
+
+
+def entry_filter(entry: Dict[str, Any]) -> Any:
+    command = entry.get("command") or {}
+    for key in ("filter", "q", "query", "pipeline"):
+        if key in command:
+            return command[key]
+    return {}
+
+
+class ProfilerCapture:
+    """Switches the profiler on for a run and restores the previous level afterwards.
+
+    system.profile is a capped collection (1 MB by default) that level-2 load wraps
+    quickly, so it is recreated at size_mb when smaller and put back to its original
+    size on exit; a wrap is still reported."""
+
+    def __init__(self, db, slowms: int = 0, size_mb: int = 64):
+        self.db = db
+        self.slowms = slowms
+        self.size_mb = size_mb
+        self.previous: Dict[str, Any] = {}
+        self.original_size: Optional[int] = None  # bytes, when system.profile was resized
+        self.started_at: Optional[datetime] = None
+
+    def _resize_profile(self, size: Optional[int]):
+        """Recreate system.profile at size bytes, or leave it to mongod's default when None.
+        The profiler must be off to replace its collection."""
+        self.db.command({"profile": 0})
+        self.db.drop_collection("system.profile")
+        if size:
+            self.db.create_collection("system.profile", capped=True, size=size)
+
+    def _ensure_capacity(self):
+        try:
+            current = self.db.command("collStats", "system.profile").get("maxSize", 0)
+        except Exception:
+            current = 0
+        if current >= self.size_mb * 1024 * 1024:
+            return
+        self.original_size = current
+        self._resize_profile(self.size_mb * 1024 * 1024)
+        print(f"📏 Resized system.profile to {self.size_mb} MB for the run")
+
+    def _restore(self):
+        if self.original_size is not None:
+            self._resize_profile(self.original_size)
+            self.original_size = None
+        self.db.command({
+            "profile": self.previous.get("was", 0),
+            "slowms": self.previous.get("slowms", 100),
+        })
+
+    def __enter__(self):
+        self.previous = self.db.command({"profile": -1})
+        try:
+            self._ensure_capacity()
+            self.db.command({"profile": 2, "slowms": self.slowms})
+            # Server clock, only used to detect a wrapped profile; entries are matched by run id
+            self.started_at = self.db.command("hello").get("localTime")
+        except Exception:
+            self._restore()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        self._restore()
+        return False
+
+    def entries(self, run_id: str) -> List[Dict[str, Any]]:
+        tagged = {"$regex": re.escape(run_id)}
+        profile = self.db["system.profile"]
+        entries = list(profile.find({"$or": [{"command.comment": tagged},
+                                             {"originatingCommand.comment": tagged},
+                                             {"comment": tagged}]}))
+        oldest = next(profile.find({}, {"ts": 1}).sort("$natural", 1).limit(1), None)
+        if oldest and self.started_at and oldest.get("ts") and oldest["ts"] > self.started_at:
+            print(f"⚠️  system.profile wrapped during the run: entries before {oldest['ts']} are lost; "
+                  f"raise the profile size or lower the load")
+        return entries
+
+
+class ProfiledLoadRun:
+    def __init__(self, base_url: str, db, cookie: Optional[str] = None):
+        self.base_url = base_url.rstrip("/")
+        self.db = db
+        self.session = requests.Session()
+        if cookie:
+            self.session.headers["Cookie"] = cookie
+        self.run_id = new_correlation_id("run")
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        # correlation id -> --route path, to attribute entries whatever label the route reports
+        self.paths: Dict[str, str] = {}
+
+    def _send(self, job: Tuple[str, str, Optional[Dict]]):
+        method, path, payload = job
+        correlation_id = f"{self.run_id}-{new_correlation_id('req')}"
+        self.paths[correlation_id] = path
+        headers = {CORRELATION_HEADER: correlation_id}
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", json=payload,
+                                            headers=headers, timeout=120)
+            if response.status_code >= 400:
+                self.errors[path] += 1
+        except requests.RequestException:
+            self.errors[path] += 1
+        self.latencies[path].append((time.perf_counter() - start) * 1000)
+
+    def run(self, routes: List[Tuple[str, str, Optional[Dict]]], requests_per_route: int,
+            concurrency: int, slowms: int = 0) -> List[Dict[str, Any]]:
+        jobs = [route for route in routes for _ in range(requests_per_route)]
+        print(f"🚀 Run {self.run_id}: {len(jobs)} requests, concurrency {concurrency}")
+        with ProfilerCapture(self.db, slowms) as profiler:
+            run_concurrent(self._send, jobs, concurrency)
+            # Give the profiler a moment to flush trailing writes
+            time.sleep(0.5)
+            return profiler.entries(self.run_id)
+
+    def report(self, entries: List[Dict[str, Any]], top: int = 10):
+        per_route: Dict[str, Dict[str, Any]] = defaultdict(lambda: defaultdict(int))
+        shapes: Dict[Tuple[str, str, str, str], List[Dict[str, Any]]] = defaultdict(list)
+
+        for entry in entries:
+            label, _, correlation_id = (entry_comment(entry) or "?|").partition("|")
+            route = self.paths.get(correlation_id, label)
+            stats = per_route[route]
+            stats["queries"] += 1
+            stats["docsExamined"] += entry.get("docsExamined", 0)
+            stats["keysExamined"] += entry.get("keysExamined", 0)
+            stats["nreturned"] += entry.get("nreturned", 0)
+            stats["millis"] += entry.get("millis", 0)
+            if entry.get("planSummary") == "COLLSCAN":
+                stats["collscans"] += 1
+            shape = json.dumps(query_shape(entry_filter(entry)), sort_keys=True)
+            shapes[(route, entry.get("ns", ""), entry.get("op", ""), shape)].append(entry)
+
+        rows = []
+        for path, samples in self.latencies.items():
+            stats = per_route.get(path, {})
+            http = summarize(samples)
+            requests_made = len(samples)
+            rows.append({
+                "route": path,
+                "requests": requests_made,
+                "errors": self.errors.get(path, 0),
+                "http_p50_ms": http["p50"],
+                "http_p99_ms": http["p99"],
+                "queries/req": stats.get("queries", 0) / requests_made if requests_made else 0.0,
+                "docsExamined": stats.get("docsExamined", 0),
+                "nreturned": stats.get("nreturned", 0),
+                "examined/returned": stats.get("docsExamined", 0) / max(1, stats.get("nreturned", 0)),
+                "collscans": stats.get("collscans", 0),
+                "db_ms": stats.get("millis", 0),
+            })
+        print_table(rows, ["route", "requests", "errors", "http_p50_ms", "http_p99_ms", "queries/req",
+                           "docsExamined", "nreturned", "examined/returned", "collscans", "db_ms"],
+                    title="Per-route query attribution")
+
+        slowest = sorted(
+            (
+                {
+                    "route": route,
+                    "ns": ns,
+                    "op": op,
+                    "count": len(items),
+                    "max_ms": max(e.get("millis", 0) for e in items),
+                    "avg_ms": sum(e.get("millis", 0) for e in items) / len(items),
+                    "plan": items[0].get("planSummary", ""),
+                    "shape": shape[:80],
+                }
+                for (route, ns, op, shape), items in shapes.items()
+            ),
+            key=lambda r: r["max_ms"],
+            reverse=True,
+        )[:top]
+        print_table(slowest, ["route", "ns", "op", "count", "max_ms", "avg_ms", "plan", "shape"],
+                    title=f"Slowest query shapes (top {top})")
+
+
+def parse_route(spec: str) -> Tuple[str, str, Optional[Dict]]:
+    """'POST /api/x {"a": 1}' -> ('POST', '/api/x', {'a': 1})"""
+    parts = spec.split(None, 2)
+    if len(parts) < 2:
+        raise argparse.ArgumentTypeError(f"Route must be 'METHOD /path [json]': {spec}")
+    payload = json.loads(parts[2]) if len(parts) == 3 else None
+    return parts[0].upper(), parts[1], payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile MongoDB queries per API route during a load run")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--db", default=DEFAULT_DB_NAME, help="database the app writes to")
+    parser.add_argument("--route", action="append", type=parse_route, required=True,
+                        help="'METHOD /api/path [json body]', repeatable")
+    parser.add_argument("--requests", type=int, default=20, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--cookie", help="session cookie for authenticated routes")
+    parser.add_argument("--slowms", type=int, default=0, help="profiler slowms threshold")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print("🔬 RecruiterAI MongoDB Profiler Capture")
+    print("=" * 60)
+
+    run = ProfiledLoadRun(args.base_url, get_database(db_name=args.db), args.cookie)
+    try:
+        entries = run.run(args.route, args.requests, args.concurrency, args.slowms)
+    except Exception as e:
+        print(f"❌ Profiler capture failed: {e}")
+        return 1
+
+    print(f"📥 Captured {len(entries)} profile entries tagged with {run.run_id}")
+    run.report(entries, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
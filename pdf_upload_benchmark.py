@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Resume PDF Upload Benchmark for RecruiterAI
+Generates resume-like PDFs of increasing page count, uploads them concurrently to
+/api/parse-resume and reports parse throughput together with the latency of a
+parallel /api/user-interviews probe, which shows whether parsing blocks the
+Node event loop for unrelated requests.
+
+test/data/05-versions-space.pdf is only the placeholder pdf-parse's debug entry
+point expects, so PDFs are generated here; --write-fixture fills it with a valid
+one-page PDF.
+"""
+
+import argparse
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+import requests
+
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, run_concurrent, summarize
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test", "data", "05-versions-space.pdf")
+
+RESUME_LINES = [
+    "Jane Candidate - Senior Software Engineer",
+    "Skills: Python, TypeScript, React, Node.js, MongoDB, AWS, Docker, Kubernetes",
+    "Experience: Built event-driven data pipelines processing 2M events per day",
+    "Led migration of a monolith to services, cutting p99 latency by 40 percent",
+    "Projects: Real-time interview scheduler with WebSockets and Redis",
+    "Education: B.Tech Computer Science",
+]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: int, lines_per_page: int = 45, padding_bytes: int = 0,
+             lines: Optional[List[str]] = None) -> bytes:
+    """Minimal multi-page PDF with Helvetica text, built without third-party libraries.
+    padding_bytes adds an unreferenced binary stream to reach a target file size;
+    lines replaces the default resume text."""
+    lines = lines or RESUME_LINES
+    objects: List[bytes] = []
+    page_ids = [3 + 2 * i for i in range(pages)]
+    font_id = 3 + 2 * pages
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+    for page in range(pages):
+        text_ops = ["BT", "/F1 10 Tf", "50 800 Td", "12 TL"]
+        for line in range(lines_per_page):
+            content = f"Page {page + 1} line {line + 1}: {lines[line % len(lines)]}"
+            text_ops.append(f"({_escape(content)}) '")
+        text_ops.append("ET")
+        stream = "\n".join(text_ops).encode()
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_ids[page] + 1} 0 R >>".encode())
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    if padding_bytes > 0:
+        objects.append(f"<< /Length {padding_bytes} >>\nstream\n".encode() + os.urandom(padding_bytes) + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+class LatencyProbe(threading.Thread):
+    """Polls a cheap route in the background while uploads run"""
+
+    def __init__(self, url: str, interval_s: float, cookie: Optional[str]):
+        super().__init__(daemon=True)
+        self.url = url
+        self.interval_s = interval_s
+        self.session = requests.Session()
+        if cookie:
+            self.session.headers["Cookie"] = cookie
+        self.samples: List[float] = []
+        self.stop_event = threading.Event()
+
+    def sample(self) -> float:
+        with Stopwatch() as sw:
+            self.session.get(self.url, timeout=30)
+        return sw.elapsed_ms
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.samples.append(self.sample())
+            except requests.RequestException:
+                pass
+            self.stop_event.wait(self.interval_s)
+
+    def stop(self):
+        self.stop_event.set()
+        self.join(timeout=30)
+
+
+class PdfUploadBenchmark:
+    def __init__(self, base_url: str, route: str):
+        self.base_url = base_url.rstrip("/")
+        self.route = route
+        self.local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def upload(self, pdf: bytes) -> Dict[str, float]:
+        with Stopwatch() as sw:
+            response = self._session().post(f"{self.base_url}{self.route}", timeout=120,
+                                            files={"resume": ("resume.pdf", pdf, "application/pdf")},
+                                            data={"targetRole": "Software Engineer"})
+        return {"ms": sw.elapsed_ms, "status": response.status_code}
+
+    def pool_stats(self) -> Dict[str, float]:
+        try:
+            response = self._session().get(f"{self.base_url}/api/parse-resume?type=pool-stats", timeout=10)
+            return response.json().get("pdfPool", {}) if response.status_code == 200 else {}
+        except (requests.RequestException, ValueError):
+            return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent resume PDF upload benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--route", default="/api/parse-resume")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--uploads", type=int, default=16, help="uploads per page count")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--probe-route", default="/api/user-interviews")
+    parser.add_argument("--probe-interval-ms", type=float, default=50)
+    parser.add_argument("--cookie", help="session cookie for the probe route")
+    parser.add_argument("--write-fixture", action="store_true", help="write a one-page PDF to the test fixture")
+    args = parser.parse_args()
+
+    print("📄 RecruiterAI Resume PDF Upload Benchmark")
+    print("=" * 60)
+
+    if args.write_fixture:
+        with open(FIXTURE_PATH, "wb") as f:
+            f.write(make_pdf(1))
+        print(f"Wrote {FIXTURE_PATH}")
+
+    bench = PdfUploadBenchmark(args.base_url, args.route)
+    probe_url = f"{args.base_url.rstrip('/')}{args.probe_route}"
+    idle_probe = LatencyProbe(probe_url, 0, args.cookie)
+    try:
+        idle = summarize([idle_probe.sample() for _ in range(20)])
+    except requests.RequestException as e:
+        print(f"❌ Probe route unreachable: {e}")
+        return 1
+
+    rows = []
+    for pages in args.pages:
+        pdf = make_pdf(pages)
+        probe = LatencyProbe(probe_url, args.probe_interval_ms / 1000, args.cookie)
+        before = bench.pool_stats()
+        probe.start()
+        with Stopwatch() as wall:
+            results = run_concurrent(lambda _: bench.upload(pdf), range(args.uploads), args.concurrency)
+        probe.stop()
+        after = bench.pool_stats()
+
+        upload = summarize([r["ms"] for r in results])
+        during = summarize(probe.samples)
+        statuses = Counter(r["status"] for r in results)
+        parsed = after.get("completed", 0) - before.get("completed", 0) if after else None
+        rows.append({
+            "pages": pages, "kb": round(len(pdf) / 1024, 1), "uploads": len(results),
+            "upload_p50": upload["p50"], "upload_p99": upload["p99"],
+            "parsed_per_s": (parsed if parsed is not None else len(results)) / (wall.elapsed_ms / 1000),
+            "probe_p50": during["p50"], "probe_p99": during["p99"],
+            "statuses": " ".join(f"{code}x{n}" for code, n in sorted(statuses.items())),
+        })
+
+    print(f"\n  Idle probe {args.probe_route}: p50 {idle['p50']:.1f}ms, p99 {idle['p99']:.1f}ms")
+    print_table(rows, ["pages", "kb", "uploads", "upload_p50", "upload_p99", "parsed_per_s",
+                       "probe_p50", "probe_p99", "statuses"], title="Upload latency and probe impact (ms)")
+
+    stats = bench.pool_stats()
+    if stats:
+        print(f"\n  PDF pool: {stats.get('workers')} workers, avg parse {stats.get('avgParseMs', 0):.1f}ms, "
+              f"avg queue {stats.get('avgQueueMs', 0):.1f}ms, timed out {stats.get('timedOut', 0)}, "
+              f"rejected {stats.get('rejected', 0)}")
+
+    worst_probe = max((row["probe_p99"] for row in rows), default=0)
+    print(f"\n  Worst probe p99 under upload load: {worst_probe:.1f}ms "
+          f"({worst_probe / max(idle['p99'], 1e-6):.1f}x idle)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the RecruiterAI performance tools
+Timing statistics, report tables and MongoDB access used by the benchmark scripts
+"""
+
+import math
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+DEFAULT_BASE_URL = os.environ.get("RECRUITERAI_BASE_URL", "http://localhost:3000")
+DEFAULT_DB_NAME = os.environ.get("RECRUITERAI_DB_NAME", "Cluster0")
+
+# Forwarded by the routes as the MongoDB query comment (src/lib/queryComment.ts)
+CORRELATION_HEADER = "x-correlation-id"
+
+# Per-response LLM accounting set by withLLMUsage (src/lib/llmUsage.ts)
+LLM_USAGE_HEADER = "x-llm-usage"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile, 0 for an empty sample"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Count, mean and tail percentiles for a list of samples"""
+    if not values:
+        return {"count": 0, "avg": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "avg": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+class Stopwatch:
+    """Context manager recording elapsed wall time in milliseconds"""
+
+    def __init__(self):
+        self.start = 0.0
+        self.elapsed_ms = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed_ms = (time.perf_counter() - self.start) * 1000
+        return False
+
+
+def new_correlation_id(prefix: str = "bench") -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+def run_concurrent(fn: Callable[[Any], Any], items: Iterable[Any], concurrency: int) -> List[Any]:
+    """Apply fn to every item with a bounded thread pool, preserving order"""
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(fn, items))
+
+
+def print_table(rows: Iterable[Dict[str, Any]], columns: List[str], title: Optional[str] = None):
+    """Print rows as a fixed-width text table"""
+    rows = list(rows)
+    if title:
+        print(f"\n📊 {title}")
+        print("=" * 60)
+    if not rows:
+        print("  (no data)")
+        return
+
+    def fmt(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.2f}"
+        return str(value)
+
+    widths = {c: max(len(c), *(len(fmt(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print("  ".join(fmt(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+
+def parse_llm_usage(header: Optional[str]) -> List[Dict[str, Any]]:
+    """Entries of an X-LLM-Usage header: provider/model;calls=..;prompt=..;network=.., ..."""
+    entries = []
+    for part in (header or "").split(","):
+        fields = part.strip().split(";")
+        if not fields[0]:
+            continue
+        provider, _, model = fields[0].partition("/")
+        entry: Dict[str, Any] = {"provider": provider, "model": model}
+        for field in fields[1:]:
+            key, _, value = field.partition("=")
+            entry[key] = float(value) if "." in value else int(value)
+        entries.append(entry)
+    return entries
+
+
+def parse_memory(header: str) -> Dict[str, float]:
+    """X-Memory-Delta-KB header (heap=..;rss=..) as numbers"""
+    values = {}
+    for item in filter(None, header.split(";")):
+        key, _, value = item.partition("=")
+        values[key] = float(value)
+    return values
+
+
+class LLMUsageTally:
+    """Aggregates X-LLM-Usage headers per route and provider/model over a run"""
+
+    FIELDS = ("calls", "failed", "prompt", "completion", "queue", "network", "parse")
+
+    def __init__(self):
+        self.requests: Dict[str, int] = {}
+        self.totals: Dict[tuple, Dict[str, float]] = {}
+
+    def add(self, route: str, headers) -> None:
+        self.requests[route] = self.requests.get(route, 0) + 1
+        for entry in parse_llm_usage(headers.get(LLM_USAGE_HEADER)):
+            totals = self.totals.setdefault((route, entry["provider"], entry["model"]), dict.fromkeys(self.FIELDS, 0))
+            for field in self.FIELDS:
+                totals[field] += entry.get(field, 0)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for (route, provider, model), t in sorted(self.totals.items()):
+            requests = self.requests[route]
+            calls = t["calls"] or 1
+            rows.append({"route": route, "provider": f"{provider}/{model}", "requests": requests,
+                         "calls": int(t["calls"]), "failed": int(t["failed"]),
+                         "tokens/req": (t["prompt"] + t["completion"]) / requests,
+                         "prompt tok": int(t["prompt"]), "completion tok": int(t["completion"]),
+                         "queue avg": t["queue"] / calls, "network avg": t["network"] / calls,
+                         "parse avg": t["parse"] / calls,
+                         "llm ms/req": (t["queue"] + t["network"] + t["parse"]) / requests})
+        return rows
+
+    def print(self, title: str = "LLM cost and latency per route (ms)") -> None:
+        print_table(self.rows(), ["route", "provider", "requests", "calls", "failed", "tokens/req", "prompt tok",
+                                  "completion tok", "queue avg", "network avg", "parse avg", "llm ms/req"],
+                    title=title)
+
+
+def get_database(uri: Optional[str] = None, db_name: Optional[str] = None):
+    """Connect with pymongo using MONGODB_URI, mirroring src/lib/db.ts"""
+    from pymongo import MongoClient
+
+    uri = uri or os.environ.get("MONGODB_URI")
+    if not uri:
+        raise RuntimeError('Invalid/Missing environment variable: "MONGODB_URI"')
+    client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+    return client[db_name or DEFAULT_DB_NAME]
+
+
+def interviews_from_db(count: int, answered: bool = False, db=None) -> List[str]:
+    """Ids of the N newest interviews; with answered, only interviews that have recorded answers"""
+    db = db if db is not None else get_database()
+    if answered:
+        cursor = db.questions.find({"answers.0": {"$exists": True}}, {"interviewId": 1}).sort("createdAt", -1)
+        return [doc["interviewId"] for doc in cursor.limit(count)]
+    cursor = db.interviews.find({}, {"_id": 1}).sort("createdAt", -1).limit(count)
+    return [str(doc["_id"]) for doc in cursor]
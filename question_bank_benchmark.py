@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Question Bank Benchmark for RecruiterAI
+Creates interviews through POST /api/create-interview for a workload of repeating
+(company, role, level, type) combinations, first with the question bank bypassed
+("useQuestionBank": false) and then with it on, against the offline mock LLM from
+mock_llm.py. Reports the bank hit rate (overall and as the bank warms up), the
+creation-to-ready latency of banked vs generated interviews, and LLM calls per
+interview. With --verify-db it also checks that no user was served the same
+question twice for a combination.
+
+create-interview needs a signed-in user: pass one session cookie per simulated user
+(--cookies "authjs.session-token=..." ...), copied from a browser session.
+
+Start the app against the mock first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, get_database, print_table, summarize
+
+ROUTE = "/api/create-interview"
+
+COMBINATIONS = [
+    ("Google", "Software Engineer", "mid", "technical"),
+    ("Amazon", "Backend Engineer", "senior", "mixed"),
+    ("Microsoft", "Frontend Engineer", "entry", "behavioral"),
+    ("Meta", "Software Engineer", "mid", "dsa"),
+    ("Netflix", "Data Engineer", "senior", "technical"),
+    ("Stripe", "Full Stack Engineer", "mid", "aptitude"),
+]
+
+
+def workload(count: int, combos: int, skew: float, seed: int) -> List[Dict[str, str]]:
+    """Interviews over the first `combos` combinations, Zipf-skewed so a few repeat most"""
+    rng = random.Random(seed)
+    pool = COMBINATIONS[:combos]
+    weights = [1 / (rank + 1) ** skew for rank in range(len(pool))]
+    return [dict(zip(("companyName", "jobTitle", "experienceLevel", "interviewType"), rng.choices(pool, weights)[0]))
+            for _ in range(count)]
+
+
+def create_interview(base_url: str, cookie: str, combo: Dict[str, str], use_bank: bool,
+                     timeout: float) -> Dict[str, object]:
+    body = {**combo, "jobDesc": f"{combo['jobTitle']} at {combo['companyName']}",
+            "skills": ["Python", "System Design", "SQL"], "useQuestionBank": use_bank}
+    with Stopwatch() as sw:
+        response = requests.post(f"{base_url}{ROUTE}", json=body, headers={"Cookie": cookie}, timeout=timeout)
+    data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+    return {"http": response.status_code, "ms": sw.elapsed_ms, "id": str(data.get("id", "")),
+            "source": data.get("questionSource", "generated"), "questions": data.get("questionsCount", 0),
+            "status": data.get("status"), "cookie": cookie, **combo}
+
+
+def bank_stats(base_url: str) -> Dict[str, object]:
+    try:
+        response = requests.get(f"{base_url}{ROUTE}", params={"type": "bank-stats"}, timeout=10)
+        return response.json().get("questionBank", {}) if response.status_code == 200 else {}
+    except (requests.RequestException, ValueError):
+        return {}
+
+
+def repeated_questions(results: List[Dict[str, object]]) -> Optional[int]:
+    """Questions a user saw more than once for the same combination (banked interviews only)"""
+    try:
+        db = get_database()
+    except Exception as e:  # The check is optional: report it as skipped
+        print(f"⚠️  Repeat check skipped: {e}")
+        return None
+    seen: Counter = Counter()
+    for r in results:
+        if r["source"] != "question-bank" or not r["id"]:
+            continue
+        doc = db.questions.find_one({"interviewId": r["id"]}, {"questions.question": 1}) or {}
+        for q in doc.get("questions", []):
+            seen[(r["cookie"], r["companyName"], r["jobTitle"], r["experienceLevel"], q.get("question"))] += 1
+    return sum(n - 1 for n in seen.values() if n > 1)
+
+
+def cleanup(results: List[Dict[str, object]]):
+    from bson import ObjectId
+    db = get_database()
+    ids = [r["id"] for r in results if r["id"]]
+    db.questions.delete_many({"interviewId": {"$in": ids}})
+    db.interviews.delete_many({"_id": {"$in": [ObjectId(i) for i in ids if ObjectId.is_valid(i)]}})
+    print(f"🧹 Removed {len(ids)} benchmark interviews")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Question bank benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--cookies", nargs="+", required=True, help="one session cookie per simulated user")
+    parser.add_argument("--interviews", type=int, default=40, help="interviews per arm")
+    parser.add_argument("--combinations", type=int, default=3, choices=range(1, len(COMBINATIONS) + 1))
+    parser.add_argument("--skew", type=float, default=1.2, help="Zipf exponent of combination popularity")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between creations (lets refills run)")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--verify-db", action="store_true", help="check served questions never repeat per user")
+    parser.add_argument("--cleanup", action="store_true", help="delete the created interviews afterwards")
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["questions=1500:300", "dsa=3000:1500"])
+    args = parser.parse_args()
+
+    print("🏦 RecruiterAI Question Bank Benchmark")
+    print("=" * 60)
+
+    work = workload(args.interviews, args.combinations, args.skew, args.seed)
+    print(f"{len(work)} interviews per arm over {args.combinations} combinations, {len(args.cookies)} user(s)")
+
+    mock = mock_from_args(args).start()
+    print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+
+    rows, runs = [], {}
+    try:
+        for label, use_bank in (("no bank", False), ("bank", True)):
+            before = bank_stats(args.base_url)
+            mock.llm.reset_stats()
+            results = []
+            for i, combo in enumerate(work):
+                results.append(create_interview(args.base_url, args.cookies[i % len(args.cookies)], combo, use_bank,
+                                                args.timeout))
+                time.sleep(args.interval)
+            runs[label] = results
+            ok = [r for r in results if r["http"] == 201 and r["status"] == "ready"]
+            latency = summarize([r["ms"] for r in ok])
+            hits = sum(1 for r in ok if r["source"] == "question-bank")
+            after = bank_stats(args.base_url)
+            rows.append({"arm": label, "ready": f"{len(ok)}/{len(results)}", "bank hits": hits,
+                         "hit rate": hits / len(ok) if ok else 0.0, "p50": latency["p50"], "p90": latency["p90"],
+                         "max": latency["max"], "llm calls/interview": mock.llm.snapshot().get("requests", 0) / len(work),
+                         "deposited": after.get("deposited", 0) - before.get("deposited", 0)})
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        mock.stop()
+
+    print_table(rows, ["arm", "ready", "bank hits", "hit rate", "p50", "p90", "max", "llm calls/interview",
+                       "deposited"], title="Creation-to-ready latency (ms)")
+
+    banked = runs["bank"]
+    by_source = []
+    for source in ("question-bank", "generated"):
+        subset = [r["ms"] for r in banked if r["source"] == source and r["http"] == 201]
+        if subset:
+            s = summarize(subset)
+            by_source.append({"source": source, "interviews": len(subset), "p50": s["p50"], "p90": s["p90"],
+                              "max": s["max"]})
+    print_table(by_source, ["source", "interviews", "p50", "p90", "max"], title="Bank arm by question source (ms)")
+
+    window = max(1, len(banked) // 4)
+    warmup = [sum(1 for r in banked[i:i + window] if r["source"] == "question-bank") / len(banked[i:i + window])
+              for i in range(0, len(banked), window)]
+    print("\n  Hit rate as the bank warms up: " + " → ".join(f"{rate:.0%}" for rate in warmup))
+
+    stats = bank_stats(args.base_url)
+    if stats:
+        print(f"  Server: bank size {stats.get('size')}, hit rate {stats.get('hitRate', 0):.1%}, "
+              f"refills queued {stats.get('refillsQueued', 0)}, rejected (fallback) {stats.get('rejected', 0)}")
+
+    repeats = repeated_questions(banked) if args.verify_db else None
+    if repeats is not None:
+        print(f"  Repeated questions per user: {repeats}")
+    if args.cleanup:
+        cleanup([r for run in runs.values() for r in run])
+
+    all_ready = all(r["http"] == 201 for run in runs.values() for r in run)
+    return 0 if all_ready and not repeats else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Async Question Generation Benchmark for RecruiterAI
+Submits question generation for a batch of interviews through the async job API
+(POST /api/groq-generate-questions with "async": true -> 202 + job id), long-polls
+every job's status URL and reports how long the 202 took, how long each job waited
+for a worker slot and how long generation itself took. --blocking runs the same batch
+as plain blocking POSTs for comparison and counts requests that would have outlived
+a proxy timeout.
+
+Interviews come from --interview-ids or, with MONGODB_URI set, the newest interviews
+in the database (--from-db).
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict
+
+import requests
+
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, interviews_from_db, print_table, run_concurrent, summarize
+
+ROUTE = "/api/groq-generate-questions"
+
+
+class QuestionJobClient:
+    def __init__(self, base_url: str, long_poll_ms: int, timeout_s: float):
+        self.base_url = base_url.rstrip("/")
+        self.long_poll_ms = long_poll_ms
+        self.timeout_s = timeout_s
+        self.local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def run_async(self, interview_id: str) -> Dict[str, object]:
+        session = self._session()
+        start = time.perf_counter()
+        response = session.post(f"{self.base_url}{ROUTE}", timeout=30,
+                                json={"interviewId": interview_id, "regenerate": True, "async": True})
+        accepted_ms = (time.perf_counter() - start) * 1000
+        status = response.json()
+        status_url = f"{self.base_url}{status.get('statusUrl', '')}"
+        polls = 0
+        while response.status_code == 202 and time.perf_counter() - start < self.timeout_s:
+            polls += 1
+            response = session.get(status_url, params={"waitMs": self.long_poll_ms},
+                                   timeout=self.long_poll_ms / 1000 + 10)
+            status = response.json()
+        return {
+            "interview": interview_id, "http": response.status_code, "status": status.get("status", "direct"),
+            "accepted_ms": accepted_ms, "queued_ms": status.get("queuedMs", 0), "run_ms": status.get("runMs", 0),
+            "total_ms": (time.perf_counter() - start) * 1000, "polls": polls,
+            "questions": status.get("questionsCount", 0), "deduplicated": status.get("deduplicated", False),
+        }
+
+    def run_blocking(self, interview_id: str) -> Dict[str, object]:
+        try:
+            with Stopwatch() as sw:
+                response = self._session().post(f"{self.base_url}{ROUTE}", timeout=self.timeout_s,
+                                                json={"interviewId": interview_id, "regenerate": True})
+            return {"interview": interview_id, "http": response.status_code, "total_ms": sw.elapsed_ms}
+        except requests.exceptions.Timeout:
+            return {"interview": interview_id, "http": "timeout", "total_ms": self.timeout_s * 1000}
+
+    def queue_stats(self) -> Dict[str, float]:
+        try:
+            response = self._session().get(f"{self.base_url}{ROUTE}", params={"type": "queue-stats"}, timeout=10)
+            return response.json().get("queue", {}) if response.status_code == 200 else {}
+        except (requests.RequestException, ValueError):
+            return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async question generation job benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--interview-ids", nargs="+", default=[])
+    parser.add_argument("--from-db", type=int, default=0, help="use the N newest interviews from MongoDB")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent submitting clients")
+    parser.add_argument("--long-poll-ms", type=int, default=20000)
+    parser.add_argument("--timeout", type=float, default=300, help="give up on a job after this many seconds")
+    parser.add_argument("--blocking", action="store_true", help="also run the batch as blocking POSTs")
+    parser.add_argument("--proxy-timeout", type=float, default=60, help="seconds a typical proxy keeps a request")
+    args = parser.parse_args()
+
+    print("📥 RecruiterAI Async Question Generation Benchmark")
+    print("=" * 60)
+
+    interview_ids = list(args.interview_ids)
+    if args.from_db:
+        interview_ids += interviews_from_db(args.from_db)
+    if not interview_ids:
+        print("❌ No interviews: pass --interview-ids or --from-db N")
+        return 1
+
+    client = QuestionJobClient(args.base_url, args.long_poll_ms, args.timeout)
+    try:
+        with Stopwatch() as wall:
+            results = run_concurrent(client.run_async, interview_ids, args.clients)
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    done = [r for r in results if r["status"] == "completed"]
+    rows = []
+    for label, key in (("202 accepted", "accepted_ms"), ("queue wait", "queued_ms"),
+                       ("generation", "run_ms"), ("client total", "total_ms")):
+        stats = summarize([r[key] for r in done])
+        rows.append({"phase": label, "jobs": stats["count"], "p50": stats["p50"],
+                     "p90": stats["p90"], "p99": stats["p99"], "max": stats["max"]})
+    print_table(rows, ["phase", "jobs", "p50", "p90", "p99", "max"], title="Async job phases (ms)")
+
+    outcomes = Counter(r["status"] for r in results)
+    polls = summarize([r["polls"] for r in done])
+    print(f"\n  {len(interview_ids)} interviews in {wall.elapsed_ms / 1000:.1f}s, outcomes {dict(outcomes)}")
+    print(f"  Status polls per job: avg {polls['avg']:.1f}, max {polls['max']:.0f} "
+          f"(long-poll {args.long_poll_ms}ms); longest single request "
+          f"{max((r['accepted_ms'] for r in results), default=0):.0f}ms to accept")
+
+    stats = client.queue_stats()
+    if stats:
+        print(f"  Worker pool: {stats.get('concurrency')} slots, avg queue {stats.get('avgQueueMs', 0):.0f}ms, "
+              f"avg run {stats.get('avgRunMs', 0):.0f}ms, deduplicated {stats.get('deduplicated', 0)}, "
+              f"rejected {stats.get('rejected', 0)}")
+
+    if args.blocking:
+        with Stopwatch() as blocking_wall:
+            blocking = run_concurrent(client.run_blocking, interview_ids, args.clients)
+        held = summarize([r["total_ms"] for r in blocking])
+        over = sum(1 for r in blocking if r["total_ms"] > args.proxy_timeout * 1000)
+        print(f"\n  Blocking POSTs: {blocking_wall.elapsed_ms / 1000:.1f}s wall, connection held "
+              f"p50 {held['p50']:.0f}ms / max {held['max']:.0f}ms, "
+              f"{over}/{len(blocking)} over a {args.proxy_timeout:.0f}s proxy timeout")
+
+    return 0 if len(done) == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Progressive Question Streaming Benchmark for RecruiterAI
+Regenerates question sets through /api/groq-generate-questions (or
+/api/free-llm-questions) in streaming mode (NDJSON or SSE) and as a plain blocking
+POST, and reports time to the first question, time to the last question and time to
+the final "done" event. A blocking reply delivers every question at once, so its
+first and last question times are both the full response time.
+
+The LLM is the offline mock from mock_llm.py, started here with different latencies
+per section so the slowest section (DSA by default) no longer gates the first
+question. Start the app against it first:
+
+    GROQ_BASE_URL=http://localhost:2360 GROQ_API_KEY=local npm run dev
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
+
+import requests
+
+from mock_llm import add_mock_arguments, mock_from_args
+from perf_harness import DEFAULT_BASE_URL, interviews_from_db, print_table, run_concurrent, summarize
+
+ROUTES = {"groq": "/api/groq-generate-questions", "free-llm": "/api/free-llm-questions"}
+ACCEPT = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+def iter_events(response: requests.Response, fmt: str) -> Iterator[Dict[str, object]]:
+    """Decode NDJSON lines or SSE "data:" frames as they arrive (chunk_size=None: no read-ahead buffering)"""
+    for raw in response.iter_lines(chunk_size=None):
+        line = raw.decode("utf-8")
+        if not line:
+            continue
+        if fmt == "sse":
+            if not line.startswith("data:"):
+                continue
+            line = line[5:].strip()
+        yield json.loads(line)
+
+
+def run_streaming(base_url: str, route: str, fmt: str, interview_id: str, timeout: float) -> Dict[str, object]:
+    start = time.perf_counter()
+    elapsed = lambda: (time.perf_counter() - start) * 1000
+    result: Dict[str, object] = {"interview": interview_id, "mode": fmt, "first_ms": None, "last_ms": None,
+                                 "done_ms": None, "questions": 0, "sections": []}
+    with requests.post(f"{base_url}{route}", json={"interviewId": interview_id, "regenerate": True},
+                       headers={"Accept": ACCEPT[fmt]}, stream=True, timeout=timeout) as response:
+        result["http"] = response.status_code
+        if response.status_code != 200:
+            return result
+        for event in iter_events(response, fmt):
+            if event["type"] == "question":
+                result["first_ms"] = result["first_ms"] or elapsed()
+                result["last_ms"] = elapsed()
+                result["questions"] += 1
+            elif event["type"] == "section":
+                result["sections"].append((event["section"], event["count"], elapsed()))
+            elif event["type"] == "done":
+                result["done_ms"] = elapsed()
+            elif event["type"] == "error":
+                result["error"] = event.get("error")
+    return result
+
+
+def run_blocking(base_url: str, route: str, interview_id: str, timeout: float) -> Dict[str, object]:
+    start = time.perf_counter()
+    response = requests.post(f"{base_url}{route}", json={"interviewId": interview_id, "regenerate": True},
+                             timeout=timeout)
+    total_ms = (time.perf_counter() - start) * 1000
+    ok = response.status_code == 200
+    count = len(response.json().get("questions", [])) if ok else 0
+    return {"interview": interview_id, "mode": "blocking", "http": response.status_code, "questions": count,
+            "first_ms": total_ms if ok else None, "last_ms": total_ms if ok else None,
+            "done_ms": total_ms if ok else None}
+
+
+def section_order(results: List[Dict[str, object]]) -> List[Tuple[str, float, float]]:
+    """Average count and arrival time per section across the streamed runs"""
+    arrivals: Dict[str, List[float]] = {}
+    counts: Counter = Counter()
+    for result in results:
+        for section, count, at in result.get("sections", []):
+            arrivals.setdefault(section, []).append(at)
+            counts[section] += count
+    return sorted(((section, counts[section] / len(times), sum(times) / len(times))
+                   for section, times in arrivals.items()), key=lambda row: row[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Progressive question streaming benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--route", choices=list(ROUTES), default="groq")
+    parser.add_argument("--interview-ids", nargs="+", default=[])
+    parser.add_argument("--from-db", type=int, default=0, help="use the N newest interviews from MongoDB")
+    parser.add_argument("--formats", nargs="+", choices=["ndjson", "sse", "blocking"],
+                        default=["blocking", "ndjson", "sse"])
+    parser.add_argument("--rounds", type=int, default=3, help="runs per interview and format")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--no-mock", action="store_true", help="the app already points at a real or external LLM")
+    add_mock_arguments(parser)
+    parser.set_defaults(mock_latency=["questions=300:120", "dsa=1500:900"])
+    args = parser.parse_args()
+
+    print("🌊 RecruiterAI Progressive Question Streaming Benchmark")
+    print("=" * 60)
+
+    interview_ids = list(args.interview_ids)
+    if args.from_db:
+        interview_ids += interviews_from_db(args.from_db)
+    if not interview_ids:
+        print("❌ No interviews: pass --interview-ids or --from-db N")
+        return 1
+
+    mock = None if args.no_mock else mock_from_args(args).start()
+    if mock:
+        print(f"🤖 Mock LLM on {mock.url}; the app must run with GROQ_BASE_URL={mock.url}")
+
+    route = ROUTES[args.route]
+    rows, streamed, failures = [], [], 0
+    try:
+        for fmt in args.formats:
+            work = [iid for iid in interview_ids for _ in range(args.rounds)]
+            if fmt == "blocking":
+                run = lambda iid: run_blocking(args.base_url, route, iid, args.timeout)
+            else:
+                run = lambda iid, fmt=fmt: run_streaming(args.base_url, route, fmt, iid, args.timeout)
+            results = run_concurrent(run, work, args.concurrency)
+            ok = [r for r in results if r.get("http") == 200 and r["first_ms"] is not None and not r.get("error")]
+            failures += len(results) - len(ok)
+            if fmt != "blocking":
+                streamed += ok
+            first, last, done = (summarize([r[key] for r in ok]) for key in ("first_ms", "last_ms", "done_ms"))
+            rows.append({"mode": fmt, "runs": len(ok), "questions": summarize([r["questions"] for r in ok])["avg"],
+                         "first p50": first["p50"], "first p90": first["p90"], "last p50": last["p50"],
+                         "done p50": done["p50"], "done p90": done["p90"]})
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        if mock:
+            mock.stop()
+
+    print_table(rows, ["mode", "runs", "questions", "first p50", "first p90", "last p50", "done p50", "done p90"],
+                title=f"Time to questions via {route} (ms)")
+
+    if streamed:
+        print("\n  Section arrival (streamed runs, avg):")
+        for section, count, at in section_order(streamed):
+            print(f"    {section:<12} {count:>5.1f} questions at {at:>8.0f}ms")
+
+    blocking = next((row for row in rows if row["mode"] == "blocking"), None)
+    for row in rows:
+        if blocking and row is not blocking and row["first p50"]:
+            print(f"  {row['mode']}: first question {blocking['first p50'] / row['first p50']:.1f}x sooner than blocking")
+    if failures:
+        print(f"\n⚠️  {failures} runs failed or returned no questions")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -145,8 +145,6 @@ class RecruiterAIFocusedTester:
                 200,
                 timeout=10
             )
-            
-            time.sleep(1)  # Brief pause between requests
 
     def test_interview_creation_flow(self):
         """Test Interview Creation Flow (20 mins) - Complete form testing"""
@@ -345,8 +343,6 @@ class RecruiterAIFocusedTester:
                             print(f"  - {company['name']}")
                 else:
                     print(f"⚠️ No companies field in response for '{query}'")
-            
-            time.sleep(0.5)  # Brief pause between searches
         
         # Test edge cases
         self.run_test(
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Resume Analysis Cache Benchmark for RecruiterAI
+Uploads a set of distinct resumes to /api/analyze-resume, then re-uploads each one
+several times for the same target role and once for a different role. Repeat uploads
+should come back as X-Cache: HIT with no llm phase in Server-Timing, i.e. a database
+read instead of a Gemini call, and /api/resume-analysis-history should list exactly
+one analysis per (resume, role) pair.
+
+/api/analyze-resume requires a signed-in session: pass its cookie with --cookie.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+import requests
+
+from pdf_upload_benchmark import RESUME_LINES, make_pdf
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, summarize
+from resume_upload_benchmark import parse_server_timing
+
+ROLES = ["Software Engineer", "Data Scientist"]
+
+
+def make_resume(index: int, run_tag: str) -> bytes:
+    """Distinct resume text per index so every first upload is a true miss"""
+    lines = [f"Candidate {index} ({run_tag}) - Software Engineer"] + RESUME_LINES[1:]
+    return make_pdf(1, lines_per_page=20, lines=lines)
+
+
+class ResumeAnalysisCacheBenchmark:
+    def __init__(self, base_url: str, cookie: str):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.headers["Cookie"] = cookie
+        self.samples: Dict[str, List[float]] = {"MISS": [], "HIT": []}
+        self.server: Dict[str, List[Dict[str, float]]] = {"MISS": [], "HIT": []}
+        self.outcomes: Counter = Counter()
+        self.analysis_ids: Dict[tuple, set] = {}
+
+    def analyze(self, index: int, pdf: bytes, role: str, expected: str) -> bool:
+        with Stopwatch() as sw:
+            response = self.session.post(f"{self.base_url}/api/analyze-resume", timeout=180,
+                                         files={"resume": (f"resume-{index}.pdf", pdf, "application/pdf")},
+                                         data={"targetRole": role})
+        if response.status_code != 200:
+            self.outcomes[f"status {response.status_code}"] += 1
+            return False
+
+        outcome = response.headers.get("X-Cache", "MISS")
+        self.outcomes[f"{expected}->{outcome}"] += 1
+        self.samples[outcome].append(sw.elapsed_ms)
+        self.server[outcome].append(parse_server_timing(response.headers.get("Server-Timing", "")))
+        self.analysis_ids.setdefault((index, role), set()).add(response.json()["analysis"]["id"])
+        return outcome == expected
+
+    def history_ids(self) -> set:
+        response = self.session.get(f"{self.base_url}/api/resume-analysis-history", timeout=30)
+        response.raise_for_status()
+        return {analysis["id"] for analysis in response.json().get("analyses", [])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repeat-upload resume analysis cache benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--cookie", required=True, help="session cookie of a signed-in user")
+    parser.add_argument("--resumes", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=4, help="same-role re-uploads per resume")
+    args = parser.parse_args()
+
+    print("📄 RecruiterAI Resume Analysis Cache Benchmark")
+    print("=" * 60)
+
+    run_tag = f"run {int(time.time())}"
+    bench = ResumeAnalysisCacheBenchmark(args.base_url, args.cookie)
+    mismatches = 0
+    try:
+        for index in range(args.resumes):
+            pdf = make_resume(index, run_tag)
+            mismatches += not bench.analyze(index, pdf, ROLES[0], "MISS")
+            for _ in range(args.repeats):
+                mismatches += not bench.analyze(index, pdf, ROLES[0], "HIT")
+            # Same document for another role is a different analysis
+            mismatches += not bench.analyze(index, pdf, ROLES[1], "MISS")
+        history = bench.history_ids()
+    except requests.RequestException as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+
+    rows = []
+    for outcome in ("MISS", "HIT"):
+        latency = summarize(bench.samples[outcome])
+        server = bench.server[outcome]
+        rows.append({
+            "outcome": outcome, "requests": latency["count"], "p50": latency["p50"], "p99": latency["p99"],
+            "srv_pdf": summarize([s.get("pdf", 0) for s in server])["p50"],
+            "srv_llm": summarize([s.get("llm", 0) for s in server])["p50"],
+            "srv_db": summarize([s.get("db", 0) for s in server])["p50"],
+        })
+    print_table(rows, ["outcome", "requests", "p50", "p99", "srv_pdf", "srv_llm", "srv_db"],
+                title="Analyze latency by cache outcome (ms)")
+
+    print(f"\n  Outcomes (expected->actual): {dict(bench.outcomes)}")
+    miss, hit = summarize(bench.samples["MISS"])["p50"], summarize(bench.samples["HIT"])["p50"]
+    if hit:
+        print(f"  Repeat upload p50 {hit:.1f}ms vs first upload {miss:.1f}ms ({miss / hit:.1f}x faster)")
+
+    # One stored analysis per (resume, role), and the history route sees every one of them
+    duplicated = [key for key, ids in bench.analysis_ids.items() if len(ids) > 1]
+    all_ids = set().union(*bench.analysis_ids.values()) if bench.analysis_ids else set()
+    missing = all_ids - history
+    print(f"  Stored analyses: {len(all_ids)} for {len(bench.analysis_ids)} (resume, role) pairs, "
+          f"{len(missing)} missing from /api/resume-analysis-history")
+
+    if mismatches or duplicated or missing:
+        print("⚠️ Repeat uploads were not served from the analysis store as expected")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Resume Upload Load Scenario for RecruiterAI
+Streams large multipart resume uploads from disk to the resume routes without
+buffering them in Python, across a grid of file sizes and concurrency levels, and
+reports upload bandwidth, server-side processing time (Server-Timing) and the
+server memory delta per upload (X-Memory-Delta-KB).
+
+Two transfer modes:
+  sendfile  fixed Content-Length; the file part goes kernel-to-socket via socket.sendfile
+  chunked   chunked transfer encoding from a generator that readinto()s a reused buffer
+"""
+
+import argparse
+import http.client
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from pdf_upload_benchmark import make_pdf
+from perf_harness import DEFAULT_BASE_URL, parse_memory, print_table, run_concurrent, summarize
+
+CHUNK_SIZE = 256 * 1024
+MB = 1024 * 1024
+
+
+def write_resume_file(directory: str, size_bytes: int) -> str:
+    """A valid 2-page resume PDF padded to roughly size_bytes"""
+    base = len(make_pdf(2))
+    path = os.path.join(directory, f"resume-{size_bytes}.pdf")
+    with open(path, "wb") as f:
+        f.write(make_pdf(2, padding_bytes=max(0, size_bytes - base - 64)))
+    return path
+
+
+class MultipartFile:
+    """Multipart envelope around a file on disk; the file itself is never read into Python memory"""
+
+    def __init__(self, path: str, fields: Dict[str, str], file_field: str = "resume"):
+        self.path = path
+        self.boundary = f"----recruiterai{uuid.uuid4().hex}"
+        parts = [f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{k}\"\r\n\r\n{v}\r\n"
+                 for k, v in fields.items()]
+        parts.append(f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{file_field}\"; "
+                     f"filename=\"{os.path.basename(path)}\"\r\nContent-Type: application/pdf\r\n\r\n")
+        self.head = "".join(parts).encode()
+        self.tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.file_size = os.path.getsize(path)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> int:
+        return len(self.head) + self.file_size + len(self.tail)
+
+    def chunks(self) -> Iterator[memoryview]:
+        yield memoryview(self.head)
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(self.path, "rb", buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                # bytes() only here because requests needs an immutable chunk for chunked encoding
+                yield bytes(view[:read])
+        yield memoryview(self.tail)
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    timings = {}
+    for metric in filter(None, (m.strip() for m in header.split(","))):
+        name, _, params = metric.partition(";")
+        for param in params.split(";"):
+            if param.startswith("dur="):
+                timings[name] = float(param[4:])
+    return timings
+
+
+class ResumeUploadScenario:
+    def __init__(self, base_url: str, route: str, mode: str, cookie: Optional[str]):
+        self.url = urlparse(base_url.rstrip("/") + route)
+        self.mode = mode
+        self.cookie = cookie
+        self.local = threading.local()
+
+    def _send_sendfile(self, body: MultipartFile) -> Dict[str, object]:
+        connection_class = http.client.HTTPSConnection if self.url.scheme == "https" else http.client.HTTPConnection
+        conn = connection_class(self.url.hostname, self.url.port, timeout=300)
+        try:
+            start = time.perf_counter()
+            conn.putrequest("POST", self.url.path)
+            conn.putheader("Content-Type", body.content_type)
+            conn.putheader("Content-Length", str(body.content_length))
+            if self.cookie:
+                conn.putheader("Cookie", self.cookie)
+            conn.endheaders()
+            conn.send(body.head)
+            with open(body.path, "rb") as f:
+                conn.sock.sendfile(f)  # os.sendfile: no copy through user space
+            conn.send(body.tail)
+            sent = time.perf_counter()
+            response = conn.getresponse()
+            response.read()
+            done = time.perf_counter()
+            return {"status": response.status, "headers": dict(response.getheaders()),
+                    "send_s": sent - start, "total_s": done - start}
+        finally:
+            conn.close()
+
+    def _send_chunked(self, body: MultipartFile) -> Dict[str, object]:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        headers = {"Content-Type": body.content_type}
+        if self.cookie:
+            headers["Cookie"] = self.cookie
+        marks = {}
+
+        def timed_chunks():
+            marks["start"] = time.perf_counter()
+            yield from body.chunks()
+            marks["sent"] = time.perf_counter()
+
+        response = self.local.session.post(self.url.geturl(), data=timed_chunks(), headers=headers, timeout=300)
+        done = time.perf_counter()
+        start = marks.get("start", done)
+        return {"status": response.status_code, "headers": dict(response.headers),
+                "send_s": marks.get("sent", done) - start, "total_s": done - start}
+
+    def upload(self, path: str) -> Dict[str, object]:
+        body = MultipartFile(path, {"targetRole": "Software Engineer"})
+        try:
+            result = self._send_sendfile(body) if self.mode == "sendfile" else self._send_chunked(body)
+        except (OSError, http.client.HTTPException, requests.RequestException) as e:
+            return {"status": "error", "error": str(e)[:80], "bytes": body.content_length}
+        headers = {k.lower(): v for k, v in result["headers"].items()}
+        result["server"] = parse_server_timing(headers.get("server-timing", ""))
+        result["memory"] = parse_memory(headers.get("x-memory-delta-kb", ""))
+        result["bytes"] = body.content_length
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamed multipart resume upload load scenario")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--route", default="/api/parse-resume", help="or /api/analyze-resume with --cookie")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[0.25, 1, 4, 8])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--uploads", type=int, default=16, help="uploads per grid cell")
+    parser.add_argument("--mode", choices=["sendfile", "chunked"], default="sendfile")
+    parser.add_argument("--cookie", help="session cookie for authenticated routes")
+    parser.add_argument("--workdir", help="where generated files go (default: temp dir)")
+    args = parser.parse_args()
+
+    print("📤 RecruiterAI Resume Upload Load Scenario")
+    print("=" * 60)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="resume-upload-")
+    files = {size: write_resume_file(workdir, int(size * MB)) for size in args.sizes_mb}
+    print(f"Generated {len(files)} files in {workdir} ({args.mode} transfer)")
+
+    scenario = ResumeUploadScenario(args.base_url, args.route, args.mode, args.cookie)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    rows = []
+    for size, path in files.items():
+        for concurrency in args.concurrency:
+            results = run_concurrent(lambda _: scenario.upload(path), range(args.uploads), concurrency)
+            ok = [r for r in results if r["status"] != "error"]
+            statuses = Counter(str(r["status"]) for r in results)
+            bandwidth = [r["bytes"] / MB / max(r["send_s"], 1e-6) for r in ok]
+            rows.append({
+                "size_mb": size, "conc": concurrency,
+                "upload_MBps": summarize(bandwidth)["p50"],
+                "total_p50": summarize([r["total_s"] * 1000 for r in ok])["p50"],
+                "total_p99": summarize([r["total_s"] * 1000 for r in ok])["p99"],
+                "srv_upload": summarize([r["server"].get("upload", 0) for r in ok])["p50"],
+                "srv_pdf": summarize([r["server"].get("pdf", 0) for r in ok])["p50"],
+                "srv_total": summarize([r["server"].get("total", 0) for r in ok])["p50"],
+                "mem_ab_kb": summarize([r["memory"].get("arrayBuffers", 0) for r in ok])["p50"],
+                "mem_rss_kb": summarize([r["memory"].get("rss", 0) for r in ok])["p50"],
+                "statuses": " ".join(f"{code}x{n}" for code, n in sorted(statuses.items())),
+            })
+
+    print_table(rows, ["size_mb", "conc", "upload_MBps", "total_p50", "total_p99", "srv_upload", "srv_pdf",
+                       "srv_total", "mem_ab_kb", "mem_rss_kb", "statuses"],
+                title="Upload bandwidth, server time (ms) and server memory delta per upload")
+
+    # ru_maxrss is KB on Linux; stays flat because file bodies never enter Python memory
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    largest = max(args.sizes_mb)
+    print(f"\n  Client peak RSS grew {(rss_after - rss_before) / 1024:.1f}MB while sending "
+          f"{max(args.concurrency)} x {largest}MB files concurrently")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
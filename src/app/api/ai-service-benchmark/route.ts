@@ -0,0 +1,117 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
+import { ServerTimer } from '@/lib/serverTiming';
+import GroqAIService from '@/lib/groqAIService';
+import OptimizedAIService from '@/lib/optimizedAIService';
+import SmartAIService from '@/lib/smartAIService';
+import FreeLLMService from '@/lib/freeLLMService';
+import ReliableAIService from '@/lib/reliableAIService';
+import HybridAIService from '@/lib/hybridAIService';
+
+/**
+ * Development-only entry point that runs one identical workload through any of the
+ * parallel AI service families, with nothing else in the request (no auth, no
+ * database), so ai_service_benchmark.py can compare the services themselves.
+ * Server-Timing / X-Memory-Delta-KB and X-LLM-Usage headers carry the measurements.
+ */
+
+interface QuestionParams {
+  jobTitle: string;
+  companyName: string;
+  skills: string[];
+  interviewType: 'technical' | 'behavioral' | 'mixed';
+  experienceLevel: 'entry' | 'mid' | 'senior';
+  numberOfQuestions: number;
+}
+
+interface AnalysisParams {
+  question: string;
+  userAnswer: string;
+  expectedAnswer: string;
+  category: string;
+  companyContext: string;
+}
+
+interface ServiceFamily {
+  questions: (params: QuestionParams) => Promise<any>;
+  analysis: (params: AnalysisParams) => Promise<any>;
+}
+
+// Each family exactly as its own routes call it, fallbacks included
+const FAMILIES: Record<string, ServiceFamily> = {
+  groq: {
+    questions: params => GroqAIService.getInstance().generateInterviewQuestions(params),
+    analysis: p => GroqAIService.getInstance().analyzeInterviewResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  },
+  optimized: {
+    questions: params => OptimizedAIService.getInstance().generateInterviewQuestions(params),
+    analysis: p => OptimizedAIService.getInstance().analyzeInterviewResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  },
+  smart: {
+    questions: params => SmartAIService.getInstance().generateQuestions(params),
+    analysis: p => SmartAIService.getInstance().analyzeResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  },
+  'free-llm': {
+    questions: params => FreeLLMService.getInstance().generateInterviewQuestions(params),
+    analysis: p => FreeLLMService.getInstance().analyzeInterviewResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  },
+  reliable: {
+    questions: params => ReliableAIService.getInstance().generateInterviewQuestions(params),
+    analysis: p => ReliableAIService.getInstance().analyzeInterviewResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  },
+  hybrid: {
+    questions: params => HybridAIService.getInstance().generateInterviewQuestions(params),
+    analysis: p => HybridAIService.getInstance().analyzeInterviewResponse(p.question, p.userAnswer, p.expectedAnswer, p.category, p.companyContext)
+  }
+};
+
+// Smart AI wraps its payload as { success, data, provider, ... }
+function unwrap(result: any): any {
+  return result && typeof result === 'object' && 'data' in result && 'taskType' in result ? result.data : result;
+}
+
+function summarizeResult(task: string, result: any) {
+  const value = unwrap(result);
+  if (task === 'questions') {
+    const questions = Array.isArray(value) ? value : value?.questions;
+    return { items: Array.isArray(questions) ? questions.length : 0 };
+  }
+  return { score: typeof value?.score === 'number' ? value.score : null };
+}
+
+export async function GET() {
+  return NextResponse.json({ families: Object.keys(FAMILIES), tasks: ['questions', 'analysis'] });
+}
+
+export async function POST(request: NextRequest) {
+  if (process.env.NODE_ENV === 'production') {
+    return NextResponse.json({ error: 'Not available in production' }, { status: 403 });
+  }
+  return withLLMUsage('/api/ai-service-benchmark', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
+  const timer = new ServerTimer();
+  try {
+    const { family, task, params } = await request.json();
+    const service = FAMILIES[family];
+    if (!service || (task !== 'questions' && task !== 'analysis') || !params) {
+      return NextResponse.json(
+        { error: `family must be one of ${Object.keys(FAMILIES).join(', ')}; task questions or analysis; params required` },
+        { status: 400 }
+      );
+    }
+    timer.mark('parse');
+
+    const result = await service[task as keyof ServiceFamily](params);
+    timer.mark('service');
+
+    return timer.apply(NextResponse.json({ success: true, family, task, ...summarizeResult(task, result) }));
+  } catch (error) {
+    console.error('❌ AI service benchmark request failed:', error);
+    return timer.apply(NextResponse.json({
+      success: false,
+      error: error instanceof Error ? error.message : String(error)
+    }, { status: 500 }));
+  }
+}
@@ -5,10 +5,15 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import EnhancedGroqAIService from '@/lib/enhancedGroqAIService';
 import { getServerSession } from 'next-auth';
 
 export async function POST(req: NextRequest) {
+  return withLLMUsage('/api/analyze-response', () => handlePOST(req));
+}
+
+async function handlePOST(req: NextRequest) {
   try {
     console.log('🔍 Enhanced Response Analysis API called');
     
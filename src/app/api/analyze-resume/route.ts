@@ -1,9 +1,10 @@
-import { extractTextFromPDF } from "@/lib/pdfParse";
+import { extractTextFromPDF, PdfParseError } from "@/lib/pdfParse";
+import ServerTimer from "@/lib/serverTiming";
 import { NextRequest, NextResponse } from "next/server";
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import { modelUsed } from "@/constants/constants";
 import { auth } from "@/app/auth";
-import client from "@/lib/db";
+import { getOrAnalyze, resumeFingerprint } from "@/lib/resumeAnalysisStore";
 import { v4 as uuidv4 } from 'uuid';
 
 const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY ?? '');
@@ -25,6 +26,11 @@ interface ResumeAnalysisResult {
 }
 
 export async function POST(request: NextRequest) {
+  const timer = new ServerTimer();
+  return timer.apply(await analyzeResume(request, timer));
+}
+
+async function analyzeResume(request: NextRequest, timer: ServerTimer): Promise<NextResponse> {
   try {
     const session = await auth();
     if (!session?.user?.id) {
@@ -40,6 +46,7 @@ export async function POST(request: NextRequest) {
     }
 
     const formData = await request.formData();
+    timer.mark('upload');
     const file = formData.get("resume") as File;
     const targetRole = formData.get("targetRole") as string;
 
@@ -77,6 +84,7 @@ export async function POST(request: NextRequest) {
     console.log(`📄 Analyzing resume: ${file.name} for role: ${targetRole}`);
 
     const textContent = await extractTextFromPDF(buffer);
+    timer.mark('pdf');
     
     if (!textContent || textContent.length < 50) {
       return NextResponse.json({
@@ -85,7 +93,57 @@ export async function POST(request: NextRequest) {
       }, { status: 400 });
     }
 
-    const analysisPrompt = `;
+    // Same text for the same role was analyzed before: answer from the store
+    const fingerprint = resumeFingerprint(textContent, targetRole);
+    const { analysis: analysisRecord, cached } = await getOrAnalyze(session.user.id, fingerprint, async () => {
+      const validatedResult = await runAnalysis(textContent, targetRole);
+      timer.mark('llm');
+      return {
+        id: uuidv4(),
+        fileName: file.name,
+        targetRole: targetRole,
+        ...validatedResult,
+        createdAt: new Date()
+      };
+    });
+    timer.mark('db');
+
+    console.log(cached
+      ? `♻️ Reusing stored resume analysis ${analysisRecord.id} for ${targetRole}`
+      : `✅ Resume analysis completed. Score: ${analysisRecord.overallScore}/100`);
+
+    return NextResponse.json({ 
+      message: "Resume analyzed successfully", 
+      analysis: analysisRecord,
+      cached,
+      status: 200
+    }, { status: 200, headers: { 'X-Cache': cached ? 'HIT' : 'MISS' } });
+
+  } catch (error) {
+    console.error("❌ Error in resume analysis:", error);
+    if (error instanceof PdfParseError) {
+      return NextResponse.json({
+        error: error.message,
+        status: error.status
+      }, { status: error.status });
+    }
+    if (error instanceof SyntaxError) {
+      return NextResponse.json({
+        error: "Failed to parse analysis results. Please try again.",
+        status: 500,
+        details: error.message
+      }, { status: 500 });
+    }
+    return NextResponse.json({
+      error: "Resume analysis failed. Please try again.",
+      status: 500,
+      details: error instanceof Error ? error.message : "Unknown error"
+    }, { status: 500 });
+  }
+}
+
+async function runAnalysis(textContent: string, targetRole: string) {
+  const analysisPrompt = `;
 You are an expert resume analyst and career coach. Analyze the following resume for a ${targetRole} position and provide comprehensive feedback.
 
 RESUME CONTENT:
@@ -140,84 +198,47 @@ Focus on:
 - ATS-friendly formatting and keywords
 `;
 
-    if (!process.env.GEMINI_API_KEY) {
-      throw new Error("GEMINI_API_KEY not configured");
-    }
-
-    const model = genAI.getGenerativeModel({
-      model: modelUsed,
-      generationConfig: {
-        temperature: 0.7,
-        maxOutputTokens: 2000
-      }
-    });
-
-    const result = await model.generateContent(analysisPrompt);
-    const text = result.response.text();
-    
-    try {
-      const cleaned = text.replace(/```json\s*/g, '').replace(/\s*```/g, '').trim();
-      const analysisResult: ResumeAnalysisResult = JSON.parse(cleaned),
-
-      // Validate and ensure proper structure
-      const validatedResult = {
-        overallScore: Math.min(100, Math.max(0, analysisResult.overallScore || 0)),
-        breakdown: {
-          structure: Math.min(15, Math.max(0, analysisResult.breakdown?.structure || 0)),
-          skills: Math.min(25, Math.max(0, analysisResult.breakdown?.skills || 0)),
-          experience: Math.min(25, Math.max(0, analysisResult.breakdown?.experience || 0)),
-          projects: Math.min(20, Math.max(0, analysisResult.breakdown?.projects || 0)),
-          education: Math.min(10, Math.max(0, analysisResult.breakdown?.education || 0)),
-          language: Math.min(5, Math.max(0, analysisResult.breakdown?.language || 0))
-        },
-        strengths: analysisResult.strengths || [],
-        improvements: analysisResult.improvements || [],
-        recommendations: analysisResult.recommendations || [],
-        detailedFeedback: analysisResult.detailedFeedback || "Analysis completed successfully."
-      };
-
-      // Store in database
-      const dbClient = client;
-      const db = dbClient.db();
-      
-      const analysisRecord = {
-        id: uuidv4(),
-        userId: session.user.id,
-        fileName: file.name,
-        targetRole: targetRole,
-        ...validatedResult,
-        createdAt: new Date()
-      };
-
-      await db.collection("resumeAnalyses").insertOne(analysisRecord);
-
-      console.log(`✅ Resume analysis completed. Score: ${validatedResult.overallScore}/100`);
+  if (!process.env.GEMINI_API_KEY) {
+    throw new Error("GEMINI_API_KEY not configured");
+  }
 
-      return NextResponse.json({ 
-        message: "Resume analyzed successfully", 
-        analysis: analysisRecord,
-        status: 200
-      }, { status: 200 });
-
-    } catch (parseError) {
-      console.error("❌ Error parsing AI analysis response:", parseError);
-      console.error("Raw response:", text);
-      
-      return NextResponse.json({
-        error: "Failed to parse analysis results. Please try again.",
-        status: 500,
-        details: parseError instanceof Error ? parseError.message : "Parse error"
-      }, { status: 500 });
+  const model = genAI.getGenerativeModel({
+    model: modelUsed,
+    generationConfig: {
+      temperature: 0.7,
+      maxOutputTokens: 2000
     }
+  });
 
-  } catch (error) {
-    console.error("❌ Error in resume analysis:", error);
-    return NextResponse.json({
-      error: "Resume analysis failed. Please try again.",
-      status: 500,
-      details: error instanceof Error ? error.message : "Unknown error"
-    }, { status: 500 });
+  const result = await model.generateContent(analysisPrompt);
+  const text = result.response.text();
+
+  let analysisResult: ResumeAnalysisResult;
+  try {
+    const cleaned = text.replace(/```json\s*/g, '').replace(/\s*```/g, '').trim();
+    analysisResult = JSON.parse(cleaned);
+  } catch (parseError) {
+    console.error("❌ Error parsing AI analysis response:", parseError);
+    console.error("Raw response:", text);
+    throw parseError;
   }
+
+  // Validate and ensure proper structure
+  return {
+    overallScore: Math.min(100, Math.max(0, analysisResult.overallScore || 0)),
+    breakdown: {
+      structure: Math.min(15, Math.max(0, analysisResult.breakdown?.structure || 0)),
+      skills: Math.min(25, Math.max(0, analysisResult.breakdown?.skills || 0)),
+      experience: Math.min(25, Math.max(0, analysisResult.breakdown?.experience || 0)),
+      projects: Math.min(20, Math.max(0, analysisResult.breakdown?.projects || 0)),
+      education: Math.min(10, Math.max(0, analysisResult.breakdown?.education || 0)),
+      language: Math.min(5, Math.max(0, analysisResult.breakdown?.language || 0))
+    },
+    strengths: analysisResult.strengths || [],
+    improvements: analysisResult.improvements || [],
+    recommendations: analysisResult.recommendations || [],
+    detailedFeedback: analysisResult.detailedFeedback || "Analysis completed successfully."
+  };
 }
 
 export async function GET() {
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { auth } from '@/app/auth';
 import { connectToDatabase } from '@/lib/db';
 import { ObjectId } from 'mongodb';
+import { getQueryOptions } from '@/lib/queryComment';
 
 export async function GET(request: NextRequest) {
   try {
@@ -19,12 +20,13 @@ export async function GET(request: NextRequest) {
     }
 
     const { db } = await connectToDatabase();
+    const queryOptions = getQueryOptions(request, '/api/check-interview-status');
     
     // Get interview details
     const interview = await db.collection('interviews').findOne({
       _id: new ObjectId(interviewId),
       userId: session.user.id
-    })
+    }, queryOptions)
     
     if (!interview) {
       return NextResponse.json({ error: 'Interview not found' }, { status: 404 });
@@ -34,7 +36,7 @@ export async function GET(request: NextRequest) {
     const performance = await db.collection('performances').findOne({
       interviewId: new ObjectId(interviewId),
       userId: new ObjectId(session.user.id)
-    })
+    }, queryOptions)
     
     return NextResponse.json({
       success: true,
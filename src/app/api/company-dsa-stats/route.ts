@@ -1,13 +1,20 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { auth } from '@/app/auth';
 import { enhancedDSAGenerator } from '@/lib/enhancedDSAGenerator';
+import { dsaCatalogue, dsaCatalogueEnabled } from '@/lib/dsaCatalogue';
 
 /**
- * Get DSA problem statistics for a company
+ * Get DSA problem statistics for a company, from the precomputed catalogue when it
+ * covers the company (catalogue=false forces the on-demand scan).
+ * GET ?type=catalogue-stats reports catalogue lookups.
  */
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
+    if (searchParams.get('type') === 'catalogue-stats') {
+      return NextResponse.json({ enabled: dsaCatalogueEnabled, catalogue: dsaCatalogue.getMetrics() });
+    }
+
     const companyName = searchParams.get('company');
 
     if (!companyName) {
@@ -19,12 +26,15 @@ export async function GET(request: NextRequest) {
 
     console.log(`📊 Getting DSA stats for company: ${companyName}`);
 
-    const stats = await enhancedDSAGenerator.getCompanyProblemStats(companyName);
+    const useCatalogue = dsaCatalogueEnabled && searchParams.get('catalogue') !== 'false';
+    const catalogued = useCatalogue ? await dsaCatalogue.getCompanyStats(companyName) : null;
+    const stats = catalogued || await enhancedDSAGenerator.getCompanyProblemStats(companyName);
 
     return NextResponse.json({
       success: true,
       company: companyName,
       statistics: stats,
+      source: catalogued ? 'catalogue' : 'on-demand',
       message: `DSA statistics retrieved for ${companyName}`
     });
 
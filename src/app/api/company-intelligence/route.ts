@@ -1,12 +1,35 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { HybridAIService } from '@/lib/hybridAIService';
+import EnhancedCompanyIntelligenceService from '@/lib/enhancedCompanyIntelligence';
+import { getCompanyCacheMetrics, companyIntelligenceCache, companySearchCache } from '@/lib/companyCache';
+
+// Single-company intelligence lookup, served from the company cache when possible
+async function getCompanyIntelligenceResponse(companyName: string, jobTitle?: string) {
+  const service = EnhancedCompanyIntelligenceService.getInstance();
+  const intelligence = await service.getEnhancedCompanyIntelligence(companyName, jobTitle || 'Software Engineer');
+  const cacheSource = intelligence?.cache_source || 'loaded';
+
+  return NextResponse.json(
+    {
+      success: true,
+      companyName,
+      intelligence,
+      cache: { source: cacheSource, metrics: companyIntelligenceCache.getMetrics() }
+    },
+    { headers: { 'X-Cache': cacheSource === 'loaded' ? 'MISS' : `HIT-${cacheSource.toUpperCase()}` } }
+  );
+}
 
 export async function POST(request: NextRequest) {
   try {
     console.log('🏢 Enhanced Company Intelligence API called');
     
     const body = await request.json();
-    const { query, limit = 10 } = body;
+    const { query, limit = 10, companyName, jobTitle } = body;
+
+    if (companyName && typeof companyName === 'string') {
+      return await getCompanyIntelligenceResponse(companyName, jobTitle);
+    }
 
     if (!query || query.length < 2) {
       return NextResponse.json(
@@ -78,6 +101,15 @@ export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
     const type = searchParams.get('type') || 'trending';
+    const company = searchParams.get('company');
+
+    if (company) {
+      return await getCompanyIntelligenceResponse(company, searchParams.get('jobTitle') || undefined);
+    }
+
+    if (type === 'cache-stats') {
+      return NextResponse.json({ success: true, type, data: getCompanyCacheMetrics() });
+    }
     
     let responseData;
     
@@ -114,6 +146,24 @@ export async function GET(request: NextRequest) {
   }
 }
 
+// DELETE endpoint to reset the in-memory company caches (benchmarks only)
+export async function DELETE(request: NextRequest) {
+  if (process.env.NODE_ENV === 'production') {
+    return NextResponse.json({ error: 'Not available in production' }, { status: 403 });
+  }
+
+  const { searchParams } = new URL(request.url);
+  companyIntelligenceCache.clear();
+  companySearchCache.clear();
+
+  // scope=all also drops the MongoDB tier for a true cold start
+  if (searchParams.get('scope') === 'all') {
+    await Promise.all([companyIntelligenceCache.clearPersistent(), companySearchCache.clearPersistent()]);
+  }
+
+  return NextResponse.json({ success: true, message: 'Company caches cleared' });
+}
+
 // Helper functions for enhanced company intelligence
 
 const getCompanyIndustry = (company: string): string => {
@@ -1,4 +1,50 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { companySearchCache, normalizeSearchQuery, CompanySuggestion } from '@/lib/companyCache';
+import CompanyPrefixIndex from '@/lib/companyPrefixIndex';
+
+async function searchCompaniesWithGroq(query: string, groqApiKey: string): Promise<CompanySuggestion[]> {
+  const response = await fetch('https://api.groq.com/openai/v1/chat/completions', {
+    method: 'POST',
+    headers: {
+      'Authorization': `Bearer ${groqApiKey}`,
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({
+      model: 'llama-3.1-8b-instant',
+      messages: [
+        {
+          role: 'system',
+          content: `You are a company search assistant. Given a search query, return a JSON array of company suggestions. Each company should have: name, industry, and description. Return only real, well-known companies. Limit to 5 companies maximum. Format: {"companies": [{"name": "Company Name", "industry": "Industry", "description": "Brief description"}]}`
+        },
+        {
+          role: 'user',
+          content: `Search for companies related to: "${query}". Only suggest real companies.`
+        }
+      ],
+      temperature: 0.3,
+      max_tokens: 500
+    }),
+  })
+
+  if (!response.ok) {
+    throw new Error(`Groq API error: ${response.status}`);
+  }
+
+  const data = await response.json();
+  const content = data.choices[0]?.message?.content;
+
+  if (!content) {
+    return [];
+  }
+
+  try {
+    const parsed = JSON.parse(content);
+    return (parsed.companies || []).slice(0, 5); // Limit to 5 suggestions
+  } catch (parseError) {
+    // If JSON parsing fails, return empty results
+    return [];
+  }
+}
 
 export async function POST(request: NextRequest) {
   try {
@@ -8,83 +54,54 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ success: false, error: 'Query too short' }, { status: 400 });
     }
 
+    // Autocomplete is served from the local prefix index; the LLM is only asked on a true miss
+    const prefixIndex = CompanyPrefixIndex.getInstance();
+    void prefixIndex.warmFromPersistent().catch(error => console.warn('⚠️ Company prefix index warm-up failed:', error));
+    const localMatches = prefixIndex.search(query, 5);
+    if (localMatches.length > 0) {
+      return NextResponse.json(
+        { success: true, companies: localMatches, source: 'local-index' },
+        { headers: { 'X-Cache': 'HIT-INDEX' } }
+      )
+    }
+
     const groqApiKey = process.env.GROQ_API_KEY;
     if (!groqApiKey) {
       // Fallback to basic suggestions if no API key
-      return NextResponse.json({ 
-        success: true, 
-        companies: [] 
+      return NextResponse.json({
+        success: true,
+        companies: []
       })
     }
 
     try {
-      const response = await fetch('https://api.groq.com/openai/v1/chat/completions', {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${groqApiKey}`,
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          model: 'llama-3.1-8b-instant',
-          messages: [
-            {
-              role: 'system',
-              content: `You are a company search assistant. Given a search query, return a JSON array of company suggestions. Each company should have: name, industry, and description. Return only real, well-known companies. Limit to 5 companies maximum. Format: {"companies": [{"name": "Company Name", "industry": "Industry", "description": "Brief description"}]}`
-            },
-            {
-              role: 'user',
-              content: `Search for companies related to: "${query}". Only suggest real companies.`
-            }
-          ],
-          temperature: 0.3,
-          max_tokens: 500;
-        }),
-      })
-
-      if (!response.ok) {
-        throw new Error(`Groq API error: ${response.status}`);
-      }
-
-      const data = await response.json();
-      const content = data.choices[0]?.message?.content;
-
-      if (!content) {
-        return NextResponse.json({ 
-          success: true, 
-          companies: [] 
-        })
-      }
+      // Empty results are not cached so a transient bad response is retried next time
+      const { value: companies, source } = await companySearchCache.getOrLoad(
+        normalizeSearchQuery(query),
+        () => searchCompaniesWithGroq(query, groqApiKey),
+        (results) => results.length > 0
+      );
+      prefixIndex.addResolved(companies);
 
-      try {
-        const parsed = JSON.parse(content);
-        const companies = parsed.companies || [];
-        
-        return NextResponse.json({ 
-          success: true, 
-          companies: companies.slice(0, 5) // Limit to 5 suggestions
-        })
-      } catch (parseError) {
-        // If JSON parsing fails, return empty results
-        return NextResponse.json({ 
-          success: true, 
-          companies: [] 
-        })
-      }
+      return NextResponse.json(
+        { success: true, companies, source: 'llm', cacheSource: source },
+        { headers: { 'X-Cache': source === 'loaded' ? 'MISS' : `HIT-${source.toUpperCase()}` } }
+      )
 
     } catch (groqError) {
       console.error('Groq API error:', groqError);
       // Return empty results on API error
-      return NextResponse.json({ 
-        success: true, 
-        companies: [] 
+      return NextResponse.json({
+        success: true,
+        companies: []
       })
     }
 
   } catch (error) {
     console.error('Company search error:', error);
-    return NextResponse.json({ 
-      success: false, 
-      error: 'Failed to search companies' 
+    return NextResponse.json({
+      success: false,
+      error: 'Failed to search companies'
     }, { status: 500 })
   }
-}
\ No newline at end of file
+}
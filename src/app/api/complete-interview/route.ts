@@ -1,9 +1,14 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import GroqAIService from '@/lib/groqAIService';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/complete-interview', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     console.log('🏁 Complete Interview API called');
     
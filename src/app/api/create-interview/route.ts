@@ -2,6 +2,8 @@ import client from "@/lib/db";
 import { auth } from "@/app/auth";
 import { ObjectId } from "mongodb";
 import { type NextRequest, NextResponse } from "next/server";
+import { withLLMUsage } from "@/lib/llmUsage";
+import { bankKey, interviewMix, questionBank, questionBankEnabled } from "@/lib/questionBank";
 
 // Helper function for question counts (updated for new requirements)
 function getQuestionCountForType(interviewType: string): number {
@@ -297,7 +299,21 @@ function getDSAPointsForDifficulty(difficulty: string): number {
     }
 }
 
+/**
+ * GET ?type=bank-stats reports question bank hit rate, size and refills
+ */
+export async function GET(request: NextRequest) {
+    if (new URL(request.url).searchParams.get('type') === 'bank-stats') {
+        return NextResponse.json({ enabled: questionBankEnabled, questionBank: await questionBank.getMetrics() });
+    }
+    return NextResponse.json({ error: "Unknown type; use ?type=bank-stats" }, { status: 400 });
+}
+
 export async function POST(request: NextRequest) {
+    return withLLMUsage('/api/create-interview', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
     try {
         console.log("🎯 CREATE INTERVIEW API - Starting with enhanced features");
         
@@ -329,7 +345,8 @@ export async function POST(request: NextRequest) {
             estimatedDuration,
             difficultyPreference,
             companyIntelligence,
-            roundConfigs
+            roundConfigs,
+            useQuestionBank = true
         } = body;
 
         // ALWAYS use the authenticated session user ID for security
@@ -397,8 +414,25 @@ export async function POST(request: NextRequest) {
         const interviewResult = await db.collection("interviews").insertOne(interviewData);
         console.log('✅ Interview record created for user:', session.user.id);
 
-        // Generate questions immediately with user preferences
-        const questions = await generateQuestionsImmediately(interviewData, userId);
+        // Draw a set this user has not seen from the question bank, generating only when
+        // the bank cannot cover the mix yet; either way top the bank up in the background
+        const key = bankKey(companyName, jobTitle, interviewData.experienceLevel);
+        const mix = interviewMix(interviewData.interviewType);
+        const bankEnabled = questionBankEnabled && useQuestionBank !== false;
+        const drawStartedAt = Date.now();
+        let questions = bankEnabled ? await questionBank.draw(key, mix, userId) : null;
+        const questionSource = questions ? 'question-bank' : 'generated';
+        if (questions) {
+            console.log(`🏦 Drew ${questions.length} unseen questions from the question bank in ${Date.now() - drawStartedAt}ms`);
+        } else {
+            questions = await generateQuestionsImmediately(interviewData, userId);
+            if (bankEnabled) {
+                questionBank.deposit(key, questions).catch(error => console.error('❌ Question bank deposit failed:', error));
+            }
+        }
+        if (bankEnabled) {
+            void questionBank.scheduleRefill(key, mix, () => generateQuestionsImmediately(interviewData, userId));
+        }
         
         // Store questions in database
         const questionsResult = await db.collection("questions").insertOne({
@@ -414,6 +448,7 @@ export async function POST(request: NextRequest) {
                 provider: questions[0]?.provider || 'enhanced-generator',
                 model: questions[0]?.model || 'groq-enhanced',
                 processingMethod: 'intelligent-routing-v2',
+                questionSource,
                 interviewStructure: {
                     mixed: interviewType === 'mixed',
                     dsaOnly: interviewType === 'dsa',
@@ -452,6 +487,7 @@ export async function POST(request: NextRequest) {
                 averagePoints: questions.reduce((sum, q) => sum + (q.points || 15), 0) / questions.length,
                 totalPoints: questions.reduce((sum, q) => sum + (q.points || 15), 0),
                 service: 'enhanced-smart-ai',
+                questionSource,
                 userId: session.user.id,
                 enhancedFeatures: interviewData.enhancedFeatures,
                 questionDistribution: getQuestionDistribution(questions)
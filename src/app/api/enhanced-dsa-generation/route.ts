@@ -1,7 +1,12 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import { EnhancedGroqDSAService } from '@/lib/enhancedGroqDSAService';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/enhanced-dsa-generation', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { 
@@ -1,10 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import FreeLLMService from '@/lib/freeLLMService';
 import EnhancedCompanyIntelligenceService from '@/lib/enhancedCompanyIntelligence';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/enhanced-generate-questions', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId, regenerate = false } = body;
@@ -1,7 +1,10 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import GroqAIService from '@/lib/groqAIService';
+import { getQueryOptions } from '@/lib/queryComment';
+import ServerTimer from '@/lib/serverTiming';
 
 // Enhanced fallback analysis function when AI services are not available
 function generateFallbackAnalysis(questions: any[], answers: string[], jobTitle: string) {
@@ -145,6 +148,13 @@ function generateFallbackAnalysis(questions: any[], answers: string[], jobTitle:
 }
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/fast-feedback', async () => {
+    const timer = new ServerTimer();
+    return timer.apply(await handlePOST(request));
+  });
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId } = body;
@@ -160,11 +170,12 @@ export async function POST(request: NextRequest) {
     const startTime = Date.now();
 
     const db = client.db();
+    const queryOptions = getQueryOptions(request, '/api/fast-feedback');
     
     // Get interview details
     const interview = await db.collection('interviews').findOne({
       _id: new ObjectId(interviewId)
-    });
+    }, queryOptions);
 
     if (!interview) {
       return NextResponse.json(
@@ -177,7 +188,7 @@ export async function POST(request: NextRequest) {
     // Get questions and answers
     const questionsDoc = await db.collection("questions").findOne({
       interviewId: interviewId
-    });
+    }, queryOptions);
 
     console.log('📄 Questions document found:', {
       exists: !!questionsDoc,
@@ -225,7 +236,7 @@ export async function POST(request: NextRequest) {
       // Check for DSA execution results
       const dsaExecutions = await db.collection('dsa_executions').find({
         problemId: { $in: questionsDoc.questions?.map((q: any) => q.id || q.dsaProblem?.id) || [] }
-      }).toArray();
+      }, queryOptions).toArray();
       
       // Check for interview responses (used by complete-interview)
       const interviewResponses = interview.responses || [];
@@ -321,7 +332,8 @@ Execution Time: ${execution.executionTime}ms`;
               analyzedAt: new Date(),
               aiProvider: 'no-submissions-fallback'
             }
-          }
+          },
+          queryOptions
         );
 
         return NextResponse.json({
@@ -507,7 +519,8 @@ Execution Time: ${execution.executionTime}ms`;
           analyzedAt: new Date(),
           aiProvider: 'groq-fast'
         }
-      }
+      },
+      queryOptions
     );
 
     // CRITICAL: Mark interview as completed so it doesn't show in dashboard
@@ -520,7 +533,8 @@ Execution Time: ${execution.executionTime}ms`;
           performanceAnalyzed: true,
           finalScore: enhancedInsights.overallScore || 0
         } 
-      }
+      },
+      queryOptions
     );
 
     // Store comprehensive performance analysis for stats dashboard
@@ -543,7 +557,7 @@ Execution Time: ${execution.executionTime}ms`;
     await db.collection('performance_analysis').updateOne(
       { interviewId },
       { $set: performanceDoc },
-      { upsert: true }
+      { upsert: true, ...queryOptions }
     );
 
     const processingTime = Date.now() - startTime;
@@ -592,7 +606,7 @@ export async function GET(request: NextRequest) {
     // Check if feedback already exists
     const questionsDoc = await db.collection("questions").findOne({
       interviewId: interviewId
-    });
+    }, getQueryOptions(request, '/api/fast-feedback'));
 
     if (questionsDoc?.extracted) {
       return NextResponse.json({
@@ -1,9 +1,14 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import FreeLLMService from '@/lib/freeLLMService';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/free-llm-analysis', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId } = body;
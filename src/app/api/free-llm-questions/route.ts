@@ -1,8 +1,10 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
-import { ObjectId } from 'mongodb';
+import { Db, ObjectId } from 'mongodb';
 import FreeLLMService from '@/lib/freeLLMService';
 import EnhancedCompanyIntelligenceService from '@/lib/enhancedCompanyIntelligence';
+import { generateSections, QuestionSection, requestedStreamFormat, streamQuestionSections } from '@/lib/questionStream';
 
 // Helper function to validate ObjectId
 function isValidObjectId(id: string): boolean {
@@ -10,9 +12,14 @@ function isValidObjectId(id: string): boolean {
 }
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/free-llm-questions', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId, regenerate = false } = body;
+    const streamFormat = requestedStreamFormat(request.headers.get('accept'), body);
 
     if (!interviewId) {
       return NextResponse.json(
@@ -50,6 +57,13 @@ export async function POST(request: NextRequest) {
       });
 
       if (existingQuestions && existingQuestions.questions && existingQuestions.questions.length > 0) {
+        if (streamFormat) {
+          return streamQuestionSections(
+            [{ category: 'cached', generate: async () => existingQuestions.questions }],
+            streamFormat,
+            async ({ questions }) => ({ message: 'Questions already exist', questionsCount: questions.length, provider: 'cached' })
+          );
+        }
         return NextResponse.json({
           message: 'Questions already exist',
           questionsCount: existingQuestions.questions.length,
@@ -59,191 +73,192 @@ export async function POST(request: NextRequest) {
       }
     }
 
-    console.log(`🚀 Generating HARD questions for ${interview.companyName} ${interview.jobTitle} using FREE LLMs...`);
+    const { sections, enhancedCompanyData } = await planQuestionSections(interview);
 
-    const freeLLMService = FreeLLMService.getInstance();
-    const companyIntelligence = EnhancedCompanyIntelligenceService.getInstance();
-    
-    // Get enhanced company intelligence with recent news and posts
-    const enhancedCompanyData = await companyIntelligence.getEnhancedCompanyIntelligence(
-      interview.companyName,
-      interview.jobTitle
+    // Streaming mode: send each question as soon as its section is generated and validated
+    if (streamFormat) {
+      return streamQuestionSections(sections, streamFormat, async ({ questions }) => {
+        const { questions: _all, ...summary } = await storeQuestions(db, interviewId, interview, questions, enhancedCompanyData);
+        return summary;
+      });
+    }
+
+    const { questions } = await generateSections(sections);
+    return NextResponse.json(await storeQuestions(db, interviewId, interview, questions, enhancedCompanyData));
+
+  } catch (error) {
+    console.error('Error generating questions with free LLMs:', error);
+    return NextResponse.json(
+      { error: 'Failed to generate questions: ' + error },
+      { status: 500 }
     );
+  }
+}
 
-    console.log(`📊 Company intelligence gathered for ${interview.companyName}`);
-    
-    // Generate enhanced HARD questions based on interview type
-    let allQuestions: any[] = [],
-    
-    if (interview.interviewType === 'mixed') {
-      console.log('🔄 Generating comprehensive mixed interview questions with HIGH DIFFICULTY...');
-      
-      // Technical Questions (40%) - Enhanced with company context and HARD difficulty
-      const technicalQuestions = await freeLLMService.generateHardInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: 'technical',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: 10,
-        companyIntelligence: enhancedCompanyData?.company_data,
-        difficultyLevel: 'hard' // Force hard difficulty
-      });
+/**
+ * GET ?type=provider-stats reports provider availability and the rate-limit scheduler
+ */
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
 
-      // Behavioral Questions (30%) - Company culture focused with challenging scenarios
-      const behavioralQuestions = await freeLLMService.generateHardInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: 'behavioral',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: 8,
-        companyIntelligence: enhancedCompanyData?.company_data,
-        difficultyLevel: 'hard' // Force hard difficulty
-      });
+  if (searchParams.get('type') === 'provider-stats') {
+    return NextResponse.json({ success: true, providers: await FreeLLMService.getInstance().healthCheck() });
+  }
 
-      // DSA Problems (30%) - Company-specific HARD difficulty
-      const dsaProblems = await freeLLMService.generateHardDSAProblems(
-        interview.companyName,
-        'hard', // Force hard difficulty regardless of experience
-        8,
-        enhancedCompanyData?.company_data
-      );
+  return NextResponse.json({ error: 'Unknown stats type' }, { status: 400 });
+}
+
+/**
+ * Company intelligence plus the independent generation sections for an interview.
+ * Sections run concurrently; in streaming mode each is sent as soon as it returns.
+ */
+async function planQuestionSections(interview: any): Promise<{ sections: QuestionSection[]; enhancedCompanyData: any }> {
+  console.log(`🚀 Generating HARD questions for ${interview.companyName} ${interview.jobTitle} using FREE LLMs...`);
 
-      allQuestions = [
-        ...technicalQuestions,
-        ...behavioralQuestions,
-        ...dsaProblems.map(p => ({
-          id: p.id,
-          question: p.title,
-          expectedAnswer: p.description,
-          category: 'dsa',
-          difficulty: 'hard', // Force hard
-          points: getDSAPoints('hard'),
-          problemData: p,
-          provider: p.provider,
-          model: p.model
-        }))
-      ];
-    } else if (interview.interviewType === 'dsa') {
-      console.log('💻 Generating DSA-focused HARD interview questions...');
+  const freeLLMService = FreeLLMService.getInstance();
+  const companyIntelligence = EnhancedCompanyIntelligenceService.getInstance();
+  
+  // Get enhanced company intelligence with recent news and posts
+  const enhancedCompanyData = await companyIntelligence.getEnhancedCompanyIntelligence(
+    interview.companyName,
+    interview.jobTitle
+  );
+
+  console.log(`📊 Company intelligence gathered for ${interview.companyName}`);
+
+  const questionsFor = (interviewType: any, numberOfQuestions: number): QuestionSection => ({
+    category: interviewType,
+    generate: () => freeLLMService.generateHardInterviewQuestions({
+      jobTitle: interview.jobTitle,
+      companyName: interview.companyName,
+      skills: interview.skills || [],
+      interviewType,
+      experienceLevel: interview.experienceLevel || 'mid',
+      numberOfQuestions,
+      companyIntelligence: enhancedCompanyData?.company_data,
+      difficultyLevel: 'hard' // Force hard difficulty
+    })
+  });
+
+  const dsaSection = (count: number): QuestionSection => ({
+    category: 'dsa',
+    generate: async () => {
+      // Company-specific, always hard regardless of experience
       const dsaProblems = await freeLLMService.generateHardDSAProblems(
         interview.companyName,
-        'hard', // Always hard for DSA
-        10,
+        'hard',
+        count,
         enhancedCompanyData?.company_data
       );
-
-      allQuestions = dsaProblems.map(p => ({
+      return dsaProblems.map(p => ({
         id: p.id,
         question: p.title,
         expectedAnswer: p.description,
         category: 'dsa',
-        difficulty: 'hard',
+        difficulty: 'hard', // Force hard
         points: getDSAPoints('hard'),
         problemData: p,
         provider: p.provider,
         model: p.model
       }));
-    } else {
-      console.log(`🎯 Generating HARD ${interview.interviewType} interview questions...`);
-      allQuestions = await freeLLMService.generateHardInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: interview.interviewType,
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: getQuestionCount(interview.interviewType),
-        companyIntelligence: enhancedCompanyData?.company_data,
-        difficultyLevel: 'hard' // Force hard difficulty
-      });
     }
+  });
 
-    // Enhanced question document with company intelligence
-    const questionDoc = {
-      interviewId: interviewId,
-      questions: allQuestions.map(q => ({
-        id: q.id,
-        question: q.question,
-        expectedAnswer: q.expectedAnswer,
-        category: q.category,
-        difficulty: q.difficulty || 'hard', // Default to hard
-        points: q.points,
-        timeLimit: q.timeLimit,
-        followUpQuestions: q.followUpQuestions || [],
-        evaluationCriteria: q.evaluationCriteria || [],
-        companyRelevance: q.companyRelevance || 9, // Higher relevance for hard questions
-        tags: q.tags || [],
-        hints: q.hints || [],
-        problemData: q.problemData || null,
-        provider: q.provider || 'fallback',
-        model: q.model || 'mock'
-      })),
-      companyIntelligence: enhancedCompanyData ? {
-        industry: enhancedCompanyData.company_data.industry,
-        tech_stack: enhancedCompanyData.company_data.tech_stack,
-        culture: enhancedCompanyData.company_data.culture,
-        recent_news: enhancedCompanyData.company_data.recent_news,
-        recent_posts: enhancedCompanyData.company_data.recent_posts.slice(0, 3),
-        difficulty: 'hard', // Always mark as hard
-        focus_areas: enhancedCompanyData.company_data.focus_areas
-      } : null,
-      metadata: {
-        generatedAt: new Date(),
-        aiService: 'free-llm-service',
-        totalQuestions: allQuestions.length,
-        categoryBreakdown: getCategoryBreakdown(allQuestions),
-        difficultyBreakdown: getDifficultyBreakdown(allQuestions),
-        providerBreakdown: getProviderBreakdown(allQuestions),
-        companyIntelligenceUsed: !!enhancedCompanyData,
-        difficultyLevel: 'hard' // Mark all questions as hard
-      },
-      status: 'ready'
-    };
-
-    // Store or update questions
-    await db.collection('questions').replaceOne(
-      { interviewId: interviewId },
-      questionDoc,
-      { upsert: true }
-    );
+  // Generate enhanced HARD questions based on interview type
+  let sections: QuestionSection[];
+  if (interview.interviewType === 'mixed') {
+    console.log('🔄 Generating comprehensive mixed interview questions with HIGH DIFFICULTY...');
+    // Technical (40%) with company context, behavioral (30%) on company culture, DSA (30%)
+    sections = [questionsFor('technical', 10), questionsFor('behavioral', 8), dsaSection(8)];
+  } else if (interview.interviewType === 'dsa') {
+    console.log('💻 Generating DSA-focused HARD interview questions...');
+    sections = [dsaSection(10)];
+  } else {
+    console.log(`🎯 Generating HARD ${interview.interviewType} interview questions...`);
+    sections = [questionsFor(interview.interviewType, getQuestionCount(interview.interviewType))];
+  }
 
-    // Update interview status with enhanced metadata
-    await db.collection('interviews').updateOne(
-      { _id: new ObjectId(interviewId) },
-      { 
-        $set: { 
-          status: 'ready',
-          questionMetadata: questionDoc.metadata,
-          companyIntelligence: questionDoc.companyIntelligence,
-          updatedAt: new Date()
-        } 
-      }
-    );
+  return { sections, enhancedCompanyData };
+}
 
-    console.log(`✅ Generated ${allQuestions.length} HARD enhanced questions using FREE LLMs`);
-
-    return NextResponse.json({
-      message: 'Enhanced HARD questions generated successfully with FREE LLM Services',
-      questionsCount: allQuestions.length,
-      questions: allQuestions,
-      metadata: questionDoc.metadata,
-      companyIntelligence: questionDoc.companyIntelligence,
-      breakdown: {
-        categories: getCategoryBreakdown(allQuestions),
-        difficulties: getDifficultyBreakdown(allQuestions),
-        providers: getProviderBreakdown(allQuestions)
-      },
-      difficultyLevel: 'HARD'
-    });
+async function storeQuestions(db: Db, interviewId: string, interview: any, allQuestions: any[], enhancedCompanyData: any) {
+  // Enhanced question document with company intelligence
+  const questionDoc = {
+    interviewId: interviewId,
+    questions: allQuestions.map(q => ({
+      id: q.id,
+      question: q.question,
+      expectedAnswer: q.expectedAnswer,
+      category: q.category,
+      difficulty: q.difficulty || 'hard', // Default to hard
+      points: q.points,
+      timeLimit: q.timeLimit,
+      followUpQuestions: q.followUpQuestions || [],
+      evaluationCriteria: q.evaluationCriteria || [],
+      companyRelevance: q.companyRelevance || 9, // Higher relevance for hard questions
+      tags: q.tags || [],
+      hints: q.hints || [],
+      problemData: q.problemData || null,
+      provider: q.provider || 'fallback',
+      model: q.model || 'mock'
+    })),
+    companyIntelligence: enhancedCompanyData ? {
+      industry: enhancedCompanyData.company_data.industry,
+      tech_stack: enhancedCompanyData.company_data.tech_stack,
+      culture: enhancedCompanyData.company_data.culture,
+      recent_news: enhancedCompanyData.company_data.recent_news,
+      recent_posts: enhancedCompanyData.company_data.recent_posts.slice(0, 3),
+      difficulty: 'hard', // Always mark as hard
+      focus_areas: enhancedCompanyData.company_data.focus_areas
+    } : null,
+    metadata: {
+      generatedAt: new Date(),
+      aiService: 'free-llm-service',
+      totalQuestions: allQuestions.length,
+      categoryBreakdown: getCategoryBreakdown(allQuestions),
+      difficultyBreakdown: getDifficultyBreakdown(allQuestions),
+      providerBreakdown: getProviderBreakdown(allQuestions),
+      companyIntelligenceUsed: !!enhancedCompanyData,
+      difficultyLevel: 'hard' // Mark all questions as hard
+    },
+    status: 'ready'
+  };
 
-  } catch (error) {
-    console.error('Error generating questions with free LLMs:', error);
-    return NextResponse.json(
-      { error: 'Failed to generate questions: ' + error },
-      { status: 500 }
-    );
-  }
+  // Store or update questions
+  await db.collection('questions').replaceOne(
+    { interviewId: interviewId },
+    questionDoc,
+    { upsert: true }
+  );
+
+  // Update interview status with enhanced metadata
+  await db.collection('interviews').updateOne(
+    { _id: new ObjectId(interviewId) },
+    { 
+      $set: { 
+        status: 'ready',
+        questionMetadata: questionDoc.metadata,
+        companyIntelligence: questionDoc.companyIntelligence,
+        updatedAt: new Date()
+      } 
+    }
+  );
+
+  console.log(`✅ Generated ${allQuestions.length} HARD enhanced questions using FREE LLMs`);
+
+  return {
+    message: 'Enhanced HARD questions generated successfully with FREE LLM Services',
+    questionsCount: allQuestions.length,
+    questions: allQuestions,
+    metadata: questionDoc.metadata,
+    companyIntelligence: questionDoc.companyIntelligence,
+    breakdown: {
+      categories: getCategoryBreakdown(allQuestions),
+      difficulties: getDifficultyBreakdown(allQuestions),
+      providers: getProviderBreakdown(allQuestions)
+    },
+    difficultyLevel: 'HARD'
+  };
 }
 
 // Helper functions
@@ -1,16 +1,23 @@
 /**
  * Enhanced Company-Specific DSA Generation API
- * Uses Enhanced Groq AI Service for company-tailored coding problems
+ * Serves company problems from the precomputed DSA catalogue when it holds enough,
+ * otherwise uses Enhanced Groq AI Service for company-tailored coding problems
  * Integrates with Enhanced DSA Compiler for execution
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import EnhancedGroqAIService from '@/lib/enhancedGroqAIService';
 import EnhancedDSACompiler from '@/lib/enhancedDSACompiler';
 import { getServerSession } from 'next-auth';
 import { connectToDatabase } from '@/lib/db';
+import { dsaCatalogue, dsaCatalogueEnabled } from '@/lib/dsaCatalogue';
 
 export async function POST(req: NextRequest) {
+  return withLLMUsage('/api/generate-company-dsa', () => handlePOST(req));
+}
+
+async function handlePOST(req: NextRequest) {
   try {
     console.log('🧮 Enhanced Company DSA Generation API called');
     
@@ -26,7 +33,8 @@ export async function POST(req: NextRequest) {
       count = 3,
       jobTitle = 'Software Engineer',
       techStack = [],
-      includeCompiler = true
+      includeCompiler = true,
+      useCatalogue = true
     } = body;
 
     // Validate required fields
@@ -47,15 +55,19 @@ export async function POST(req: NextRequest) {
     const compilerService = includeCompiler ? EnhancedDSACompiler.getInstance() : null,
 
     try {
-      // Generate company-specific DSA problems
-      const dsaProblems = await aiService.generateCompanySpecificDSAProblems(
+      // Precomputed catalogue first; generate only when it cannot cover the request
+      const catalogued = dsaCatalogueEnabled && useCatalogue !== false
+        ? await dsaCatalogue.findProblems(companyName, difficulty, count)
+        : null;
+      const aiProvider = catalogued ? 'dsa-catalogue' : 'enhanced-groq';
+      const dsaProblems: any[] = catalogued || await aiService.generateCompanySpecificDSAProblems(
         companyName,
         difficulty as 'easy' | 'medium' | 'hard',
         count,
         jobTitle
       );
 
-      console.log(`✅ Generated ${dsaProblems.length} company-specific DSA problems`);
+      console.log(`✅ ${catalogued ? 'Served' : 'Generated'} ${dsaProblems.length} company-specific DSA problems${catalogued ? ' from the catalogue' : ''}`);
 
       // Get compiler info if requested
       let compilerInfo = null;
@@ -95,7 +107,7 @@ export async function POST(req: NextRequest) {
           problems: dsaProblems,
           createdAt: new Date(),
           status: 'generated',
-          aiProvider: 'enhanced-groq',
+          aiProvider,
           totalProblems: dsaProblems.length,
           compilerEnabled: includeCompiler
         };
@@ -112,7 +124,7 @@ export async function POST(req: NextRequest) {
         ...problem,
         metadata: {
           generatedAt: new Date().toISOString(),
-          aiProvider: 'enhanced-groq',
+          aiProvider,
           companySpecific: true,
           jobTitle,
           estimatedTime: problem.difficulty === 'easy' ? '15-20 min' :
@@ -143,7 +155,7 @@ export async function POST(req: NextRequest) {
           jobTitle,
           difficulty,
           totalProblems: enhancedProblems.length,
-          aiProvider: 'enhanced-groq',
+          aiProvider,
           generatedAt: new Date().toISOString(),
           features: [
             'Company-specific problem context',
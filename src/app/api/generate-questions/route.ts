@@ -5,11 +5,16 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import EnhancedGroqAIService from '@/lib/enhancedGroqAIService';
 import { getServerSession } from 'next-auth';
 import { connectToDatabase } from '@/lib/db';
 
 export async function POST(req: NextRequest) {
+  return withLLMUsage('/api/generate-questions', () => handlePOST(req));
+}
+
+async function handlePOST(req: NextRequest) {
   try {
     console.log('🚀 Enhanced Question Generation API called');
     
@@ -1,7 +1,21 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import GroqAIService from '@/lib/groqAIService';
+import { answerCacheEnabled, answerCacheScope, getAnswerCacheMetrics, groqAnswerCache } from '@/lib/answerSimilarityCache';
+
+export async function GET(request: NextRequest) {
+  const type = new URL(request.url).searchParams.get('type');
+  if (type === 'cache-stats') {
+    return NextResponse.json({ answerCache: getAnswerCacheMetrics() });
+  }
+  return NextResponse.json({ error: 'Unknown type; use ?type=cache-stats' }, { status: 400 });
+}
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/groq-analyze-response', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { 
@@ -10,7 +24,9 @@ export async function POST(request: NextRequest) {
       expectedAnswer, 
       category, 
       companyContext,
-      interviewId 
+      interviewId,
+      questionId,
+      cache = true // false bypasses the near-duplicate answer cache
     } = body;
 
     if (!question || !userAnswer || !expectedAnswer || !category) {
@@ -23,17 +39,28 @@ export async function POST(request: NextRequest) {
     console.log(`🔍 Analyzing ${category} response using Groq AI...`);
 
     const groqAIService = GroqAIService.getInstance();
-    
-    // Analyze the interview response
-    const analysis = await groqAIService.analyzeInterviewResponse(
-      question,
-      userAnswer,
-      expectedAnswer,
-      category,
-      companyContext || 'General Company'
-    );
+    const context = companyContext || 'General Company';
+    const analyze = (strict: boolean) =>
+      groqAIService.analyzeInterviewResponse(question, userAnswer, expectedAnswer, category, context, { strict });
+
+    // Near-identical answers to the same question reuse an earlier analysis
+    let analysis;
+    let cacheInfo: { hit: boolean, similarity: number | null, entryId: string | null } = { hit: false, similarity: null, entryId: null };
+    if (answerCacheEnabled && cache !== false) {
+      const scope = answerCacheScope({ questionId, question, category, companyContext: context });
+      try {
+        const cached = await groqAnswerCache.resolve(scope, userAnswer, () => analyze(true));
+        analysis = cached.value;
+        cacheInfo = { hit: cached.hit, similarity: cached.similarity, entryId: cached.entryId };
+      } catch (error) {
+        // Offline analyses are served but never cached
+        analysis = groqAIService.generateMockAnalysis(userAnswer);
+      }
+    } else {
+      analysis = await analyze(false);
+    }
 
-    console.log('✅ Response analysis completed');
+    console.log(`✅ Response analysis completed${cacheInfo.hit ? ` (reused, similarity ${cacheInfo.similarity?.toFixed(2)})` : ''}`);
 
     return NextResponse.json({
       message: 'Response analyzed successfully',
@@ -43,7 +70,8 @@ export async function POST(request: NextRequest) {
         service: 'groq-ai',
         questionCategory: category,
         wordCount: userAnswer.split(' ').length,
-        responseLength: userAnswer.length
+        responseLength: userAnswer.length,
+        cache: cacheInfo
       }
     });
 
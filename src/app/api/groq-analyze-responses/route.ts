@@ -0,0 +1,123 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
+import GroqAIService from '@/lib/groqAIService';
+import { AnalysisBatchItem, DEFAULT_BATCH_LIMITS, packAnalysisBatches } from '@/lib/analysisBatch';
+import { answerCacheEnabled, answerCacheScope, groqAnswerCache } from '@/lib/answerSimilarityCache';
+
+const MAX_ANSWERS = 100;
+
+/**
+ * Batch counterpart of /api/groq-analyze-response: analyses every answer of a round
+ * with as few Groq calls as the prompt size limits allow. Results come back in input
+ * order; "source" tells whether an answer was reused from the near-duplicate answer
+ * cache, scored in a batch, re-analysed alone after the batch reply missed it, or
+ * given the offline fallback analysis.
+ */
+export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/groq-analyze-responses', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
+  try {
+    const body = await request.json();
+    const { answers, companyContext, interviewId, cache = true } = body;
+
+    if (!Array.isArray(answers) || answers.length === 0) {
+      return NextResponse.json(
+        { error: 'answers must be a non-empty array of { question, userAnswer, expectedAnswer, category }' },
+        { status: 400 }
+      );
+    }
+    if (answers.length > MAX_ANSWERS) {
+      return NextResponse.json({ error: `At most ${MAX_ANSWERS} answers per request` }, { status: 400 });
+    }
+
+    const invalid = answers.findIndex((a: any) => !a || !a.question || !a.userAnswer || !a.expectedAnswer || !a.category);
+    if (invalid !== -1) {
+      return NextResponse.json(
+        { error: `Missing required fields in answers[${invalid}]: question, userAnswer, expectedAnswer, category` },
+        { status: 400 }
+      );
+    }
+
+    // Positional ids keep the prompt free of client-chosen ids and duplicates
+    const items: AnalysisBatchItem[] = answers.map((a: any, index: number) => ({
+      id: String(index + 1),
+      question: String(a.question),
+      userAnswer: String(a.userAnswer),
+      expectedAnswer: String(a.expectedAnswer),
+      category: String(a.category)
+    }));
+
+    console.log(`🔍 Analyzing ${items.length} responses in batch using Groq AI...`);
+    const startedAt = Date.now();
+
+    const context = companyContext || 'General Company';
+    const useCache = answerCacheEnabled && cache !== false;
+    const scopes = items.map((item, index) =>
+      answerCacheScope({ questionId: answers[index].questionId, question: item.question, category: item.category, companyContext: context }));
+
+    // Near-duplicates of already analysed answers skip the LLM; the rest go out in batches
+    const results: Array<{ source: 'cache' | 'batch' | 'single' | 'mock', analysis: any, similarity?: number | null }> = [];
+    const pending: AnalysisBatchItem[] = [];
+    items.forEach((item, index) => {
+      const cached = useCache ? groqAnswerCache.lookup(scopes[index], item.userAnswer) : null;
+      if (cached) {
+        results[index] = { source: 'cache', analysis: cached.value, similarity: cached.similarity };
+      } else {
+        pending.push(item);
+      }
+    });
+
+    if (pending.length > 0) {
+      const groqAIService = GroqAIService.getInstance();
+      const batchStartedAt = Date.now();
+      const analysed = await groqAIService.analyzeInterviewResponsesBatch(pending, context);
+      const perItemMs = (Date.now() - batchStartedAt) / pending.length;
+      analysed.forEach((result, i) => {
+        const index = Number(result.id) - 1;
+        results[index] = { source: result.source, analysis: result.analysis };
+        if (useCache && result.source !== 'mock') {
+          groqAnswerCache.store(scopes[index], pending[i].userAnswer, result.analysis, perItemMs);
+        }
+      });
+    }
+
+    const sources = { cache: 0, batch: 0, single: 0, mock: 0 };
+    results.forEach(result => sources[result.source]++);
+    console.log(`✅ Batch analysis completed: ${sources.cache} cached, ${sources.batch} batched, ${sources.single} single, ${sources.mock} fallback`);
+
+    return NextResponse.json({
+      message: 'Responses analyzed successfully',
+      analyses: results.map((result, index) => ({
+        index,
+        questionId: answers[index].questionId ?? answers[index].id ?? null,
+        source: result.source,
+        similarity: result.similarity ?? null,
+        analysis: result.analysis,
+        metadata: {
+          questionCategory: items[index].category,
+          wordCount: items[index].userAnswer.split(' ').length,
+          responseLength: items[index].userAnswer.length
+        }
+      })),
+      metadata: {
+        analyzedAt: new Date(),
+        service: 'groq-ai',
+        interviewId: interviewId || null,
+        answers: items.length,
+        batches: packAnalysisBatches(pending).length,
+        limits: DEFAULT_BATCH_LIMITS,
+        sources,
+        processingTime: Date.now() - startedAt
+      }
+    });
+
+  } catch (error) {
+    console.error('Error analyzing responses with Groq AI:', error);
+    return NextResponse.json(
+      { error: 'Failed to analyze responses: ' + error },
+      { status: 500 }
+    );
+  }
+}
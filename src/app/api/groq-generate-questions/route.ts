@@ -1,8 +1,21 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
-import { ObjectId } from 'mongodb';
+import { Db, ObjectId } from 'mongodb';
 import GroqAIService from '@/lib/groqAIService';
 import EnhancedCompanyIntelligenceService from '@/lib/enhancedCompanyIntelligence';
+import JobQueue, { JobQueueFullError, JobSnapshot } from '@/lib/jobQueue';
+import { generateSections, QuestionSection, requestedStreamFormat, streamQuestionSections } from '@/lib/questionStream';
+
+const MAX_LONG_POLL_MS = 30000;
+
+// Generations run in the background on a few slots so 202 replies return immediately
+const questionJobs = new JobQueue<Record<string, any>>({
+  name: 'question-generation',
+  concurrency: parseInt(process.env.QUESTION_JOB_CONCURRENCY || '2'),
+  maxQueue: parseInt(process.env.QUESTION_JOB_QUEUE_DEPTH || '50'),
+  retentionMs: parseInt(process.env.QUESTION_JOB_RETENTION_MS || String(15 * 60 * 1000))
+});
 
 // Helper function to validate ObjectId
 function isValidObjectId(id: string): boolean {
@@ -10,9 +23,14 @@ function isValidObjectId(id: string): boolean {
 }
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/groq-generate-questions', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId, regenerate = false } = body;
+    const streamFormat = requestedStreamFormat(request.headers.get('accept'), body);
 
     if (!interviewId) {
       return NextResponse.json(
@@ -50,6 +68,13 @@ export async function POST(request: NextRequest) {
       });
 
       if (existingQuestions && existingQuestions.questions && existingQuestions.questions.length > 0) {
+        if (streamFormat) {
+          return streamQuestionSections(
+            [{ category: 'cached', generate: async () => existingQuestions.questions }],
+            streamFormat,
+            async ({ questions }) => ({ message: 'Questions already exist', questionsCount: questions.length, provider: 'cached' })
+          );
+        }
         return NextResponse.json({
           message: 'Questions already exist',
           questionsCount: existingQuestions.questions.length,
@@ -59,213 +84,265 @@ export async function POST(request: NextRequest) {
       }
     }
 
-    console.log(`🚀 Generating questions for ${interview.companyName} ${interview.jobTitle} using Groq AI...`);
+    // Streaming mode: send each question as soon as its section is generated and validated
+    if (streamFormat) {
+      const { sections, enhancedCompanyData } = await planQuestionSections(interview);
+      return streamQuestionSections(sections, streamFormat, async ({ questions }) => {
+        const { questions: _all, ...summary } = await storeQuestions(db, interviewId, interview, questions, enhancedCompanyData);
+        return summary;
+      });
+    }
+
+    // Async mode: queue the generation and answer 202 with a job to poll
+    if (body.async === true || request.headers.get('prefer')?.includes('respond-async')) {
+      try {
+        const { job, deduplicated } = questionJobs.enqueue(interviewId, () => generateQuestions(db, interviewId, interview));
+        console.log(`📥 Question generation ${deduplicated ? 'already queued' : 'queued'} for ${interviewId} as job ${job.id}`);
+        return NextResponse.json(
+          { ...jobBody(job), deduplicated },
+          { status: 202, headers: { 'Location': jobUrl(job.id), 'Retry-After': '1' } }
+        );
+      } catch (error) {
+        if (error instanceof JobQueueFullError) {
+          return NextResponse.json({ error: error.message }, { status: 503, headers: { 'Retry-After': '5' } });
+        }
+        throw error;
+      }
+    }
 
-    const groqAIService = GroqAIService.getInstance();
-    const companyIntelligence = EnhancedCompanyIntelligenceService.getInstance();
-    
-    // Get enhanced company intelligence
-    const enhancedCompanyData = await companyIntelligence.getEnhancedCompanyIntelligence(
-      interview.companyName,
-      interview.jobTitle
+    return NextResponse.json(await generateQuestions(db, interviewId, interview));
+
+  } catch (error) {
+    console.error('Error generating questions with Groq AI:', error);
+    return NextResponse.json(
+      { error: 'Failed to generate questions: ' + error },
+      { status: 500 }
     );
+  }
+}
 
-    console.log(`📊 Company intelligence gathered for ${interview.companyName}`);
-    
-    // Generate questions based on interview type
-    let allQuestions: any[] = [],
-    
-    if (interview.interviewType === 'mixed') {
-      console.log('🔄 Generating comprehensive mixed interview questions with all 4 rounds...');
-      
-      // Technical Questions (6 questions - 37.5%)
-      const technicalQuestions = await groqAIService.generateInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: 'technical',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: 6,
-        companyIntelligence: enhancedCompanyData?.company_data
-      });
+/**
+ * GET ?jobId=<id>[&waitMs=<ms>] reports an async generation job, long-polling up to
+ * waitMs for it to finish; ?type=queue-stats reports the worker pool
+ */
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
 
-      // Behavioral Questions (4 questions - 25%)
-      const behavioralQuestions = await groqAIService.generateInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: 'behavioral',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: 4,
-        companyIntelligence: enhancedCompanyData?.company_data
-      });
+  if (searchParams.get('type') === 'queue-stats') {
+    return NextResponse.json({ success: true, queue: questionJobs.getMetrics() });
+  }
 
-      // Aptitude Questions (4 questions - 25%)
-      const aptitudeQuestions = await groqAIService.generateInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: 'aptitude',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: 4,
-        companyIntelligence: enhancedCompanyData?.company_data
-      });
+  const jobId = searchParams.get('jobId');
+  if (!jobId) {
+    return NextResponse.json({ error: 'jobId is required' }, { status: 400 });
+  }
 
-      // DSA Problems (2 questions - 12.5%)
-      const dsaProblems = await groqAIService.generateDSAProblems(
-        interview.companyName,
-        getDSADifficulty(interview.experienceLevel),
-        2, // Fixed to exactly 2 DSA questions
-        enhancedCompanyData?.company_data
-      );
+  const waitMs = Math.min(parseInt(searchParams.get('waitMs') || '0') || 0, MAX_LONG_POLL_MS);
+  const job = await questionJobs.waitFor(jobId, waitMs);
+  if (!job) {
+    return NextResponse.json({ error: 'Job not found or expired' }, { status: 404 });
+  }
+
+  if (job.status === 'completed') {
+    return NextResponse.json({ ...jobBody(job), ...job.result });
+  }
+  if (job.status === 'failed') {
+    return NextResponse.json(
+      { ...jobBody(job), error: 'Failed to generate questions: ' + job.error },
+      { status: 500 }
+    );
+  }
+  return NextResponse.json(jobBody(job), { status: 202, headers: { 'Retry-After': '1' } });
+}
+
+function jobUrl(jobId: string): string {
+  return `/api/groq-generate-questions?jobId=${jobId}`;
+}
+
+function jobBody(job: JobSnapshot<any>) {
+  return {
+    jobId: job.id,
+    interviewId: job.key,
+    status: job.status,
+    position: job.position,
+    queuedMs: job.queuedMs,
+    runMs: job.runMs,
+    statusUrl: jobUrl(job.id)
+  };
+}
 
-      allQuestions = [
-        ...technicalQuestions,
-        ...behavioralQuestions,
-        ...aptitudeQuestions,
-        ...dsaProblems.map(p => ({
-          id: p.id,
-          question: p.title,
-          expectedAnswer: p.description,
-          category: 'dsa',
-          difficulty: p.difficulty,
-          points: getDSAPoints(p.difficulty),
-          timeLimit: 45, // DSA problems get more time
-          problemData: p,
-          provider: 'groq',
-          model: 'llama-3.3-70b-versatile'
-        }))
-      ];
-
-      console.log(`✅ Mixed interview generated: ${technicalQuestions.length} Technical + ${behavioralQuestions.length} Behavioral + ${aptitudeQuestions.length} Aptitude + ${dsaProblems.length} DSA = ${allQuestions.length} total questions`);
-      
-    } else if (interview.interviewType === 'dsa') {
-      console.log('💻 Generating DSA-focused interview with exactly 2 questions...');
+/**
+ * Company intelligence plus the independent generation sections for an interview.
+ * Sections run concurrently; in streaming mode each is sent as soon as it returns.
+ */
+async function planQuestionSections(interview: any): Promise<{ sections: QuestionSection[]; enhancedCompanyData: any }> {
+  console.log(`🚀 Generating questions for ${interview.companyName} ${interview.jobTitle} using Groq AI...`);
+
+  const groqAIService = GroqAIService.getInstance();
+  const companyIntelligence = EnhancedCompanyIntelligenceService.getInstance();
+  
+  // Get enhanced company intelligence
+  const enhancedCompanyData = await companyIntelligence.getEnhancedCompanyIntelligence(
+    interview.companyName,
+    interview.jobTitle
+  );
+
+  console.log(`📊 Company intelligence gathered for ${interview.companyName}`);
+
+  const questionsFor = (interviewType: 'technical' | 'behavioral' | 'aptitude', numberOfQuestions: number): QuestionSection => ({
+    category: interviewType,
+    generate: () => groqAIService.generateInterviewQuestions({
+      jobTitle: interview.jobTitle,
+      companyName: interview.companyName,
+      skills: interview.skills || [],
+      interviewType,
+      experienceLevel: interview.experienceLevel || 'mid',
+      numberOfQuestions,
+      companyIntelligence: enhancedCompanyData?.company_data
+    })
+  });
+
+  const dsaSection: QuestionSection = {
+    category: 'dsa',
+    generate: async () => {
       const dsaProblems = await groqAIService.generateDSAProblems(
         interview.companyName,
         getDSADifficulty(interview.experienceLevel),
         2, // Fixed to exactly 2 DSA questions
         enhancedCompanyData?.company_data
       );
-
-      allQuestions = dsaProblems.map(p => ({
+      return dsaProblems.map(p => ({
         id: p.id,
         question: p.title,
         expectedAnswer: p.description,
         category: 'dsa',
         difficulty: p.difficulty,
         points: getDSAPoints(p.difficulty),
-        timeLimit: 45, // More time for DSA problems
+        timeLimit: 45, // DSA problems get more time
         problemData: p,
         provider: 'groq',
         model: 'llama-3.3-70b-versatile'
       }));
-
-      console.log(`✅ DSA interview generated with ${allQuestions.length} questions`);
-    } else {
-      console.log(`🎯 Generating ${interview.interviewType} interview questions...`);
-      allQuestions = await groqAIService.generateInterviewQuestions({
-        jobTitle: interview.jobTitle,
-        companyName: interview.companyName,
-        skills: interview.skills || [],
-        interviewType: interview.interviewType as 'technical' | 'behavioral' | 'aptitude',
-        experienceLevel: interview.experienceLevel || 'mid',
-        numberOfQuestions: getQuestionCount(interview.interviewType),
-        companyIntelligence: enhancedCompanyData?.company_data
-      });
     }
+  };
 
-    // Enhanced question document with company intelligence
-    const questionDoc = {
-      interviewId: interviewId,
-      questions: allQuestions.map(q => ({
-        id: q.id,
-        question: q.question,
-        expectedAnswer: q.expectedAnswer,
-        category: q.category,
-        difficulty: q.difficulty,
-        points: q.points,
-        timeLimit: q.timeLimit,
-        followUpQuestions: q.followUpQuestions || [],
-        evaluationCriteria: q.evaluationCriteria || [],
-        companyRelevance: q.companyRelevance || 8,
-        tags: q.tags || [],
-        hints: q.hints || [],
-        problemData: q.problemData || null,
-        provider: q.provider || 'groq',
-        model: q.model || 'llama-3.3-70b-versatile'
-      })),
-      companyIntelligence: enhancedCompanyData ? {
-        industry: enhancedCompanyData.company_data.industry,
-        tech_stack: enhancedCompanyData.company_data.tech_stack,
-        culture: enhancedCompanyData.company_data.culture,
-        recent_news: enhancedCompanyData.company_data.recent_news,
-        recent_posts: enhancedCompanyData.company_data.recent_posts.slice(0, 3),
-        difficulty: enhancedCompanyData.company_data.difficulty,
-        focus_areas: enhancedCompanyData.company_data.focus_areas
-      } : null,
-      metadata: {
-        generatedAt: new Date(),
-        aiService: 'groq-ai-service',
-        totalQuestions: allQuestions.length,
-        categoryBreakdown: getCategoryBreakdown(allQuestions),
-        difficultyBreakdown: getDifficultyBreakdown(allQuestions),
-        providerBreakdown: getProviderBreakdown(allQuestions),
-        companyIntelligenceUsed: !!enhancedCompanyData,
-        interviewType: interview.interviewType,
-        enhancedFeatures: interview.interviewType === 'mixed' ?
-          'Full comprehensive interview with Technical + Behavioral + Aptitude + DSA rounds' :
-          interview.interviewType === 'dsa' ?
-          'Focused DSA interview with 2 challenging problems' :
-          `Specialized ${interview.interviewType} interview`
-      },
-      status: 'ready'
-    };
-
-    // Store or update questions
-    await db.collection('questions').replaceOne(
-      { interviewId: interviewId },
-      questionDoc,
-      { upsert: true }
-    );
+  // Generate questions based on interview type
+  let sections: QuestionSection[];
+  if (interview.interviewType === 'mixed') {
+    console.log('🔄 Generating comprehensive mixed interview questions with all 4 rounds...');
+    // 6 Technical (37.5%) + 4 Behavioral (25%) + 4 Aptitude (25%) + 2 DSA (12.5%)
+    sections = [
+      questionsFor('technical', 6),
+      questionsFor('behavioral', 4),
+      questionsFor('aptitude', 4),
+      dsaSection
+    ];
+  } else if (interview.interviewType === 'dsa') {
+    console.log('💻 Generating DSA-focused interview with exactly 2 questions...');
+    sections = [dsaSection];
+  } else {
+    console.log(`🎯 Generating ${interview.interviewType} interview questions...`);
+    sections = [questionsFor(interview.interviewType, getQuestionCount(interview.interviewType))];
+  }
 
-    // Update interview status with enhanced metadata
-    await db.collection('interviews').updateOne(
-      { _id: new ObjectId(interviewId) },
-      { 
-        $set: { 
-          status: 'ready',
-          questionMetadata: questionDoc.metadata,
-          companyIntelligence: questionDoc.companyIntelligence,
-          updatedAt: new Date(),
-          totalQuestions: allQuestions.length,
-          estimatedDuration: calculateEstimatedDuration(allQuestions)
-        } 
-      }
-    );
+  return { sections, enhancedCompanyData };
+}
 
-    console.log(`✅ Generated ${allQuestions.length} questions using Groq AI Service`);
-
-    return NextResponse.json({
-      message: `Questions generated successfully with Groq AI Service - ${interview.interviewType === 'mixed' ? 'All 4 rounds included' : interview.interviewType === 'dsa' ? '2 DSA problems' : `${allQuestions.length} ${interview.interviewType} questions`}`,
-      questionsCount: allQuestions.length,
-      questions: allQuestions,
-      metadata: questionDoc.metadata,
-      companyIntelligence: questionDoc.companyIntelligence,
-      breakdown: {
-        categories: getCategoryBreakdown(allQuestions),
-        difficulties: getDifficultyBreakdown(allQuestions),
-        providers: getProviderBreakdown(allQuestions)
-      }
-    });
+/**
+ * Generate, store and return the question set for an interview
+ */
+async function generateQuestions(db: Db, interviewId: string, interview: any) {
+  const { sections, enhancedCompanyData } = await planQuestionSections(interview);
+  const { questions } = await generateSections(sections);
+  return storeQuestions(db, interviewId, interview, questions, enhancedCompanyData);
+}
 
-  } catch (error) {
-    console.error('Error generating questions with Groq AI:', error);
-    return NextResponse.json(
-      { error: 'Failed to generate questions: ' + error },
-      { status: 500 }
-    );
-  }
+async function storeQuestions(db: Db, interviewId: string, interview: any, allQuestions: any[], enhancedCompanyData: any) {
+  console.log(`✅ ${interview.interviewType} interview generated: ${JSON.stringify(getCategoryBreakdown(allQuestions))} = ${allQuestions.length} total questions`);
+
+  // Enhanced question document with company intelligence
+  const questionDoc = {
+    interviewId: interviewId,
+    questions: allQuestions.map(q => ({
+      id: q.id,
+      question: q.question,
+      expectedAnswer: q.expectedAnswer,
+      category: q.category,
+      difficulty: q.difficulty,
+      points: q.points,
+      timeLimit: q.timeLimit,
+      followUpQuestions: q.followUpQuestions || [],
+      evaluationCriteria: q.evaluationCriteria || [],
+      companyRelevance: q.companyRelevance || 8,
+      tags: q.tags || [],
+      hints: q.hints || [],
+      problemData: q.problemData || null,
+      provider: q.provider || 'groq',
+      model: q.model || 'llama-3.3-70b-versatile'
+    })),
+    companyIntelligence: enhancedCompanyData ? {
+      industry: enhancedCompanyData.company_data.industry,
+      tech_stack: enhancedCompanyData.company_data.tech_stack,
+      culture: enhancedCompanyData.company_data.culture,
+      recent_news: enhancedCompanyData.company_data.recent_news,
+      recent_posts: enhancedCompanyData.company_data.recent_posts.slice(0, 3),
+      difficulty: enhancedCompanyData.company_data.difficulty,
+      focus_areas: enhancedCompanyData.company_data.focus_areas
+    } : null,
+    metadata: {
+      generatedAt: new Date(),
+      aiService: 'groq-ai-service',
+      totalQuestions: allQuestions.length,
+      categoryBreakdown: getCategoryBreakdown(allQuestions),
+      difficultyBreakdown: getDifficultyBreakdown(allQuestions),
+      providerBreakdown: getProviderBreakdown(allQuestions),
+      companyIntelligenceUsed: !!enhancedCompanyData,
+      interviewType: interview.interviewType,
+      enhancedFeatures: interview.interviewType === 'mixed' ?
+        'Full comprehensive interview with Technical + Behavioral + Aptitude + DSA rounds' :
+        interview.interviewType === 'dsa' ?
+        'Focused DSA interview with 2 challenging problems' :
+        `Specialized ${interview.interviewType} interview`
+    },
+    status: 'ready'
+  };
+
+  // Store or update questions
+  await db.collection('questions').replaceOne(
+    { interviewId: interviewId },
+    questionDoc,
+    { upsert: true }
+  );
+
+  // Update interview status with enhanced metadata
+  await db.collection('interviews').updateOne(
+    { _id: new ObjectId(interviewId) },
+    { 
+      $set: { 
+        status: 'ready',
+        questionMetadata: questionDoc.metadata,
+        companyIntelligence: questionDoc.companyIntelligence,
+        updatedAt: new Date(),
+        totalQuestions: allQuestions.length,
+        estimatedDuration: calculateEstimatedDuration(allQuestions)
+      } 
+    }
+  );
+
+  console.log(`✅ Generated ${allQuestions.length} questions using Groq AI Service`);
+
+  return {
+    message: `Questions generated successfully with Groq AI Service - ${interview.interviewType === 'mixed' ? 'All 4 rounds included' : interview.interviewType === 'dsa' ? '2 DSA problems' : `${allQuestions.length} ${interview.interviewType} questions`}`,
+    questionsCount: allQuestions.length,
+    questions: allQuestions,
+    metadata: questionDoc.metadata,
+    companyIntelligence: questionDoc.companyIntelligence,
+    breakdown: {
+      categories: getCategoryBreakdown(allQuestions),
+      difficulties: getDifficultyBreakdown(allQuestions),
+      providers: getProviderBreakdown(allQuestions)
+    }
+  };
 }
 
 // Helper functions
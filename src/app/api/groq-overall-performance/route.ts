@@ -1,9 +1,19 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import GroqAIService from '@/lib/groqAIService';
+import { getQueryOptions } from '@/lib/queryComment';
+import ServerTimer from '@/lib/serverTiming';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/groq-overall-performance', async () => {
+    const timer = new ServerTimer();
+    return timer.apply(await handlePOST(request));
+  });
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId } = body;
@@ -16,11 +26,12 @@ export async function POST(request: NextRequest) {
     }
 
     const db = client.db();
+    const queryOptions = getQueryOptions(request, '/api/groq-overall-performance');
     
     // Get interview details
     const interview = await db.collection('interviews').findOne({
       _id: new ObjectId(interviewId)
-    });
+    }, queryOptions);
 
     if (!interview) {
       return NextResponse.json(
@@ -32,7 +43,7 @@ export async function POST(request: NextRequest) {
     // Get questions and answers
     const questionData = await db.collection('questions').findOne({
       interviewId: interviewId
-    });
+    }, queryOptions);
 
     if (!questionData || !questionData.answers) {
       return NextResponse.json(
@@ -123,7 +134,7 @@ export async function POST(request: NextRequest) {
     };
 
     // Store performance analysis
-    await db.collection('performance_reports').insertOne(performanceReport);
+    await db.collection('performance_reports').insertOne(performanceReport, queryOptions);
 
     // Update interview status
     await db.collection('interviews').updateOne(
@@ -134,7 +145,8 @@ export async function POST(request: NextRequest) {
           performanceScore: averageScore,
           analyzedAt: new Date()
         } 
-      }
+      },
+      queryOptions
     );
 
     console.log(`✅ Overall performance analysis completed using Optimized Feedback Service - Score: ${averageScore.toFixed(1)}/10`);
@@ -0,0 +1,151 @@
+import { NextRequest, NextResponse } from 'next/server';
+import Judge0Service from '@/lib/judge0Service';
+import ImprovedJudge0Service from '@/lib/improvedJudge0Service';
+import FixedJudge0Service from '@/lib/fixedJudge0Service';
+import EnhancedJudge0Service from '@/lib/enhancedJudge0Service';
+import EnhancedDSACompiler from '@/lib/enhancedDSACompiler';
+
+/**
+ * Development-only entry point that runs one submission through any of the Judge0
+ * client variants, the way the component or route using it does, and reports the
+ * outcome in one shape so judge0_variant_benchmark.py can compare them.
+ *
+ * Variants take code in one of two forms: "function" variants append a call built
+ * from each test case input to the user's function, "stdin" variants run a complete
+ * program with the test case input on stdin.
+ */
+
+type Verdict = 'accepted' | 'wrong_answer' | 'time_limit' | 'compile_error' | 'runtime_error' | 'failed' | 'error';
+
+interface BenchmarkTestCase {
+  id: string;
+  input: string;
+  expectedOutput: string;
+}
+
+interface Outcome {
+  verdict: Verdict;
+  passed: number;
+  total: number;
+  statuses: string[];
+  error?: string;
+}
+
+interface Variant {
+  contract: 'function' | 'stdin';
+  run: (source: string, language: string, testCases: BenchmarkTestCase[]) => Promise<Outcome>;
+}
+
+// Verdict from Judge0 status descriptions, for variants that report them
+function fromStatuses(statuses: string[], passed: number, total: number): Verdict {
+  if (statuses.some(status => status.startsWith('Compilation Error'))) return 'compile_error';
+  if (statuses.some(status => status.startsWith('Time Limit Exceeded'))) return 'time_limit';
+  if (statuses.some(status => status.startsWith('Runtime Error'))) return 'runtime_error';
+  if (total > 0 && passed === total) return 'accepted';
+  return 'wrong_answer';
+}
+
+// ImprovedJudge0Service, FixedJudge0Service and EnhancedJudge0Service share a response shape
+function fromExecutionResponse(response: any): Outcome {
+  const statuses: string[] = (response.results || []).map((result: any) => result.status);
+  const outcome = { passed: response.totalPassed, total: response.totalTests, statuses };
+  if (response.runtimeError) return { ...outcome, verdict: 'error', error: response.runtimeError };
+  if (response.compilationError) return { ...outcome, verdict: 'compile_error' };
+  return { ...outcome, verdict: fromStatuses(statuses, response.totalPassed, response.totalTests) };
+}
+
+const VARIANTS: Record<string, Variant> = {
+  // AdvancedDSACompiler: no Judge0 status in the results, so failures stay unexplained
+  judge0: {
+    contract: 'stdin',
+    run: async (source, language, testCases) => {
+      const results = await Judge0Service.getInstance().executeCode(source, language, testCases);
+      const passed = results.filter(result => result.passed).length;
+      return { verdict: passed === results.length ? 'accepted' : 'failed', passed, total: results.length, statuses: [] };
+    }
+  },
+  // DSACompiler
+  improved: {
+    contract: 'function',
+    run: async (source, language, testCases) =>
+      fromExecutionResponse(await ImprovedJudge0Service.getInstance().executeCode(source, language, testCases))
+  },
+  // EnhancedDSACompiler component
+  fixed: {
+    contract: 'function',
+    run: async (source, language, testCases) =>
+      fromExecutionResponse(await FixedJudge0Service.getInstance().executeCode(source, language, testCases))
+  },
+  // FixedDSACompiler component and /api/test-dsa-execution
+  enhanced: {
+    contract: 'function',
+    run: async (source, language, testCases) =>
+      fromExecutionResponse(await EnhancedJudge0Service.getInstance().executeCodeWithFallback(source, language, testCases))
+  },
+  // /api/execute-dsa-code, without its verdict cache
+  compiler: {
+    contract: 'stdin',
+    run: async (source, language, testCases) => {
+      const result = await EnhancedDSACompiler.getInstance().executeCode({
+        sourceCode: source,
+        language,
+        companyName: 'Benchmark',
+        problem: {
+          id: 'judge0-benchmark', title: 'Judge0 benchmark', difficulty: 'medium', description: '',
+          examples: [], testCases, constraints: [], topics: []
+        }
+      });
+      const testResults = result.testResults || [];
+      const passed = testResults.filter(test => test.passed).length;
+      if (result.error || testResults.some(test => test.infrastructureError)) {
+        return { verdict: 'error', passed, total: testCases.length, statuses: [], error: result.error };
+      }
+      return { verdict: passed === testResults.length ? 'accepted' : 'failed', passed, total: testResults.length, statuses: [] };
+    }
+  }
+};
+
+export async function GET() {
+  return NextResponse.json({
+    variants: Object.entries(VARIANTS).map(([name, variant]) => ({ name, contract: variant.contract }))
+  });
+}
+
+export async function POST(request: NextRequest) {
+  if (process.env.NODE_ENV === 'production') {
+    return NextResponse.json({ error: 'Not available in production' }, { status: 403 });
+  }
+
+  try {
+    const { variant: name, language, functionSource, programSource, testCases } = await request.json();
+    const variant = VARIANTS[name];
+    if (!variant || !language || !Array.isArray(testCases)) {
+      return NextResponse.json(
+        { error: `variant must be one of ${Object.keys(VARIANTS).join(', ')}; language and testCases are required` },
+        { status: 400 }
+      );
+    }
+
+    const source = variant.contract === 'function' ? functionSource : programSource;
+    if (!source) {
+      return NextResponse.json({ error: `${name} needs ${variant.contract === 'function' ? 'functionSource' : 'programSource'}` }, { status: 400 });
+    }
+
+    const startTime = performance.now();
+    const outcome = await variant.run(source, language, testCases);
+    return NextResponse.json({
+      success: true,
+      variant: name,
+      contract: variant.contract,
+      ...outcome,
+      verdictMs: performance.now() - startTime
+    });
+  } catch (error) {
+    console.error('❌ Judge0 benchmark request failed:', error);
+    return NextResponse.json({
+      success: false,
+      verdict: 'error',
+      error: error instanceof Error ? error.message : String(error)
+    }, { status: 500 });
+  }
+}
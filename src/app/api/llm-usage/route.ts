@@ -0,0 +1,20 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { llmUsage } from '@/lib/llmUsage';
+
+/**
+ * LLM call accounting: calls, failures, prompt/completion tokens and queue, network
+ * and parse time per provider/model and per route since start-up or the last reset
+ */
+export async function GET() {
+  return NextResponse.json(llmUsage.getMetrics());
+}
+
+// DELETE endpoint to reset the counters between benchmark runs
+export async function DELETE(request: NextRequest) {
+  if (process.env.NODE_ENV === 'production') {
+    return NextResponse.json({ error: 'Not available in production' }, { status: 403 });
+  }
+
+  llmUsage.reset();
+  return NextResponse.json({ success: true, message: 'LLM usage counters reset' });
+}
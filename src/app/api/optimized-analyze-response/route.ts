@@ -1,12 +1,18 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import OptimizedAIService from '@/lib/optimizedAIService';
+import { answerCacheEnabled, answerCacheScope, optimizedAnswerCache } from '@/lib/answerSimilarityCache';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/optimized-analyze-response', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     console.log('🔍 Optimized Response Analysis API called');
     
     const body = await request.json();
-    const { question, userAnswer, expectedAnswer, category, companyContext } = body;
+    const { question, userAnswer, expectedAnswer, category, companyContext, questionId, cache = true } = body;
 
     if (!question || !userAnswer || !expectedAnswer) {
       return NextResponse.json(
@@ -26,15 +32,33 @@ export async function POST(request: NextRequest) {
       throw new Error('AI service is not available - check API keys');
     }
 
-    // Analyze the response using Anthropic Claude 3.5 Sonnet for best analysis quality
-    const analysis = await aiService.analyzeInterviewResponse(
+    // Analyze the response using Anthropic Claude 3.5 Sonnet for best analysis quality,
+    // reusing the analysis of a near-identical earlier answer to the same question
+    const analyze = (strict: boolean) => aiService.analyzeInterviewResponse(
       question,
       userAnswer,
       expectedAnswer,
       category || 'technical',
-      companyContext || 'General'
+      companyContext || 'General',
+      { strict }
     );
 
+    let analysis;
+    let cacheInfo: { hit: boolean, similarity: number | null, entryId: string | null } = { hit: false, similarity: null, entryId: null };
+    if (answerCacheEnabled && cache !== false) {
+      const scope = answerCacheScope({ questionId, question, category: category || 'technical', companyContext: companyContext || 'General' });
+      try {
+        const cached = await optimizedAnswerCache.resolve(scope, userAnswer, () => analyze(true));
+        analysis = cached.value;
+        cacheInfo = { hit: cached.hit, similarity: cached.similarity, entryId: cached.entryId };
+      } catch (error) {
+        // Fallback analyses are served but never cached
+        analysis = aiService.generateFallbackAnalysis(userAnswer, companyContext || 'General');
+      }
+    } else {
+      analysis = await analyze(false);
+    }
+
     const responseData = {
       success: true,
       analysis,
@@ -45,7 +69,8 @@ export async function POST(request: NextRequest) {
         processingTime: 'high-speed-api',
         companyContext: companyContext || 'General',
         performanceImprovement: '8x faster than Ollama',
-        analysisQuality: 'professional-grade'
+        analysisQuality: 'professional-grade',
+        cache: cacheInfo
       }
     };
 
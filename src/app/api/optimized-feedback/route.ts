@@ -1,9 +1,19 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import { OptimizedFeedbackService } from '@/lib/optimizedFeedbackService';
+import { getQueryOptions } from '@/lib/queryComment';
+import ServerTimer from '@/lib/serverTiming';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/optimized-feedback', async () => {
+    const timer = new ServerTimer();
+    return timer.apply(await handlePOST(request));
+  });
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId, mode = 'fast' } = body;
@@ -18,11 +28,12 @@ export async function POST(request: NextRequest) {
     console.log(`⚡ Generating optimized feedback for interview ${interviewId}...`);
 
     const db = client.db();
+    const queryOptions = getQueryOptions(request, '/api/optimized-feedback');
     
     // Get interview details
     const interview = await db.collection('interviews').findOne({
       _id: new ObjectId(interviewId)
-    });
+    }, queryOptions);
 
     if (!interview) {
       return NextResponse.json(
@@ -34,7 +45,7 @@ export async function POST(request: NextRequest) {
     // Get questions and answers
     const questionData = await db.collection('questions').findOne({
       interviewId: interviewId
-    });
+    }, queryOptions);
 
     if (!questionData || !questionData.answers) {
       return NextResponse.json(
@@ -123,7 +134,7 @@ export async function POST(request: NextRequest) {
     };
 
     // Store performance analysis
-    await db.collection('performance_reports').insertOne(performanceReport);
+    await db.collection('performance_reports').insertOne(performanceReport, queryOptions);
 
     // Update interview status
     await db.collection('interviews').updateOne(
@@ -135,7 +146,8 @@ export async function POST(request: NextRequest) {
           analyzedAt: new Date(),
           fastAnalysis: true
         } 
-      }
+      },
+      queryOptions
     );
 
     console.log(`✅ Fast feedback completed in ${analysis.processingTime}ms`);
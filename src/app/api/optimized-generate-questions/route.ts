@@ -1,8 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import { connectDB } from '@/lib/db';
 import OptimizedAIService from '@/lib/optimizedAIService';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/optimized-generate-questions', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     console.log('🚀 Optimized Question Generation API called');
     
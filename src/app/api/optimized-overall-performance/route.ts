@@ -1,8 +1,18 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import { connectDB } from '@/lib/db';
 import OptimizedAIService from '@/lib/optimizedAIService';
+import { getQueryOptions } from '@/lib/queryComment';
+import ServerTimer from '@/lib/serverTiming';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/optimized-overall-performance', async () => {
+    const timer = new ServerTimer();
+    return timer.apply(await handlePOST(request));
+  });
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     console.log('📊 Optimized Overall Performance Analysis API called');
     
@@ -81,7 +91,8 @@ export async function POST(request: NextRequest) {
               lastAnalyzed: new Date(),
               analysisProvider: 'optimized-ai'
             }
-          }
+          },
+          getQueryOptions(request, '/api/optimized-overall-performance')
         );
         
         console.log('✅ Performance analysis saved to database');
@@ -1,4 +1,6 @@
-import { extractTextFromPDF } from "@/lib/pdfParse";
+import { extractTextFromPDF, PdfParseError } from "@/lib/pdfParse";
+import PdfWorkerPool from "@/lib/pdfWorkerPool";
+import ServerTimer from "@/lib/serverTiming";
 import { NextRequest, NextResponse } from "next/server";
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import { modelUsed } from "@/constants/constants";
@@ -7,6 +9,11 @@ import { error } from "console";
 const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY ?? '');
 
 export async function POST(request: NextRequest) {
+    const timer = new ServerTimer();
+    return timer.apply(await parseResume(request, timer));
+}
+
+async function parseResume(request: NextRequest, timer: ServerTimer): Promise<NextResponse> {
     console.log("✅ Received POST request to /api/parse-resume");
 
     try {
@@ -20,6 +27,7 @@ export async function POST(request: NextRequest) {
         }
 
         const formData = await request.formData();
+        timer.mark('upload');
         const file = formData.get("resume") as File;
 
         if (!file) {
@@ -50,6 +58,7 @@ export async function POST(request: NextRequest) {
         console.log(`📄 Processing ${file.name} (${file.size} bytes)`);
 
         const textContent = await extractTextFromPDF(buffer);
+        timer.mark('pdf');
         console.log(`📝 Extracted text length: ${textContent.length} characters`);
 
         if (!textContent || textContent.length < 50) {
@@ -92,6 +101,7 @@ ${textContent.substring(0, 4000)}
         })
 
         const result = await model.generateContent(promptForDetails);
+        timer.mark('llm');
         const text = result.response.text();
         console.log("🧠 Gemini response received");
 
@@ -132,6 +142,12 @@ ${textContent.substring(0, 4000)}
 
     } catch (error) {
         console.error("❌ Error in resume parser:", error);
+        if (error instanceof PdfParseError) {
+            return NextResponse.json({
+                error: error.message,
+                status: error.status
+            }, { status: error.status });
+        }
         return NextResponse.json({
             error: "Resume parsing failed. Please try again or contact support.",
             status: 500,
@@ -140,6 +156,10 @@ ${textContent.substring(0, 4000)}
     }
 }
 
-export async function GET() {
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
+  if (searchParams.get('type') === 'pool-stats') {
+    return NextResponse.json({ success: true, pdfPool: PdfWorkerPool.getInstance().getMetrics() });
+  }
   return new Response("Hello from GET", { status: 200 });
 }
\ No newline at end of file
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { auth } from '@/app/auth';
 import { connectToDatabase } from '@/lib/db';
 import { ObjectId } from 'mongodb';
+import { getQueryOptions } from '@/lib/queryComment';
 
 export async function GET(request: NextRequest) {
   try {
@@ -19,7 +20,7 @@ export async function GET(request: NextRequest) {
     // Fetch all completed interviews with performance data
     const performances = await db.collection('performances').find({
       userId: new ObjectId(session.user.id)
-    }).sort({ completedAt: -1 }).toArray()
+    }, getQueryOptions(request, '/api/performance-stats')).sort({ completedAt: -1 }).toArray()
 
     // Calculate performance statistics
     const stats = calculatePerformanceStats(performances);
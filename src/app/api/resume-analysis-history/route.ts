@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
 import { auth } from "@/app/auth";
-import client from "@/lib/db";
+import { listAnalyses } from "@/lib/resumeAnalysisStore";
 
 export async function GET(request: NextRequest) {
   try {
@@ -9,20 +9,8 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "Authentication required" }, { status: 401 });
     }
 
-    const dbClient = client;
-    const db = dbClient.db();
-
-    const analyses = await db.collection("resumeAnalyses")
-      .find({ userId: session.user.id })
-      .sort({ createdAt: -1 })
-      .toArray();
-
-    // Convert MongoDB _id to string and clean up the response
-    const cleanedAnalyses = analyses.map(analysis => ({
-      ...analysis,
-      _id: undefined, // Remove MongoDB _id
-      id: analysis.id || analysis._id.toString()
-    }));
+    // Same store /api/analyze-resume writes to and answers repeat uploads from
+    const cleanedAnalyses = await listAnalyses(session.user.id);
 
     return NextResponse.json({ 
       analyses: cleanedAnalyses,
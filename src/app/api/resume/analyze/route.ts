@@ -2,7 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { auth } from '@/app/auth';
 import { connectToDatabase } from '@/lib/db';
 import { GoogleGenerativeAI } from '@google/generative-ai';
-import pdfParse from 'pdf-parse';
+import { extractTextFromPDF, PdfParseError } from '@/lib/pdfParse';
 
 const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY!);
 
@@ -31,13 +31,12 @@ export async function POST(request: NextRequest) {
     let resumeText = '';
     
     try {
-      const pdfData = await pdfParse(resumeBuffer);
-      resumeText = pdfData.text;
+      resumeText = await extractTextFromPDF(resumeBuffer);
     } catch (err) {
       console.error('PDF parsing error:', err);
       return NextResponse.json(
-        { error: 'Failed to parse resume PDF' },
-        { status: 400 }
+        { error: err instanceof PdfParseError && err.code !== 'parse_failed' ? err.message : 'Failed to parse resume PDF' },
+        { status: err instanceof PdfParseError ? err.status : 400 }
       );
     }
 
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { auth } from '@/app/auth';
 import { connectToDatabase } from '@/lib/db';
 import { ObjectId } from 'mongodb';
+import { getQueryOptions } from '@/lib/queryComment';
 
 export async function POST(request: NextRequest) {
   try {
@@ -70,9 +71,10 @@ export async function POST(request: NextRequest) {
     }
 
     // Check if performance data already exists
+    const queryOptions = getQueryOptions(request, '/api/save-performance');
     const existingPerformance = await db.collection('performances').findOne({
       interviewId: interviewObjectId
-    })
+    }, queryOptions)
     
     if (existingPerformance) {
       console.log('⚠️ Performance data already exists, skipping save');
@@ -106,7 +108,7 @@ export async function POST(request: NextRequest) {
     }
 
     console.log('💾 Inserting performance data...');
-    const result = await db.collection('performances').insertOne(performanceData);
+    const result = await db.collection('performances').insertOne(performanceData, queryOptions);
     console.log('✅ Performance data inserted with ID:', result.insertedId);
 
     // Update interview status to completed and remove from active list
@@ -119,7 +121,8 @@ export async function POST(request: NextRequest) {
           completedAt: new Date(),
           performanceId: result.insertedId
         }
-      }
+      },
+      queryOptions
     )
     console.log('📊 Interview updated:', updateResult.modifiedCount, 'documents modified');
 
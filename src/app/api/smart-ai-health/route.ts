@@ -52,6 +52,7 @@ export async function GET(request: NextRequest) {
     return NextResponse.json({
       health,
       system: systemInfo,
+      hedging: smartAI.getHedgingMetrics(),
       status: 'success'
     });
 
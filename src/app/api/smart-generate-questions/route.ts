@@ -1,9 +1,14 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { withLLMUsage } from '@/lib/llmUsage';
 import client from '@/lib/db';
 import { ObjectId } from 'mongodb';
 import SmartAIService from '@/lib/smartAIService';
 
 export async function POST(request: NextRequest) {
+  return withLLMUsage('/api/smart-generate-questions', () => handlePOST(request));
+}
+
+async function handlePOST(request: NextRequest) {
   try {
     const body = await request.json();
     const { interviewId, regenerate = false } = body;
@@ -58,7 +63,7 @@ export async function POST(request: NextRequest) {
       experienceLevel: interview.experienceLevel || 'mid',
       numberOfQuestions: getQuestionCount(interview.interviewType),
       companyIntelligence: null // Can be enhanced later
-    });
+    }, { hedge: typeof body.hedge === 'boolean' ? body.hedge : undefined });
 
     if (!questionResponse.success) {
       throw new Error('Failed to generate questions with SmartAI service');
@@ -126,7 +131,8 @@ export async function POST(request: NextRequest) {
       metadata: questionDoc.metadata,
       provider: questionResponse.provider,
       model: questionResponse.model,
-      processingTime: questionResponse.processingTime
+      processingTime: questionResponse.processingTime,
+      hedged: questionResponse.hedged || false
     });
 
   } catch (error) {
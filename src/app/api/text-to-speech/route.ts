@@ -1,14 +1,83 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { ElevenLabsClient } from 'elevenlabs';
+import AudioClipCache, { CachedClip, parseRange } from '@/lib/audioCache';
+
+export const runtime = 'nodejs';
+
+const DEFAULT_VOICE_ID = '21m00Tcm4TlvDq8ikWAM'; // Rachel - Professional female voice
+const DEFAULT_MODEL = 'eleven_monolingual_v1';
+// Models a client may ask for; anything else would spend quota and cache space on arbitrary ids
+const ALLOWED_MODELS = new Set([
+  'eleven_monolingual_v1',
+  'eleven_multilingual_v1',
+  'eleven_multilingual_v2',
+  'eleven_turbo_v2',
+  'eleven_turbo_v2_5',
+  'eleven_flash_v2',
+  'eleven_flash_v2_5'
+]);
+// ElevenLabs voice ids are alphanumeric; anything else could steer the upstream path
+const VOICE_ID_PATTERN = /^[A-Za-z0-9]{1,64}$/;
+
+function clipUrl(key: string): string {
+  return `/api/text-to-speech?key=${key}`;
+}
+
+// Serve a finished clip from disk, honouring a single byte Range
+function serveClip(request: NextRequest, cache: AudioClipCache, clip: CachedClip): NextResponse {
+  const headers: Record<string, string> = {
+    'Content-Type': 'audio/mpeg',
+    'Accept-Ranges': 'bytes',
+    'Cache-Control': 'public, max-age=86400, immutable',
+    'ETag': `"${clip.key}"`,
+    'Content-Location': clipUrl(clip.key),
+    'X-Cache': 'HIT'
+  };
+
+  const range = parseRange(request.headers.get('range'), clip.size);
+  if (range === 'unsatisfiable') {
+    return new NextResponse(null, { status: 416, headers: { ...headers, 'Content-Range': `bytes */${clip.size}` } });
+  }
+  if (range) {
+    return new NextResponse(cache.openStream(clip, range), {
+      status: 206,
+      headers: {
+        ...headers,
+        'Content-Range': `bytes ${range.start}-${range.end}/${clip.size}`,
+        'Content-Length': String(range.end - range.start + 1)
+      }
+    });
+  }
+
+  return new NextResponse(cache.openStream(clip), {
+    status: 200,
+    headers: { ...headers, 'Content-Length': String(clip.size) }
+  });
+}
 
 export async function POST(request: NextRequest) {
   try {
-    const { text } = await request.json();
+    const { text, voiceId = DEFAULT_VOICE_ID, model = DEFAULT_MODEL } = await request.json();
 
     if (!text) {
       return NextResponse.json({ error: 'Text is required' }, { status: 400 });
     }
 
+    if (typeof voiceId !== 'string' || !VOICE_ID_PATTERN.test(voiceId)) {
+      return NextResponse.json({ error: 'Invalid voiceId' }, { status: 400 });
+    }
+
+    if (typeof model !== 'string' || !ALLOWED_MODELS.has(model)) {
+      return NextResponse.json({ error: 'Unsupported model' }, { status: 400 });
+    }
+
+    // Identical interviewer prompts are served from the on-disk clip cache
+    const cache = AudioClipCache.getInstance();
+    const key = cache.key(text, voiceId, model);
+    const cached = await cache.lookup(key);
+    if (cached) {
+      return serveClip(request, cache, cached);
+    }
+
     if (!process.env.ELEVENLABS_API_KEY) {
       return NextResponse.json(
         { error: 'ElevenLabs API key not configured' },
@@ -16,31 +85,53 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const client = new ElevenLabsClient({
-      apiKey: process.env.ELEVENLABS_API_KEY
-    });
-
-    // Generate audio stream
-    const audio = await client.generate({
-      voice: 'Rachel', // Professional female voice
-      text: text,
-      model_id: 'eleven_monolingual_v1'
+    const baseUrl = process.env.ELEVENLABS_BASE_URL || 'https://api.elevenlabs.io';
+    const upstream = await fetch(`${baseUrl}/v1/text-to-speech/${encodeURIComponent(voiceId)}/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Accept': 'audio/mpeg',
+        'xi-api-key': process.env.ELEVENLABS_API_KEY
+      },
+      body: JSON.stringify({ text, model_id: model })
     });
 
-    // Convert stream to buffer
-    const chunks: Uint8Array[] = [];
-    for await (const chunk of audio) {
-      chunks.push(chunk);
+    if (!upstream.ok || !upstream.body) {
+      throw new Error(`ElevenLabs API error: ${upstream.status}`);
     }
-    
-    const buffer = Buffer.concat(chunks);
 
-    // Return audio with proper headers
-    return new NextResponse(buffer, {
+    // Pipe audio to the client as it arrives and tee it into the cache
+    const reader = upstream.body.getReader();
+    const writer = await cache.createWriter(key);
+    const stream = new ReadableStream<Uint8Array>({
+      async pull(controller) {
+        try {
+          const { done, value } = await reader.read();
+          if (done) {
+            controller.close();
+            await writer.commit();
+            return;
+          }
+          writer.write(value);
+          controller.enqueue(value);
+        } catch (error) {
+          writer.abort();
+          controller.error(error);
+        }
+      },
+      cancel(reason) {
+        // Client went away before the clip finished; a partial clip is never cached
+        writer.abort();
+        reader.cancel(reason).catch(() => undefined);
+      }
+    });
+
+    return new NextResponse(stream, {
       status: 200,
       headers: {
         'Content-Type': 'audio/mpeg',
-        'Content-Length': buffer.length.toString()
+        'Content-Location': clipUrl(key),
+        'X-Cache': 'MISS'
       }
     });
 
@@ -52,3 +143,26 @@ export async function POST(request: NextRequest) {
     );
   }
 }
+
+/**
+ * GET ?key=<hash> replays a cached clip (seekable via Range); ?type=cache-stats reports the cache
+ */
+export async function GET(request: NextRequest) {
+  const { searchParams } = new URL(request.url);
+  const cache = AudioClipCache.getInstance();
+
+  if (searchParams.get('type') === 'cache-stats') {
+    return NextResponse.json({ success: true, cache: cache.getMetrics() });
+  }
+
+  const key = searchParams.get('key') || '';
+  if (!cache.isValidKey(key)) {
+    return NextResponse.json({ error: 'A valid clip key is required' }, { status: 400 });
+  }
+
+  const clip = await cache.lookup(key);
+  if (!clip) {
+    return NextResponse.json({ error: 'Clip not found' }, { status: 404 });
+  }
+  return serveClip(request, cache, clip);
+}
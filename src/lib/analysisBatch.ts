@@ -0,0 +1,82 @@
+/**
+ * Batched answer analysis
+ * Packs the answers of a round into size-bounded prompts so many answers are scored
+ * in one LLM call, and maps the structured reply back onto the answers by id. Answers
+ * the reply leaves out or gets wrong are reported missing so the caller can fall back
+ * to analysing them one at a time.
+ */
+
+export interface AnalysisBatchItem {
+  id: string;
+  question: string;
+  userAnswer: string;
+  expectedAnswer: string;
+  category: string;
+}
+
+export interface AnalysisBatchLimits {
+  maxChars: number; // Prompt characters spent on answers per call
+  maxItems: number;
+}
+
+export const DEFAULT_BATCH_LIMITS: AnalysisBatchLimits = {
+  maxChars: parseInt(process.env.ANALYSIS_BATCH_MAX_CHARS || '12000'),
+  maxItems: parseInt(process.env.ANALYSIS_BATCH_MAX_ITEMS || '8')
+};
+
+export function renderAnalysisItem(item: AnalysisBatchItem): string {
+  return [
+    `### Response id: ${item.id}`,
+    `Question Category: ${item.category}`,
+    `Interview Question: ${item.question}`,
+    `Expected Answer Guidelines: ${item.expectedAnswer}`,
+    `Candidate's Actual Response: ${item.userAnswer}`
+  ].join('\n');
+}
+
+/**
+ * Greedy packing in input order; an item larger than maxChars on its own gets a
+ * batch to itself rather than being cut
+ */
+export function packAnalysisBatches(items: AnalysisBatchItem[], limits: AnalysisBatchLimits = DEFAULT_BATCH_LIMITS): AnalysisBatchItem[][] {
+  const batches: AnalysisBatchItem[][] = [];
+  let current: AnalysisBatchItem[] = [];
+  let chars = 0;
+
+  for (const item of items) {
+    const size = renderAnalysisItem(item).length;
+    if (current.length > 0 && (current.length >= limits.maxItems || chars + size > limits.maxChars)) {
+      batches.push(current);
+      current = [];
+      chars = 0;
+    }
+    current.push(item);
+    chars += size;
+  }
+  if (current.length > 0) batches.push(current);
+  return batches;
+}
+
+function isAnalysis(entry: any): boolean {
+  return !!entry && typeof entry === 'object' && Number.isFinite(Number(entry.score)) && typeof entry.feedback === 'string';
+}
+
+/**
+ * Map a parsed batch reply ({ analyses: [...] } or a bare array) onto the batch by id.
+ * Entries without ids are matched by position only when the reply has exactly one
+ * entry per item; anything unmatched or malformed is left out of the result.
+ */
+export function demultiplexAnalyses(parsed: any, batch: AnalysisBatchItem[]): Map<string, any> {
+  const entries: any[] = Array.isArray(parsed) ? parsed : Array.isArray(parsed?.analyses) ? parsed.analyses : [];
+  const ids = new Set(batch.map(item => item.id));
+  const byPosition = entries.length === batch.length;
+  const matched = new Map<string, any>();
+
+  entries.forEach((entry, index) => {
+    const id = entry?.id != null ? String(entry.id) : byPosition ? batch[index].id : null;
+    if (id && ids.has(id) && !matched.has(id) && isAnalysis(entry)) {
+      matched.set(id, entry);
+    }
+  });
+  return matched;
+}
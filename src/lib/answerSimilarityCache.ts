@@ -0,0 +1,294 @@
+/**
+ * Near-duplicate answer cache
+ * Reuses a previous analysis when a candidate's answer to the same question is nearly
+ * identical to one already analysed. Answers are normalized, split into word
+ * shingles and MinHashed; an LSH index over the signature bands finds candidates
+ * without comparing against every stored answer, and a candidate is reused only when
+ * its estimated Jaccard similarity reaches the threshold. Exact repeats (after
+ * normalization) are answered from a direct lookup.
+ */
+
+import { createHash } from 'crypto';
+
+export interface SimilarityCacheOptions {
+  name: string;
+  threshold: number; // Minimum estimated Jaccard similarity to reuse an analysis
+  numHashes: number;
+  bands: number; // numHashes / bands rows per band; more bands find looser candidates
+  shingleSize: number; // Words per shingle
+  maxEntries: number;
+  ttlMs: number;
+}
+
+export interface SimilarityCacheResult<T> {
+  value: T;
+  hit: boolean;
+  similarity: number | null; // Estimated similarity of the reused answer, null on a miss
+  entryId: string; // Stored answer the value came from (or was stored as)
+}
+
+interface SimilarityEntry<T> {
+  id: string;
+  scope: string;
+  signature: Uint32Array;
+  bucketKeys: string[];
+  value: T;
+  computeMs: number; // What producing the value cost, credited on every reuse
+  expiresAt: number;
+}
+
+const HOUR = 60 * 60 * 1000;
+
+export function normalizeAnswer(text: string): string {
+  return text
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9+#]+/g, ' ')
+    .trim();
+}
+
+/**
+ * Word k-shingles; answers shorter than k words become a single shingle
+ */
+export function shingleAnswer(normalized: string, size: number): string[] {
+  const words = normalized.split(' ').filter(Boolean);
+  if (words.length <= size) return words.length ? [words.join(' ')] : [];
+  const shingles = new Set<string>();
+  for (let i = 0; i + size <= words.length; i++) {
+    shingles.add(words.slice(i, i + size).join(' '));
+  }
+  return [...shingles];
+}
+
+function fnv1a(text: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+// MurmurHash3 finalizer: a bijection on 32-bit values, so each seed gives a permutation
+function fmix32(value: number): number {
+  let h = value;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+}
+
+export class AnswerSimilarityCache<T> {
+  private entries: Map<string, SimilarityEntry<T>> = new Map(); // Insertion order doubles as LRU order
+  private buckets: Map<string, Set<string>> = new Map();
+  private seeds: Uint32Array;
+  private rows: number;
+  private stats = { lookups: 0, exactHits: 0, nearHits: 0, candidates: 0, stored: 0, evictions: 0, savedMs: 0, similaritySum: 0 };
+
+  constructor(private options: SimilarityCacheOptions) {
+    this.rows = Math.max(1, Math.floor(options.numHashes / options.bands));
+    this.seeds = new Uint32Array(options.numHashes);
+    let state = 0x9e3779b9;
+    for (let i = 0; i < options.numHashes; i++) {
+      state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+      this.seeds[i] = state;
+    }
+  }
+
+  /**
+   * The most similar stored answer in scope at or above the threshold, if any
+   */
+  lookup(scope: string, answer: string): SimilarityCacheResult<T> | null {
+    this.stats.lookups++;
+    const normalized = normalizeAnswer(answer);
+    if (!normalized) return null;
+
+    const exact = this.entries.get(this.entryId(scope, normalized));
+    if (exact && exact.expiresAt > Date.now()) {
+      this.stats.exactHits++;
+      return this.reuse(exact, 1);
+    }
+
+    const signature = this.signature(normalized);
+    const candidates = new Set<string>();
+    this.bucketKeys(scope, signature).forEach(key => this.buckets.get(key)?.forEach(id => candidates.add(id)));
+    this.stats.candidates += candidates.size;
+
+    let best: SimilarityEntry<T> | null = null;
+    let bestSimilarity = 0;
+    for (const id of candidates) {
+      const entry = this.entries.get(id);
+      if (!entry) continue;
+      if (entry.expiresAt <= Date.now()) {
+        this.remove(entry);
+        continue;
+      }
+      const similarity = this.estimate(signature, entry.signature);
+      if (similarity > bestSimilarity) {
+        best = entry;
+        bestSimilarity = similarity;
+      }
+    }
+
+    if (!best || bestSimilarity < this.options.threshold) return null;
+    this.stats.nearHits++;
+    this.stats.similaritySum += bestSimilarity;
+    return this.reuse(best, bestSimilarity);
+  }
+
+  store(scope: string, answer: string, value: T, computeMs: number): string | null {
+    const normalized = normalizeAnswer(answer);
+    if (!normalized) return null;
+
+    const id = this.entryId(scope, normalized);
+    const existing = this.entries.get(id);
+    if (existing) this.remove(existing);
+
+    const signature = this.signature(normalized);
+    const entry: SimilarityEntry<T> = {
+      id,
+      scope,
+      signature,
+      bucketKeys: this.bucketKeys(scope, signature),
+      value,
+      computeMs,
+      expiresAt: Date.now() + this.options.ttlMs
+    };
+    this.entries.set(id, entry);
+    entry.bucketKeys.forEach(key => {
+      const bucket = this.buckets.get(key) ?? new Set<string>();
+      bucket.add(id);
+      this.buckets.set(key, bucket);
+    });
+    this.stats.stored++;
+
+    while (this.entries.size > this.options.maxEntries) {
+      this.remove(this.entries.values().next().value as SimilarityEntry<T>);
+      this.stats.evictions++;
+    }
+    return id;
+  }
+
+  /**
+   * Reuse a similar answer's value or load, time and store a fresh one. A load that
+   * throws is not cached.
+   */
+  async resolve(scope: string, answer: string, load: () => Promise<T>): Promise<SimilarityCacheResult<T>> {
+    const cached = this.lookup(scope, answer);
+    if (cached) return cached;
+
+    const startedAt = Date.now();
+    const value = await load();
+    const entryId = this.store(scope, answer, value, Date.now() - startedAt) ?? '';
+    return { value, hit: false, similarity: null, entryId };
+  }
+
+  getMetrics() {
+    const hits = this.stats.exactHits + this.stats.nearHits;
+    return {
+      name: this.options.name,
+      size: this.entries.size,
+      maxEntries: this.options.maxEntries,
+      threshold: this.options.threshold,
+      numHashes: this.options.numHashes,
+      bands: this.options.bands,
+      lookups: this.stats.lookups,
+      hits,
+      exactHits: this.stats.exactHits,
+      nearHits: this.stats.nearHits,
+      hitRate: this.stats.lookups ? hits / this.stats.lookups : 0,
+      avgNearSimilarity: this.stats.nearHits ? this.stats.similaritySum / this.stats.nearHits : 0,
+      avgCandidates: this.stats.lookups ? this.stats.candidates / this.stats.lookups : 0,
+      stored: this.stats.stored,
+      evictions: this.stats.evictions,
+      savedMs: this.stats.savedMs
+    };
+  }
+
+  private reuse(entry: SimilarityEntry<T>, similarity: number): SimilarityCacheResult<T> {
+    this.entries.delete(entry.id);
+    this.entries.set(entry.id, entry);
+    this.stats.savedMs += entry.computeMs;
+    return { value: entry.value, hit: true, similarity, entryId: entry.id };
+  }
+
+  private remove(entry: SimilarityEntry<T>): void {
+    this.entries.delete(entry.id);
+    entry.bucketKeys.forEach(key => {
+      const bucket = this.buckets.get(key);
+      if (!bucket) return;
+      bucket.delete(entry.id);
+      if (bucket.size === 0) this.buckets.delete(key);
+    });
+  }
+
+  private entryId(scope: string, normalized: string): string {
+    return createHash('sha256').update(scope).update('\0').update(normalized).digest('hex').slice(0, 24);
+  }
+
+  private signature(normalized: string): Uint32Array {
+    const signature = new Uint32Array(this.options.numHashes).fill(0xffffffff);
+    shingleAnswer(normalized, this.options.shingleSize).forEach(shingle => {
+      const base = fnv1a(shingle);
+      for (let i = 0; i < signature.length; i++) {
+        const hash = fmix32(base ^ this.seeds[i]);
+        if (hash < signature[i]) signature[i] = hash;
+      }
+    });
+    return signature;
+  }
+
+  private bucketKeys(scope: string, signature: Uint32Array): string[] {
+    const keys: string[] = [];
+    for (let band = 0; band < this.options.bands; band++) {
+      const rows = signature.subarray(band * this.rows, (band + 1) * this.rows);
+      keys.push(`${scope}\0${band}\0${rows.join(',')}`);
+    }
+    return keys;
+  }
+
+  private estimate(a: Uint32Array, b: Uint32Array): number {
+    let equal = 0;
+    for (let i = 0; i < a.length; i++) {
+      if (a[i] === b[i]) equal++;
+    }
+    return equal / a.length;
+  }
+}
+
+/**
+ * Everything besides the answer that the analysis depends on; a question id, when the
+ * client has one, stands in for the question text
+ */
+export function answerCacheScope(params: { questionId?: string; question: string; category?: string; companyContext?: string }): string {
+  const question = params.questionId ? `id:${params.questionId}` : normalizeAnswer(params.question);
+  return [params.companyContext || '', params.category || '', question].join('\0');
+}
+
+export const answerCacheEnabled = process.env.ANSWER_CACHE_ENABLED !== 'false';
+
+function createAnswerCache(name: string) {
+  return new AnswerSimilarityCache<any>({
+    name,
+    threshold: parseFloat(process.env.ANSWER_CACHE_THRESHOLD || '0.8'),
+    numHashes: 128,
+    bands: 32,
+    shingleSize: 2,
+    maxEntries: parseInt(process.env.ANSWER_CACHE_MAX_ENTRIES || '5000'),
+    ttlMs: parseInt(process.env.ANSWER_CACHE_TTL_MS || String(24 * HOUR))
+  });
+}
+
+// One cache per analysis service: their analyses differ in prompt and shape
+export const groqAnswerCache = createAnswerCache('groq-answer-analysis');
+export const optimizedAnswerCache = createAnswerCache('optimized-answer-analysis');
+
+export function getAnswerCacheMetrics() {
+  return {
+    enabled: answerCacheEnabled,
+    caches: [groqAnswerCache.getMetrics(), optimizedAnswerCache.getMetrics()]
+  };
+}
@@ -0,0 +1,190 @@
+/**
+ * Text-to-speech audio cache
+ * Content-addressed on-disk cache of finished TTS clips, keyed by hash(text, voice,
+ * model), bounded by total size with least-recently-used eviction. Clips are written
+ * to a temp file while they stream to the client and only become visible once complete.
+ */
+
+import { createHash } from 'crypto';
+import { createReadStream, createWriteStream, promises as fs, WriteStream } from 'fs';
+import os from 'os';
+import path from 'path';
+import { Readable } from 'stream';
+
+export interface CachedClip {
+  key: string;
+  path: string;
+  size: number;
+}
+
+export interface ByteRange {
+  start: number;
+  end: number; // inclusive
+}
+
+export interface ClipWriter {
+  write(chunk: Uint8Array): void;
+  commit(): Promise<void>;
+  abort(): void;
+}
+
+export class AudioClipCache {
+  private static instance: AudioClipCache;
+  private dir: string;
+  private maxBytes: number;
+  private ready: Promise<void> | null = null;
+  private stats = { hits: 0, misses: 0, writes: 0, evictions: 0, bytesServed: 0 };
+
+  private constructor() {
+    this.dir = process.env.TTS_CACHE_DIR || path.join(os.tmpdir(), 'recruiterai-tts-cache');
+    this.maxBytes = parseInt(process.env.TTS_CACHE_MAX_BYTES || String(200 * 1024 * 1024));
+  }
+
+  public static getInstance(): AudioClipCache {
+    if (!AudioClipCache.instance) {
+      AudioClipCache.instance = new AudioClipCache();
+    }
+    return AudioClipCache.instance;
+  }
+
+  public key(text: string, voice: string, model: string): string {
+    return createHash('sha256').update(`${voice}\0${model}\0${text}`).digest('hex');
+  }
+
+  public isValidKey(key: string): boolean {
+    return /^[a-f0-9]{64}$/.test(key);
+  }
+
+  /**
+   * Look up a finished clip; a hit refreshes its mtime so eviction is LRU
+   */
+  public async lookup(key: string): Promise<CachedClip | null> {
+    const clipPath = this.clipPath(key);
+    try {
+      const stat = await fs.stat(clipPath);
+      const now = new Date();
+      await fs.utimes(clipPath, now, now).catch(() => undefined);
+      this.stats.hits++;
+      return { key, path: clipPath, size: stat.size };
+    } catch {
+      this.stats.misses++;
+      return null;
+    }
+  }
+
+  /**
+   * Tee target for a clip being streamed; nothing is cached unless commit() runs
+   */
+  public async createWriter(key: string): Promise<ClipWriter> {
+    await this.ensureDir();
+    const finalPath = this.clipPath(key);
+    const tempPath = `${finalPath}.${process.pid}.${Date.now()}.part`;
+    const file: WriteStream = createWriteStream(tempPath);
+    let failed = false;
+    file.on('error', () => { failed = true; });
+
+    const close = () => new Promise<void>(resolve => file.end(() => resolve()));
+
+    return {
+      write: (chunk: Uint8Array) => {
+        if (!failed) file.write(chunk);
+      },
+      commit: async () => {
+        await close();
+        if (failed) {
+          await fs.unlink(tempPath).catch(() => undefined);
+          return;
+        }
+        await fs.rename(tempPath, finalPath);
+        this.stats.writes++;
+        await this.evict();
+      },
+      abort: () => {
+        failed = true;
+        close().then(() => fs.unlink(tempPath)).catch(() => undefined);
+      }
+    };
+  }
+
+  public openStream(clip: CachedClip, range?: ByteRange): ReadableStream<Uint8Array> {
+    this.stats.bytesServed += range ? range.end - range.start + 1 : clip.size;
+    const file = createReadStream(clip.path, range ? { start: range.start, end: range.end } : undefined);
+    return Readable.toWeb(file) as ReadableStream<Uint8Array>;
+  }
+
+  /**
+   * Remove least recently used clips until the cache fits in maxBytes
+   */
+  public async evict(): Promise<void> {
+    const names = (await fs.readdir(this.dir)).filter(name => name.endsWith('.mp3'));
+    const clips = await Promise.all(names.map(async name => {
+      const stat = await fs.stat(path.join(this.dir, name)).catch(() => null);
+      return stat ? { name, size: stat.size, mtime: stat.mtimeMs } : null;
+    }));
+
+    const present = clips.filter((c): c is { name: string; size: number; mtime: number } => c !== null);
+    let total = present.reduce((sum, c) => sum + c.size, 0);
+
+    for (const clip of present.sort((a, b) => a.mtime - b.mtime)) {
+      if (total <= this.maxBytes) break;
+      await fs.unlink(path.join(this.dir, clip.name)).catch(() => undefined);
+      total -= clip.size;
+      this.stats.evictions++;
+    }
+  }
+
+  public async clear(): Promise<void> {
+    await fs.rm(this.dir, { recursive: true, force: true });
+    this.ready = null;
+  }
+
+  public getMetrics() {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      dir: this.dir,
+      maxBytes: this.maxBytes,
+      ...this.stats,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0
+    };
+  }
+
+  private clipPath(key: string): string {
+    return path.join(this.dir, `${key}.mp3`);
+  }
+
+  private ensureDir(): Promise<void> {
+    if (!this.ready) {
+      this.ready = fs.mkdir(this.dir, { recursive: true }).then(() => undefined);
+    }
+    return this.ready;
+  }
+}
+
+/**
+ * Parse a single "bytes=start-end" Range header. Returns null when absent and
+ * 'unsatisfiable' for ranges outside the clip; multi-range requests are served whole.
+ */
+export function parseRange(header: string | null, size: number): ByteRange | null | 'unsatisfiable' {
+  if (!header) return null;
+  const match = /^bytes=(\d*)-(\d*)$/.exec(header.trim());
+  if (!match) return null;
+
+  const [, startText, endText] = match;
+  let start: number;
+  let end: number;
+  if (startText === '') {
+    // Suffix range: the last N bytes
+    const suffix = parseInt(endText);
+    if (!suffix) return 'unsatisfiable';
+    start = Math.max(0, size - suffix);
+    end = size - 1;
+  } else {
+    start = parseInt(startText);
+    end = endText === '' ? size - 1 : Math.min(parseInt(endText), size - 1);
+  }
+
+  if (start >= size || start > end) return 'unsatisfiable';
+  return { start, end };
+}
+
+export default AudioClipCache;
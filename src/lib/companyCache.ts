@@ -0,0 +1,52 @@
+/**
+ * Company lookup caches
+ * Shared LRU + TTL caches for company intelligence and company search, keyed by
+ * normalized company name and persisted in MongoDB across restarts.
+ */
+
+import LRUCache from './lruCache';
+
+const HOUR = 60 * 60 * 1000;
+
+const COMPANY_SUFFIXES = /\b(inc|incorporated|corp|corporation|co|company|llc|ltd|limited|plc|gmbh)\b\.?$/;
+
+// Lowercase, punctuation-free form used for partial (autocomplete) queries
+export function normalizeSearchQuery(query: string): string {
+  return query
+    .toLowerCase()
+    .replace(/[.,'"()&]/g, ' ')
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
+// Canonical company identity: search normalization plus legal suffixes removed
+export function normalizeCompanyKey(name: string): string {
+  return normalizeSearchQuery(name).replace(COMPANY_SUFFIXES, '').trim();
+}
+
+export interface CompanySuggestion {
+  name: string;
+  industry?: string;
+  description?: string;
+}
+
+export const companyIntelligenceCache = new LRUCache<any>({
+  name: 'company-intelligence',
+  maxEntries: parseInt(process.env.COMPANY_CACHE_MAX_ENTRIES || '500'),
+  ttlMs: parseInt(process.env.COMPANY_CACHE_TTL_MS || String(24 * HOUR)),
+  persistCollection: 'company_intelligence_cache'
+});
+
+export const companySearchCache = new LRUCache<CompanySuggestion[]>({
+  name: 'company-search',
+  maxEntries: parseInt(process.env.COMPANY_SEARCH_CACHE_MAX_ENTRIES || '2000'),
+  ttlMs: parseInt(process.env.COMPANY_SEARCH_CACHE_TTL_MS || String(6 * HOUR)),
+  persistCollection: 'company_search_cache'
+});
+
+export function getCompanyCacheMetrics() {
+  return {
+    intelligence: companyIntelligenceCache.getMetrics(),
+    search: companySearchCache.getMetrics()
+  };
+}
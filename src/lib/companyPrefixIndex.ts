@@ -0,0 +1,133 @@
+/**
+ * Company Prefix Index
+ * In-memory sorted-array prefix index for company autocomplete. Built from the
+ * enhanced company database and extended with companies previously resolved by
+ * the LLM, so only true misses need an upstream call.
+ */
+
+import { ENHANCED_COMPANIES, POPULAR_SEARCH_SUGGESTIONS } from './enhancedCompanyDatabase';
+import { CompanySuggestion, normalizeCompanyKey, normalizeSearchQuery } from './companyCache';
+import client from './db';
+
+interface IndexedCompany extends CompanySuggestion {
+  popularity: number;
+}
+
+interface IndexKey {
+  key: string;
+  company: IndexedCompany;
+}
+
+export class CompanyPrefixIndex {
+  private static instance: CompanyPrefixIndex;
+  private keys: IndexKey[] = []; // sorted by key
+  private companies: Map<string, IndexedCompany> = new Map();
+  private warmed = false;
+
+  private constructor() {
+    const curated = Object.values(ENHANCED_COMPANIES);
+    curated.forEach((company, index) => {
+      // Curated entries are listed roughly by interview volume
+      this.add({ name: company.name, industry: company.industry }, 1000 - index * 10);
+    });
+
+    POPULAR_SEARCH_SUGGESTIONS.forEach((suggestion, index) => {
+      const name = suggestion.split(' ')[0];
+      this.add({ name }, 500 - index * 5);
+    });
+  }
+
+  public static getInstance(): CompanyPrefixIndex {
+    if (!CompanyPrefixIndex.instance) {
+      CompanyPrefixIndex.instance = new CompanyPrefixIndex();
+    }
+    return CompanyPrefixIndex.instance;
+  }
+
+  public get size(): number {
+    return this.companies.size;
+  }
+
+  /**
+   * Add or merge a company. Every word suffix of the name is indexed so
+   * "web" finds "Amazon Web Services".
+   */
+  public add(suggestion: CompanySuggestion, popularity: number = 1): void {
+    const id = normalizeCompanyKey(suggestion.name);
+    if (!id) return;
+
+    const existing = this.companies.get(id);
+    if (existing) {
+      existing.popularity = Math.max(existing.popularity, popularity);
+      existing.industry = existing.industry || suggestion.industry;
+      existing.description = existing.description || suggestion.description;
+      return;
+    }
+
+    const company: IndexedCompany = { ...suggestion, popularity };
+    this.companies.set(id, company);
+
+    const words = normalizeSearchQuery(suggestion.name).split(' ');
+    for (let i = 0; i < words.length; i++) {
+      this.insertKey({ key: words.slice(i).join(' '), company });
+    }
+  }
+
+  public addResolved(suggestions: CompanySuggestion[]): void {
+    suggestions.forEach(suggestion => this.add(suggestion, 1));
+  }
+
+  /**
+   * Companies whose name (or a word in it) starts with the query, most popular first
+   */
+  public search(query: string, limit: number = 5): CompanySuggestion[] {
+    const prefix = normalizeSearchQuery(query);
+    if (!prefix) return [];
+
+    const matches = new Set<IndexedCompany>();
+    for (let i = this.lowerBound(prefix); i < this.keys.length && this.keys[i].key.startsWith(prefix); i++) {
+      matches.add(this.keys[i].company);
+    }
+
+    return Array.from(matches)
+      .sort((a, b) => b.popularity - a.popularity)
+      .slice(0, limit)
+      .map(({ popularity, ...suggestion }) => suggestion);
+  }
+
+  /**
+   * Load companies resolved in earlier runs from the company search cache (once)
+   */
+  public async warmFromPersistent(): Promise<void> {
+    if (this.warmed) return;
+    this.warmed = true;
+
+    try {
+      const docs = await client.db().collection('company_search_cache')
+        .find({}, { projection: { value: 1 } })
+        .limit(5000)
+        .toArray();
+      docs.forEach(doc => this.addResolved(Array.isArray(doc.value) ? doc.value : []));
+      console.log(`🔤 Company prefix index warmed: ${this.size} companies`);
+    } catch (error) {
+      console.warn('⚠️ Company prefix index warm-up failed:', error);
+    }
+  }
+
+  private lowerBound(prefix: string): number {
+    let lo = 0;
+    let hi = this.keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.keys[mid].key < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  }
+
+  private insertKey(entry: IndexKey): void {
+    this.keys.splice(this.lowerBound(entry.key), 0, entry);
+  }
+}
+
+export default CompanyPrefixIndex;
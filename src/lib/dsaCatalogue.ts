@@ -0,0 +1,95 @@
+/**
+ * Company DSA catalogue
+ * Read side of build_dsa_catalogue.py: company problem sets and statistics are
+ * precomputed offline, so the DSA routes answer with single indexed reads instead of
+ * scanning company_dsa_problems or generating problems per request.
+ */
+
+import client from './db';
+
+const PROBLEMS_COLLECTION = 'dsa_catalogue_problems';
+const COMPANIES_COLLECTION = 'dsa_catalogue_companies';
+
+export interface CatalogueTopicGroup {
+  topic: string;
+  count: number;
+  difficultyBreakdown: { [difficulty: string]: number };
+  problemIds: string[];
+}
+
+export interface CatalogueCompanyStats {
+  company: string;
+  companyName: string;
+  totalProblems: number;
+  difficultyBreakdown: { [difficulty: string]: number };
+  topicDistribution: { [topic: string]: number };
+  averageUniquenessScore: number;
+  topics: CatalogueTopicGroup[];
+  tags: string[];
+  builtAt: Date;
+}
+
+/**
+ * Must match company_key in build_dsa_catalogue.py
+ */
+export function catalogueCompanyKey(companyName: string): string {
+  return companyName.toLowerCase().replace(/\s+/g, ' ').trim();
+}
+
+export class DSACatalogue {
+  private dbName = 'Cluster0';
+  private stats = { statsHits: 0, statsMisses: 0, problemHits: 0, problemMisses: 0, errors: 0 };
+
+  async getCompanyStats(companyName: string): Promise<CatalogueCompanyStats | null> {
+    try {
+      const doc = await client.db(this.dbName).collection(COMPANIES_COLLECTION)
+        .findOne({ company: catalogueCompanyKey(companyName) }, { projection: { _id: 0 } });
+      if (doc) {
+        this.stats.statsHits++;
+      } else {
+        this.stats.statsMisses++;
+      }
+      return doc as CatalogueCompanyStats | null;
+    } catch (error) {
+      this.stats.errors++;
+      console.error('❌ DSA catalogue stats read failed:', error);
+      return null;
+    }
+  }
+
+  /**
+   * A random set of `count` catalogued problems at this difficulty, or null when the
+   * catalogue holds fewer (the caller then generates)
+   */
+  async findProblems(companyName: string, difficulty: string, count: number): Promise<any[] | null> {
+    try {
+      const docs = await client.db(this.dbName).collection(PROBLEMS_COLLECTION).aggregate([
+        { $match: { company: catalogueCompanyKey(companyName), difficulty } },
+        { $sample: { size: count } },
+        { $project: { _id: 0, problem: 1 } }
+      ]).toArray();
+      if (docs.length < count) {
+        this.stats.problemMisses++;
+        return null;
+      }
+      this.stats.problemHits++;
+      return docs.map(doc => doc.problem);
+    } catch (error) {
+      this.stats.errors++;
+      console.error('❌ DSA catalogue problem read failed:', error);
+      return null;
+    }
+  }
+
+  getMetrics() {
+    const lookups = this.stats.statsHits + this.stats.statsMisses + this.stats.problemHits + this.stats.problemMisses;
+    return {
+      ...this.stats,
+      hitRate: lookups ? (this.stats.statsHits + this.stats.problemHits) / lookups : 0
+    };
+  }
+}
+
+export const dsaCatalogueEnabled = process.env.DSA_CATALOGUE_ENABLED !== 'false';
+
+export const dsaCatalogue = new DSACatalogue();
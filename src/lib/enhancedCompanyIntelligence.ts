@@ -6,6 +6,8 @@
 
 import SmartAIService from './smartAIService';
 import { safeExtractJSON } from './jsonExtractor';
+import { CacheSource } from './lruCache';
+import { companyIntelligenceCache, normalizeCompanyKey } from './companyCache';
 
 interface CompanyData {
   name: string,
@@ -63,13 +65,12 @@ interface EnhancedCompanyIntelligence {
     behavioral: string[],
     company_specific: string[];
   };
+  cache_source?: CacheSource;
 }
 
 export class EnhancedCompanyIntelligenceService {
   private static instance: EnhancedCompanyIntelligenceService,
   private smartAIService: SmartAIService,
-  private cache: Map<string, { data: EnhancedCompanyIntelligence; timestamp: number }> = new Map();
-  private cacheExpiry = 3600000; // 1 hour
 
   private constructor() {
     this.smartAIService = SmartAIService.getInstance();
@@ -87,15 +88,6 @@ export class EnhancedCompanyIntelligenceService {
     jobTitle: string = 'Software Engineer';
   ): Promise<EnhancedCompanyIntelligence | null> {
     try {
-      // Check cache first
-      const cacheKey = `${companyName.toLowerCase()}-${jobTitle.toLowerCase()}`;
-      const cached = this.cache.get(cacheKey);
-      
-      if (cached && Date.now() - cached.timestamp < this.cacheExpiry) {
-        console.log(`📦 Using cached data for ${companyName}`);
-        return cached.data;
-      }
-
       console.log(`🔍 Fetching enhanced intelligence for ${companyName} using Smart AI...`);
 
       // Get predefined company data first (fastest)
@@ -113,9 +105,6 @@ export class EnhancedCompanyIntelligenceService {
         ...enhancedInsights
       };
 
-      // Cache the result
-      this.cache.set(cacheKey, { data: intelligence, timestamp: Date.now() });
-      
       console.log(`✅ Enhanced intelligence generated for ${companyName} (Smart AI powered)`);
       return intelligence;
 
@@ -130,11 +119,19 @@ export class EnhancedCompanyIntelligenceService {
     jobTitle: string
   ): Promise<Omit<EnhancedCompanyIntelligence, 'company_data'>> {
     try {
-      const result = await this.smartAIService.searchCompany(companyData.name);
+      // Only the AI lookup is cached - it depends on the company alone, not the job title.
+      // Concurrent misses for the same company share one upstream call.
+      const { value: result, source } = await companyIntelligenceCache.getOrLoad(
+        normalizeCompanyKey(companyData.name),
+        () => this.smartAIService.searchCompany(companyData.name),
+        (response) => !!(response?.success && response?.data)
+      );
+      console.log(`📦 Company intelligence for ${companyData.name}: ${source}`);
       
       if (result.success && result.data) {
         // Use AI-generated company insights
         return {
+          cache_source: source,
           market_position: result.data.industry || `${companyData.name} is a competitive player in the ${companyData.industry} industry`,
           competitors: ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple'].filter(c => c !== companyData.name).slice(0, 3),
           business_model: result.data.description || 'Technology-focused business model with emphasis on innovation and growth',
@@ -370,7 +367,7 @@ export class EnhancedCompanyIntelligenceService {
 
   // Public method to clear cache
   public clearCache(): void {
-    this.cache.clear();
+    companyIntelligenceCache.clear();
     console.log('Company intelligence cache cleared');
   }
 }
@@ -5,6 +5,7 @@
  */
 
 import EnhancedGroqAIService from './enhancedGroqAIService';
+import { executeBatch } from './judge0Batch';
 
 interface CompilerLanguage {
   id: number,
@@ -57,7 +58,8 @@ interface TestResult {
   passed: boolean,
   actualOutput: string,
   executionTime: number,
-  error?: string
+  error?: string,
+  infrastructureError?: boolean // Judge0 could not run it; not a verdict on the code
 }
 
 interface CompilerSubmission {
@@ -232,7 +234,7 @@ const solution = new Solution();
     this.aiService = EnhancedGroqAIService.getInstance();
     this.judge0ApiKey = process.env.JUDGE0_API_KEY || process.env.NEXT_PUBLIC_JUDGE0_API_KEY || '';
     this.judge0Host = process.env.JUDGE0_API_HOST || 'judge0-ce.p.rapidapi.com';
-    this.judge0BaseUrl = `https://${this.judge0Host}`
+    this.judge0BaseUrl = process.env.JUDGE0_BASE_URL || `https://${this.judge0Host}`
     
     if (!this.judge0ApiKey) {
       console.warn('⚠️ Judge0 API key not found - compiler will use mock results');
@@ -293,13 +295,21 @@ const solution = new Solution();
       let totalExecutionTime = 0;
       let maxMemory = 0;
 
-      // Run code against all test cases
-      for (const testCase of submission.problem.testCases) {
-        const result = await this.runSingleTest(
-          submission.sourceCode,
-          language.id,
-          testCase
-        );
+      // Run code against all test cases in one Judge0 batch
+      const testCases = submission.problem.testCases;
+      const judgements = await executeBatch(
+        this.judge0Request.bind(this),
+        testCases.map(testCase => ({
+          source_code: submission.sourceCode,
+          language_id: language.id,
+          stdin: testCase.input,
+          expected_output: testCase.expectedOutput
+        })),
+        { base64Encoded: false }
+      );
+
+      for (let i = 0; i < testCases.length; i++) {
+        const result = this.toTestResult(testCases[i], judgements[i]);
         
         testResults.push(result);
         if (!result.passed) allPassed = false;
@@ -338,75 +348,49 @@ const solution = new Solution();
     }
   }
 
-  // Run code against a single test case  
-  private async runSingleTest(
-    sourceCode: string,
-    languageId: number,
-    testCase: TestCase
-  ): Promise<TestResult> {
-    try {
-      // Submit code to Judge0
-      const submissionResponse = await fetch(`${this.judge0BaseUrl}/submissions`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'X-RapidAPI-Key': this.judge0ApiKey,
-          'X-RapidAPI-Host': this.judge0Host
-        },
-        body: JSON.stringify({
-          source_code: sourceCode,
-          language_id: languageId,
-          stdin: testCase.input,
-          expected_output: testCase.expectedOutput
-        })
-      });
-
-      if (!submissionResponse.ok) {
-        throw new Error(`Submission failed: ${submissionResponse.statusText}`);
-      }
-
-      const submissionData = await submissionResponse.json();
-      const token = submissionData.token;
-
-      // Wait for execution to complete
-      await this.delay(1000); // Give it time to process
-
-      // Get result
-      const resultResponse = await fetch(`${this.judge0BaseUrl}/submissions/${token}`, {
-        headers: {
-          'X-RapidAPI-Key': this.judge0ApiKey,
-          'X-RapidAPI-Host': this.judge0Host
-        }
-      });
-
-      if (!resultResponse.ok) {
-        throw new Error(`Result fetch failed: ${resultResponse.statusText}`);
-      }
+  private async judge0Request(endpoint: string, method: 'GET' | 'POST' = 'GET', body?: any): Promise<any> {
+    const response = await fetch(`${this.judge0BaseUrl}${endpoint}`, {
+      method,
+      headers: {
+        'Content-Type': 'application/json',
+        'X-RapidAPI-Key': this.judge0ApiKey,
+        'X-RapidAPI-Host': this.judge0Host
+      },
+      body: body ? JSON.stringify(body) : undefined
+    });
 
-      const result = await resultResponse.json();
-      
-      const actualOutput = (result.stdout || '').trim();
-      const expectedOutput = testCase.expectedOutput.trim();
-      const passed = actualOutput === expectedOutput;
-      const executionTime = parseFloat(result.time || '0') * 1000; // Convert to ms
+    if (!response.ok) {
+      throw new Error(`Judge0 request failed: ${response.statusText}`);
+    }
 
-      return {
-        testCase: testCase,
-        passed: passed,
-        actualOutput: actualOutput,
-        executionTime: executionTime,
-        error: result.stderr || undefined
-      };
+    return await response.json();
+  }
 
-    } catch (error) {
+  // Convert a Judge0 verdict (or a submission that could not be queued) to a test result
+  private toTestResult(testCase: TestCase, result: any): TestResult {
+    if (result instanceof Error) {
       return {
         testCase: testCase,
         passed: false,
         actualOutput: '',
         executionTime: 0,
-        error: error instanceof Error ? error.message : 'Test execution failed'
+        error: result.message,
+        infrastructureError: true
       };
     }
+
+    const actualOutput = (result.stdout || '').trim();
+    const expectedOutput = testCase.expectedOutput.trim();
+    const passed = actualOutput === expectedOutput;
+    const executionTime = parseFloat(result.time || '0') * 1000; // Convert to ms
+
+    return {
+      testCase: testCase,
+      passed: passed,
+      actualOutput: actualOutput,
+      executionTime: executionTime,
+      error: result.stderr || result.compile_output || undefined
+    };
   }
 
   // Generate intelligent feedback based on execution results
@@ -471,6 +455,11 @@ const solution = new Solution();
     return feedback;
   }
 
+  // Without a key executeCode returns mock results, which must not be treated as verdicts
+  public isJudge0Configured(): boolean {
+    return !!this.judge0ApiKey;
+  }
+
   // Get available programming languages
   public getAvailableLanguages(): CompilerLanguage[] {
     return this.languages;
@@ -520,10 +509,6 @@ const solution = new Solution();
   }
 
   // Utility methods
-  private async delay(ms: number): Promise<void> {
-    return new Promise(resolve => setTimeout(resolve, ms));
-  }
-
   private generateMockExecution(submission: CompilerSubmission): ExecutionResult {
     const testResults: TestResult[] = submission.problem.testCases.map((testCase, index) => ({
       testCase: testCase,
@@ -7,6 +7,7 @@
 
 import Groq from 'groq-sdk';
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, LLMReply, llmParse, promptText } from './llmUsage';
 
 // Load environment variables
 const groqApiKey = process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY || '';
@@ -21,6 +22,15 @@ interface GroqRequest {
   temperature?: number
 }
 
+/**
+ * Per-call options for callers that manage cancellation themselves (e.g. hedged
+ * requests): with a signal, failures are thrown instead of answered with mock data
+ */
+export interface GroqCallOptions {
+  signal?: AbortSignal,
+  model?: string
+}
+
 interface InterviewQuestion {
   id: string,
   question: string,
@@ -87,6 +97,7 @@ export class EnhancedGroqAIService {
     
     this.groq = new Groq({
       apiKey: groqApiKey,
+      baseURL: process.env.GROQ_BASE_URL || 'https://api.groq.com',
       dangerouslyAllowBrowser: true
     });
     
@@ -176,22 +187,27 @@ export class EnhancedGroqAIService {
     });
   }
 
-  private async callGroqAPI(request: GroqRequest): Promise<string> {
+  private async callGroqAPI(request: GroqRequest, options: GroqCallOptions = {}): Promise<LLMReply> {
+    const model = options.model || request.model || this.model;
+    const call = new LLMCall('groq', model);
     try {
-      console.log(`🚀 Calling Enhanced Groq API with ${this.model}...`);
+      console.log(`🚀 Calling Enhanced Groq API with ${model}...`);
       
+      call.sent();
       const chatCompletion = await this.groq.chat.completions.create({
         messages: request.messages as any,
-        model: request.model || this.model,
+        model,
         max_tokens: request.max_tokens || 4000,
-        temperature: request.temperature || 0.7;
-      });
+        temperature: request.temperature || 0.7
+      }, { signal: options.signal });
 
       const content = chatCompletion.choices[0]?.message?.content || '';
+      call.received(chatCompletion.usage, promptText(request.messages), content);
       console.log('✅ Enhanced Groq API response received');
       
-      return content;
+      return { content, call };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Enhanced Groq API call failed:', error);
       throw error;
     }
@@ -206,7 +222,7 @@ export class EnhancedGroqAIService {
     experienceLevel: 'entry' | 'mid' | 'senior',
     numberOfQuestions: number,
     companyIntelligence?: any
-  }): Promise<InterviewQuestion[]> {
+  }, options: GroqCallOptions = {}): Promise<InterviewQuestion[]> {
     
     const companyProfile = this.companyProfiles.get(params.companyName.toLowerCase());
     
@@ -278,16 +294,16 @@ Return ONLY a valid JSON array:
 🚀 MAKE QUESTIONS FEEL AUTHENTIC TO ${params.companyName} - like they came from their actual interview process!`;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
         ],
         max_tokens: 8000,
         temperature: 0.8
-      });
+      }, options);
 
-      const questions = extractJSON(response);
+      const questions = llmParse(call, () => extractJSON(response));
       return questions.map((q: any, index: number) => ({
         ...q,
         id: q.id || `enhanced-groq-q-${Date.now()}-${index}`,
@@ -298,10 +314,11 @@ Return ONLY a valid JSON array:
         tags: [...(q.tags || []), params.companyName, params.jobTitle, params.interviewType],
         companyRelevance: q.companyRelevance || 8,
         provider: 'enhanced-groq',
-        model: this.model
+        model: options.model || this.model
       }));
     } catch (error) {
       console.error('❌ Error generating enhanced interview questions:', error);
+      if (options.signal) throw error;
       return this.generateMockQuestions(params);
     }
   }
@@ -311,7 +328,8 @@ Return ONLY a valid JSON array:
     companyName: string,
     difficulty: 'easy' | 'medium' | 'hard' = 'medium',
     count: number = 6,
-    jobTitle: string = 'Software Engineer';
+    jobTitle: string = 'Software Engineer',
+    options: GroqCallOptions = {}
   ): Promise<DSAProblem[]> {
     
     const companyProfile = this.companyProfiles.get(companyName.toLowerCase());
@@ -401,16 +419,16 @@ Return ONLY a valid JSON array:
 🎯 MAKE EACH PROBLEM FEEL LIKE A REAL ${companyName} ENGINEERING CHALLENGE!`;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
         ],
         max_tokens: 10000,
         temperature: 0.8
-      });
+      }, options);
 
-      const problems = extractJSON(response);
+      const problems = llmParse(call, () => extractJSON(response));
       
       // Debug logging
       console.log('Raw Groq response:', response.substring(0, 200) + '...');
@@ -419,11 +437,13 @@ Return ONLY a valid JSON array:
       // Validate that problems is an array
       if (!Array.isArray(problems)) {
         console.warn('DSA generation did not return an array, got:', typeof problems, problems);
+        if (options.signal) throw new Error('DSA generation did not return an array');
         return this.generateMockDSAProblems(companyName, difficulty, count);
       }
       
       if (problems.length === 0) {
         console.warn('DSA generation returned empty array, using fallback');
+        if (options.signal) throw new Error('DSA generation returned no problems');
         return this.generateMockDSAProblems(companyName, difficulty, count);
       }
       
@@ -439,10 +459,11 @@ Return ONLY a valid JSON array:
         companyContext: p.companyContext || `Relevant to ${companyName}'s engineering challenges`,
         realWorldApplication: p.realWorldApplication || `Used in ${companyName}'s systems`,
         provider: 'enhanced-groq',
-        model: this.model
+        model: options.model || this.model
       }));
     } catch (error) {
       console.error('❌ Error generating company-specific DSA problems:', error);
+      if (options.signal) throw error;
       return this.generateMockDSAProblems(companyName, difficulty, count);
     }
   }
@@ -453,7 +474,8 @@ Return ONLY a valid JSON array:
     userAnswer: string,
     expectedAnswer: string,
     category: string,
-    companyContext: string
+    companyContext: string,
+    options: GroqCallOptions = {}
   ): Promise<{
     score: number,
     feedback: string,
@@ -519,16 +541,16 @@ Return ONLY valid JSON:
 💡 Provide analysis that feels authentic to ${companyContext}'s actual interview feedback style!`;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
         ],
         max_tokens: 4000,
         temperature: 0.5
-      });
+      }, options);
 
-      const analysis = extractJSON(response);
+      const analysis = llmParse(call, () => extractJSON(response));
       return {
         score: Math.max(0, Math.min(10, analysis.score || 5)),
         feedback: analysis.feedback || 'Response analyzed successfully with comprehensive feedback.',
@@ -539,6 +561,7 @@ Return ONLY valid JSON:
       };
     } catch (error) {
       console.error('❌ Error analyzing response with Enhanced Groq:', error);
+      if (options.signal) throw error;
       return this.generateMockAnalysis(userAnswer, companyContext);
     }
   }
@@ -605,7 +628,7 @@ Return ONLY valid JSON:
     try {
       console.log('🔍 Performing Enhanced Groq health check...');
       
-      const testResponse = await this.callGroqAPI({
+      const { content: testResponse } = await this.callGroqAPI({
         messages: [
           { role: 'user', content: 'Health check - respond with "OK"' }
         ],
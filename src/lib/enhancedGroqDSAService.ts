@@ -6,6 +6,7 @@
 
 import Groq from 'groq-sdk';
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, LLMReply, llmParse, promptText } from './llmUsage';
 
 // Load environment variables
 const groqApiKey = process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY || '';
@@ -44,6 +45,7 @@ export interface DSAProblem {
     uniqueId: string,
     version: number
   };
+  fallback?: boolean; // Canned problem served when generation failed
 }
 
 interface CompanyDSAPatterns {
@@ -114,6 +116,7 @@ export class EnhancedGroqDSAService {
     
     this.groq = new Groq({
       apiKey: groqApiKey,
+      baseURL: process.env.GROQ_BASE_URL,
       dangerouslyAllowBrowser: true
     });
     
@@ -127,10 +130,12 @@ export class EnhancedGroqDSAService {
     return EnhancedGroqDSAService.instance;
   }
 
-  private async callGroqAPI(messages: any[], temperature: number = 0.8): Promise<string> {
+  private async callGroqAPI(messages: any[], temperature: number = 0.8): Promise<LLMReply> {
+    const call = new LLMCall('groq', this.model);
     try {
       console.log(`🚀 Calling Groq API for DSA generation...`);
       
+      call.sent();
       const chatCompletion = await this.groq.chat.completions.create({
         messages: messages,
         model: this.model,
@@ -139,10 +144,12 @@ export class EnhancedGroqDSAService {
       });
 
       const content = chatCompletion.choices[0]?.message?.content || '';
+      call.received(chatCompletion.usage, promptText(messages), content);
       console.log('✅ Groq API response received for DSA');
       
-      return content;
+      return { content, call };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Groq API call failed for DSA:', error);
       throw error;
     }
@@ -168,12 +175,12 @@ export class EnhancedGroqDSAService {
     const userMessage = this.buildEnhancedCompanyPrompt(company, pattern, count, difficulty, experienceLevel);
 
     try {
-      const response = await this.callGroqAPI([
+      const { content: response, call } = await this.callGroqAPI([
         { role: 'system', content: systemMessage },
         { role: 'user', content: userMessage }
       ], 0.9);
 
-      let problems = extractJSON(response);
+      let problems = llmParse(call, () => extractJSON(response));
       
       // Validate that problems is an array before mapping
       if (!Array.isArray(problems)) {
@@ -312,12 +319,12 @@ export class EnhancedGroqDSAService {
     `;
 
     try {
-      const response = await this.callGroqAPI([
+      const { content: response, call } = await this.callGroqAPI([
         { role: 'system', content: systemMessage },
         { role: 'user', content: userMessage }
       ], 0.7);
 
-      let problems = extractJSON(response);
+      let problems = llmParse(call, () => extractJSON(response));
       
       // Validate that problems is an array before mapping
       if (!Array.isArray(problems)) {
@@ -481,6 +488,7 @@ export class EnhancedGroqDSAService {
     return fallbackProblems.slice(0, count).map((problem, index) => ({
       ...problem,
       id: `${company.toLowerCase()}-fallback-${Date.now()}-${index}`,
+      fallback: true,
       interactiveFeatures: {
         hasVisualizer: true,
         hasStepByStep: true,
@@ -501,7 +509,7 @@ export class EnhancedGroqDSAService {
    */
   public async healthCheck(): Promise<{ status: string; groqAvailable: boolean }> {
     try {
-      const testResponse = await this.callGroqAPI([
+      const { content: testResponse } = await this.callGroqAPI([
         { role: 'user', content: 'Health check - respond with "OK"' }
       ], 0);
       
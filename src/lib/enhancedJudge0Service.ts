@@ -3,6 +3,8 @@
  * Fixes test case validation and improves DSA code execution reliability
  */
 
+import { executeBatch, Judge0Submission } from './judge0Batch';
+
 interface TestCase {
   id: string,
   input: string,
@@ -41,7 +43,7 @@ export class EnhancedJudge0Service {
   private constructor() {
     this.apiKey = process.env.JUDGE0_API_KEY || process.env.NEXT_PUBLIC_JUDGE0_API_KEY || '';
     this.apiHost = process.env.JUDGE0_API_HOST || 'judge0-ce.p.rapidapi.com';
-    this.baseUrl = `https://${this.apiHost}`
+    this.baseUrl = process.env.JUDGE0_BASE_URL || `https://${this.apiHost}`
     
     console.log('🔧 Enhanced Judge0Service initialized');
   }
@@ -94,37 +96,14 @@ export class EnhancedJudge0Service {
     return await response.json();
   }
 
-  private async submitCode(sourceCode: string, languageId: number, stdin?: string): Promise<string> {
-    const submission = {
+  private buildSubmission(sourceCode: string, languageId: number, stdin?: string): Judge0Submission {
+    return {
       source_code: Buffer.from(sourceCode).toString('base64'),
       language_id: languageId,
       stdin: stdin ? Buffer.from(stdin).toString('base64') : undefined,
-      wait: false,
       cpu_time_limit: 2,
       memory_limit: 128000
     };
-
-    const response = await this.makeApiRequest('/submissions', 'POST', submission);
-    return response.token;
-  }
-
-  private async getSubmissionResult(token: string): Promise<any> {
-    const maxAttempts = 30;
-    const pollInterval = 1000;
-    
-    for (let attempt = 0; attempt < maxAttempts; attempt++) {
-      const result = await this.makeApiRequest(`/submissions/${token}`);
-      
-      if (result.status && result.status.id > 2) {
-        return result;
-      }
-      
-      if (attempt < maxAttempts - 1) {
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
-      }
-    }
-    
-    throw new Error('Code execution timeout - submission took too long');
   }
 
   /**
@@ -222,20 +201,20 @@ export class EnhancedJudge0Service {
 
       console.log(`🚀 Executing ${testCases.length} test cases for ${language}`);
 
-      // Execute code for each test case
+      // Submit every test case in one batch and resolve them together
+      const submissions = await executeBatch(
+        this.makeApiRequest.bind(this),
+        testCases.map(testCase => this.buildSubmission(this.createExecutableCode(sourceCode, testCase, language), languageId, ''))
+      );
+
       for (let i = 0; i < testCases.length; i++) {
         const testCase = testCases[i];
         
         try {
-          // Create executable code
-          const executableCode = this.createExecutableCode(sourceCode, testCase, language);
-          console.log(`📝 Test case ${i + 1}: ${testCase.input.substring(0, 50)}...`);
-          
-          // Submit code
-          const token = await this.submitCode(executableCode, languageId, '');
-          
-          // Get result
-          const submission = await this.getSubmissionResult(token);
+          const submission = submissions[i];
+          if (submission instanceof Error) {
+            throw submission;
+          }
           
           // Decode outputs
           const stdout = submission.stdout ? Buffer.from(submission.stdout, 'base64').toString().trim() : '',
@@ -3,6 +3,8 @@
  * Fixes compilation issues and provides better test case management
  */
 
+import { executeBatch, Judge0Submission } from './judge0Batch';
+
 interface TestCase {
   id: string,
   input: string,
@@ -40,7 +42,7 @@ export class FixedJudge0Service {
   private constructor() {
     this.apiKey = process.env.JUDGE0_API_KEY || process.env.NEXT_PUBLIC_JUDGE0_API_KEY || '';
     this.apiHost = process.env.JUDGE0_API_HOST || 'judge0-ce.p.rapidapi.com';
-    this.baseUrl = `https://${this.apiHost}`
+    this.baseUrl = process.env.JUDGE0_BASE_URL || `https://${this.apiHost}`
     
     console.log('🔧 Fixed Judge0Service initialized:', {
       hasKey: !!this.apiKey,
@@ -246,39 +248,15 @@ int main() {
     };
   }
 
-  private async submitCode(sourceCode: string, languageId: number, stdin?: string): Promise<string> {
-    const submission = {
+  private buildSubmission(sourceCode: string, languageId: number, stdin?: string): Judge0Submission {
+    return {
       source_code: Buffer.from(sourceCode).toString('base64'),
       language_id: languageId,
       stdin: stdin ? Buffer.from(stdin).toString('base64') : undefined,
-      wait: false,
       cpu_time_limit: 5, // Increased timeout
       memory_limit: 256000, // Increased memory limit
       wall_time_limit: 10
     };
-
-    const response = await this.makeApiRequest('/submissions', 'POST', submission);
-    return response.token;
-  }
-
-  private async getSubmissionResult(token: string): Promise<any> {
-    const maxAttempts = 30;
-    const pollInterval = 1000;
-    
-    for (let attempt = 0; attempt < maxAttempts; attempt++) {
-      const result = await this.makeApiRequest(`/submissions/${token}`);
-      
-      // Status IDs: 1=In Queue, 2=Processing, 3=Accepted, 4=Wrong Answer, 5=Time Limit Exceeded, 6=Compilation Error, etc.
-      if (result.status && result.status.id > 2) {
-        return result;
-      }
-      
-      if (attempt < maxAttempts - 1) {
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
-      }
-    }
-    
-    throw new Error('Code execution timeout - submission took too long');
   }
 
   public async executeCode(
@@ -301,25 +279,23 @@ int main() {
 
       console.log(`🚀 Executing ${testCases.length} test cases for ${language} (Language ID: ${languageId})`);
 
-      // Execute code for each test case
+      // Submit every test case in one batch and resolve them together
+      const submissions = await executeBatch(
+        this.makeApiRequest.bind(this),
+        testCases.map(testCase => {
+          const { code: executableCode, stdin } = this.createExecutableCode(sourceCode, testCase, language);
+          return this.buildSubmission(executableCode, languageId, stdin);
+        })
+      );
+
       for (let i = 0; i < testCases.length; i++) {
         const testCase = testCases[i];
         
         try {
-          console.log(`🧪 Running test case ${i + 1}/${testCases.length}:`, {
-            input: testCase.input,
-            expected: testCase.expectedOutput
-          });
-
-          // Create executable code
-          const { code: executableCode, stdin } = this.createExecutableCode(sourceCode, testCase, language);
-          
-          // Submit code for execution
-          const token = await this.submitCode(executableCode, languageId, stdin);
-          console.log(`📋 Submitted code with token: ${token}`);
-          
-          // Get execution result
-          const submission = await this.getSubmissionResult(token);
+          const submission = submissions[i];
+          if (submission instanceof Error) {
+            throw submission;
+          }
           
           // Decode outputs
           const stdout = submission.stdout ? Buffer.from(submission.stdout, 'base64').toString().trim() : '',
@@ -6,6 +6,15 @@
  */
 
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, llmParse, promptText } from './llmUsage';
+import {
+  MemoryBucketStore,
+  MongoBucketStore,
+  ProviderScheduler,
+  RateLimitedError,
+  retryAfterMs,
+  SchedulerPriority
+} from './providerScheduler';
 
 interface LLMRequest {
   messages: Array<{
@@ -15,7 +24,8 @@ interface LLMRequest {
   model?: string,
   provider?: string,
   max_tokens?: number,
-  temperature?: number
+  temperature?: number,
+  priority?: SchedulerPriority // Live interview work is 'interactive'; defaults to 'background'
 }
 
 interface LLMResponse {
@@ -27,6 +37,7 @@ interface LLMResponse {
     completion_tokens: number,
     total_tokens: number
   };
+  call?: LLMCall; // Handle for llmParse
 }
 
 interface ProviderConfig {
@@ -44,10 +55,23 @@ interface ProviderConfig {
 export class FreeLLMService {
   private static instance: FreeLLMService,
   private providers: ProviderConfig[] = [],
-  private requestCounts: { [key: string]: { minute: number; day: number; lastReset: Date } } = {};
+  private scheduler: ProviderScheduler;
 
   private constructor() {
     this.initializeProviders();
+
+    // Rate limits are shared across worker processes when LLM_RATE_LIMIT_STORE=mongo
+    this.scheduler = new ProviderScheduler(
+      this.providers.map(p => ({ name: p.name, ...p.rateLimits })),
+      process.env.LLM_RATE_LIMIT_STORE === 'mongo' ? new MongoBucketStore() : new MemoryBucketStore(),
+      {
+        maxWaitMs: {
+          interactive: parseInt(process.env.LLM_INTERACTIVE_MAX_WAIT_MS || '30000'),
+          background: parseInt(process.env.LLM_BACKGROUND_MAX_WAIT_MS || '120000')
+        },
+        spreadThreshold: parseFloat(process.env.LLM_SPREAD_THRESHOLD || '0.5')
+      }
+    );
   }
 
   public static getInstance(): FreeLLMService {
@@ -62,7 +86,7 @@ export class FreeLLMService {
     if (process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY) {
       this.providers.push({
         name: 'groq',
-        apiUrl: 'https://api.groq.com/openai/v1/chat/completions',
+        apiUrl: `${process.env.GROQ_BASE_URL || 'https://api.groq.com'}/openai/v1/chat/completions`,
         apiKey: process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY || '',
         models: {
           'llama-3.1-8b': 'llama-3.1-8b-instant',
@@ -70,8 +94,8 @@ export class FreeLLMService {
           'mixtral-8x7b': 'mixtral-8x7b-32768'
         },
         rateLimits: {
-          requestsPerMinute: 30,
-          requestsPerDay: 14400
+          requestsPerMinute: parseInt(process.env.GROQ_REQUESTS_PER_MINUTE || '30'),
+          requestsPerDay: parseInt(process.env.GROQ_REQUESTS_PER_DAY || '14400')
         },
         priority: 1
       });
@@ -81,15 +105,15 @@ export class FreeLLMService {
     if (process.env.GEMINI_API_KEY || process.env.NEXT_PUBLIC_GEMINI_API_KEY) {
       this.providers.push({
         name: 'gemini',
-        apiUrl: 'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent',
+        apiUrl: `${process.env.GEMINI_BASE_URL || 'https://generativelanguage.googleapis.com'}/v1/models/gemini-1.5-flash:generateContent`,
         apiKey: process.env.GEMINI_API_KEY || process.env.NEXT_PUBLIC_GEMINI_API_KEY || '',
         models: {
           'gemini-1.5-flash': 'gemini-1.5-flash',
           'gemini-pro': 'gemini-1.5-pro'
         },
         rateLimits: {
-          requestsPerMinute: 60,
-          requestsPerDay: 1500
+          requestsPerMinute: parseInt(process.env.GEMINI_REQUESTS_PER_MINUTE || '60'),
+          requestsPerDay: parseInt(process.env.GEMINI_REQUESTS_PER_DAY || '1500')
         },
         priority: 2
       });
@@ -99,15 +123,15 @@ export class FreeLLMService {
     if (process.env.HUGGINGFACE_API_KEY || process.env.NEXT_PUBLIC_HUGGINGFACE_API_KEY) {
       this.providers.push({
         name: 'huggingface',
-        apiUrl: 'https://api-inference.huggingface.co/models',
+        apiUrl: `${process.env.HUGGINGFACE_BASE_URL || 'https://api-inference.huggingface.co'}/models`,
         apiKey: process.env.HUGGINGFACE_API_KEY || process.env.NEXT_PUBLIC_HUGGINGFACE_API_KEY || '',
         models: {
           'mistral-7b': 'microsoft/DialoGPT-medium',
           'llama-2-7b': 'microsoft/DialoGPT-medium'
         },
         rateLimits: {
-          requestsPerMinute: 10,
-          requestsPerDay: 1000
+          requestsPerMinute: parseInt(process.env.HUGGINGFACE_REQUESTS_PER_MINUTE || '10'),
+          requestsPerDay: parseInt(process.env.HUGGINGFACE_REQUESTS_PER_DAY || '1000')
         },
         priority: 3
       });
@@ -121,62 +145,35 @@ export class FreeLLMService {
     console.log(`🎯 Provider order: ${this.providers.map(p => p.name).join(' → ')}`);
   }
 
-  private canMakeRequest(providerName: string): boolean {
-    const now = new Date();
-    const key = providerName;
-    
-    if (!this.requestCounts[key]) {
-      this.requestCounts[key] = { minute: 0, day: 0, lastReset: now };
-      return true;
-    }
-
-    const counts = this.requestCounts[key];
-    const provider = this.providers.find(p => p.name === providerName);
-    
-    if (!provider) return false;
-
-    // Reset counters if needed
-    const timeDiff = now.getTime() - counts.lastReset.getTime();
-    if (timeDiff > 60000) { // Reset minute counter
-      counts.minute = 0;
-    }
-    if (timeDiff > 86400000) { // Reset day counter
-      counts.day = 0;
-      counts.lastReset = now;
-    }
-
-    // Check rate limits
-    return counts.minute < provider.rateLimits.requestsPerMinute &&
-           counts.day < provider.rateLimits.requestsPerDay;
-  }
-
-  private incrementRequestCount(providerName: string) {
-    const key = providerName;
-    if (!this.requestCounts[key]) {
-      this.requestCounts[key] = { minute: 0, day: 0, lastReset: new Date() };
-    }
-    this.requestCounts[key].minute++;
-    this.requestCounts[key].day++;
-  }
-
   public async callLLM(request: LLMRequest): Promise<LLMResponse> {
     const errors: Array<{ provider: string; error: string }> = [];
-    
-    // Try each provider in priority order
-    for (const provider of this.providers) {
-      if (!this.canMakeRequest(provider.name)) {
-        console.log(`⏰ Rate limit reached for ${provider.name}, trying next provider`);
-        continue;
+    const tried: string[] = [];
+
+    // The scheduler hands out each attempt's provider once it has a token for it
+    while (tried.length < this.providers.length) {
+      let providerName: string;
+      const queuedAt = performance.now();
+      try {
+        providerName = await this.scheduler.acquire(request.priority || 'background', tried);
+      } catch (error: any) {
+        errors.push({ provider: 'scheduler', error: error.message || 'Unknown error' });
+        break;
       }
 
+      const provider = this.providers.find(p => p.name === providerName)!;
+      tried.push(provider.name);
+
       try {
         console.log(`🚀 Trying ${provider.name} for LLM request...`);
-        const response = await this.callProvider(provider, request);
-        this.incrementRequestCount(provider.name);
+        const response = await this.callProvider(provider, request, queuedAt);
         
         console.log(`✅ Success with ${provider.name}`);
         return response;
       } catch (error: any) {
+        if (error instanceof RateLimitedError) {
+          console.log(`⏰ Rate limit reached for ${provider.name}, backing off ${error.retryAfterMs}ms`);
+          this.scheduler.penalize(provider.name, error.retryAfterMs);
+        }
         const errorMsg = error.message || 'Unknown error';
         errors.push({ provider: provider.name, error: errorMsg });
         console.error(`❌ ${provider.name} failed:`, errorMsg);
@@ -189,16 +186,27 @@ export class FreeLLMService {
     throw new Error(`All LLM providers failed. Errors: ${JSON.stringify(errors)}`);
   }
 
-  private async callProvider(provider: ProviderConfig, request: LLMRequest): Promise<LLMResponse> {
+  private async callProvider(provider: ProviderConfig, request: LLMRequest, queuedAt: number): Promise<LLMResponse> {
     const modelKey = request.model || 'llama-3.1-8b';
     const modelName = provider.models[modelKey] || provider.models['llama-3.1-8b'] || Object.values(provider.models)[0];
 
-    if (provider.name === 'huggingface') {
-      return this.callHuggingFace(provider, request, modelName);
-    } else if (provider.name === 'gemini') {
-      return this.callGemini(provider, request, modelName);
-    } else {
-      return this.callOpenAICompatible(provider, request, modelName);
+    // Queue time is the wait for the scheduler's token
+    const call = new LLMCall(provider.name, modelName, queuedAt);
+    try {
+      call.sent();
+      let response: LLMResponse;
+      if (provider.name === 'huggingface') {
+        response = await this.callHuggingFace(provider, request, modelName);
+      } else if (provider.name === 'gemini') {
+        response = await this.callGemini(provider, request, modelName);
+      } else {
+        response = await this.callOpenAICompatible(provider, request, modelName);
+      }
+      call.received(response.usage, promptText(request.messages), response.content);
+      return { ...response, call };
+    } catch (error) {
+      call.failed(error);
+      throw error;
     }
   }
 
@@ -220,7 +228,11 @@ export class FreeLLMService {
 
     if (!response.ok) {
       const errorText = await response.text();
-      throw new Error(`${provider.name} API error: ${response.status} ${response.statusText} - ${errorText}`);
+      const message = `${provider.name} API error: ${response.status} ${response.statusText} - ${errorText}`;
+      if (response.status === 429) {
+        throw new RateLimitedError(provider.name, retryAfterMs(response.headers.get('retry-after')), message);
+      }
+      throw new Error(message);
     }
 
     const data = await response.json();
@@ -259,7 +271,11 @@ export class FreeLLMService {
 
     if (!response.ok) {
       const errorText = await response.text();
-      throw new Error(`HuggingFace API error: ${response.status} ${response.statusText} - ${errorText}`);
+      const message = `HuggingFace API error: ${response.status} ${response.statusText} - ${errorText}`;
+      if (response.status === 429) {
+        throw new RateLimitedError(provider.name, retryAfterMs(response.headers.get('retry-after')), message);
+      }
+      throw new Error(message);
     }
 
     const data = await response.json();
@@ -305,7 +321,11 @@ export class FreeLLMService {
 
     if (!response.ok) {
       const errorText = await response.text();
-      throw new Error(`Gemini API error: ${response.status} ${response.statusText} - ${errorText}`);
+      const message = `Gemini API error: ${response.status} ${response.statusText} - ${errorText}`;
+      if (response.status === 429) {
+        throw new RateLimitedError(provider.name, retryAfterMs(response.headers.get('retry-after')), message);
+      }
+      throw new Error(message);
     }
 
     const data = await response.json();
@@ -417,13 +437,13 @@ export class FreeLLMService {
       
       let questions;
       try {
-        questions = JSON.parse(jsonContent);
+        questions = llmParse(response.call, () => JSON.parse(jsonContent));
       } catch (parseError) {
         console.warn('Failed to parse JSON, trying to extract from response:', parseError);
         // If JSON parsing fails, look for a JSON-like structure
         const arrayMatch = response.content.match(/\[\s*{[\s\S]*}\s*\]/);
         if (arrayMatch) {
-          questions = JSON.parse(arrayMatch[0]);
+          questions = llmParse(response.call, () => JSON.parse(arrayMatch[0]));
         } else {
           throw new Error(`Unable to extract valid JSON from response: ${response.content.substring(0, 200)}...`);
         }
@@ -545,13 +565,13 @@ export class FreeLLMService {
       
       let problems;
       try {
-        problems = JSON.parse(jsonContent);
+        problems = llmParse(response.call, () => JSON.parse(jsonContent));
       } catch (parseError) {
         console.warn('Failed to parse DSA JSON, trying to extract from response:', parseError);
         // If JSON parsing fails, look for a JSON-like structure
         const arrayMatch = response.content.match(/\[\s*{[\s\S]*}\s*\]/);
         if (arrayMatch) {
-          problems = JSON.parse(arrayMatch[0]);
+          problems = llmParse(response.call, () => JSON.parse(arrayMatch[0]));
         } else {
           throw new Error(`Unable to extract valid JSON from response: ${response.content.substring(0, 200)}...`);
         }
@@ -649,10 +669,11 @@ export class FreeLLMService {
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
         ],
-        model: 'llama-3.1-8b'
+        model: 'llama-3.1-8b',
+        priority: 'interactive'
       });
 
-      const analysis = extractJSON(response.content);
+      const analysis = llmParse(response.call, () => extractJSON(response.content));
       return {
         score: Math.max(0, Math.min(10, analysis.score || 5)),
         feedback: analysis.feedback || 'Response analyzed successfully.',
@@ -763,12 +784,13 @@ export class FreeLLMService {
     availableProviders: string[],
     totalProviders: number,
     rateLimitStatus: { [key: string]: boolean };
+    scheduler: ReturnType<ProviderScheduler['getMetrics']>;
   }> {
     const availableProviders: string[] = [],
     const rateLimitStatus: { [key: string]: boolean } = {};
 
     for (const provider of this.providers) {
-      const canMakeRequest = this.canMakeRequest(provider.name);
+      const canMakeRequest = this.scheduler.hasHeadroom(provider.name);
       rateLimitStatus[provider.name] = canMakeRequest;
       
       if (canMakeRequest) {
@@ -779,7 +801,8 @@ export class FreeLLMService {
     return {
       availableProviders,
       totalProviders: this.providers.length,
-      rateLimitStatus
+      rateLimitStatus,
+      scheduler: this.scheduler.getMetrics()
     };
   }
 }
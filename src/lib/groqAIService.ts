@@ -6,6 +6,15 @@
 
 import Groq from 'groq-sdk';
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, LLMReply, llmParse, promptText } from './llmUsage';
+import {
+  AnalysisBatchItem,
+  AnalysisBatchLimits,
+  DEFAULT_BATCH_LIMITS,
+  demultiplexAnalyses,
+  packAnalysisBatches,
+  renderAnalysisItem
+} from './analysisBatch';
 
 // Load environment variables
 const groqApiKey = process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY || '';
@@ -31,6 +40,21 @@ interface InterviewQuestion {
   evaluationCriteria: string[],
   tags: string[],
   hints?: string[];
+  provider?: string;
+}
+
+interface ResponseAnalysis {
+  score: number,
+  feedback: string,
+  suggestions: string[],
+  strengths: string[],
+  improvements: string[];
+}
+
+export interface BatchAnalysisResult {
+  id: string,
+  source: 'batch' | 'single' | 'mock', // How this response ended up analysed
+  analysis: ResponseAnalysis;
 }
 
 interface DSAProblem {
@@ -69,6 +93,7 @@ export class GroqAIService {
     
     this.groq = new Groq({
       apiKey: groqApiKey,
+      baseURL: process.env.GROQ_BASE_URL || 'https://api.groq.com',
       dangerouslyAllowBrowser: true
     });
     
@@ -82,10 +107,12 @@ export class GroqAIService {
     return GroqAIService.instance;
   }
 
-  private async callGroqAPI(request: GroqRequest): Promise<string> {
+  private async callGroqAPI(request: GroqRequest): Promise<LLMReply> {
+    const call = new LLMCall('groq', request.model || this.model);
     try {
       console.log(`🚀 Calling Groq API with ${this.model}...`);
       
+      call.sent();
       const chatCompletion = await this.groq.chat.completions.create({
         messages: request.messages as any,
         model: request.model || this.model,
@@ -94,10 +121,12 @@ export class GroqAIService {
       });
 
       const content = chatCompletion.choices[0]?.message?.content || '';
+      call.received(chatCompletion.usage, promptText(request.messages), content);
       console.log('✅ Groq API response received');
       
-      return content;
+      return { content, call };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Groq API call failed:', error);
       throw error;
     }
@@ -156,7 +185,7 @@ export class GroqAIService {
     `;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
@@ -165,7 +194,7 @@ export class GroqAIService {
         temperature: 0.7
       });
 
-      const questions = extractJSON(response);
+      const questions = llmParse(call, () => extractJSON(response));
       return questions.map((q: any, index: number) => ({
         ...q,
         id: q.id || `groq-q-${Date.now()}-${index}`,
@@ -243,7 +272,7 @@ export class GroqAIService {
     `;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
@@ -252,7 +281,7 @@ export class GroqAIService {
         temperature: 0.8
       });
 
-      const problems = extractJSON(response);
+      const problems = llmParse(call, () => extractJSON(response));
       return problems.map((p: any, index: number) => ({
         ...p,
         id: p.id || `groq-dsa-${Date.now()}-${index}`,
@@ -277,14 +306,9 @@ export class GroqAIService {
     userAnswer: string,
     expectedAnswer: string,
     category: string,
-    companyContext: string
-  ): Promise<{
-    score: number,
-    feedback: string,
-    suggestions: string[],
-    strengths: string[],
-    improvements: string[];
-  }> {
+    companyContext: string,
+    options: { strict?: boolean } = {} // strict: throw instead of returning the offline analysis
+  ): Promise<ResponseAnalysis> {
     const systemMessage = `You are an expert interview evaluator with extensive experience in ${companyContext} interviews. Provide detailed, constructive, and actionable feedback that helps candidates improve their interview performance.`;
     
     const userMessage = `;
@@ -316,7 +340,7 @@ export class GroqAIService {
     `;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: userMessage }
@@ -325,20 +349,115 @@ export class GroqAIService {
         temperature: 0.5
       });
 
-      const analysis = extractJSON(response);
-      return {
-        score: Math.max(0, Math.min(10, analysis.score || 5)),
-        feedback: analysis.feedback || 'Response analyzed successfully with comprehensive feedback.',
-        suggestions: analysis.suggestions || ['Continue practicing similar questions', 'Focus on providing more detailed examples', 'Structure responses more clearly'],
-        strengths: analysis.strengths || ['Attempted the question thoroughly', 'Showed understanding of the topic'],
-        improvements: analysis.improvements || ['Add more specific technical details', 'Include more practical examples']
-      };
+      return this.normalizeAnalysis(llmParse(call, () => extractJSON(response)));
     } catch (error) {
       console.error('❌ Error analyzing response with Groq:', error);
+      if (options.strict) throw error;
       return this.generateMockAnalysis(userAnswer);
     }
   }
 
+  // Analyze a whole round of responses, packing several into each Groq call
+  public async analyzeInterviewResponsesBatch(
+    items: AnalysisBatchItem[],
+    companyContext: string,
+    limits: AnalysisBatchLimits = DEFAULT_BATCH_LIMITS
+  ): Promise<BatchAnalysisResult[]> {
+    const batches = packAnalysisBatches(items, limits);
+    const results = new Map<string, BatchAnalysisResult>();
+    console.log(`📦 Analyzing ${items.length} responses in ${batches.length} Groq call(s)`);
+
+    await Promise.all(batches.map(async batch => {
+      let reply: LLMReply | null = null;
+      let matched = new Map<string, any>();
+      try {
+        reply = await this.callGroqAPI({
+          messages: this.batchAnalysisMessages(batch, companyContext),
+          max_tokens: Math.min(8000, 200 + 700 * batch.length),
+          temperature: 0.5
+        });
+        const { content: response, call } = reply;
+        matched = demultiplexAnalyses(llmParse(call, () => extractJSON(response)), batch);
+      } catch (error) {
+        console.error('❌ Batch analysis with Groq failed:', error);
+      }
+      // When the call itself failed, retrying every item alone would only fail again
+      const callFailed = reply === null;
+
+      await Promise.all(batch.map(async item => {
+        const analysis = matched.get(item.id);
+        if (analysis) {
+          results.set(item.id, { id: item.id, source: 'batch', analysis: this.normalizeAnalysis(analysis) });
+        } else if (callFailed) {
+          results.set(item.id, { id: item.id, source: 'mock', analysis: this.generateMockAnalysis(item.userAnswer) });
+        } else {
+          results.set(item.id, await this.analyzeBatchItemAlone(item, companyContext));
+        }
+      }));
+    }));
+
+    return items.map(item => results.get(item.id)!);
+  }
+
+  private batchAnalysisMessages(batch: AnalysisBatchItem[], companyContext: string): GroqRequest['messages'] {
+    const systemMessage = `You are an expert interview evaluator with extensive experience in ${companyContext} interviews. Provide detailed, constructive, and actionable feedback that helps candidates improve their interview performance.`;
+
+    const userMessage = `Analyze each of the ${batch.length} interview responses below independently.
+
+Company Context: ${companyContext}
+
+${batch.map(renderAnalysisItem).join('\n\n')}
+
+For every response consider technical accuracy, communication clarity, completeness, relevance to the company and role, problem-solving approach and use of specific examples.
+
+Return ONLY a valid JSON object with one entry per response, using each response's id exactly as given:
+{
+  "analyses": [
+    {
+      "id": "response id",
+      "score": (numerical score from 0-10 based on overall response quality),
+      "feedback": "Detailed constructive feedback paragraph",
+      "suggestions": ["actionable suggestion 1", "actionable suggestion 2", "actionable suggestion 3"],
+      "strengths": ["strength 1", "strength 2", "strength 3"],
+      "improvements": ["area for improvement 1", "area for improvement 2", "area for improvement 3"]
+    }
+  ]
+}`;
+
+    return [
+      { role: 'system', content: systemMessage },
+      { role: 'user', content: userMessage }
+    ];
+  }
+
+  // Per-item fallback for responses the batch reply dropped or mangled
+  private async analyzeBatchItemAlone(item: AnalysisBatchItem, companyContext: string): Promise<BatchAnalysisResult> {
+    try {
+      const { content: response, call } = await this.callGroqAPI({
+        messages: this.batchAnalysisMessages([item], companyContext),
+        max_tokens: 3000,
+        temperature: 0.5
+      });
+      const analysis = demultiplexAnalyses(llmParse(call, () => extractJSON(response)), [item]).get(item.id);
+      if (analysis) {
+        return { id: item.id, source: 'single', analysis: this.normalizeAnalysis(analysis) };
+      }
+    } catch (error) {
+      console.error(`❌ Fallback analysis for response ${item.id} failed:`, error);
+    }
+    return { id: item.id, source: 'mock', analysis: this.generateMockAnalysis(item.userAnswer) };
+  }
+
+  private normalizeAnalysis(analysis: any): ResponseAnalysis {
+    return {
+      score: Math.max(0, Math.min(10, Number(analysis.score) || 5)),
+      feedback: analysis.feedback || 'Response analyzed successfully with comprehensive feedback.',
+      suggestions: analysis.suggestions || ['Continue practicing similar questions', 'Focus on providing more detailed examples', 'Structure responses more clearly'],
+      strengths: analysis.strengths || ['Attempted the question thoroughly', 'Showed understanding of the topic'],
+      improvements: analysis.improvements || ['Add more specific technical details', 'Include more practical examples']
+    };
+  }
+
   // Fast performance analysis with Groq AI (optimized for speed and accuracy)
   // Fast performance analysis with Groq AI (optimized for speed)
   public async analyzeOverallPerformance(
@@ -432,7 +551,7 @@ export class GroqAIService {
     `;
 
     try {
-      const response = await this.callGroqAPI({
+      const { content: response, call } = await this.callGroqAPI({
         messages: [
           { role: 'system', content: systemMessage },
           { role: 'user', content: prompt }
@@ -443,7 +562,7 @@ export class GroqAIService {
         temperature: 0.1  // Lower temperature for faster, more consistent results
       });
 
-      const analysis = extractJSON(response);
+      const analysis = llmParse(call, () => extractJSON(response));
       
       // Validate and enhance the analysis
       const validatedAnalysis = {
@@ -499,7 +618,7 @@ export class GroqAIService {
     try {
       console.log('🔍 Performing Groq health check...');
       
-      const testResponse = await this.callGroqAPI({
+      const { content: testResponse } = await this.callGroqAPI({
         messages: [
           { role: 'user', content: 'Health check - respond with "OK"' }
         ],
@@ -539,7 +658,8 @@ export class GroqAIService {
         timeLimit: 5,
         evaluationCriteria: ['Technical accuracy', 'Communication clarity', 'Real-world application', 'Problem-solving approach'],
         tags: [params.jobTitle, params.companyName, params.skills[i % params.skills.length]],
-        hints: ['Think about specific projects and measurable outcomes']
+        hints: ['Think about specific projects and measurable outcomes'],
+        provider: 'fallback'
       });
     }
     
@@ -613,7 +733,7 @@ export class GroqAIService {
     return mockProblems;
   }
 
-  private generateMockAnalysis(userAnswer: string) {
+  public generateMockAnalysis(userAnswer: string) {
     const wordCount = userAnswer.split(' ').length;
     const score = Math.min(10, Math.max(3, wordCount / 15));
     
@@ -0,0 +1,140 @@
+/**
+ * Hedged requests
+ * Cuts the latency tail of idempotent LLM calls: when the primary attempt has not
+ * answered within a delay taken from recent latencies (e.g. their rolling p90), the
+ * same work is sent to a secondary attempt, the first valid answer wins and the other
+ * attempt is aborted. A token-bucket budget caps how many extra requests hedging adds.
+ */
+
+export interface HedgeAttempt<T> {
+  name: string;
+  run: (signal: AbortSignal) => Promise<T>;
+}
+
+export interface HedgeOutcome<T> {
+  result: T;
+  winner: string;
+  hedged: boolean; // Whether the secondary attempt was sent
+  delayMs: number | null; // Hedge delay that applied, null when hedging was off
+}
+
+/**
+ * Rolling window of recent latencies
+ */
+export class LatencyWindow {
+  private samples: number[] = [];
+
+  constructor(private size = 200, private minSamples = 20) {}
+
+  record(ms: number): void {
+    this.samples.push(ms);
+    if (this.samples.length > this.size) {
+      this.samples.shift();
+    }
+  }
+
+  /**
+   * Percentile of the window, or null until enough samples have been seen
+   */
+  percentile(p: number): number | null {
+    if (this.samples.length < this.minSamples) return null;
+    const sorted = [...this.samples].sort((a, b) => a - b);
+    return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+  }
+
+  get count(): number {
+    return this.samples.length;
+  }
+}
+
+/**
+ * Every request earns `ratio` tokens and every hedge spends one, so hedges stay
+ * below ratio × requests over time; `burst` bounds the tokens that can pile up
+ */
+export class HedgeBudget {
+  private tokens: number;
+
+  constructor(private ratio: number, private burst = 5) {
+    this.tokens = ratio > 0 ? Math.min(burst, 1) : 0;
+  }
+
+  deposit(): void {
+    this.tokens = Math.min(this.burst, this.tokens + this.ratio);
+  }
+
+  trySpend(): boolean {
+    if (this.tokens < 1) return false;
+    this.tokens -= 1;
+    return true;
+  }
+}
+
+/**
+ * Run primary and, after delayMs (or as soon as the primary fails), secondary; resolve
+ * with the first result accepted by isValid and abort the other attempt. A null delay
+ * runs the primary alone. Rejects with the primary's error when no attempt succeeds.
+ * allowHedge is asked right before the secondary would be sent (e.g. to spend budget).
+ */
+export function hedgedRun<T>(
+  primary: HedgeAttempt<T>,
+  secondary: HedgeAttempt<T>,
+  options: { delayMs: number | null; isValid?: (result: T) => boolean; allowHedge?: () => boolean }
+): Promise<HedgeOutcome<T>> {
+  const { delayMs, isValid = () => true, allowHedge = () => true } = options;
+
+  return new Promise((resolve, reject) => {
+    const controllers: AbortController[] = [];
+    let settled = false;
+    let hedged = false;
+    let pending = 0;
+    let firstError: unknown = null;
+    let timer: ReturnType<typeof setTimeout> | null = null;
+
+    const finish = () => {
+      settled = true;
+      if (timer) clearTimeout(timer);
+      controllers.forEach(controller => controller.abort());
+    };
+
+    const launch = (attempt: HedgeAttempt<T>) => {
+      const controller = new AbortController();
+      controllers.push(controller);
+      pending++;
+
+      attempt.run(controller.signal)
+        .then(result => {
+          if (!isValid(result)) throw new Error(`${attempt.name} returned an invalid result`);
+          if (settled) return;
+          finish();
+          resolve({ result, winner: attempt.name, hedged, delayMs });
+        })
+        .catch(error => {
+          if (settled) return;
+          firstError = firstError ?? error;
+          pending--;
+          if (attempt === primary) {
+            hedge(); // Don't wait out the delay once the primary has failed
+          }
+          if (pending === 0) {
+            finish();
+            reject(firstError);
+          }
+        });
+    };
+
+    const hedge = () => {
+      if (timer) {
+        clearTimeout(timer);
+        timer = null;
+      }
+      if (settled || hedged || delayMs === null || !allowHedge()) return;
+      hedged = true;
+      launch(secondary);
+    };
+
+    launch(primary);
+    if (delayMs !== null) {
+      timer = setTimeout(hedge, delayMs);
+    }
+  });
+}
@@ -3,6 +3,8 @@
  * Handles code compilation and execution with proper error handling
  */
 
+import { executeBatch, Judge0Submission } from './judge0Batch';
+
 interface TestCase {
   id: string,
   input: string,
@@ -39,7 +41,7 @@ export class ImprovedJudge0Service {
   private constructor() {
     this.apiKey = process.env.JUDGE0_API_KEY || process.env.NEXT_PUBLIC_JUDGE0_API_KEY || '';
     this.apiHost = process.env.JUDGE0_API_HOST || 'judge0-ce.p.rapidapi.com';
-    this.baseUrl = `https://${this.apiHost}`
+    this.baseUrl = process.env.JUDGE0_BASE_URL || `https://${this.apiHost}`
     
     console.log('🔧 Judge0Service initialized with API:', {
       hasKey: !!this.apiKey,
@@ -95,39 +97,14 @@ export class ImprovedJudge0Service {
     return await response.json();
   }
 
-  private async submitCode(sourceCode: string, languageId: number, stdin?: string): Promise<string> {
-    const submission = {
+  private buildSubmission(sourceCode: string, languageId: number, stdin?: string): Judge0Submission {
+    return {
       source_code: Buffer.from(sourceCode).toString('base64'),
       language_id: languageId,
       stdin: stdin ? Buffer.from(stdin).toString('base64') : undefined,
-      wait: false,
       cpu_time_limit: 2,
       memory_limit: 128000
     };
-
-    const response = await this.makeApiRequest('/submissions', 'POST', submission);
-    return response.token;
-  }
-
-  private async getSubmissionResult(token: string): Promise<any> {
-    // Poll for result with timeout
-    const maxAttempts = 30;
-    const pollInterval = 1000; // 1 second
-    
-    for (let attempt = 0; attempt < maxAttempts; attempt++) {
-      const result = await this.makeApiRequest(`/submissions/${token}`);
-      
-      if (result.status && result.status.id > 2) {
-        // Status > 2 means execution completed (success, error, or timeout)
-        return result;
-      }
-      
-      if (attempt < maxAttempts - 1) {
-        await new Promise(resolve => setTimeout(resolve, pollInterval));
-      }
-    }
-    
-    throw new Error('Code execution timeout - submission took too long');
   }
 
   private createExecutableCode(userCode: string, testCase: TestCase, language: string): string {
@@ -187,18 +164,19 @@ except Exception as e:
 
       console.log(`🚀 Executing ${testCases.length} test cases for ${language}`);
 
-      // Execute code for each test case
-      for (const testCase of testCases) {
+      // Submit every test case in one batch (no stdin needed as we embed the test case)
+      const submissions = await executeBatch(
+        this.makeApiRequest.bind(this),
+        testCases.map(testCase => this.buildSubmission(this.createExecutableCode(sourceCode, testCase, language), languageId, ''))
+      );
+
+      for (let i = 0; i < testCases.length; i++) {
+        const testCase = testCases[i];
         try {
-          // Create executable code that calls the user's function with test inputs
-          const executableCode = this.createExecutableCode(sourceCode, testCase, language);
-          console.log('📝 Executable code created:', executableCode.substring(0, 200) + '...');
-          
-          // Submit executable code (no stdin needed as we embed the test case)
-          const token = await this.submitCode(executableCode, languageId, '');
-          
-          // Get execution result
-          const submission = await this.getSubmissionResult(token);
+          const submission = submissions[i];
+          if (submission instanceof Error) {
+            throw submission;
+          }
           
           // Decode outputs
           const stdout = submission.stdout ? Buffer.from(submission.stdout, 'base64').toString() : '',
@@ -190,7 +190,7 @@ export class InterviewServiceManager {
           evaluationCriteria: ['Correctness', 'Efficiency', 'Code Quality', 'Edge Cases', 'Complexity Analysis'],
           tags: [params.companyName, 'dsa', ...problem.topics],
           dsaProblem: problem, // Include full DSA problem data
-          provider: 'enhanced-dsa-service'
+          provider: problem.fallback ? 'fallback' : 'enhanced-dsa-service'
         }));
         
       } else if (params.interviewType === 'mixed') {
@@ -244,7 +244,7 @@ export class InterviewServiceManager {
           evaluationCriteria: ['Correctness', 'Efficiency', 'Code Quality'],
           tags: [params.companyName, 'dsa', ...problem.topics],
           dsaProblem: problem,
-          provider: 'enhanced-dsa-service'
+          provider: problem.fallback ? 'fallback' : 'enhanced-dsa-service'
         }));
         
         const allQuestions = [...technicalQuestions, ...behavioralQuestions, ...aptitudeQuestions, ...dsaQuestions];
@@ -384,7 +384,8 @@ export class InterviewServiceManager {
           company: companyName,
           uniqueId: `fallback-${Date.now()}-${i}`,
           version: 1
-        }
+        },
+        fallback: true
       });
     }
     
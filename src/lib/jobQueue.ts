@@ -0,0 +1,196 @@
+/**
+ * In-process background job queue
+ * Runs long LLM work outside the request that asked for it: callers enqueue a job,
+ * answer 202 with its id and clients poll (or long-poll) its status. Jobs run on a
+ * bounded number of concurrent slots, the waiting queue is bounded, duplicate jobs
+ * for the same key share one run and finished jobs are kept for a retention window.
+ *
+ * State lives in this process only; behind several instances the status request
+ * must reach the instance that accepted the job.
+ */
+
+import { AsyncResource } from 'async_hooks';
+import { randomUUID } from 'crypto';
+
+export type JobStatus = 'queued' | 'running' | 'completed' | 'failed';
+
+export interface JobSnapshot<T> {
+  id: string;
+  key: string;
+  status: JobStatus;
+  position?: number; // Place in the waiting queue while queued
+  queuedMs: number; // Time spent waiting for a slot
+  runMs: number; // Time spent running
+  enqueuedAt: string;
+  result?: T;
+  error?: string;
+}
+
+export interface JobQueueOptions {
+  name: string;
+  concurrency: number;
+  maxQueue: number;
+  retentionMs: number;
+}
+
+export class JobQueueFullError extends Error {
+  constructor(name: string) {
+    super(`${name} queue is full, please retry shortly`);
+    this.name = 'JobQueueFullError';
+  }
+}
+
+interface Job<T> {
+  id: string;
+  key: string;
+  status: JobStatus;
+  run: () => Promise<T>;
+  enqueuedAt: number;
+  startedAt?: number;
+  finishedAt?: number;
+  result?: T;
+  error?: string;
+  waiters: Array<() => void>;
+}
+
+export class JobQueue<T> {
+  private jobs: Map<string, Job<T>> = new Map();
+  private activeByKey: Map<string, string> = new Map();
+  private waiting: Job<T>[] = [];
+  private running = 0;
+  private stats = { enqueued: 0, deduplicated: 0, completed: 0, failed: 0, rejected: 0, totalQueueMs: 0, totalRunMs: 0 };
+
+  constructor(private options: JobQueueOptions) {}
+
+  /**
+   * Queue run() under key; a key that is already queued or running returns that job instead
+   */
+  enqueue(key: string, run: () => Promise<T>): { job: JobSnapshot<T>; deduplicated: boolean } {
+    this.prune();
+
+    const activeId = this.activeByKey.get(key);
+    const active = activeId ? this.jobs.get(activeId) : undefined;
+    if (active) {
+      this.stats.deduplicated++;
+      return { job: this.snapshot(active), deduplicated: true };
+    }
+
+    if (this.waiting.length >= this.options.maxQueue) {
+      this.stats.rejected++;
+      throw new JobQueueFullError(this.options.name);
+    }
+
+    // Bound to the enqueuing request's async context; pump() starts jobs from whichever
+    // job finished last, whose context (e.g. LLM usage scope) would otherwise leak in
+    const job: Job<T> = { id: randomUUID(), key, status: 'queued', run: AsyncResource.bind(run), enqueuedAt: Date.now(), waiters: [] };
+    this.jobs.set(job.id, job);
+    this.activeByKey.set(key, job.id);
+    this.waiting.push(job);
+    this.stats.enqueued++;
+    this.pump();
+    return { job: this.snapshot(job), deduplicated: false };
+  }
+
+  get(id: string): JobSnapshot<T> | undefined {
+    const job = this.jobs.get(id);
+    return job ? this.snapshot(job) : undefined;
+  }
+
+  /**
+   * Long-poll: resolve once the job finishes or waitMs elapses, whichever comes first
+   */
+  async waitFor(id: string, waitMs: number): Promise<JobSnapshot<T> | undefined> {
+    const job = this.jobs.get(id);
+    if (!job || waitMs <= 0 || job.status === 'completed' || job.status === 'failed') {
+      return job ? this.snapshot(job) : undefined;
+    }
+
+    await new Promise<void>(resolve => {
+      const timer = setTimeout(() => {
+        // Timed out: drop the waiter so repeated polls on a long job do not pile up
+        const index = job.waiters.indexOf(done);
+        if (index !== -1) job.waiters.splice(index, 1);
+        resolve();
+      }, waitMs);
+      function done() {
+        clearTimeout(timer);
+        resolve();
+      }
+      job.waiters.push(done);
+    });
+    return this.snapshot(job);
+  }
+
+  getMetrics() {
+    const finished = this.stats.completed + this.stats.failed;
+    return {
+      name: this.options.name,
+      concurrency: this.options.concurrency,
+      running: this.running,
+      queued: this.waiting.length,
+      maxQueue: this.options.maxQueue,
+      retained: this.jobs.size,
+      ...this.stats,
+      avgQueueMs: finished > 0 ? this.stats.totalQueueMs / finished : 0,
+      avgRunMs: finished > 0 ? this.stats.totalRunMs / finished : 0
+    };
+  }
+
+  private pump(): void {
+    while (this.running < this.options.concurrency && this.waiting.length > 0) {
+      const job = this.waiting.shift()!;
+      this.running++;
+      job.status = 'running';
+      job.startedAt = Date.now();
+      this.stats.totalQueueMs += job.startedAt - job.enqueuedAt;
+
+      job.run()
+        .then(result => {
+          job.result = result;
+          job.status = 'completed';
+          this.stats.completed++;
+        })
+        .catch(error => {
+          job.error = error instanceof Error ? error.message : String(error);
+          job.status = 'failed';
+          this.stats.failed++;
+          console.error(`❌ ${this.options.name} job ${job.id} failed:`, error);
+        })
+        .finally(() => {
+          job.finishedAt = Date.now();
+          this.stats.totalRunMs += job.finishedAt - job.startedAt!;
+          this.running--;
+          this.activeByKey.delete(job.key);
+          job.waiters.splice(0).forEach(wake => wake());
+          this.pump();
+        });
+    }
+  }
+
+  private prune(): void {
+    const cutoff = Date.now() - this.options.retentionMs;
+    for (const [id, job] of this.jobs) {
+      if (job.finishedAt && job.finishedAt < cutoff) {
+        this.jobs.delete(id);
+      }
+    }
+  }
+
+  private snapshot(job: Job<T>): JobSnapshot<T> {
+    const now = Date.now();
+    const startedAt = job.startedAt ?? now;
+    return {
+      id: job.id,
+      key: job.key,
+      status: job.status,
+      position: job.status === 'queued' ? this.waiting.indexOf(job) + 1 : undefined,
+      queuedMs: startedAt - job.enqueuedAt,
+      runMs: job.startedAt ? (job.finishedAt ?? now) - job.startedAt : 0,
+      enqueuedAt: new Date(job.enqueuedAt).toISOString(),
+      result: job.result,
+      error: job.error
+    };
+  }
+}
+
+export default JobQueue;
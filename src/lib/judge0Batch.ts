@@ -0,0 +1,128 @@
+/**
+ * Judge0 Batch Execution Helpers
+ * Submits all test cases of a run through /submissions/batch and polls the
+ * outstanding tokens together with adaptive backoff, so a run costs one
+ * round of polling instead of one fixed 1s wait per test case.
+ */
+
+export type Judge0Request = (endpoint: string, method?: 'GET' | 'POST', body?: any) => Promise<any>;
+
+export interface Judge0Submission {
+  source_code: string,
+  language_id: number,
+  stdin?: string,
+  expected_output?: string,
+  cpu_time_limit?: number,
+  memory_limit?: number,
+  wall_time_limit?: number
+}
+
+export interface Judge0PollOptions {
+  base64Encoded?: boolean,
+  initialDelayMs?: number,
+  maxDelayMs?: number,
+  backoffFactor?: number,
+  timeoutMs?: number
+}
+
+// Judge0 rejects batches larger than MAX_SUBMISSION_BATCH_SIZE (20 by default)
+const MAX_BATCH_SIZE = 20;
+
+const RESULT_FIELDS = 'token,stdout,stderr,compile_output,message,status,time,memory';
+
+const DEFAULT_POLL_OPTIONS: Required<Judge0PollOptions> = {
+  base64Encoded: true,
+  initialDelayMs: parseInt(process.env.JUDGE0_POLL_INITIAL_MS || '25'),
+  maxDelayMs: parseInt(process.env.JUDGE0_POLL_MAX_MS || '1000'),
+  backoffFactor: 1.6,
+  timeoutMs: parseInt(process.env.JUDGE0_POLL_TIMEOUT_MS || '30000')
+};
+
+function chunk<T>(items: T[], size: number): T[][] {
+  const chunks: T[][] = [];
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size));
+  }
+  return chunks;
+}
+
+/**
+ * Submit every submission in as few batch calls as possible. Entries Judge0
+ * refused (e.g. a full queue) come back as Errors in the same position.
+ */
+export async function submitBatch(
+  request: Judge0Request,
+  submissions: Judge0Submission[],
+  base64Encoded: boolean = true
+): Promise<Array<string | Error>> {
+  const responses = await Promise.all(
+    chunk(submissions, MAX_BATCH_SIZE).map(part =>
+      request(`/submissions/batch?base64_encoded=${base64Encoded}`, 'POST', { submissions: part })
+    )
+  );
+
+  return responses.flat().map((entry: any) =>
+    entry && entry.token ? entry.token : new Error(`Judge0 rejected submission: ${JSON.stringify(entry)}`)
+  );
+}
+
+/**
+ * Poll all tokens together until each one leaves In Queue/Processing. The
+ * delay starts in milliseconds and backs off towards maxDelayMs.
+ */
+export async function pollBatch(
+  request: Judge0Request,
+  tokens: string[],
+  options: Judge0PollOptions = {}
+): Promise<Map<string, any>> {
+  const { base64Encoded, initialDelayMs, maxDelayMs, backoffFactor, timeoutMs } = { ...DEFAULT_POLL_OPTIONS, ...options };
+  const results = new Map<string, any>();
+  const pending = new Set(tokens);
+  const deadline = Date.now() + timeoutMs;
+  let delay = initialDelayMs;
+
+  while (pending.size > 0) {
+    const responses = await Promise.all(
+      chunk(Array.from(pending), MAX_BATCH_SIZE).map(part =>
+        request(`/submissions/batch?tokens=${part.join(',')}&base64_encoded=${base64Encoded}&fields=${RESULT_FIELDS}`)
+      )
+    );
+
+    responses.forEach(response => {
+      (response?.submissions || []).forEach((submission: any) => {
+        // Status IDs: 1=In Queue, 2=Processing, anything above is a final verdict
+        if (submission && submission.status && submission.status.id > 2) {
+          results.set(submission.token, submission);
+          pending.delete(submission.token);
+        }
+      });
+    });
+
+    if (pending.size === 0) break;
+    if (Date.now() + delay > deadline) {
+      throw new Error('Code execution timeout - submission took too long');
+    }
+
+    await new Promise(resolve => setTimeout(resolve, delay));
+    delay = Math.min(maxDelayMs, Math.ceil(delay * backoffFactor));
+  }
+
+  return results;
+}
+
+/**
+ * Submit and resolve a whole run. Results line up with the submissions; a
+ * submission that could not be queued resolves to an Error.
+ */
+export async function executeBatch(
+  request: Judge0Request,
+  submissions: Judge0Submission[],
+  options: Judge0PollOptions = {}
+): Promise<Array<any | Error>> {
+  const base64Encoded = options.base64Encoded ?? DEFAULT_POLL_OPTIONS.base64Encoded;
+  const tokens = await submitBatch(request, submissions, base64Encoded);
+  const queued = tokens.filter((token): token is string => typeof token === 'string');
+  const results = await pollBatch(request, queued, { ...options, base64Encoded });
+
+  return tokens.map(token => (typeof token === 'string' ? results.get(token) : token));
+}
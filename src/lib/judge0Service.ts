@@ -38,7 +38,7 @@ export class Judge0Service {
 
   private constructor() {
     this.apiKey = process.env.JUDGE0_API_KEY || '';
-    this.baseUrl = 'https://judge0-ce.p.rapidapi.com'
+    this.baseUrl = process.env.JUDGE0_BASE_URL || 'https://judge0-ce.p.rapidapi.com'
   }
 
   public static getInstance(): Judge0Service {
@@ -0,0 +1,242 @@
+/**
+ * LLM call accounting
+ * Records provider, model, prompt/completion tokens and where the time of every LLM
+ * call went: waiting for a rate-limit token (queue), on the network, and parsing the
+ * reply. Totals are kept per provider/model and per route for /api/llm-usage; calls
+ * made while a route handler runs under withLLMUsage are also reported on that
+ * response as X-LLM-Calls / X-LLM-Usage headers.
+ */
+
+import { AsyncLocalStorage } from 'async_hooks';
+import { LatencyWindow } from './hedgedRequest';
+
+export interface LLMCallRecord {
+  provider: string;
+  model: string;
+  route: string | null;
+  ok: boolean;
+  error?: string;
+  queueMs: number;
+  networkMs: number;
+  parseMs: number;
+  promptTokens: number;
+  completionTokens: number;
+  tokensEstimated: boolean; // The provider reported no usage; counted from text length
+}
+
+interface UsageScope {
+  route: string;
+  calls: LLMCallRecord[];
+}
+
+const scopes = new AsyncLocalStorage<UsageScope>();
+
+// Roughly four characters per token for English text
+export function estimateTokens(text: string): number {
+  return Math.ceil(text.length / 4);
+}
+
+export function promptText(messages: Array<{ content: string }>): string {
+  return messages.map(message => message.content).join('\n\n');
+}
+
+/**
+ * Token counts from an OpenAI-style (prompt_tokens) or Gemini (promptTokenCount)
+ * usage block, estimated from the texts when the provider sent none
+ */
+export function normalizeUsage(usage: any, prompt: string, completion: string) {
+  const promptTokens = usage?.prompt_tokens ?? usage?.promptTokenCount;
+  const completionTokens = usage?.completion_tokens ?? usage?.candidatesTokenCount;
+  if (typeof promptTokens === 'number' && typeof completionTokens === 'number') {
+    return { promptTokens, completionTokens, tokensEstimated: false };
+  }
+  return { promptTokens: estimateTokens(prompt), completionTokens: estimateTokens(completion), tokensEstimated: true };
+}
+
+interface UsageTotals {
+  calls: number;
+  failures: number;
+  promptTokens: number;
+  completionTokens: number;
+  estimatedCalls: number;
+  queueMs: number;
+  networkMs: number;
+  parseMs: number;
+  network: LatencyWindow;
+}
+
+function emptyTotals(): UsageTotals {
+  return { calls: 0, failures: 0, promptTokens: 0, completionTokens: 0, estimatedCalls: 0, queueMs: 0, networkMs: 0, parseMs: 0, network: new LatencyWindow(500, 1) };
+}
+
+function summarizeTotals(totals: UsageTotals) {
+  const { network, ...sums } = totals;
+  return {
+    ...sums,
+    totalTokens: totals.promptTokens + totals.completionTokens,
+    avgQueueMs: totals.calls ? totals.queueMs / totals.calls : 0,
+    avgNetworkMs: totals.calls ? totals.networkMs / totals.calls : 0,
+    avgParseMs: totals.calls ? totals.parseMs / totals.calls : 0,
+    networkP50Ms: network.percentile(50),
+    networkP90Ms: network.percentile(90)
+  };
+}
+
+class LLMUsageLedger {
+  private byProvider: Map<string, UsageTotals> = new Map();
+  private byRoute: Map<string, UsageTotals> = new Map();
+  private since = new Date();
+
+  private totalsFor(map: Map<string, UsageTotals>, key: string): UsageTotals {
+    if (!map.has(key)) map.set(key, emptyTotals());
+    return map.get(key)!;
+  }
+
+  private keys(record: LLMCallRecord): Array<[Map<string, UsageTotals>, string]> {
+    const providerKey = `${record.provider}|${record.model}`;
+    return [[this.byProvider, providerKey], [this.byRoute, `${record.route || 'background'}|${providerKey}`]];
+  }
+
+  add(record: LLMCallRecord): void {
+    for (const [map, key] of this.keys(record)) {
+      const totals = this.totalsFor(map, key);
+      totals.calls++;
+      if (!record.ok) totals.failures++;
+      if (record.tokensEstimated) totals.estimatedCalls++;
+      totals.promptTokens += record.promptTokens;
+      totals.completionTokens += record.completionTokens;
+      totals.queueMs += record.queueMs;
+      totals.networkMs += record.networkMs;
+      totals.network.record(record.networkMs);
+    }
+  }
+
+  addParse(record: LLMCallRecord, ms: number): void {
+    for (const [map, key] of this.keys(record)) {
+      this.totalsFor(map, key).parseMs += ms;
+    }
+  }
+
+  reset(): void {
+    this.byProvider.clear();
+    this.byRoute.clear();
+    this.since = new Date();
+  }
+
+  getMetrics() {
+    return {
+      since: this.since,
+      providers: [...this.byProvider].map(([key, totals]) => {
+        const [provider, model] = key.split('|');
+        return { provider, model, ...summarizeTotals(totals) };
+      }),
+      routes: [...this.byRoute].map(([key, totals]) => {
+        const [route, provider, model] = key.split('|');
+        return { route, provider, model, ...summarizeTotals(totals) };
+      })
+    };
+  }
+}
+
+export const llmUsage = new LLMUsageLedger();
+
+/**
+ * One network attempt against a provider. queuedAt is when the caller started waiting
+ * (e.g. for a rate-limit token); call sent() as the request goes out, then received()
+ * or failed().
+ */
+export class LLMCall {
+  private sentAt: number | null = null;
+  private scope = scopes.getStore();
+  readonly record: LLMCallRecord;
+
+  constructor(provider: string, model: string, private startedAt: number = performance.now()) {
+    this.record = {
+      provider, model, route: this.scope?.route ?? null, ok: false,
+      queueMs: 0, networkMs: 0, parseMs: 0, promptTokens: 0, completionTokens: 0, tokensEstimated: false
+    };
+  }
+
+  sent(): void {
+    this.sentAt = performance.now();
+    this.record.queueMs = this.sentAt - this.startedAt;
+  }
+
+  received(usage: any, prompt: string, completion: string): void {
+    Object.assign(this.record, normalizeUsage(usage, prompt, completion), { ok: true });
+    this.finish();
+  }
+
+  failed(error: unknown): void {
+    this.record.error = error instanceof Error ? error.message : String(error);
+    this.finish();
+  }
+
+  private finish(): void {
+    this.record.networkMs = performance.now() - (this.sentAt ?? this.startedAt);
+    llmUsage.add(this.record);
+    if (this.scope) {
+      this.scope.calls.push(this.record);
+    }
+  }
+}
+
+// Reply text of a call, kept together with the call so its parse time lands on it
+export interface LLMReply {
+  content: string;
+  call: LLMCall;
+}
+
+/**
+ * Time parsing of an LLM reply and charge it to the call that produced it; calls run
+ * in parallel within one route, so the call is passed in rather than looked up
+ */
+export function llmParse<T>(call: LLMCall | undefined, parse: () => T): T {
+  const startedAt = performance.now();
+  try {
+    return parse();
+  } finally {
+    if (call) {
+      const ms = performance.now() - startedAt;
+      call.record.parseMs += ms;
+      llmUsage.addParse(call.record, ms);
+    }
+  }
+}
+
+/**
+ * Run a route handler with its LLM calls collected, then report them on the response.
+ * Streamed responses get their headers before the calls finish; those calls still
+ * count towards the route in /api/llm-usage.
+ */
+export async function withLLMUsage<T extends Response>(route: string, handler: () => Promise<T>): Promise<T> {
+  const scope: UsageScope = { route, calls: [] };
+  const response = await scopes.run(scope, handler);
+
+  const perModel = new Map<string, { calls: number; failed: number; prompt: number; completion: number; queue: number; network: number; parse: number }>();
+  for (const call of scope.calls) {
+    const key = `${call.provider}/${call.model}`;
+    const entry = perModel.get(key) || { calls: 0, failed: 0, prompt: 0, completion: 0, queue: 0, network: 0, parse: 0 };
+    entry.calls++;
+    if (!call.ok) entry.failed++;
+    entry.prompt += call.promptTokens;
+    entry.completion += call.completionTokens;
+    entry.queue += call.queueMs;
+    entry.network += call.networkMs;
+    entry.parse += call.parseMs;
+    perModel.set(key, entry);
+  }
+
+  try {
+    response.headers.set('X-LLM-Calls', String(scope.calls.length));
+    if (perModel.size > 0) {
+      response.headers.set('X-LLM-Usage', [...perModel].map(([key, e]) =>
+        `${key};calls=${e.calls};failed=${e.failed};prompt=${e.prompt};completion=${e.completion};` +
+        `queue=${e.queue.toFixed(1)};network=${e.network.toFixed(1)};parse=${e.parse.toFixed(1)}`
+      ).join(', '));
+    }
+  } catch {
+    // Some responses (e.g. redirects) have immutable headers
+  }
+  return response;
+}
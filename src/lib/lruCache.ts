@@ -0,0 +1,185 @@
+/**
+ * LRU + TTL cache with single-flight loading
+ * Bounded in-memory tier with least-recently-used eviction, optional MongoDB tier for
+ * persistence across restarts, and request coalescing so concurrent misses for the
+ * same key trigger a single upstream call.
+ */
+
+import client from './db';
+
+export type CacheSource = 'memory' | 'persistent' | 'loaded' | 'coalesced';
+
+export interface LRUCacheOptions {
+  name: string;
+  maxEntries: number;
+  ttlMs: number;
+  persistCollection?: string; // MongoDB collection for the persistent tier
+}
+
+export interface CacheMetrics {
+  name: string;
+  size: number;
+  maxEntries: number;
+  ttlMs: number;
+  hits: number;
+  persistentHits: number;
+  misses: number;
+  coalesced: number;
+  evictions: number;
+  loadErrors: number;
+  hitRate: number;
+}
+
+interface CacheEntry<T> {
+  value: T;
+  expiresAt: number;
+}
+
+export class LRUCache<T> {
+  private entries: Map<string, CacheEntry<T>> = new Map();
+  private inFlight: Map<string, Promise<T>> = new Map();
+  private indexEnsured = false;
+  private stats = { hits: 0, persistentHits: 0, misses: 0, coalesced: 0, evictions: 0, loadErrors: 0 };
+
+  constructor(private options: LRUCacheOptions) {}
+
+  get(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used (Map keeps insertion order)
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: T, ttlMs: number = this.options.ttlMs): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    while (this.entries.size > this.options.maxEntries) {
+      const oldestKey = this.entries.keys().next().value as string;
+      this.entries.delete(oldestKey);
+      this.stats.evictions++;
+    }
+  }
+
+  delete(key: string): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  async clearPersistent(): Promise<void> {
+    if (!this.options.persistCollection) return;
+    await client.db().collection(this.options.persistCollection).deleteMany({});
+  }
+
+  /**
+   * Return the cached value or load it once, coalescing concurrent callers.
+   * Values rejected by shouldCache are returned but not stored.
+   */
+  async getOrLoad(
+    key: string,
+    loader: () => Promise<T>,
+    shouldCache: (value: T) => boolean = () => true
+  ): Promise<{ value: T; source: CacheSource }> {
+    const cached = this.get(key);
+    if (cached !== undefined) {
+      this.stats.hits++;
+      return { value: cached, source: 'memory' };
+    }
+
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      this.stats.coalesced++;
+      return { value: await pending, source: 'coalesced' };
+    }
+
+    let source: CacheSource = 'loaded';
+    const load = (async () => {
+      const persisted = await this.readPersistent(key);
+      if (persisted !== undefined) {
+        this.stats.persistentHits++;
+        source = 'persistent';
+        this.set(key, persisted);
+        return persisted;
+      }
+
+      this.stats.misses++;
+      const value = await loader();
+      if (shouldCache(value)) {
+        this.set(key, value);
+        await this.writePersistent(key, value);
+      }
+      return value;
+    })();
+
+    this.inFlight.set(key, load);
+    try {
+      const value = await load;
+      return { value, source };
+    } catch (error) {
+      this.stats.loadErrors++;
+      throw error;
+    } finally {
+      this.inFlight.delete(key);
+    }
+  }
+
+  getMetrics(): CacheMetrics {
+    const lookups = this.stats.hits + this.stats.persistentHits + this.stats.misses + this.stats.coalesced;
+    return {
+      name: this.options.name,
+      size: this.entries.size,
+      maxEntries: this.options.maxEntries,
+      ttlMs: this.options.ttlMs,
+      ...this.stats,
+      hitRate: lookups > 0 ? (lookups - this.stats.misses) / lookups : 0
+    };
+  }
+
+  private async readPersistent(key: string): Promise<T | undefined> {
+    if (!this.options.persistCollection) return undefined;
+
+    try {
+      const doc = await client.db().collection(this.options.persistCollection).findOne({
+        key,
+        expiresAt: { $gt: new Date() }
+      });
+      return doc ? (doc.value as T) : undefined;
+    } catch (error) {
+      console.warn(`⚠️ ${this.options.name} cache: persistent read failed`, error);
+      return undefined;
+    }
+  }
+
+  private async writePersistent(key: string, value: T): Promise<void> {
+    if (!this.options.persistCollection) return;
+
+    try {
+      const collection = client.db().collection(this.options.persistCollection);
+      if (!this.indexEnsured) {
+        await collection.createIndex({ key: 1 }, { unique: true });
+        await collection.createIndex({ expiresAt: 1 }, { expireAfterSeconds: 0 });
+        this.indexEnsured = true;
+      }
+      await collection.updateOne(
+        { key },
+        { $set: { key, value, expiresAt: new Date(Date.now() + this.options.ttlMs), updatedAt: new Date() } },
+        { upsert: true }
+      );
+    } catch (error) {
+      console.warn(`⚠️ ${this.options.name} cache: persistent write failed`, error);
+    }
+  }
+}
+
+export default LRUCache;
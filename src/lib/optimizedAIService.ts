@@ -7,6 +7,7 @@
 import Groq from 'groq-sdk';
 import { config } from 'dotenv';
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, llmParse, promptText } from './llmUsage';
 
 // Load environment variables
 if (typeof process !== 'undefined') {
@@ -32,6 +33,7 @@ interface GroqResponse {
     completion_tokens: number,
     total_tokens: number
   };
+  call?: LLMCall; // Handle for llmParse
 }
 
 interface InterviewQuestion {
@@ -242,9 +244,11 @@ export class OptimizedAIService {
       throw new Error('Groq API key not configured');
     }
 
+    const call = new LLMCall('groq', request.model || this.groqModel);
     try {
       console.log('🚀 Calling Groq API with model:', request.model || this.groqModel);
       
+      call.sent();
       const chatCompletion = await this.groq.chat.completions.create({
         messages: request.messages as any,
         model: request.model || this.groqModel,
@@ -253,6 +257,7 @@ export class OptimizedAIService {
       });
 
       const content = chatCompletion.choices[0]?.message?.content || '';
+      call.received(chatCompletion.usage, promptText(request.messages), content);
       console.log('✅ Groq API response received');
       
       return {
@@ -263,9 +268,11 @@ export class OptimizedAIService {
           prompt_tokens: chatCompletion.usage.prompt_tokens,
           completion_tokens: chatCompletion.usage.completion_tokens,
           total_tokens: chatCompletion.usage.total_tokens
-        } : undefined
+        } : undefined,
+        call
       };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Groq API call failed:', error);
       throw error;
     }
@@ -276,28 +283,36 @@ export class OptimizedAIService {
       throw new Error('Gemini API key not configured');
     }
 
+    const call = new LLMCall('gemini', 'gemini-1.5-flash');
     try {
       console.log('🔄 Calling Gemini API...');
       
       const { GoogleGenerativeAI } = await import('@google/generative-ai');
       const genAI = new GoogleGenerativeAI(this.geminiApiKey);
-      const model = genAI.getGenerativeModel({ model: 'gemini-1.5-flash' });
+      const model = genAI.getGenerativeModel(
+        { model: 'gemini-1.5-flash' },
+        process.env.GEMINI_BASE_URL ? { baseUrl: process.env.GEMINI_BASE_URL } : undefined
+      );
 
       // Convert messages to Gemini format
       const prompt = messages.map(msg => `${msg.role}: ${msg.content}`).join('\n\n');
       
+      call.sent();
       const result = await model.generateContent(prompt);
       const response = await result.response;
       const text = response.text();
+      call.received(response.usageMetadata, prompt, text);
       
       console.log('✅ Gemini API response received');
       
       return {
         content: text,
         provider: 'gemini',
-        model: 'gemini-1.5-flash'
+        model: 'gemini-1.5-flash',
+        call
       };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Gemini API call failed:', error);
       throw error;
     }
@@ -367,7 +382,7 @@ Return ONLY a valid JSON array:
         temperature: 0.8
       });
 
-      const questions = extractJSON(response.content);
+      const questions = llmParse(response.call, () => extractJSON(response.content));
       
       if (!Array.isArray(questions)) {
         throw new Error('Invalid JSON response format');
@@ -460,7 +475,7 @@ Return ONLY a valid JSON array:
         temperature: 0.7
       });
 
-      const problems = extractJSON(response.content);
+      const problems = llmParse(response.call, () => extractJSON(response.content));
       
       if (!Array.isArray(problems)) {
         throw new Error('Invalid JSON response format');
@@ -491,7 +506,8 @@ Return ONLY a valid JSON array:
     userAnswer: string,
     expectedAnswer: string,
     category: string,
-    companyContext: string
+    companyContext: string,
+    options: { strict?: boolean } = {} // strict: throw instead of returning the fallback analysis
   ): Promise<{
     score: number,
     feedback: string,
@@ -545,7 +561,7 @@ Consider:
         temperature: 0.5
       });
 
-      const analysis = extractJSON(response.content);
+      const analysis = llmParse(response.call, () => extractJSON(response.content));
       
       return {
         score: Math.max(0, Math.min(10, analysis.score || 5)),
@@ -556,6 +572,7 @@ Consider:
       };
     } catch (error) {
       console.error('❌ Error analyzing response:', error);
+      if (options.strict) throw error;
       return this.generateFallbackAnalysis(userAnswer, companyContext);
     }
   }
@@ -627,7 +644,7 @@ Return ONLY valid JSON:
         temperature: 0.3
       });
 
-      return extractJSON(response.content);
+      return llmParse(response.call, () => extractJSON(response.content));
     } catch (error) {
       console.error('❌ Error analyzing overall performance:', error);
       return this.generateFallbackOverallAnalysis(questions, answers, companyName);
@@ -744,7 +761,7 @@ Return ONLY valid JSON:
     return problems;
   }
 
-  private generateFallbackAnalysis(userAnswer: string, companyContext: string) {
+  public generateFallbackAnalysis(userAnswer: string, companyContext: string) {
     const wordCount = userAnswer.split(' ').length;
     const score = Math.max(0, Math.min(10, wordCount / 15));
     
@@ -6,6 +6,7 @@
 
 import Groq from 'groq-sdk';
 import { extractJSON } from './jsonExtractor';
+import { LLMCall, LLMReply, llmParse, promptText } from './llmUsage';
 
 const groqApiKey = process.env.GROQ_API_KEY || process.env.NEXT_PUBLIC_GROQ_API_KEY || '';
 
@@ -50,8 +51,10 @@ export class OptimizedFeedbackService {
     return OptimizedFeedbackService.instance;
   }
 
-  private async callGroqAPI(messages: any[], maxTokens: number = 2000): Promise<string> {
+  private async callGroqAPI(messages: any[], maxTokens: number = 2000): Promise<LLMReply> {
+    const call = new LLMCall('groq', this.model);
     try {
+      call.sent();
       const chatCompletion = await this.groq.chat.completions.create({
         messages: messages,
         model: this.model,
@@ -59,8 +62,11 @@ export class OptimizedFeedbackService {
         temperature: 0.3;
       });
 
-      return chatCompletion.choices[0]?.message?.content || '';
+      const content = chatCompletion.choices[0]?.message?.content || '';
+      call.received(chatCompletion.usage, promptText(messages), content);
+      return { content, call };
     } catch (error) {
+      call.failed(error);
       console.error('❌ Groq API call failed for feedback:', error);
       throw error;
     }
@@ -94,12 +100,12 @@ export class OptimizedFeedbackService {
     `;
 
     try {
-      const response = await this.callGroqAPI([
+      const { content: response, call } = await this.callGroqAPI([
         { role: 'system', content: systemMessage },
         { role: 'user', content: userMessage }
       ], 1000);
 
-      const feedback = extractJSON(response);
+      const feedback = llmParse(call, () => extractJSON(response));
       return {
         score: Math.max(0, Math.min(10, feedback.score || 5)),
         feedback: feedback.feedback || 'Response evaluated successfully.',
@@ -150,12 +156,12 @@ export class OptimizedFeedbackService {
     `;
 
     try {
-      const response = await this.callGroqAPI([
+      const { content: response, call } = await this.callGroqAPI([
         { role: 'system', content: systemMessage },
         { role: 'user', content: prompt }
       ], 1500);
 
-      const analysis = extractJSON(response);
+      const analysis = llmParse(call, () => extractJSON(response));
       
       return {
         overallScore: Math.max(0, Math.min(10, analysis.overallScore || 5)),
@@ -1,12 +1,14 @@
-// const pdfParse = require('pdf-parse')
+import PdfWorkerPool from './pdfWorkerPool';
 
+export { PdfParseError } from './pdfWorkerPool';
+
+// Parsing runs on the PDF worker pool so large resumes do not block other requests
 export const extractTextFromPDF = async (buffer: Buffer): Promise<string> => {
   try {
-    const pdfParse = (await import('pdf-parse')).default;
-    const data = await pdfParse(buffer);  // works with default import fix
+    const data = await PdfWorkerPool.getInstance().parse(buffer);
     return data.text;
   } catch (error) {
     console.error("PDF parsing error:", error);
     throw error;
   }
-};
\ No newline at end of file
+};
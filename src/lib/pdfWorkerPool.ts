@@ -0,0 +1,202 @@
+/**
+ * PDF Worker Pool
+ * Parses PDFs on a bounded pool of worker threads so a large resume never blocks
+ * the request event loop. Jobs wait in a bounded queue, have a per-job timeout
+ * (the worker is terminated and replaced) and are capped by size and page count.
+ */
+
+import os from 'os';
+import { Worker } from 'worker_threads';
+
+export type PdfParseErrorCode = 'too_large' | 'queue_full' | 'timeout' | 'parse_failed';
+
+const ERROR_STATUS: Record<PdfParseErrorCode, number> = {
+  too_large: 413,
+  queue_full: 503,
+  timeout: 422,
+  parse_failed: 400
+};
+
+export class PdfParseError extends Error {
+  public readonly status: number;
+
+  constructor(public readonly code: PdfParseErrorCode, message: string) {
+    super(message);
+    this.name = 'PdfParseError';
+    this.status = ERROR_STATUS[code];
+  }
+}
+
+export interface PdfParseResult {
+  text: string;
+  numpages: number;
+}
+
+interface PdfJob {
+  id: number;
+  data: Uint8Array;
+  maxPages: number;
+  enqueuedAt: number;
+  resolve: (result: PdfParseResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  job: PdfJob | null;
+  timer: NodeJS.Timeout | null;
+  startedAt: number;
+}
+
+// Evaluated inline so the worker does not depend on where the bundler places files.
+// lib/pdf-parse.js is required directly to skip the package's debug entry point.
+const WORKER_SOURCE = `
+const { parentPort } = require('worker_threads');
+const pdfParse = require('pdf-parse/lib/pdf-parse.js');
+parentPort.on('message', ({ id, data, maxPages }) => {
+  pdfParse(Buffer.from(data.buffer, data.byteOffset, data.byteLength), { max: maxPages })
+    .then(result => parentPort.postMessage({ id, text: result.text, numpages: result.numpages }))
+    .catch(error => parentPort.postMessage({ id, error: (error && error.message) || String(error) }));
+});
+`;
+
+export class PdfWorkerPool {
+  private static instance: PdfWorkerPool;
+  private workers: PoolWorker[] = [];
+  private queue: PdfJob[] = [];
+  private nextJobId = 1;
+  private stats = { completed: 0, failed: 0, timedOut: 0, rejected: 0, totalParseMs: 0, totalQueueMs: 0 };
+
+  private readonly size = parseInt(process.env.PDF_WORKERS || String(Math.min(4, Math.max(1, os.cpus().length - 1))));
+  private readonly maxQueue = parseInt(process.env.PDF_QUEUE_DEPTH || '32');
+  private readonly timeoutMs = parseInt(process.env.PDF_PARSE_TIMEOUT_MS || '15000');
+  private readonly maxBytes = parseInt(process.env.PDF_MAX_BYTES || String(10 * 1024 * 1024));
+  private readonly maxPages = parseInt(process.env.PDF_MAX_PAGES || '20');
+
+  private constructor() {
+    for (let i = 0; i < this.size; i++) {
+      this.workers.push(this.spawn());
+    }
+    console.log(`📄 PDF worker pool started: ${this.size} workers, queue depth ${this.maxQueue}`);
+  }
+
+  public static getInstance(): PdfWorkerPool {
+    if (!PdfWorkerPool.instance) {
+      PdfWorkerPool.instance = new PdfWorkerPool();
+    }
+    return PdfWorkerPool.instance;
+  }
+
+  /**
+   * Parse a PDF off the event loop; only the first maxPages pages are extracted
+   */
+  public parse(buffer: Buffer, maxPages: number = this.maxPages): Promise<PdfParseResult> {
+    if (buffer.length > this.maxBytes) {
+      this.stats.rejected++;
+      return Promise.reject(new PdfParseError('too_large', `PDF exceeds ${Math.round(this.maxBytes / 1024 / 1024)}MB limit`));
+    }
+    if (this.queue.length >= this.maxQueue) {
+      this.stats.rejected++;
+      return Promise.reject(new PdfParseError('queue_full', 'PDF parser is busy, please retry shortly'));
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({
+        id: this.nextJobId++,
+        // Copy so the transferred buffer never aliases Node's shared Buffer pool
+        data: new Uint8Array(buffer),
+        maxPages: Math.min(maxPages, this.maxPages),
+        enqueuedAt: Date.now(),
+        resolve,
+        reject
+      });
+      this.dispatch();
+    });
+  }
+
+  public getMetrics() {
+    const finished = this.stats.completed + this.stats.failed + this.stats.timedOut;
+    return {
+      workers: this.size,
+      busy: this.workers.filter(w => w.job).length,
+      queued: this.queue.length,
+      maxQueue: this.maxQueue,
+      timeoutMs: this.timeoutMs,
+      maxBytes: this.maxBytes,
+      maxPages: this.maxPages,
+      ...this.stats,
+      avgParseMs: finished > 0 ? this.stats.totalParseMs / finished : 0,
+      avgQueueMs: finished > 0 ? this.stats.totalQueueMs / finished : 0
+    };
+  }
+
+  private spawn(): PoolWorker {
+    const slot: PoolWorker = { worker: new Worker(WORKER_SOURCE, { eval: true }), job: null, timer: null, startedAt: 0 };
+
+    slot.worker.on('message', (message: { id: number; text?: string; numpages?: number; error?: string }) => {
+      const job = slot.job;
+      if (!job || job.id !== message.id) return;
+      if (message.error) {
+        this.finish(slot, 'failed');
+        job.reject(new PdfParseError('parse_failed', message.error));
+      } else {
+        this.finish(slot, 'completed');
+        job.resolve({ text: message.text || '', numpages: message.numpages || 0 });
+      }
+    });
+
+    // A crashed worker fails its job and is replaced
+    slot.worker.on('error', (error) => {
+      const job = slot.job;
+      this.replace(slot, 'failed');
+      job?.reject(new PdfParseError('parse_failed', error.message));
+    });
+
+    return slot;
+  }
+
+  private dispatch(): void {
+    for (const slot of this.workers) {
+      if (this.queue.length === 0) return;
+      if (slot.job) continue;
+
+      const job = this.queue.shift()!;
+      slot.job = job;
+      slot.startedAt = Date.now();
+      this.stats.totalQueueMs += slot.startedAt - job.enqueuedAt;
+
+      slot.timer = setTimeout(() => {
+        this.replace(slot, 'timedOut');
+        job.reject(new PdfParseError('timeout', `PDF parsing exceeded ${this.timeoutMs}ms`));
+      }, this.timeoutMs);
+
+      slot.worker.postMessage({ id: job.id, data: job.data, maxPages: job.maxPages }, [job.data.buffer]);
+    }
+  }
+
+  private finish(slot: PoolWorker, outcome: 'completed' | 'failed'): void {
+    if (slot.timer) clearTimeout(slot.timer);
+    this.stats.totalParseMs += Date.now() - slot.startedAt;
+    this.stats[outcome]++;
+    slot.job = null;
+    slot.timer = null;
+    this.dispatch();
+  }
+
+  private replace(slot: PoolWorker, outcome: 'failed' | 'timedOut'): void {
+    const hadJob = !!slot.job;
+    if (hadJob) this.stats.totalParseMs += Date.now() - slot.startedAt;
+    slot.worker.removeAllListeners();
+    slot.worker.terminate().catch(() => undefined);
+    const index = this.workers.indexOf(slot);
+    const fresh = this.spawn();
+    if (index >= 0) this.workers[index] = fresh;
+    if (slot.timer) clearTimeout(slot.timer);
+    slot.timer = null;
+    slot.job = null;
+    if (hadJob) this.stats[outcome]++;
+    this.dispatch();
+  }
+}
+
+export default PdfWorkerPool;
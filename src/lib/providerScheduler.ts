@@ -0,0 +1,331 @@
+/**
+ * LLM provider rate-limit scheduler
+ * Token buckets per provider (requests per minute and per day) shared by every caller
+ * in the process or, with the MongoDB store, by every worker process, so several
+ * workers no longer each assume they own the full free-tier quota. Callers wait in a
+ * priority queue (interactive work such as live answer analysis ahead of background
+ * generation) and each grant goes to the preferred provider while it still has
+ * headroom, otherwise to the one with the most, spreading load before a provider
+ * starts answering 429. A 429 empties that provider's bucket until Retry-After.
+ */
+
+import client from './db';
+
+export type SchedulerPriority = 'interactive' | 'background';
+
+export interface ProviderLimits {
+  name: string;
+  requestsPerMinute: number;
+  requestsPerDay: number;
+}
+
+export class RateLimitedError extends Error {
+  constructor(public provider: string, public retryAfterMs: number, message: string) {
+    super(message);
+    this.name = 'RateLimitedError';
+  }
+}
+
+export class SchedulerTimeoutError extends Error {
+  constructor(priority: SchedulerPriority, waitedMs: number) {
+    super(`No LLM provider capacity for ${priority} request after ${waitedMs}ms`);
+    this.name = 'SchedulerTimeoutError';
+  }
+}
+
+/**
+ * Retry-After as seconds or an HTTP date; defaults to 10s when absent
+ */
+export function retryAfterMs(header: string | null): number {
+  if (!header) return 10000;
+  const seconds = Number(header);
+  if (!Number.isNaN(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? 10000 : Math.max(0, date - Date.now());
+}
+
+interface BucketState {
+  granted: boolean;
+  tokens: number; // Tokens left after this take
+  waitMs: number; // Until the next token when not granted
+}
+
+export interface BucketStore {
+  readonly mode: 'memory' | 'mongo';
+  take(key: string, capacity: number, refillPerMs: number): Promise<BucketState>;
+  refund(key: string, capacity: number): Promise<void>;
+  block(key: string, untilMs: number): Promise<void>;
+}
+
+function waitFor(tokens: number, refillPerMs: number): number {
+  return tokens >= 1 ? 0 : Math.ceil((1 - tokens) / refillPerMs);
+}
+
+export class MemoryBucketStore implements BucketStore {
+  readonly mode = 'memory' as const;
+  private buckets: Map<string, { tokens: number; updatedAt: number }> = new Map();
+
+  async take(key: string, capacity: number, refillPerMs: number): Promise<BucketState> {
+    const now = Date.now();
+    const bucket = this.buckets.get(key) ?? { tokens: capacity, updatedAt: now };
+    // A blocked bucket has updatedAt in the future, which keeps tokens below zero until then
+    const tokens = Math.min(capacity, bucket.tokens + (now - bucket.updatedAt) * refillPerMs);
+    const granted = tokens >= 1;
+    const left = granted ? tokens - 1 : tokens;
+    this.buckets.set(key, { tokens: left, updatedAt: now });
+    return { granted, tokens: left, waitMs: granted ? 0 : waitFor(tokens, refillPerMs) };
+  }
+
+  async refund(key: string, capacity: number): Promise<void> {
+    const bucket = this.buckets.get(key);
+    if (bucket) bucket.tokens = Math.min(capacity, bucket.tokens + 1);
+  }
+
+  async block(key: string, untilMs: number): Promise<void> {
+    this.buckets.set(key, { tokens: 0, updatedAt: untilMs });
+  }
+}
+
+/**
+ * Buckets as documents updated atomically with a pipeline update, so concurrent takes
+ * from any number of processes never hand out the same token twice
+ */
+export class MongoBucketStore implements BucketStore {
+  readonly mode = 'mongo' as const;
+
+  constructor(private collectionName = 'llm_rate_buckets') {}
+
+  private collection() {
+    return client.db().collection<{ _id: string; tokens: number; updatedAt: Date; granted?: boolean }>(this.collectionName);
+  }
+
+  async take(key: string, capacity: number, refillPerMs: number): Promise<BucketState> {
+    const now = new Date();
+    const doc = await this.collection().findOneAndUpdate(
+      { _id: key },
+      [
+        {
+          $set: {
+            tokens: {
+              $min: [capacity, {
+                $add: [
+                  { $ifNull: ['$tokens', capacity] },
+                  { $multiply: [{ $subtract: [now, { $ifNull: ['$updatedAt', now] }] }, refillPerMs] }
+                ]
+              }]
+            },
+            updatedAt: now
+          }
+        },
+        { $set: { granted: { $gte: ['$tokens', 1] } } },
+        { $set: { tokens: { $cond: ['$granted', { $subtract: ['$tokens', 1] }, '$tokens'] } } }
+      ],
+      { upsert: true, returnDocument: 'after' }
+    );
+
+    const granted = !!doc?.granted;
+    const tokens = doc?.tokens ?? 0;
+    return { granted, tokens, waitMs: granted ? 0 : waitFor(tokens, refillPerMs) };
+  }
+
+  async refund(key: string, capacity: number): Promise<void> {
+    await this.collection().updateOne(
+      { _id: key },
+      [{ $set: { tokens: { $min: [capacity, { $add: [{ $ifNull: ['$tokens', capacity] }, 1] }] } } }]
+    );
+  }
+
+  async block(key: string, untilMs: number): Promise<void> {
+    await this.collection().updateOne(
+      { _id: key },
+      { $set: { tokens: 0, updatedAt: new Date(untilMs) } },
+      { upsert: true }
+    );
+  }
+}
+
+interface Waiter {
+  priority: SchedulerPriority;
+  exclude: string[];
+  enqueuedAt: number;
+  resolve: (provider: string) => void;
+  reject: (error: Error) => void;
+}
+
+export interface SchedulerOptions {
+  maxWaitMs: Record<SchedulerPriority, number>;
+  spreadThreshold: number; // Leave the preferred provider once its minute headroom drops below this share
+}
+
+const MINUTE_MS = 60000;
+const DAY_MS = 86400000;
+
+export class ProviderScheduler {
+  private queue: Waiter[] = [];
+  private pumping = false;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private fallbackStore = new MemoryBucketStore();
+  private headroom: Map<string, number> = new Map(); // Last seen minute tokens / capacity
+  private stats = {
+    granted: {} as Record<string, number>,
+    rateLimited: {} as Record<string, number>,
+    waitMs: { interactive: 0, background: 0 },
+    grants: { interactive: 0, background: 0 },
+    timeouts: 0,
+    storeErrors: 0
+  };
+
+  constructor(private providers: ProviderLimits[], private store: BucketStore, private options: SchedulerOptions) {}
+
+  /**
+   * Wait for a token and resolve with the provider it was granted on; providers in
+   * exclude (e.g. ones that already failed this request) are skipped
+   */
+  acquire(priority: SchedulerPriority, exclude: string[] = []): Promise<string> {
+    if (this.providers.every(p => exclude.includes(p.name))) {
+      return Promise.reject(new Error('No LLM provider left to try'));
+    }
+
+    return new Promise((resolve, reject) => {
+      const waiter: Waiter = { priority, exclude, enqueuedAt: Date.now(), resolve, reject };
+      const firstBackground = this.queue.findIndex(w => w.priority === 'background');
+      if (priority === 'interactive' && firstBackground !== -1) {
+        this.queue.splice(firstBackground, 0, waiter);
+      } else {
+        this.queue.push(waiter);
+      }
+      void this.pump();
+    });
+  }
+
+  /**
+   * The provider answered 429: no grants on it until Retry-After has passed
+   */
+  penalize(provider: string, retryAfter: number): void {
+    this.stats.rateLimited[provider] = (this.stats.rateLimited[provider] || 0) + 1;
+    this.headroom.set(provider, 0);
+    this.store.block(`${provider}:minute`, Date.now() + retryAfter).catch(error => {
+      this.stats.storeErrors++;
+      console.warn(`⚠️ Could not record ${provider} rate limit in ${this.store.mode} store:`, error);
+    });
+  }
+
+  hasHeadroom(provider: string): boolean {
+    return (this.headroom.get(provider) ?? 1) > 0;
+  }
+
+  getMetrics() {
+    return {
+      mode: this.store.mode,
+      queued: {
+        interactive: this.queue.filter(w => w.priority === 'interactive').length,
+        background: this.queue.filter(w => w.priority === 'background').length
+      },
+      providers: Object.fromEntries(this.providers.map(p => [p.name, {
+        ...p,
+        granted: this.stats.granted[p.name] || 0,
+        rateLimited: this.stats.rateLimited[p.name] || 0,
+        headroom: this.headroom.get(p.name) ?? 1
+      }])),
+      avgWaitMs: {
+        interactive: this.stats.grants.interactive ? this.stats.waitMs.interactive / this.stats.grants.interactive : 0,
+        background: this.stats.grants.background ? this.stats.waitMs.background / this.stats.grants.background : 0
+      },
+      timeouts: this.stats.timeouts,
+      storeErrors: this.stats.storeErrors
+    };
+  }
+
+  private async pump(): Promise<void> {
+    if (this.pumping) return;
+    this.pumping = true;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+
+    try {
+      this.expireWaiters();
+      while (this.queue.length > 0) {
+        const waiter = this.queue[0];
+        const grant = await this.tryGrant(this.providers.filter(p => !waiter.exclude.includes(p.name)));
+        if (grant.provider) {
+          this.queue.shift();
+          this.stats.granted[grant.provider] = (this.stats.granted[grant.provider] || 0) + 1;
+          this.stats.grants[waiter.priority]++;
+          this.stats.waitMs[waiter.priority] += Date.now() - waiter.enqueuedAt;
+          waiter.resolve(grant.provider);
+          continue;
+        }
+
+        // The head of the queue waits for the next token, and everyone behind it with it
+        this.timer = setTimeout(() => {
+          this.timer = null;
+          void this.pump();
+        }, Math.min(Math.max(grant.waitMs, 10), 1000));
+        break;
+      }
+    } finally {
+      this.pumping = false;
+    }
+  }
+
+  private expireWaiters(): void {
+    const now = Date.now();
+    this.queue = this.queue.filter(waiter => {
+      const waited = now - waiter.enqueuedAt;
+      if (waited <= this.options.maxWaitMs[waiter.priority]) return true;
+      this.stats.timeouts++;
+      waiter.reject(new SchedulerTimeoutError(waiter.priority, waited));
+      return false;
+    });
+  }
+
+  private async tryGrant(candidates: ProviderLimits[]): Promise<{ provider: string | null; waitMs: number }> {
+    const headroom = (p: ProviderLimits) => this.headroom.get(p.name) ?? 1;
+    const preferred = candidates.find(p => headroom(p) >= this.options.spreadThreshold);
+    const byHeadroom = [...candidates].sort((a, b) => headroom(b) - headroom(a));
+    const ordered = preferred ? [preferred, ...byHeadroom.filter(p => p !== preferred)] : byHeadroom;
+
+    let waitMs = Infinity;
+    for (const provider of ordered) {
+      const minute = await this.take(`${provider.name}:minute`, provider.requestsPerMinute, provider.requestsPerMinute / MINUTE_MS);
+      this.headroom.set(provider.name, Math.max(0, minute.tokens) / provider.requestsPerMinute);
+      if (!minute.granted) {
+        waitMs = Math.min(waitMs, minute.waitMs);
+        continue;
+      }
+
+      const day = await this.take(`${provider.name}:day`, provider.requestsPerDay, provider.requestsPerDay / DAY_MS);
+      if (!day.granted) {
+        // Out of daily quota: give back the minute token so retries do not drain it
+        await this.refund(`${provider.name}:minute`, provider.requestsPerMinute);
+        this.headroom.set(provider.name, 0);
+        waitMs = Math.min(waitMs, day.waitMs);
+        continue;
+      }
+      return { provider: provider.name, waitMs: 0 };
+    }
+    return { provider: null, waitMs };
+  }
+
+  private async take(key: string, capacity: number, refillPerMs: number): Promise<BucketState> {
+    try {
+      return await this.store.take(key, capacity, refillPerMs);
+    } catch (error) {
+      // Shared store unavailable: keep serving from this process's own buckets
+      this.stats.storeErrors++;
+      console.warn(`⚠️ ${this.store.mode} rate-limit store failed, using in-process buckets:`, error);
+      return this.fallbackStore.take(key, capacity, refillPerMs);
+    }
+  }
+
+  private async refund(key: string, capacity: number): Promise<void> {
+    try {
+      await this.store.refund(key, capacity);
+    } catch (error) {
+      this.stats.storeErrors++;
+      await this.fallbackStore.refund(key, capacity);
+    }
+  }
+}
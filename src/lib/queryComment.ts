@@ -0,0 +1,21 @@
+/**
+ * Query comment tagging for profiler attribution
+ * The benchmark harness sends an `x-correlation-id` header; routes forward it as the
+ * MongoDB `comment` option so profiler entries can be traced back to the API route.
+ */
+
+export const CORRELATION_HEADER = 'x-correlation-id';
+
+export interface QueryOptions {
+  comment?: string;
+}
+
+export function getQueryOptions(request: Request, route: string): QueryOptions {
+  const correlationId = request.headers.get(CORRELATION_HEADER);
+  if (!correlationId) {
+    return {};
+  }
+
+  // Comment format: "<route>|<correlationId>" - parsed by mongo_profiler.py
+  return { comment: `${route}|${correlationId.slice(0, 128)}` };
+}
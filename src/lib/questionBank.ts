@@ -0,0 +1,253 @@
+/**
+ * Generated question bank
+ * Keeps validated LLM-generated questions, with their difficulty, points and time
+ * limit, indexed by (company, role, level, category), so a new interview for a
+ * combination seen before draws its set from MongoDB instead of waiting on the LLM.
+ * Every user gets questions they have not been served before (served records expire
+ * after QUESTION_BANK_SERVED_TTL_DAYS), sampled at random, and
+ * combinations that run low are topped up by a background generation.
+ */
+
+import { createHash } from 'crypto';
+import { MongoBulkWriteError } from 'mongodb';
+import client from './db';
+import JobQueue, { JobQueueFullError } from './jobQueue';
+import { isValidQuestion } from './questionStream';
+
+export interface BankKey {
+  company: string;
+  role: string;
+  level: string;
+}
+
+export type QuestionMix = Record<string, number>; // category -> questions per interview
+
+const BANK_COLLECTION = 'question_bank';
+const SERVED_COLLECTION = 'question_bank_served';
+// A user may be served a question again once its served record expires
+const SERVED_TTL_SECONDS = parseInt(process.env.QUESTION_BANK_SERVED_TTL_DAYS || '180') * 24 * 60 * 60;
+// Rounds of redrawing questions a concurrent draw for the same user claimed first
+const DRAW_ATTEMPTS = 3;
+
+function normalizeDimension(value: string | undefined, fallback: string): string {
+  return (value || fallback).toLowerCase().replace(/\s+/g, ' ').trim();
+}
+
+export function bankKey(companyName: string, jobTitle: string | undefined, experienceLevel: string | undefined): BankKey {
+  return {
+    company: normalizeDimension(companyName, 'general'),
+    role: normalizeDimension(jobTitle, 'software engineer'),
+    level: normalizeDimension(experienceLevel, 'mid')
+  };
+}
+
+/**
+ * Questions per category an interview of this type is made of
+ */
+export function interviewMix(interviewType: string): QuestionMix {
+  switch (interviewType) {
+    case 'mixed': return { technical: 6, behavioral: 4, aptitude: 4, dsa: 2 };
+    case 'dsa': return { dsa: 2 };
+    case 'behavioral': return { behavioral: 10 };
+    case 'aptitude': return { aptitude: 15 };
+    default: return { technical: 12 };
+  }
+}
+
+/**
+ * Only real generations go into the bank: canned questions are marked with a fallback
+ * provider where they are produced. Ids are the model's own and say nothing.
+ */
+export function isBankable(question: any): boolean {
+  return isValidQuestion(question) && !/fallback/i.test(String(question.provider || ''));
+}
+
+function fingerprint(question: any): string {
+  const text = String(question.question).toLowerCase().replace(/\s+/g, ' ').trim();
+  return createHash('sha256').update(text).digest('hex').slice(0, 32);
+}
+
+export class QuestionBank {
+  private indexesEnsured = false;
+  private refills = new JobQueue<number>({
+    name: 'question-bank-refill',
+    concurrency: parseInt(process.env.QUESTION_BANK_REFILL_CONCURRENCY || '1'),
+    maxQueue: parseInt(process.env.QUESTION_BANK_REFILL_QUEUE_DEPTH || '20'),
+    retentionMs: 10 * 60 * 1000
+  });
+  private stats = { draws: 0, hits: 0, misses: 0, servedQuestions: 0, deposited: 0, duplicates: 0, rejected: 0, refillsQueued: 0, refillsSkipped: 0, errors: 0 };
+
+  constructor(private targetMultiple: number) {}
+
+  private bank() {
+    return client.db().collection(BANK_COLLECTION);
+  }
+
+  private served() {
+    return client.db().collection(SERVED_COLLECTION);
+  }
+
+  private async ensureIndexes(): Promise<void> {
+    if (this.indexesEnsured) return;
+    await Promise.all([
+      this.bank().createIndex({ company: 1, role: 1, level: 1, category: 1, fingerprint: 1 }, { unique: true }),
+      this.served().createIndex({ userId: 1, company: 1, role: 1, level: 1, category: 1 }),
+      this.served().createIndex({ userId: 1, bankId: 1 }, { unique: true }),
+      this.served().createIndex({ servedAt: 1 }, { expireAfterSeconds: SERVED_TTL_SECONDS })
+    ]);
+    this.indexesEnsured = true;
+  }
+
+  /**
+   * A fresh random set for this user with the given mix, or null when the bank cannot
+   * fill every category with questions the user has not seen
+   */
+  async draw(key: BankKey, mix: QuestionMix, userId: string): Promise<any[] | null> {
+    this.stats.draws++;
+    const docs: any[] = [];
+    try {
+      await this.ensureIndexes();
+      const now = new Date();
+      let wanted = Object.entries(mix);
+      for (let attempt = 0; attempt < DRAW_ATTEMPTS && wanted.length > 0; attempt++) {
+        const picks = await Promise.all(wanted.map(async ([category, count]) => {
+          const seen = await this.served().distinct('bankId', { userId, ...key, category });
+          return this.bank().aggregate([
+            { $match: { ...key, category, _id: { $nin: seen } } },
+            { $sample: { size: count } }
+          ]).toArray().then(found => ({ count, found }));
+        }));
+        if (picks.some(pick => pick.found.length < pick.count)) break;
+
+        // Claimed questions are final; ones a concurrent draw claimed first are redrawn
+        const drawn = picks.flatMap(pick => pick.found);
+        const rejected = await this.claim(userId, key, drawn, now);
+        docs.push(...drawn.filter(doc => !rejected.includes(doc)));
+        const short: Record<string, number> = {};
+        rejected.forEach(doc => { short[doc.category] = (short[doc.category] || 0) + 1; });
+        wanted = Object.entries(short);
+      }
+
+      if (wanted.length > 0) {
+        this.stats.misses++;
+        await this.release(userId, docs);
+        return null;
+      }
+
+      await this.bank().updateMany({ _id: { $in: docs.map(doc => doc._id) } }, { $inc: { servedCount: 1 }, $set: { lastServedAt: now } });
+
+      this.stats.hits++;
+      this.stats.servedQuestions += docs.length;
+      return docs.map(doc => ({ ...doc.question, id: `bank-${doc._id}`, bankId: doc._id.toString() }));
+    } catch (error) {
+      this.stats.errors++;
+      console.error('❌ Question bank draw failed:', error);
+      await this.release(userId, docs).catch(() => undefined);
+      return null;
+    }
+  }
+
+  /**
+   * Record docs as served to the user; returns those already recorded, which a
+   * concurrent draw for the same user got to first
+   */
+  private async claim(userId: string, key: BankKey, docs: any[], now: Date): Promise<any[]> {
+    try {
+      await this.served().insertMany(
+        docs.map(doc => ({ userId, bankId: doc._id, ...key, category: doc.category, servedAt: now })),
+        { ordered: false }
+      );
+      return [];
+    } catch (error) {
+      const writeErrors = error instanceof MongoBulkWriteError ? [error.writeErrors].flat() : [];
+      if (writeErrors.length === 0 || writeErrors.some(writeError => writeError.code !== 11000)) throw error;
+      const rejected = new Set(writeErrors.map(writeError => writeError.index));
+      return docs.filter((_, index) => rejected.has(index));
+    }
+  }
+
+  // Undo the claims of a draw that ends up a miss, so those questions stay unseen
+  private async release(userId: string, docs: any[]): Promise<void> {
+    if (docs.length === 0) return;
+    await this.served().deleteMany({ userId, bankId: { $in: docs.map(doc => doc._id) } });
+  }
+
+  /**
+   * Add generated questions under the key; repeats of a stored question are skipped.
+   * Returns how many were new.
+   */
+  async deposit(key: BankKey, questions: any[]): Promise<number> {
+    const bankable = questions.filter(isBankable);
+    this.stats.rejected += questions.length - bankable.length;
+    if (bankable.length === 0) return 0;
+
+    await this.ensureIndexes();
+    const now = new Date();
+    const result = await this.bank().bulkWrite(bankable.map(question => {
+      const { bankId, ...stored } = question;
+      return {
+        updateOne: {
+          filter: { ...key, category: question.category, fingerprint: fingerprint(question) },
+          update: { $setOnInsert: { question: stored, difficulty: question.difficulty, servedCount: 0, createdAt: now } },
+          upsert: true
+        }
+      };
+    }), { ordered: false });
+
+    this.stats.deposited += result.upsertedCount;
+    this.stats.duplicates += bankable.length - result.upsertedCount;
+    return result.upsertedCount;
+  }
+
+  /**
+   * Queue a background generation when any category of the mix holds fewer than
+   * targetMultiple interviews' worth of questions. One refill per key at a time.
+   */
+  async scheduleRefill(key: BankKey, mix: QuestionMix, generate: () => Promise<any[]>): Promise<boolean> {
+    try {
+      await this.ensureIndexes();
+      const low = await Promise.all(Object.entries(mix).map(async ([category, count]) =>
+        (await this.bank().countDocuments({ ...key, category })) < count * this.targetMultiple));
+      if (!low.some(Boolean)) return false;
+
+      const { deduplicated } = this.refills.enqueue(
+        `${key.company}|${key.role}|${key.level}|${Object.keys(mix).sort().join(',')}`,
+        async () => {
+          const added = await this.deposit(key, await generate());
+          console.log(`🏦 Question bank refilled ${key.company} / ${key.role} / ${key.level} with ${added} new questions`);
+          return added;
+        }
+      );
+      if (!deduplicated) this.stats.refillsQueued++;
+      return true;
+    } catch (error) {
+      if (error instanceof JobQueueFullError) {
+        this.stats.refillsSkipped++;
+      } else {
+        this.stats.errors++;
+        console.error('❌ Question bank refill check failed:', error);
+      }
+      return false;
+    }
+  }
+
+  async getMetrics() {
+    let size: number | null = null;
+    try {
+      size = await this.bank().estimatedDocumentCount();
+    } catch {
+      // Metrics stay available without the database
+    }
+    return {
+      size,
+      targetMultiple: this.targetMultiple,
+      ...this.stats,
+      hitRate: this.stats.draws ? this.stats.hits / this.stats.draws : 0,
+      refillQueue: this.refills.getMetrics()
+    };
+  }
+}
+
+export const questionBankEnabled = process.env.QUESTION_BANK_ENABLED !== 'false';
+
+export const questionBank = new QuestionBank(parseInt(process.env.QUESTION_BANK_TARGET_MULTIPLE || '4'));
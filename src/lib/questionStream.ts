@@ -0,0 +1,125 @@
+/**
+ * Progressive question streaming
+ * Question sets are generated as independent sections (technical, behavioral, DSA, ...)
+ * that run concurrently. In streaming mode every question is written to the client as
+ * soon as its section returns and it passes validation, as NDJSON or Server-Sent
+ * Events, so an interview can start on the first question instead of the slowest call.
+ */
+
+export interface QuestionSection {
+  category: string;
+  generate: () => Promise<any[]>;
+}
+
+export type StreamFormat = 'ndjson' | 'sse';
+
+export interface StreamCompletion {
+  questions: any[]; // All valid questions in section order
+  rejected: number;
+}
+
+/**
+ * Streaming is requested with "stream": true in the body or by accepting
+ * application/x-ndjson or text/event-stream; returns null for a regular JSON reply
+ */
+export function requestedStreamFormat(accept: string | null, body: any): StreamFormat | null {
+  if (accept?.includes('text/event-stream')) return 'sse';
+  if (accept?.includes('application/x-ndjson') || body?.stream === true) return 'ndjson';
+  return null;
+}
+
+export function isValidQuestion(question: any): boolean {
+  return !!question &&
+    typeof question.question === 'string' &&
+    question.question.trim().length > 0 &&
+    !!question.category;
+}
+
+/**
+ * Run all sections concurrently and return the valid questions in section order
+ */
+export async function generateSections(sections: QuestionSection[]): Promise<StreamCompletion> {
+  const results = await Promise.all(sections.map(section => section.generate()));
+  const all = results.flat();
+  const questions = all.filter(isValidQuestion);
+  return { questions, rejected: all.length - questions.length };
+}
+
+function encodeEvent(format: StreamFormat, type: string, data: any): Uint8Array {
+  const json = JSON.stringify({ type, ...data });
+  return new TextEncoder().encode(format === 'sse' ? `event: ${type}\ndata: ${json}\n\n` : `${json}\n`);
+}
+
+/**
+ * Stream questions section by section as they complete. Events:
+ *   question  { index, section, question }   one per valid question, in arrival order
+ *   section   { section, count, rejected, ms }
+ *   done      { ...whatever onComplete returns }
+ *   error     { error }
+ * onComplete receives the full set (section order) once every section has finished,
+ * e.g. to persist it, even if the client has already disconnected.
+ */
+export function streamQuestionSections(
+  sections: QuestionSection[],
+  format: StreamFormat,
+  onComplete: (completion: StreamCompletion) => Promise<Record<string, any>>
+): Response {
+  const startedAt = Date.now();
+  let closed = false;
+
+  const stream = new ReadableStream<Uint8Array>({
+    async start(controller) {
+      const send = (type: string, data: any) => {
+        if (closed) return;
+        try {
+          controller.enqueue(encodeEvent(format, type, data));
+        } catch {
+          closed = true;
+        }
+      };
+
+      const bySection: any[][] = sections.map(() => []);
+      let index = 0;
+      let rejected = 0;
+
+      try {
+        await Promise.all(sections.map(async (section, position) => {
+          const generated = await section.generate();
+          const valid = generated.filter(isValidQuestion);
+          bySection[position] = valid;
+          rejected += generated.length - valid.length;
+          valid.forEach(question => send('question', { index: index++, section: section.category, question }));
+          send('section', {
+            section: section.category,
+            count: valid.length,
+            rejected: generated.length - valid.length,
+            ms: Date.now() - startedAt
+          });
+        }));
+
+        const summary = await onComplete({ questions: bySection.flat(), rejected });
+        send('done', { ...summary, ms: Date.now() - startedAt });
+      } catch (error) {
+        console.error('❌ Question stream failed:', error);
+        send('error', { error: 'Failed to generate questions: ' + (error instanceof Error ? error.message : String(error)) });
+      }
+
+      if (!closed) {
+        closed = true;
+        controller.close();
+      }
+    },
+    cancel() {
+      // Client went away; generation continues so the set is still stored
+      closed = true;
+    }
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': format === 'sse' ? 'text/event-stream' : 'application/x-ndjson',
+      'Cache-Control': 'no-cache, no-transform',
+      'X-Accel-Buffering': 'no'
+    }
+  });
+}
@@ -0,0 +1,104 @@
+/**
+ * Resume analysis store
+ * Analyses live in the resumeAnalyses collection tagged with a fingerprint of the
+ * extracted resume text plus target role, so a re-upload of the same resume for the
+ * same role is answered from the stored analysis instead of another LLM call. The
+ * history route reads the same collection through listAnalyses.
+ */
+
+import { createHash } from 'crypto';
+import client from './db';
+
+const COLLECTION = 'resumeAnalyses';
+
+// Bump when the analysis prompt or scoring changes so older analyses stop matching
+const ANALYSIS_VERSION = 'v1';
+
+let indexesEnsured: Promise<void> | null = null;
+const inFlight: Map<string, Promise<any>> = new Map();
+
+function collection() {
+  return client.db().collection(COLLECTION);
+}
+
+function ensureIndexes(): Promise<void> {
+  if (!indexesEnsured) {
+    indexesEnsured = (async () => {
+      await collection().createIndex({ userId: 1, fingerprint: 1, createdAt: -1 }, { name: 'userId_fingerprint_createdAt' });
+      await collection().createIndex({ userId: 1, createdAt: -1 }, { name: 'userId_createdAt' });
+    })().catch(error => {
+      indexesEnsured = null;
+      console.warn('⚠️ Resume analysis store: index creation failed', error);
+    });
+  }
+  return indexesEnsured;
+}
+
+// Whitespace differences between PDF extractions of the same file do not change the key; the role
+// is also matched case-insensitively, the resume text is not
+export function resumeFingerprint(text: string, targetRole: string): string {
+  const hash = createHash('sha256');
+  hash.update(ANALYSIS_VERSION);
+  hash.update('\0');
+  hash.update(targetRole.toLowerCase().replace(/\s+/g, ' ').trim());
+  hash.update('\0');
+  hash.update(text.replace(/\s+/g, ' ').trim());
+  return hash.digest('hex');
+}
+
+export async function findAnalysis(userId: string, fingerprint: string): Promise<any | null> {
+  await ensureIndexes();
+  return collection().findOne(
+    { userId, fingerprint },
+    { sort: { createdAt: -1 }, projection: { _id: 0 } }
+  );
+}
+
+/**
+ * Return the stored analysis for this fingerprint or run analyze() once and store it.
+ * Concurrent uploads of the same resume share a single analysis.
+ */
+export async function getOrAnalyze(
+  userId: string,
+  fingerprint: string,
+  analyze: () => Promise<Record<string, any>>
+): Promise<{ analysis: any; cached: boolean }> {
+  const existing = await findAnalysis(userId, fingerprint);
+  if (existing) {
+    return { analysis: existing, cached: true };
+  }
+
+  const key = `${userId}:${fingerprint}`;
+  const pending = inFlight.get(key);
+  if (pending) {
+    return { analysis: await pending, cached: true };
+  }
+
+  const run = (async () => {
+    const record = { ...(await analyze()), userId, fingerprint };
+    await collection().insertOne(record);
+    const { _id, ...stored } = record as any;
+    return stored;
+  })();
+
+  inFlight.set(key, run);
+  try {
+    return { analysis: await run, cached: false };
+  } finally {
+    inFlight.delete(key);
+  }
+}
+
+export async function listAnalyses(userId: string): Promise<any[]> {
+  await ensureIndexes();
+  const analyses = await collection()
+    .find({ userId })
+    .sort({ createdAt: -1 })
+    .toArray();
+
+  return analyses.map(analysis => ({
+    ...analysis,
+    _id: undefined,
+    id: analysis.id || analysis._id.toString()
+  }));
+}
@@ -0,0 +1,42 @@
+/**
+ * Server-Timing instrumentation
+ * Records named phases of a request plus the process memory delta across it and
+ * exposes them as response headers, so load harnesses can separate server-side
+ * processing from network time.
+ */
+
+import { NextResponse } from 'next/server';
+
+const KB = 1024;
+
+export class ServerTimer {
+  private start = performance.now();
+  private last = this.start;
+  private phases: Array<{ name: string; dur: number }> = [];
+  private memoryAtStart = process.memoryUsage();
+
+  // Close the current phase under the given name
+  mark(name: string): void {
+    const now = performance.now();
+    this.phases.push({ name, dur: now - this.last });
+    this.last = now;
+  }
+
+  apply<T extends Response | NextResponse>(response: T): T {
+    const total = performance.now() - this.start;
+    const metrics = [...this.phases, { name: 'total', dur: total }]
+      .map(phase => `${phase.name};dur=${phase.dur.toFixed(1)}`);
+    response.headers.set('Server-Timing', metrics.join(', '));
+
+    // Process-wide, so only indicative under concurrency; arrayBuffers tracks upload buffers
+    const memory = process.memoryUsage();
+    response.headers.set('X-Memory-Delta-KB', [
+      `rss=${Math.round((memory.rss - this.memoryAtStart.rss) / KB)}`,
+      `heap=${Math.round((memory.heapUsed - this.memoryAtStart.heapUsed) / KB)}`,
+      `arrayBuffers=${Math.round((memory.arrayBuffers - this.memoryAtStart.arrayBuffers) / KB)}`
+    ].join(';'));
+    return response;
+  }
+}
+
+export default ServerTimer;
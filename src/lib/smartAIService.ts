@@ -5,9 +5,11 @@
  * - Gemini for lightweight tasks (resume parsing, company search)
  */
 
-import EnhancedGroqAIService from './enhancedGroqAIService';
+import EnhancedGroqAIService, { GroqCallOptions } from './enhancedGroqAIService';
 import { GoogleGenerativeAI } from '@google/generative-ai';
 import { extractJSON } from './jsonExtractor';
+import { HedgeBudget, HedgeOutcome, hedgedRun, LatencyWindow } from './hedgedRequest';
+import { LLMCall, LLMReply, llmParse } from './llmUsage';
 
 export interface SmartAIRequest {
   task: 'question_generation' | 'response_analysis' | 'resume_parsing' | 'company_search' | 'performance_analysis' | 'dsa_generation' | 'aptitude_generation',
@@ -26,7 +28,8 @@ export interface SmartAIRequest {
     difficulty?: string,
     count?: number
   };
-  priority?: 'high' | 'medium' | 'low'
+  priority?: 'high' | 'medium' | 'low',
+  hedge?: boolean // Overrides SMART_AI_HEDGING for this request
 }
 
 export interface SmartAIResponse {
@@ -37,13 +40,36 @@ export interface SmartAIResponse {
   processingTime: number,
   taskType: string,
   features?: string[];
+  hedged?: boolean
 }
 
+// Per task: share of requests that may send a hedge, and the hedge delay used until
+// enough latencies have been seen. Tasks answered without a model call never hedge.
+const HEDGE_POLICIES: Record<SmartAIRequest['task'], { budget: number; initialDelayMs: number }> = {
+  question_generation: { budget: 0.1, initialDelayMs: 8000 },
+  dsa_generation: { budget: 0.1, initialDelayMs: 12000 },
+  response_analysis: { budget: 0.2, initialDelayMs: 4000 },
+  performance_analysis: { budget: 0, initialDelayMs: 0 },
+  aptitude_generation: { budget: 0, initialDelayMs: 0 },
+  resume_parsing: { budget: 0, initialDelayMs: 0 },
+  company_search: { budget: 0, initialDelayMs: 0 }
+};
+
 export class SmartAIService {
   private static instance: SmartAIService,
   private groqService: EnhancedGroqAIService,
   private geminiAI: GoogleGenerativeAI | null = null,
   private geminiModel: any = null,
+  private hedging = {
+    enabled: process.env.SMART_AI_HEDGING === 'true',
+    model: process.env.SMART_AI_HEDGE_MODEL || 'llama-3.3-70b-versatile',
+    percentile: parseInt(process.env.SMART_AI_HEDGE_PERCENTILE || '90'),
+    minDelayMs: parseInt(process.env.SMART_AI_HEDGE_MIN_DELAY_MS || '250'),
+    maxDelayMs: parseInt(process.env.SMART_AI_HEDGE_MAX_DELAY_MS || '20000')
+  };
+  private latencies: Map<SmartAIRequest['task'], LatencyWindow> = new Map();
+  private hedgeBudgets: Map<SmartAIRequest['task'], HedgeBudget> = new Map();
+  private hedgeStats: Map<SmartAIRequest['task'], { requests: number; hedged: number; hedgeWins: number; budgetDenied: number }> = new Map();
 
   private constructor() {
     this.groqService = EnhancedGroqAIService.getInstance();
@@ -54,7 +80,10 @@ export class SmartAIService {
       try {
         this.geminiAI = new GoogleGenerativeAI(geminiKey);
         // Try the most stable model first
-        this.geminiModel = this.geminiAI.getGenerativeModel({ model: 'gemini-1.5-flash' });
+        this.geminiModel = this.geminiAI.getGenerativeModel(
+          { model: 'gemini-1.5-flash' },
+          process.env.GEMINI_BASE_URL ? { baseUrl: process.env.GEMINI_BASE_URL } : undefined
+        );
       } catch (error) {
         console.warn('Failed to initialize Gemini:', error instanceof Error ? error.message : String(error)),
         this.geminiModel = null;
@@ -73,67 +102,32 @@ export class SmartAIService {
 
   public async processRequest(request: SmartAIRequest): Promise<SmartAIResponse> {
     const startTime = Date.now();
-    
-    try {
-      console.log(`🎯 Processing ${request.task} with optimal AI provider...`);
-      
 
     try {
       console.log(`🎯 Processing ${request.task} with optimal AI provider...`);
 
       // Route to appropriate AI service based on task complexity
-      let result: any,
-      let provider: 'enhanced-groq' | 'gemini',
-      let model: string,
-      let features: string[] = [],
+      let result: any;
+      let provider: 'enhanced-groq' | 'gemini';
+      let model: string;
+      let features: string[] = [];
+      let hedged = false;
 
-      // Try primary provider first
       if (this.shouldUseGroq(request.task)) {
-        try {
-          result = await this.processWithGroq(request);
-          provider = 'enhanced-groq';
-          model = 'llama-3.3-70b-versatile';
-          features = [
-            'Company-specific intelligence',
-            'Enhanced prompt engineering',
-            'Advanced problem generation',
-            'Cultural fit analysis'
-          ];
-        } catch (groqError: any) {
-          console.warn('Groq service failed, trying Gemini fallback:', groqError.message);
-          result = await this.processWithGemini(request);
-          provider = 'gemini';
-          model = 'gemini-1.5-flash';
-          features = ['Fallback processing', 'Basic functionality'];
-        }
-      } else {
-        try {
-          result = await this.processWithGemini(request);
-          provider = 'gemini';
-          model = 'gemini-1.5-flash';
-          features = [
-            'Fast processing',
-            'Resume parsing',
-            'Basic company search',
-            'Cost-effective'
-          ];
-        } catch (geminiError: any) {
-          console.warn('Gemini service failed, trying Groq fallback:', geminiError.message);
-          result = await this.processWithGroq(request);
-          provider = 'enhanced-groq';
-          model = 'llama-3.3-70b-versatile';
-          features = ['Fallback processing', 'Enhanced capabilities'];
-        }
-      if (this.shouldUseGroq(request.task)) {
-        result = await this.processWithGroq(request);
+        const outcome = await this.processWithHedging(request);
+        result = outcome.result;
+        hedged = outcome.hedged;
         provider = 'enhanced-groq';
-        model = 'llama-3.3-70b-versatile';
+        model = outcome.winner === 'hedge' ? this.hedging.model : 'llama-3.3-70b-versatile';
         features = [
           'Company-specific intelligence',
           'Enhanced prompt engineering',
           'Advanced problem generation',
           'Cultural fit analysis'
         ];
+        if (hedged) {
+          features.push(`Hedged request (${outcome.winner} answered first)`);
+        }
       } else {
         result = await this.processWithGemini(request);
         provider = 'gemini';
@@ -147,7 +141,7 @@ export class SmartAIService {
       }
 
       const processingTime = Date.now() - startTime;
-      console.log(`✅ ${request.task} completed in ${processingTime}ms using ${provider}`);
+      console.log(`✅ ${request.task} completed in ${processingTime}ms using ${provider}${hedged ? ' (hedged)' : ''}`);
 
       return {
         success: true,
@@ -156,17 +150,16 @@ export class SmartAIService {
         model,
         processingTime,
         taskType: request.task,
-        features
+        features,
+        hedged
       };
     } catch (error) {
       console.error(`❌ SmartAI processing failed for ${request.task}:`, error);
-      
 
       // Attempt fallback if primary service fails
       try {
         const fallbackResult = await this.processFallback(request);
         const processingTime = Date.now() - startTime;
-        
 
         return {
           success: true,
@@ -191,6 +184,89 @@ export class SmartAIService {
     }
   }
 
+  /**
+   * Run a Groq task, hedged when enabled and the task has budget: if the primary has not
+   * answered within the task's rolling p90 the same task is sent again (on
+   * SMART_AI_HEDGE_MODEL when set), the first valid answer wins and the other is aborted
+   */
+  private async processWithHedging(request: SmartAIRequest): Promise<HedgeOutcome<any>> {
+    const task = request.task;
+    const stats = this.hedgeStatsFor(task);
+    const latency = this.latencyFor(task);
+    const startedAt = Date.now();
+    stats.requests++;
+
+    if (!(request.hedge ?? this.hedging.enabled) || HEDGE_POLICIES[task].budget <= 0) {
+      const result = await this.processWithGroq(request);
+      latency.record(Date.now() - startedAt);
+      return { result, winner: 'primary', hedged: false, delayMs: null };
+    }
+
+    const budget = this.budgetFor(task);
+    budget.deposit();
+
+    const outcome = await hedgedRun(
+      { name: 'primary', run: signal => this.processWithGroq(request, { signal }) },
+      { name: 'hedge', run: signal => this.processWithGroq(request, { signal, model: this.hedging.model }) },
+      {
+        delayMs: this.hedgeDelay(task),
+        isValid: result => Array.isArray(result) ? result.length > 0 : !!result,
+        allowHedge: () => {
+          if (budget.trySpend()) return true;
+          stats.budgetDenied++;
+          return false;
+        }
+      }
+    );
+
+    latency.record(Date.now() - startedAt);
+    if (outcome.hedged) stats.hedged++;
+    if (outcome.winner === 'hedge') stats.hedgeWins++;
+    return outcome;
+  }
+
+  private hedgeDelay(task: SmartAIRequest['task']): number {
+    const observed = this.latencyFor(task).percentile(this.hedging.percentile);
+    const delay = observed ?? HEDGE_POLICIES[task].initialDelayMs;
+    return Math.min(this.hedging.maxDelayMs, Math.max(this.hedging.minDelayMs, delay));
+  }
+
+  private latencyFor(task: SmartAIRequest['task']): LatencyWindow {
+    if (!this.latencies.has(task)) {
+      this.latencies.set(task, new LatencyWindow());
+    }
+    return this.latencies.get(task)!;
+  }
+
+  private budgetFor(task: SmartAIRequest['task']): HedgeBudget {
+    if (!this.hedgeBudgets.has(task)) {
+      this.hedgeBudgets.set(task, new HedgeBudget(HEDGE_POLICIES[task].budget));
+    }
+    return this.hedgeBudgets.get(task)!;
+  }
+
+  private hedgeStatsFor(task: SmartAIRequest['task']) {
+    if (!this.hedgeStats.has(task)) {
+      this.hedgeStats.set(task, { requests: 0, hedged: 0, hedgeWins: 0, budgetDenied: 0 });
+    }
+    return this.hedgeStats.get(task)!;
+  }
+
+  public getHedgingMetrics() {
+    const tasks: Record<string, any> = {};
+    for (const [task, stats] of this.hedgeStats) {
+      tasks[task] = {
+        ...stats,
+        budget: HEDGE_POLICIES[task].budget,
+        hedgeRate: stats.requests > 0 ? stats.hedged / stats.requests : 0,
+        latencySamples: this.latencyFor(task).count,
+        p90Ms: this.latencyFor(task).percentile(90),
+        currentDelayMs: this.hedgeDelay(task)
+      };
+    }
+    return { ...this.hedging, tasks };
+  }
+
   private shouldUseGroq(task: string): boolean {
     // Complex tasks that need high-quality AI with company intelligence
     const groqTasks = [
@@ -206,7 +282,7 @@ export class SmartAIService {
     return groqTasks.includes(task);
   }
 
-  private async processWithGroq(request: SmartAIRequest): Promise<any> {
+  private async processWithGroq(request: SmartAIRequest, options: GroqCallOptions = {}): Promise<any> {
     switch (request.task) {
       case 'question_generation':
         return await this.groqService.generateInterviewQuestions({
@@ -217,7 +293,7 @@ export class SmartAIService {
           experienceLevel: request.context.experienceLevel as any || 'mid',
           numberOfQuestions: request.context.numberOfQuestions || 10,
           companyIntelligence: request.context.companyIntelligence
-        });
+        }, options);
 
       case 'response_analysis':
         return await this.groqService.analyzeInterviewResponse(
@@ -225,7 +301,8 @@ export class SmartAIService {
           request.context.userAnswer || '',
           request.context.expectedAnswer || '',
           request.context.interviewType || 'technical',
-          request.context.companyName || ''
+          request.context.companyName || '',
+          options
         );
 
       case 'dsa_generation':
@@ -234,7 +311,8 @@ export class SmartAIService {
             request.context.companyName || 'Technology Company',
             request.context.difficulty as any || 'medium',
             request.context.count || 3,
-            request.context.jobTitle || 'Software Engineer'
+            request.context.jobTitle || 'Software Engineer',
+            options
           );
           
           // Validate that we got an array of problems
@@ -245,6 +323,7 @@ export class SmartAIService {
           return dsaProblems;
         } catch (dsaError) {
           console.error('DSA generation failed in Smart AI service:', dsaError);
+          if (options.signal) throw dsaError; // Hedged calls let the other attempt answer
           // Return a basic fallback DSA problem
           return [{
             id: `fallback-dsa-${Date.now()}`,
@@ -342,6 +421,21 @@ export class SmartAIService {
     }
   }
 
+  private async callGemini(prompt: string): Promise<LLMReply> {
+    const call = new LLMCall('gemini', 'gemini-1.5-flash');
+    try {
+      call.sent();
+      const result = await this.geminiModel.generateContent(prompt);
+      const response = await result.response;
+      const text = response.text();
+      call.received(response.usageMetadata, prompt, text);
+      return { content: text, call };
+    } catch (error) {
+      call.failed(error);
+      throw error;
+    }
+  }
+
   private async parseResumeWithGemini(resumeText: string): Promise<any> {
     const prompt = `;
       Parse this resume and extract structured information for interview preparation. Return as JSON:
@@ -387,13 +481,11 @@ export class SmartAIService {
       }
     `;
 
-    const result = await this.geminiModel.generateContent(prompt);
-    const response = await result.response;
-    const text = response.text();
+    const { content: text, call } = await this.callGemini(prompt);
     
 
     try {
-      return extractJSON(text);
+      return llmParse(call, () => extractJSON(text));
     } catch (error) {
       console.error('Failed to parse Gemini resume response:', error);
       // Fallback parsing
@@ -453,12 +545,10 @@ export class SmartAIService {
     `;
 
     try {
-      const result = await this.geminiModel.generateContent(prompt);
-      const response = await result.response;
-      const text = response.text();
+      const { content: text, call } = await this.callGemini(prompt);
       
       try {
-        return extractJSON(text);
+        return llmParse(call, () => extractJSON(text));
       } catch (parseError) {
         console.error('Failed to parse Gemini company response:', parseError);
         throw parseError;
@@ -476,12 +566,10 @@ export class SmartAIService {
       }
       
       // Return fallback data instead of throwing error
-    const result = await this.geminiModel.generateContent(prompt);
-    const response = await result.response;
-    const text = response.text();
+    const { content: text, call } = await this.callGemini(prompt);
 
     try {
-      return extractJSON(text);
+      return llmParse(call, () => extractJSON(text));
     } catch (error) {
       console.error('Failed to parse Gemini company response:', error);
       return {
@@ -795,11 +883,12 @@ export class SmartAIService {
     experienceLevel: string,
     numberOfQuestions: number,
     companyIntelligence?: any
-  }) {
+  }, options: { hedge?: boolean } = {}) {
     return this.processRequest({
       task: 'question_generation',
       context: params,
-      priority: 'high'
+      priority: 'high',
+      hedge: options.hedge
     });
   }
 
@@ -0,0 +1,50 @@
+/**
+ * DSA verdict cache
+ * Content-addressed cache of code execution verdicts so re-running unchanged code
+ * against the same test cases is answered without another Judge0 round trip.
+ */
+
+import { createHash } from 'crypto';
+import LRUCache from './lruCache';
+
+const MINUTE = 60 * 1000;
+
+interface VerdictTestCase {
+  input: string;
+  expectedOutput: string;
+}
+
+// Key covers everything that can change the verdict: language, exact source and the test-case set.
+// context covers anything else baked into the cached response (e.g. company-specific feedback text).
+export function verdictCacheKey(
+  language: string,
+  sourceCode: string,
+  testCases: VerdictTestCase[],
+  context: string = ''
+): string {
+  const hash = createHash('sha256');
+  hash.update(context);
+  hash.update('\0');
+  hash.update(language.toLowerCase());
+  hash.update('\0');
+  hash.update(sourceCode.replace(/\r\n/g, '\n'));
+  testCases.forEach(testCase => {
+    hash.update('\0');
+    hash.update(testCase.input);
+    hash.update('\0');
+    hash.update(testCase.expectedOutput);
+  });
+  return hash.digest('hex');
+}
+
+export const dsaVerdictCache = new LRUCache<any>({
+  name: 'dsa-verdict',
+  maxEntries: parseInt(process.env.DSA_VERDICT_CACHE_MAX_ENTRIES || '1000'),
+  ttlMs: parseInt(process.env.DSA_VERDICT_CACHE_TTL_MS || String(10 * MINUTE)),
+  // The Mongo tier is opt-in: verdicts are cheap to recompute but shared across instances
+  persistCollection: process.env.DSA_VERDICT_CACHE_PERSIST === 'true' ? 'dsa_verdict_cache' : undefined
+});
+
+export function getVerdictCacheMetrics() {
+  return dsaVerdictCache.getMetrics();
+}
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Text-to-Speech Streaming Benchmark for RecruiterAI
+Runs a local ElevenLabs-compatible TTS stub that emits audio in timed chunks, then
+replays interviewer prompts against /api/text-to-speech and reports
+time-to-first-audio-byte, full clip time, audio cache hit rate and Range support.
+
+Start the app against the stub this script launches:
+    ELEVENLABS_BASE_URL=http://localhost:2359 ELEVENLABS_API_KEY=local npm run dev
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import requests
+
+from perf_harness import DEFAULT_BASE_URL, print_table, summarize
+
+PROMPTS = [
+    "Hello! Let's begin your interview. Tell me about yourself.",
+    "Can you walk me through a challenging project you worked on recently?",
+    "How do you approach debugging a production issue?",
+    "Describe a time you disagreed with a teammate and how you resolved it.",
+    "What interests you about this role?",
+    "Great answer. Let's move on to the next question.",
+    "Thank you. That concludes the interview.",
+]
+
+
+class TTSStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    first_byte_ms = 300.0
+    chunk_ms = 40.0
+    chunks = 25
+    chunk_bytes = 2048
+    stats: Counter = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.startswith("/v1/text-to-speech/"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.stats["generations"] += 1
+        # Deterministic bytes per text so cached and fresh clips can be compared
+        seed = hashlib.sha256(body.get("text", "").encode()).digest()
+        time.sleep(self.first_byte_ms / 1000)
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(self.chunks):
+            if i:
+                time.sleep(self.chunk_ms / 1000)
+            chunk = (seed * (self.chunk_bytes // len(seed) + 1))[:self.chunk_bytes]
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class TTSStubServer:
+    """ElevenLabs /v1/text-to-speech/{voice}/stream stand-in on a background thread"""
+
+    def __init__(self, port: int, first_byte_ms: float, chunk_ms: float, chunks: int):
+        self.stats: Counter = Counter()
+        handler = type("BoundTTSStubHandler", (TTSStubHandler,), {
+            "first_byte_ms": first_byte_ms, "chunk_ms": chunk_ms, "chunks": chunks, "stats": self.stats})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def clip_ms(self) -> float:
+        handler = self.httpd.RequestHandlerClass
+        return handler.first_byte_ms + handler.chunk_ms * (handler.chunks - 1)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        return False
+
+
+class TTSBenchmark:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.ttfb: Dict[str, List[float]] = {"MISS": [], "HIT": []}
+        self.total: Dict[str, List[float]] = {"MISS": [], "HIT": []}
+        self.outcomes: Counter = Counter()
+        self.clip_urls: Dict[str, str] = {}
+
+    def speak(self, text: str) -> str:
+        start = time.perf_counter()
+        with self.session.post(f"{self.base_url}/api/text-to-speech", json={"text": text},
+                               stream=True, timeout=60) as response:
+            response.raise_for_status()
+            first = None
+            size = 0
+            for chunk in response.iter_content(chunk_size=None):
+                if first is None:
+                    first = time.perf_counter()
+                size += len(chunk)
+            end = time.perf_counter()
+        outcome = response.headers.get("X-Cache", "MISS")
+        self.outcomes[outcome] += 1
+        self.ttfb[outcome].append(((first or end) - start) * 1000)
+        self.total[outcome].append((end - start) * 1000)
+        if response.headers.get("Content-Location"):
+            self.clip_urls[text] = response.headers["Content-Location"]
+        return outcome
+
+    def check_range(self) -> bool:
+        """Seek into a cached clip the way an <audio> element does"""
+        if not self.clip_urls:
+            return False
+        url = f"{self.base_url}{next(iter(self.clip_urls.values()))}"
+        full = self.session.get(url, timeout=30)
+        partial = self.session.get(url, headers={"Range": "bytes=100-199"}, timeout=30)
+        tail = self.session.get(url, headers={"Range": "bytes=-50"}, timeout=30)
+        return (full.status_code == 200 and partial.status_code == 206 and partial.content == full.content[100:200]
+                and partial.headers.get("Content-Range") == f"bytes 100-199/{len(full.content)}"
+                and tail.status_code == 206 and tail.content == full.content[-50:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS time-to-first-byte and audio cache benchmark")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--stub-port", type=int, default=2359)
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--first-byte-ms", type=float, default=300.0, help="stub latency before the first chunk")
+    parser.add_argument("--chunk-ms", type=float, default=40.0, help="stub delay between chunks")
+    parser.add_argument("--chunks", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print("🔊 RecruiterAI Text-to-Speech Streaming Benchmark")
+    print("=" * 60)
+
+    rng = random.Random(args.seed)
+    # Unique suffix per run so the first occurrence of each prompt is a true miss
+    run_tag = f" [{int(time.time())}]"
+    # Interviews reuse a handful of prompts, the greeting and transitions most of all
+    weights = [5, 2, 2, 2, 2, 6, 3]
+    texts = [rng.choices(PROMPTS, weights)[0] + run_tag for _ in range(args.requests)]
+
+    bench = TTSBenchmark(args.base_url)
+    with TTSStubServer(args.stub_port, args.first_byte_ms, args.chunk_ms, args.chunks) as stub:
+        try:
+            for text in texts:
+                bench.speak(text)
+            range_ok = bench.check_range()
+        except requests.RequestException as e:
+            print(f"❌ Benchmark failed: {e}")
+            return 1
+        generations = stub.stats["generations"]
+        clip_ms = stub.clip_ms
+
+    rows = []
+    for outcome in ("MISS", "HIT"):
+        ttfb, total = summarize(bench.ttfb[outcome]), summarize(bench.total[outcome])
+        rows.append({"outcome": outcome, "requests": ttfb["count"], "ttfb_p50": ttfb["p50"],
+                     "ttfb_p99": ttfb["p99"], "total_p50": total["p50"], "total_p99": total["p99"]})
+    print_table(rows, ["outcome", "requests", "ttfb_p50", "ttfb_p99", "total_p50", "total_p99"],
+                title="Time to first audio byte (ms)")
+
+    hit_rate = bench.outcomes["HIT"] / max(1, sum(bench.outcomes.values()))
+    print(f"\n  Stub generation time per clip: {clip_ms:.0f}ms (a buffered route cannot reply sooner)")
+    print(f"  Upstream generations: {generations} for {args.requests} requests, "
+          f"{len(set(texts))} distinct prompts")
+    print(f"  Audio cache hit rate: {hit_rate * 100:.0f}%")
+    print(f"  Range requests on cached clip: {'✅ ok' if range_ok else '❌ failed'}")
+
+    miss_ttfb = summarize(bench.ttfb["MISS"])["p50"]
+    if generations > len(set(texts)) or not range_ok or miss_ttfb >= clip_ms:
+        print("⚠️ Streaming or caching is not behaving as expected")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+DSA Verdict Cache Benchmark for RecruiterAI
+Replays candidates pressing "Run" repeatedly on unchanged code against
+/api/execute-dsa-code and reports first-run vs repeated-run latency and how many
+Judge0 executions the verdict cache saved.
+
+Start the app against the local Judge0 stand-in this script launches:
+    JUDGE0_BASE_URL=http://localhost:2358 JUDGE0_API_KEY=local npm run dev
+"""
+
+import argparse
+import random
+import sys
+from collections import Counter
+from typing import Dict, List
+
+import requests
+
+from dsa_load_scenario import SOLUTIONS, SubmissionPlan
+from local_judge0 import LocalJudge0Server
+from perf_harness import DEFAULT_BASE_URL, Stopwatch, print_table, summarize
+
+
+class VerdictCacheBenchmark:
+    def __init__(self, base_url: str, cookie: str):
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        if cookie:
+            self.session.headers["Cookie"] = cookie
+        self.latencies: Dict[str, List[float]] = {"first": [], "repeat": []}
+        self.cache_headers: Counter = Counter()
+
+    def run(self, plan: SubmissionPlan) -> str:
+        response = self.session.post(f"{self.base_url}/api/execute-dsa-code", timeout=120, json={
+            "sourceCode": plan.source,
+            "language": plan.language,
+            "companyName": "Cache Test",
+            "problem": {"id": "cache-sum", "title": "Sum of integers", "difficulty": "easy",
+                        "testCases": plan.cases},
+        })
+        response.raise_for_status()
+        header = response.headers.get("X-Cache", "none")
+        self.cache_headers[header] += 1
+        return header
+
+    def replay(self, plans: List[SubmissionPlan], repeats: int):
+        for plan in plans:
+            for attempt in range(repeats):
+                with Stopwatch() as sw:
+                    self.run(plan)
+                self.latencies["first" if attempt == 0 else "repeat"].append(sw.elapsed_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the DSA verdict cache on repeated runs")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--cookie", help="session cookie for /api/execute-dsa-code")
+    parser.add_argument("--candidates", type=int, default=10, help="distinct code submissions")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per unchanged submission")
+    parser.add_argument("--test-cases", type=int, default=5)
+    parser.add_argument("--language", choices=sorted(SOLUTIONS), default="python")
+    parser.add_argument("--judge0-port", type=int, default=2358)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print("🗃️ RecruiterAI DSA Verdict Cache Benchmark")
+    print("=" * 60)
+
+    rng = random.Random(11)
+    plans = [SubmissionPlan(i, 0, args.language, args.test_cases, rng) for i in range(args.candidates)]
+    bench = VerdictCacheBenchmark(args.base_url, args.cookie)
+
+    with LocalJudge0Server(port=args.judge0_port, workers=args.workers) as server:
+        try:
+            bench.replay(plans, args.repeats)
+        except requests.RequestException as e:
+            print(f"❌ Benchmark failed: {e}")
+            return 1
+        executed = server.judge.snapshot().get("executed", 0)
+
+    rows = []
+    for kind, samples in bench.latencies.items():
+        stats = summarize(samples)
+        rows.append({"run": kind, "count": stats["count"], "p50_ms": stats["p50"], "p90_ms": stats["p90"],
+                     "max_ms": stats["max"]})
+    print_table(rows, ["run", "count", "p50_ms", "p90_ms", "max_ms"], title="Run latency")
+    print_table([{"x_cache": h, "responses": n} for h, n in bench.cache_headers.most_common()],
+                ["x_cache", "responses"], title="Cache outcome")
+
+    uncached = args.candidates * args.repeats * args.test_cases
+    saved = uncached - executed
+    print(f"\n  Judge0 executions: {executed} (uncached would be {uncached}), saved {saved} "
+          f"({saved / uncached * 100:.0f}%)")
+
+    expected_hits = args.candidates * (args.repeats - 1)
+    hits = sum(n for h, n in bench.cache_headers.items() if h.startswith("HIT"))
+    if hits < expected_hits:
+        print(f"⚠️ Expected {expected_hits} cached repeats, saw {hits}")
+        return 1
+    print(f"✅ All {hits} repeated runs served from the verdict cache")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())